@@ -0,0 +1,52 @@
+"""Add summary_cache table for content-addressed LLM summaries.
+
+Stores LLM summaries keyed on a SHA-256 of (content hash, provider, model,
+language, rendered prompt hashes) so that syndicated or re-fetched content
+does not trigger another LLM call.
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-02-01
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '022'
+down_revision: Union[str, None] = '021'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create summary_cache table."""
+    op.create_table(
+        'summary_cache',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('cache_key', sa.String(length=64), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('provider', sa.String(length=100), nullable=False),
+        sa.Column('model', sa.String(length=100), nullable=False),
+        sa.Column('language', sa.String(length=10), nullable=True),
+        sa.Column('summary', sa.Text(), nullable=False),
+        sa.Column('title', sa.Text(), nullable=True),
+        sa.Column('hit_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('last_hit_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    op.create_index('ix_summary_cache_cache_key', 'summary_cache', ['cache_key'], unique=True)
+    op.create_index('ix_summary_cache_content_hash', 'summary_cache', ['content_hash'])
+    op.create_index('ix_summary_cache_last_hit_at', 'summary_cache', ['last_hit_at'])
+
+
+def downgrade() -> None:
+    """Drop summary_cache table."""
+    op.drop_index('ix_summary_cache_last_hit_at', table_name='summary_cache')
+    op.drop_index('ix_summary_cache_content_hash', table_name='summary_cache')
+    op.drop_index('ix_summary_cache_cache_key', table_name='summary_cache')
+    op.drop_table('summary_cache')
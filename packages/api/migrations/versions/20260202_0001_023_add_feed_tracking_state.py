@@ -0,0 +1,43 @@
+"""Add feed_tracking_state table for DB-backed feed tracking.
+
+Moves incremental fetch state (last read timestamp per feed URL) out of
+data/processed_feeds.json into one row per URL, and adds storage for HTTP
+validators (ETag / Last-Modified).
+
+Revision ID: 023
+Revises: 022
+Create Date: 2026-02-02
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '023'
+down_revision: Union[str, None] = '022'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create feed_tracking_state table."""
+    op.create_table(
+        'feed_tracking_state',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('feed_url', sa.String(length=2048), nullable=False),
+        sa.Column('last_read', sa.DateTime(), nullable=True),
+        sa.Column('etag', sa.String(length=255), nullable=True),
+        sa.Column('last_modified', sa.String(length=100), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    op.create_index('ix_feed_tracking_state_feed_url', 'feed_tracking_state', ['feed_url'], unique=True)
+
+
+def downgrade() -> None:
+    """Drop feed_tracking_state table."""
+    op.drop_index('ix_feed_tracking_state_feed_url', table_name='feed_tracking_state')
+    op.drop_table('feed_tracking_state')
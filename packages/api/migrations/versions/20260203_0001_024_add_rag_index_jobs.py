@@ -0,0 +1,47 @@
+"""Add rag_index_jobs table for background RAG indexing.
+
+Feed runs enqueue new digests here instead of embedding them inline;
+background workers embed them and compute graph relationships.
+
+Revision ID: 024
+Revises: 023
+Create Date: 2026-02-03
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '024'
+down_revision: Union[str, None] = '023'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create rag_index_jobs table."""
+    op.create_table(
+        'rag_index_jobs',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('digest_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('available_at', sa.DateTime(), nullable=False),
+        sa.Column('locked_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['digest_id'], ['digests.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    op.create_index('ix_rag_index_jobs_digest_id', 'rag_index_jobs', ['digest_id'], unique=True)
+    op.create_index('ix_rag_index_jobs_status_available', 'rag_index_jobs', ['status', 'available_at'])
+
+
+def downgrade() -> None:
+    """Drop rag_index_jobs table."""
+    op.drop_index('ix_rag_index_jobs_status_available', table_name='rag_index_jobs')
+    op.drop_index('ix_rag_index_jobs_digest_id', table_name='rag_index_jobs')
+    op.drop_table('rag_index_jobs')
@@ -0,0 +1,103 @@
+"""Add stored full-text search vectors to digests and chunk tables.
+
+Adds a generated ``search_vector`` tsvector column to digests (weighted
+title A, summary B, content C), digest_chunks and source_content_chunks,
+each backed by a GIN index. PostgreSQL keeps the columns in sync on every
+write, so queries no longer rebuild tsvectors per row.
+
+The expression indexes from migration 012 are superseded by
+ix_digests_search_vector and are dropped.
+
+Note: PostgreSQL is required for this project.
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-02-04
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+
+# revision identifiers, used by Alembic.
+revision: str = '025'
+down_revision: Union[str, None] = '024'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+DIGEST_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', COALESCE(title, '')), 'A') || "
+    "setweight(to_tsvector('english', COALESCE(summary, '')), 'B') || "
+    "setweight(to_tsvector('english', COALESCE(content, '')), 'C')"
+)
+CHUNK_SEARCH_VECTOR_SQL = "to_tsvector('english', COALESCE(text, ''))"
+
+SEARCH_VECTOR_TABLES = (
+    ('digests', DIGEST_SEARCH_VECTOR_SQL),
+    ('digest_chunks', CHUNK_SEARCH_VECTOR_SQL),
+    ('source_content_chunks', CHUNK_SEARCH_VECTOR_SQL),
+)
+
+
+def upgrade() -> None:
+    """Add generated search_vector columns and GIN indexes."""
+    connection = op.get_bind()
+    dialect_name = connection.dialect.name
+
+    # Generated tsvector columns are PostgreSQL-only
+    if dialect_name != 'postgresql':
+        return
+
+    for table, expression in SEARCH_VECTOR_TABLES:
+        op.execute(text(f'''
+            ALTER TABLE {table}
+            ADD COLUMN IF NOT EXISTS search_vector tsvector
+            GENERATED ALWAYS AS ({expression}) STORED
+        '''))
+        op.execute(text(f'''
+            CREATE INDEX IF NOT EXISTS ix_{table}_search_vector
+            ON {table}
+            USING GIN (search_vector)
+        '''))
+
+    # Superseded by ix_digests_search_vector
+    op.execute(text('DROP INDEX IF EXISTS ix_digests_content_fts'))
+    op.execute(text('DROP INDEX IF EXISTS ix_digests_title_summary_fts'))
+    op.execute(text('DROP INDEX IF EXISTS ix_digests_summary_fts'))
+    op.execute(text('DROP INDEX IF EXISTS ix_digests_title_fts'))
+
+
+def downgrade() -> None:
+    """Remove search_vector columns and restore the expression indexes."""
+    connection = op.get_bind()
+    dialect_name = connection.dialect.name
+
+    if dialect_name != 'postgresql':
+        return
+
+    for table, _ in reversed(SEARCH_VECTOR_TABLES):
+        op.execute(text(f'DROP INDEX IF EXISTS ix_{table}_search_vector'))
+        op.execute(text(f'ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector'))
+
+    op.execute(text('''
+        CREATE INDEX IF NOT EXISTS ix_digests_title_fts
+        ON digests
+        USING GIN (to_tsvector('english', COALESCE(title, '')))
+    '''))
+    op.execute(text('''
+        CREATE INDEX IF NOT EXISTS ix_digests_summary_fts
+        ON digests
+        USING GIN (to_tsvector('english', COALESCE(summary, '')))
+    '''))
+    op.execute(text('''
+        CREATE INDEX IF NOT EXISTS ix_digests_title_summary_fts
+        ON digests
+        USING GIN (to_tsvector('english', COALESCE(title, '') || ' ' || COALESCE(summary, '')))
+    '''))
+    op.execute(text('''
+        CREATE INDEX IF NOT EXISTS ix_digests_content_fts
+        ON digests
+        USING GIN (to_tsvector('english', COALESCE(content, '')))
+    '''))
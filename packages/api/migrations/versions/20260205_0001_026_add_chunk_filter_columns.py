@@ -0,0 +1,71 @@
+"""Add denormalized filter columns to digest and source content chunks.
+
+Copies feed_id, source_id and the digest's created_at onto every chunk row so
+vector search can apply its filters on the chunk table itself, where they can
+be combined with the HNSW index (or served by a btree index for exact scans)
+instead of being post-filtered through joins.
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-02-05
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+
+# revision identifiers, used by Alembic.
+revision: str = '026'
+down_revision: Union[str, None] = '025'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CHUNK_TABLES = ('digest_chunks', 'source_content_chunks')
+
+
+def upgrade() -> None:
+    """Add filter columns, backfill them and create supporting indexes."""
+    for table in CHUNK_TABLES:
+        op.add_column(table, sa.Column('feed_id', sa.Integer(), nullable=True))
+        op.add_column(table, sa.Column('source_id', sa.Integer(), nullable=True))
+        op.add_column(table, sa.Column('digest_created_at', sa.DateTime(), nullable=True))
+
+    op.execute(text('''
+        UPDATE digest_chunks AS dc
+        SET feed_id = fr.feed_id,
+            source_id = d.source_id,
+            digest_created_at = d.created_at
+        FROM digests AS d
+        LEFT JOIN feed_runs AS fr ON fr.id = d.feed_run_id
+        WHERE dc.digest_id = d.id
+    '''))
+    op.execute(text('''
+        UPDATE source_content_chunks AS scc
+        SET feed_id = fr.feed_id,
+            source_id = dsi.source_id,
+            digest_created_at = d.created_at
+        FROM source_contents AS sc
+        JOIN digest_source_items AS dsi ON dsi.id = sc.digest_source_item_id
+        JOIN digests AS d ON d.id = dsi.digest_id
+        LEFT JOIN feed_runs AS fr ON fr.id = d.feed_run_id
+        WHERE scc.source_content_id = sc.id
+    '''))
+
+    for table in CHUNK_TABLES:
+        op.create_index(f'ix_{table}_feed_created', table, ['feed_id', 'digest_created_at'])
+        op.create_index(f'ix_{table}_source_created', table, ['source_id', 'digest_created_at'])
+        op.create_index(f'ix_{table}_digest_created_at', table, ['digest_created_at'])
+
+
+def downgrade() -> None:
+    """Remove filter columns and their indexes."""
+    for table in reversed(CHUNK_TABLES):
+        op.drop_index(f'ix_{table}_digest_created_at', table_name=table)
+        op.drop_index(f'ix_{table}_source_created', table_name=table)
+        op.drop_index(f'ix_{table}_feed_created', table_name=table)
+        op.drop_column(table, 'digest_created_at')
+        op.drop_column(table, 'source_id')
+        op.drop_column(table, 'feed_id')
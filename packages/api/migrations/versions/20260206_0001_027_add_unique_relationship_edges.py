@@ -0,0 +1,45 @@
+"""Make digest relationship edges unique.
+
+Removes duplicate (source_digest_id, target_digest_id, relationship_type)
+rows, keeping the oldest, and adds a unique index on those columns so
+relationships can be bulk-written with INSERT ... ON CONFLICT DO NOTHING.
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-02-06
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+
+# revision identifiers, used by Alembic.
+revision: str = '027'
+down_revision: Union[str, None] = '026'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Deduplicate edges and add the unique index."""
+    op.execute(text('''
+        DELETE FROM digest_relationships AS duplicate
+        USING digest_relationships AS kept
+        WHERE duplicate.source_digest_id = kept.source_digest_id
+          AND duplicate.target_digest_id = kept.target_digest_id
+          AND duplicate.relationship_type = kept.relationship_type
+          AND duplicate.id > kept.id
+    '''))
+
+    op.create_index(
+        'ix_digest_relationships_edge',
+        'digest_relationships',
+        ['source_digest_id', 'target_digest_id', 'relationship_type'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Remove the unique index."""
+    op.drop_index('ix_digest_relationships_edge', table_name='digest_relationships')
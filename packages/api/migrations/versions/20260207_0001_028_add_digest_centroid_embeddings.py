@@ -0,0 +1,80 @@
+"""Add centroid embeddings to digests.
+
+Stores the mean embedding of each digest's chunks (digest_chunks and, via
+digest_source_items, source_content_chunks) on the digest row, each with
+its own HNSW index. Semantic relationships are found with a nearest-neighbour
+search over digests instead of aggregating distances over every chunk.
+
+Existing digests are backfilled from their current chunks.
+
+Note: PostgreSQL with pgvector is required for this project.
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-02-07
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+from pgvector.sqlalchemy import Vector
+
+
+# revision identifiers, used by Alembic.
+revision: str = '028'
+down_revision: Union[str, None] = '027'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Vector dimension matching BGE-M3 default
+VECTOR_DIMENSION = 1024
+
+CENTROID_COLUMNS = ('centroid_embedding', 'source_centroid_embedding')
+
+
+def upgrade() -> None:
+    """Add centroid columns, backfill them and create HNSW indexes."""
+    for column in CENTROID_COLUMNS:
+        op.add_column('digests', sa.Column(column, Vector(VECTOR_DIMENSION), nullable=True))
+
+    op.execute(text('''
+        UPDATE digests AS d
+        SET centroid_embedding = centroids.embedding
+        FROM (
+            SELECT digest_id, AVG(embedding) AS embedding
+            FROM digest_chunks
+            WHERE embedding IS NOT NULL
+            GROUP BY digest_id
+        ) AS centroids
+        WHERE centroids.digest_id = d.id
+    '''))
+    op.execute(text('''
+        UPDATE digests AS d
+        SET source_centroid_embedding = centroids.embedding
+        FROM (
+            SELECT dsi.digest_id, AVG(c.embedding) AS embedding
+            FROM source_content_chunks c
+            JOIN source_contents sc ON sc.id = c.source_content_id
+            JOIN digest_source_items dsi ON dsi.id = sc.digest_source_item_id
+            WHERE c.embedding IS NOT NULL
+            GROUP BY dsi.digest_id
+        ) AS centroids
+        WHERE centroids.digest_id = d.id
+    '''))
+
+    for column in CENTROID_COLUMNS:
+        op.execute(text(f'''
+            CREATE INDEX ix_digests_{column}_hnsw
+            ON digests
+            USING hnsw ({column} vector_cosine_ops)
+            WITH (m = 16, ef_construction = 64)
+        '''))
+
+
+def downgrade() -> None:
+    """Remove centroid columns and their indexes."""
+    for column in reversed(CENTROID_COLUMNS):
+        op.execute(text(f'DROP INDEX IF EXISTS ix_digests_{column}_hnsw'))
+        op.drop_column('digests', column)
@@ -0,0 +1,49 @@
+"""Add text hashes and embedding model identity to chunk tables.
+
+Re-embedding a digest or source content reuses the stored vector of every
+chunk whose text hash and embedding model match, so only changed chunks are
+sent to the embedding provider. The model column also identifies chunks
+embedded with a previous model, which backfills pick up for re-embedding.
+
+Existing chunks get their text hash here; their model stays NULL (unknown)
+until they are next re-embedded.
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-02-08
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+
+
+# revision identifiers, used by Alembic.
+revision: str = '029'
+down_revision: Union[str, None] = '028'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CHUNK_TABLES = ('digest_chunks', 'source_content_chunks')
+
+
+def upgrade() -> None:
+    """Add text_hash and embedding_model columns, backfill hashes and index models."""
+    for table in CHUNK_TABLES:
+        op.add_column(table, sa.Column('text_hash', sa.String(64), nullable=True))
+        op.add_column(table, sa.Column('embedding_model', sa.String(255), nullable=True))
+        op.execute(text(f'''
+            UPDATE {table}
+            SET text_hash = encode(sha256(convert_to(text, 'UTF8')), 'hex')
+        '''))
+        op.create_index(f'ix_{table}_embedding_model', table, ['embedding_model'])
+
+
+def downgrade() -> None:
+    """Remove text_hash and embedding_model columns."""
+    for table in reversed(CHUNK_TABLES):
+        op.drop_index(f'ix_{table}_embedding_model', table_name=table)
+        op.drop_column(table, 'embedding_model')
+        op.drop_column(table, 'text_hash')
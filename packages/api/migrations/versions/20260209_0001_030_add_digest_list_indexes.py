@@ -0,0 +1,31 @@
+"""Add indexes for the digest list projection.
+
+The digest list aggregates token usage per digest from llm_usage_logs and
+pages with a (created_at, id) keyset, so both need an index.
+
+Revision ID: 030
+Revises: 029
+Create Date: 2026-02-09
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '030'
+down_revision: Union[str, None] = '029'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index llm_usage_logs.digest_id and digests (created_at, id)."""
+    op.create_index('ix_llm_usage_logs_digest_id', 'llm_usage_logs', ['digest_id'])
+    op.create_index('ix_digests_created_at_id', 'digests', ['created_at', 'id'])
+
+
+def downgrade() -> None:
+    """Remove the digest list indexes."""
+    op.drop_index('ix_digests_created_at_id', table_name='digests')
+    op.drop_index('ix_llm_usage_logs_digest_id', table_name='llm_usage_logs')
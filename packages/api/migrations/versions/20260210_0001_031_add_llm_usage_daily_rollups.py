@@ -0,0 +1,68 @@
+"""Add llm_usage_daily_rollups table for dashboard and analytics totals.
+
+Daily token/cost/request totals per feed, provider and model, so analytics
+endpoints no longer aggregate the whole llm_usage_logs table on every
+request. Backfilled from the existing usage log.
+
+Revision ID: 031
+Revises: 030
+Create Date: 2026-02-10
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '031'
+down_revision: Union[str, None] = '030'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create llm_usage_daily_rollups and backfill it from llm_usage_logs."""
+    op.create_table(
+        'llm_usage_daily_rollups',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('feed_id', sa.Integer(), nullable=True),
+        sa.Column('provider', sa.String(length=100), nullable=False),
+        sa.Column('model', sa.String(length=100), nullable=False),
+        sa.Column('requests', sa.Integer(), nullable=False),
+        sa.Column('tokens_in', sa.BigInteger(), nullable=False),
+        sa.Column('tokens_out', sa.BigInteger(), nullable=False),
+        sa.Column('cost', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+    op.create_index('ix_llm_usage_daily_rollups_day', 'llm_usage_daily_rollups', ['day'])
+    op.create_index('ix_llm_usage_daily_rollups_feed_id', 'llm_usage_daily_rollups', ['feed_id'])
+    # Upsert key; COALESCE so usage outside feed runs (feed_id NULL) is unique too
+    op.create_index(
+        'ux_llm_usage_daily_rollups_key',
+        'llm_usage_daily_rollups',
+        ['day', sa.text('COALESCE(feed_id, 0)'), 'provider', 'model'],
+        unique=True,
+    )
+
+    op.execute("""
+        INSERT INTO llm_usage_daily_rollups
+            (day, feed_id, provider, model, requests, tokens_in, tokens_out, cost)
+        SELECT
+            DATE(l.timestamp), r.feed_id, l.provider, l.model,
+            COUNT(l.id), COALESCE(SUM(l.tokens_in), 0), COALESCE(SUM(l.tokens_out), 0),
+            COALESCE(SUM(l.cost), 0)
+        FROM llm_usage_logs l
+        LEFT JOIN feed_runs r ON r.id = l.feed_run_id
+        GROUP BY DATE(l.timestamp), r.feed_id, l.provider, l.model
+    """)
+
+
+def downgrade() -> None:
+    """Drop llm_usage_daily_rollups table."""
+    op.drop_index('ux_llm_usage_daily_rollups_key', table_name='llm_usage_daily_rollups')
+    op.drop_index('ix_llm_usage_daily_rollups_feed_id', table_name='llm_usage_daily_rollups')
+    op.drop_index('ix_llm_usage_daily_rollups_day', table_name='llm_usage_daily_rollups')
+    op.drop_table('llm_usage_daily_rollups')
@@ -0,0 +1,58 @@
+"""Keep blocking work off the API event loop.
+
+Route handlers that use the sync SQLAlchemy session are plain ``def``
+functions, so FastAPI runs them in its worker threadpool instead of on the
+event loop, where a slow query would stall every other request (including
+chat streams). Handlers that also call async services drive those
+coroutines to completion from the worker thread with ``run_async()``.
+"""
+import asyncio
+import threading
+import weakref
+from typing import Any, Coroutine, TypeVar
+
+from anyio.to_thread import current_default_thread_limiter
+
+T = TypeVar("T")
+
+_thread_local = threading.local()
+
+
+class _ThreadLoop:
+    """Event loop owned by one worker thread, closed when the thread exits."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        weakref.finalize(self, self.loop.close)
+
+
+def configure_threadpool(worker_threads: int) -> None:
+    """Set how many sync route handlers can run at once.
+
+    Must be called from the running event loop (e.g. the app lifespan).
+
+    Args:
+        worker_threads: Maximum number of worker threads
+    """
+    current_default_thread_limiter().total_tokens = worker_threads
+
+
+def run_async(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine from a sync route handler.
+
+    The coroutine runs on an event loop owned by the calling worker thread,
+    so the DB work it does between awaits never blocks the API event loop.
+    The loop is kept for the thread's lifetime rather than created per call,
+    so async clients bound to it (provider SDKs, connection pools) are
+    reused across requests instead of being left open on discarded loops.
+
+    Args:
+        coroutine: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    thread_loop = getattr(_thread_local, "loop", None)
+    if thread_loop is None:
+        thread_loop = _thread_local.loop = _ThreadLoop()
+    return thread_loop.loop.run_until_complete(coroutine)
@@ -1,12 +1,12 @@
 """FastAPI dependency injection for database sessions and rate limiting."""
 import os
 from typing import Generator
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from reconly_api.config import settings
+from reconly_core.database.engine import get_shared_engine
 
 
 # Check if we're in a test environment (pytest sets this, or check for test database)
@@ -26,11 +26,20 @@ limiter = Limiter(
 
 
 def get_engine():
-    """Create database engine with PostgreSQL connection pooling."""
-    return create_engine(
+    """Create database engine with PostgreSQL connection pooling.
+
+    The pool matches the API worker threadpool (settings.api_worker_threads)
+    so concurrent sync handlers don't queue behind each other for a connection.
+    The engine is the process-wide one for settings.database_url, so feed
+    runs, scheduler jobs and task runners share this pool; their connections
+    (settings.db_background_connections) come on top of the request overflow
+    so background work can't starve requests, or the other way round.
+    """
+    return get_shared_engine(
         settings.database_url,
-        pool_size=5,
-        max_overflow=10,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow + settings.db_background_connections,
+        pool_timeout=settings.db_pool_timeout,
         pool_pre_ping=True,
         echo=settings.debug
     )
@@ -47,7 +56,7 @@ def get_db() -> Generator[Session, None, None]:
 
     Usage:
         @router.get("/items")
-        async def get_items(db: Session = Depends(get_db)):
+        def get_items(db: Session = Depends(get_db)):
             ...
     """
     db = SessionLocal()
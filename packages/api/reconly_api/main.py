@@ -20,6 +20,7 @@ from slowapi.errors import RateLimitExceeded
 from reconly_core.logging import configure_logging, get_logger, generate_trace_id, get_trace_id
 from reconly_core.database import Base
 from reconly_api.config import settings, validate_secret_key, validate_configuration, SecretKeyValidationError
+from reconly_api.concurrency import configure_threadpool
 from reconly_api.dependencies import SessionLocal, engine, limiter
 from reconly_api.middleware import DemoModeMiddleware, SecurityHeadersMiddleware
 from reconly_api.routes import (
@@ -161,6 +162,9 @@ async def lifespan(app: FastAPI):
     logger = get_logger(__name__)
     logger.info("Starting Reconly API", version=settings.app_version)
 
+    # Sync route handlers (blocking DB work) run in this threadpool
+    configure_threadpool(settings.api_worker_threads)
+
     # Validate SECRET_KEY configuration
     # This will raise SecretKeyValidationError in production if the key is insecure
     try:
@@ -195,6 +199,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to start scheduler: {e}")
 
+    # Start background RAG indexing workers (feed runs only queue digests)
+    from reconly_core.rag.index_queue import start_index_workers, stop_index_workers
+    try:
+        start_index_workers(SessionLocal)
+    except Exception as e:
+        logger.error(f"Failed to start RAG index workers: {e}")
+
     yield
 
     # Shutdown: Stop scheduler
@@ -203,6 +214,20 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error shutting down scheduler: {e}")
 
+    # Shutdown: Stop RAG index workers (unfinished jobs stay queued)
+    try:
+        stop_index_workers()
+    except Exception as e:
+        logger.error(f"Error stopping RAG index workers: {e}")
+
+    # Shutdown: Close pooled database connections
+    from reconly_core.database.engine import dispose_shared_engines
+    dispose_shared_engines()
+
+    # Shutdown: Close pooled HTTP connections and the async I/O loop
+    from reconly_core.utils.http_client import close_http_client
+    close_http_client()
+
     logger.info("Shutting down Reconly API")
 
 
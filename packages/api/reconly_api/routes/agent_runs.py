@@ -71,7 +71,7 @@ def _build_agent_run_response(run: AgentRun) -> dict[str, object]:
 
 
 @router.get("", response_model=AgentRunListResponse)
-async def list_agent_runs(
+def list_agent_runs(
     source_id: int | None = Query(None, description="Filter by source ID"),
     status: str | None = Query(None, description="Filter by status (pending, running, completed, failed)"),
     from_date: datetime | None = Query(None, description="Filter by start date (inclusive)"),
@@ -112,7 +112,7 @@ async def list_agent_runs(
 
 
 @router.get("/capabilities", response_model=AgentCapabilitiesResponse)
-async def get_capabilities(db: Session = Depends(get_db)) -> AgentCapabilitiesResponse:
+def get_capabilities(db: Session = Depends(get_db)) -> AgentCapabilitiesResponse:
     """
     Check available agent research capabilities.
 
@@ -152,7 +152,7 @@ async def get_capabilities(db: Session = Depends(get_db)) -> AgentCapabilitiesRe
 
 
 @router.get("/{run_id}", response_model=AgentRunResponse)
-async def get_agent_run(
+def get_agent_run(
     run_id: int,
     db: Session = Depends(get_db),
 ) -> AgentRunResponse:
@@ -1,48 +1,68 @@
-"""Analytics API routes."""
+"""Analytics API routes.
+
+Token figures are read from the daily usage rollups (llm_usage_daily_rollups)
+rather than the raw usage log, and every response is cached briefly and
+invalidated on writes (see services/stats_cache.py).
+"""
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 
-from reconly_core.database.models import LLMUsageLog, FeedRun, Feed, Digest
+from reconly_core.database.models import FeedRun, Feed, Digest
+from reconly_core.services.stats_cache import get_stats_cache
+from reconly_core.services.usage_rollup_service import UsageRollupService
 from reconly_api.dependencies import get_db
 
 router = APIRouter()
 
 
-def parse_period(period: str) -> datetime:
-    """Parse period string to datetime."""
-    days_map = {"7d": 7, "30d": 30, "90d": 90}
-    days = days_map.get(period, 7)
-    return datetime.utcnow() - timedelta(days=days)
+PERIOD_DAYS = {"7d": 7, "30d": 30, "90d": 90}
+
+
+def normalize_period(period: str) -> str:
+    """Map unknown period strings to the default period."""
+    return period if period in PERIOD_DAYS else "7d"
+
+
+def parse_period(period: str) -> date:
+    """Parse period string to the first UTC day it covers.
+
+    A period of N days covers today and the N-1 days before it.
+    """
+    days = PERIOD_DAYS[normalize_period(period)]
+    return datetime.utcnow().date() - timedelta(days=days - 1)
 
 
 @router.get("/summary")
-async def get_analytics_summary(
+def get_analytics_summary(
     period: str = "7d",
     db: Session = Depends(get_db)
 ):
     """Get analytics summary."""
-    since = parse_period(period)
+    return get_stats_cache().get_or_compute(
+        ("analytics_summary", normalize_period(period)), lambda: _compute_summary(period, db)
+    )
+
+
+def _compute_summary(period: str, db: Session) -> dict:
+    """Compute the analytics summary for a period."""
+    since_day = parse_period(period)
+    since = datetime.combine(since_day, time.min)
 
     # Token totals
-    token_stats = db.query(
-        func.sum(LLMUsageLog.tokens_in).label('total_tokens_in'),
-        func.sum(LLMUsageLog.tokens_out).label('total_tokens_out'),
-        func.count(LLMUsageLog.id).label('total_requests'),
-    ).filter(LLMUsageLog.timestamp >= since).first()
+    token_stats = UsageRollupService(db).totals(since=since_day)
 
     # Success rate
-    total_runs = db.query(func.count(FeedRun.id)).filter(
+    runs = db.query(
+        func.count(FeedRun.id).label('total'),
+        func.count(FeedRun.id).filter(FeedRun.status == 'completed').label('successful'),
+    ).filter(
         FeedRun.created_at >= since
-    ).scalar() or 0
-
-    successful_runs = db.query(func.count(FeedRun.id)).filter(
-        FeedRun.created_at >= since,
-        FeedRun.status == 'completed'
-    ).scalar() or 0
+    ).one()
 
-    success_rate = (successful_runs / total_runs * 100) if total_runs > 0 else 0
+    total_runs = runs.total or 0
+    success_rate = (runs.successful / total_runs * 100) if total_runs > 0 else 0
 
     # Total digests
     total_digests = db.query(func.count(Digest.id)).filter(
@@ -50,8 +70,8 @@ async def get_analytics_summary(
     ).scalar() or 0
 
     return {
-        "total_tokens_in": token_stats.total_tokens_in or 0,
-        "total_tokens_out": token_stats.total_tokens_out or 0,
+        "total_tokens_in": token_stats["tokens_in"],
+        "total_tokens_out": token_stats["tokens_out"],
         "success_rate": round(success_rate, 2),
         "total_runs": total_runs,
         "total_digests": total_digests,
@@ -59,49 +79,31 @@ async def get_analytics_summary(
 
 
 @router.get("/tokens-by-provider")
-async def get_tokens_by_provider(
+def get_tokens_by_provider(
     period: str = "7d",
     db: Session = Depends(get_db)
 ):
     """Get token usage by provider with model breakdown."""
-    since = parse_period(period)
-
-    # Get provider-level aggregates
-    provider_results = db.query(
-        LLMUsageLog.provider,
-        func.sum(LLMUsageLog.tokens_in).label('tokens_in'),
-        func.sum(LLMUsageLog.tokens_out).label('tokens_out'),
-    ).filter(
-        LLMUsageLog.timestamp >= since
-    ).group_by(
-        LLMUsageLog.provider
-    ).all()
+    return get_stats_cache().get_or_compute(
+        ("analytics_tokens_by_provider", normalize_period(period)), lambda: _compute_tokens_by_provider(period, db)
+    )
 
-    total_tokens = sum((r.tokens_in or 0) + (r.tokens_out or 0) for r in provider_results)
 
-    # Get model-level breakdown for each provider
-    model_results = db.query(
-        LLMUsageLog.provider,
-        LLMUsageLog.model,
-        func.sum(LLMUsageLog.tokens_in).label('tokens_in'),
-        func.sum(LLMUsageLog.tokens_out).label('tokens_out'),
-    ).filter(
-        LLMUsageLog.timestamp >= since
-    ).group_by(
-        LLMUsageLog.provider,
-        LLMUsageLog.model
-    ).all()
+def _compute_tokens_by_provider(period: str, db: Session) -> list:
+    """Compute token usage per provider and model for a period."""
+    # Model-level totals; provider totals are summed from them
+    model_results = UsageRollupService(db).tokens_by_model(since=parse_period(period))
 
     # Build provider -> models mapping
     provider_models = {}
     for r in model_results:
-        if r.provider not in provider_models:
-            provider_models[r.provider] = []
-        model_tokens = (r.tokens_in or 0) + (r.tokens_out or 0)
-        provider_models[r.provider].append({
-            "model": r.model,
-            "tokens_in": r.tokens_in or 0,
-            "tokens_out": r.tokens_out or 0,
+        if r["provider"] not in provider_models:
+            provider_models[r["provider"]] = []
+        model_tokens = r["tokens_in"] + r["tokens_out"]
+        provider_models[r["provider"]].append({
+            "model": r["model"],
+            "tokens_in": r["tokens_in"],
+            "tokens_out": r["tokens_out"],
             "total_tokens": model_tokens,
         })
 
@@ -113,17 +115,21 @@ async def get_tokens_by_provider(
         # Sort models by total tokens descending
         models.sort(key=lambda m: m["total_tokens"], reverse=True)
 
+    total_tokens = sum(m["total_tokens"] for models in provider_models.values() for m in models)
+
     # Build response
     response = []
-    for r in provider_results:
-        provider_tokens = (r.tokens_in or 0) + (r.tokens_out or 0)
+    for provider, models in provider_models.items():
+        tokens_in = sum(m["tokens_in"] for m in models)
+        tokens_out = sum(m["tokens_out"] for m in models)
+        provider_tokens = tokens_in + tokens_out
         response.append({
-            "provider": r.provider,
-            "tokens_in": r.tokens_in or 0,
-            "tokens_out": r.tokens_out or 0,
+            "provider": provider,
+            "tokens_in": tokens_in,
+            "tokens_out": tokens_out,
             "total_tokens": provider_tokens,
             "percentage": round((provider_tokens / total_tokens * 100), 1) if total_tokens > 0 else 0,
-            "models": provider_models.get(r.provider, [])
+            "models": models,
         })
 
     # Sort by total tokens descending
@@ -133,12 +139,19 @@ async def get_tokens_by_provider(
 
 
 @router.get("/tokens-by-feed")
-async def get_tokens_by_feed(
+def get_tokens_by_feed(
     period: str = "7d",
     db: Session = Depends(get_db)
 ):
     """Get token usage by feed."""
-    since = parse_period(period)
+    return get_stats_cache().get_or_compute(
+        ("analytics_tokens_by_feed", normalize_period(period)), lambda: _compute_tokens_by_feed(period, db)
+    )
+
+
+def _compute_tokens_by_feed(period: str, db: Session) -> list:
+    """Compute token usage per feed for a period."""
+    since = datetime.combine(parse_period(period), time.min)
 
     results = db.query(
         FeedRun.feed_id,
@@ -169,30 +182,25 @@ async def get_tokens_by_feed(
 
 
 @router.get("/usage")
-async def get_usage_over_time(
+def get_usage_over_time(
     period: str = "7d",
     db: Session = Depends(get_db)
 ):
     """Get usage over time."""
-    since = parse_period(period)
+    return get_stats_cache().get_or_compute(
+        ("analytics_usage", normalize_period(period)), lambda: _compute_usage_over_time(period, db)
+    )
 
-    results = db.query(
-        func.date(LLMUsageLog.timestamp).label('date'),
-        func.sum(LLMUsageLog.tokens_in).label('tokens_in'),
-        func.sum(LLMUsageLog.tokens_out).label('tokens_out'),
-    ).filter(
-        LLMUsageLog.timestamp >= since
-    ).group_by(
-        func.date(LLMUsageLog.timestamp)
-    ).order_by(
-        func.date(LLMUsageLog.timestamp)
-    ).all()
+
+def _compute_usage_over_time(period: str, db: Session) -> list:
+    """Compute daily token usage for a period."""
+    results = UsageRollupService(db).tokens_by_day(since=parse_period(period))
 
     return [
         {
-            "date": str(r.date),
-            "tokens_in": r.tokens_in or 0,
-            "tokens_out": r.tokens_out or 0,
+            "date": str(r["day"]),
+            "tokens_in": r["tokens_in"],
+            "tokens_out": r["tokens_out"],
         }
         for r in results
     ]
@@ -30,7 +30,7 @@ router = APIRouter()
 
 
 @router.post("/login", response_model=LoginResponse)
-async def login(request: Request, body: LoginRequest, response: Response):
+def login(request: Request, body: LoginRequest, response: Response):
     """
     Authenticate with password and receive a session cookie.
 
@@ -92,7 +92,7 @@ async def login(request: Request, body: LoginRequest, response: Response):
 
 
 @router.post("/logout", response_model=LoginResponse)
-async def logout(response: Response):
+def logout(response: Response):
     """
     Clear the session cookie.
 
@@ -106,7 +106,7 @@ async def logout(response: Response):
 
 
 @router.get("/config", response_model=ConfigResponse)
-async def get_config(request: Request):
+def get_config(request: Request):
     """
     Get authentication configuration.
 
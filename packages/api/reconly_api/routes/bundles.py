@@ -34,7 +34,7 @@ router = APIRouter()
 # ============================================================================
 
 @router.post("/feeds/{feed_id}/export", response_model=BundleExportResponse)
-async def export_feed_bundle(
+def export_feed_bundle(
     feed_id: int,
     request: BundleExportRequest,
     db: Session = Depends(get_db),
@@ -97,7 +97,7 @@ async def export_feed_bundle(
 # ============================================================================
 
 @router.post("/bundles/validate", response_model=BundleValidateResponse)
-async def validate_bundle(
+def validate_bundle(
     request: BundleValidateRequest,
 ):
     """Validate a bundle without importing it.
@@ -119,7 +119,7 @@ async def validate_bundle(
 # ============================================================================
 
 @router.post("/bundles/preview", response_model=BundlePreviewResponse)
-async def preview_bundle_import(
+def preview_bundle_import(
     request: BundlePreviewRequest,
     db: Session = Depends(get_db),
 ):
@@ -178,7 +178,7 @@ async def preview_bundle_import(
 # ============================================================================
 
 @router.post("/bundles/import", response_model=BundleImportResponse, status_code=201)
-async def import_bundle(
+def import_bundle(
     request: BundleImportRequest,
     db: Session = Depends(get_db),
 ):
@@ -223,7 +223,7 @@ async def import_bundle(
 # ============================================================================
 
 @router.get("/bundles/schema")
-async def get_bundle_schema():
+def get_bundle_schema():
     """Get the JSON schema for feed bundles.
 
     Returns the schema definition for v1.0 bundles, useful for
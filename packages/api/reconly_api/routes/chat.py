@@ -25,6 +25,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
+from reconly_api.concurrency import run_async
 from reconly_api.dependencies import get_db, limiter
 from reconly_api.schemas.chat import (
     ChatCompletionRequest,
@@ -56,7 +57,7 @@ router = APIRouter()
 
 @router.post("", response_model=ChatCompletionResponse)
 @limiter.limit("30/minute")
-async def chat_completion(
+def chat_completion(
     request: Request,
     chat_request: ChatCompletionRequest,
     conversation_id: int = Query(..., description="Conversation ID to send message to"),
@@ -80,11 +81,11 @@ async def chat_completion(
         service = ChatService(db)
 
         # Send message and get response
-        response = await service.chat(
+        response = run_async(service.chat(
             conversation_id=conversation_id,
             user_message=chat_request.message,
             context={"db": db},
-        )
+        ))
 
         # Build tool calls executed list
         tool_calls_executed = None
@@ -102,7 +103,7 @@ async def chat_completion(
                 })
 
         # Load the assistant message for response
-        conversation = await service.get_conversation(conversation_id)
+        conversation = run_async(service.get_conversation(conversation_id))
         assistant_messages = [m for m in conversation.messages if m.role == "assistant"]
         latest_message = assistant_messages[-1] if assistant_messages else None
 
@@ -240,7 +241,7 @@ async def chat_stream(
 
 
 @router.get("/conversations", response_model=ChatConversationList)
-async def list_conversations(
+def list_conversations(
     limit: int = Query(50, ge=1, le=100, description="Maximum results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
     db: Session = Depends(get_db),
@@ -255,11 +256,11 @@ async def list_conversations(
     """
     try:
         service = ChatService(db)
-        conversations, total = await service.list_conversations(
+        conversations, total = run_async(service.list_conversations(
             limit=limit,
             offset=offset,
             user_id=None,  # Single-user OSS mode
-        )
+        ))
 
         # Convert to response format with message counts
         items = []
@@ -283,7 +284,7 @@ async def list_conversations(
 
 
 @router.post("/conversations", response_model=ChatConversationResponse, status_code=201)
-async def create_conversation(
+def create_conversation(
     conversation: ChatConversationCreate,
     db: Session = Depends(get_db),
 ):
@@ -296,12 +297,12 @@ async def create_conversation(
     """
     try:
         service = ChatService(db)
-        conv = await service.create_conversation(
+        conv = run_async(service.create_conversation(
             title=conversation.title,
             model_provider=conversation.model_provider,
             model_name=conversation.model_name,
             user_id=None,  # Single-user OSS mode
-        )
+        ))
 
         return ChatConversationResponse(
             id=conv.id,
@@ -320,7 +321,7 @@ async def create_conversation(
 
 
 @router.get("/conversations/{conversation_id}", response_model=ChatConversationDetail)
-async def get_conversation(
+def get_conversation(
     conversation_id: int,
     db: Session = Depends(get_db),
 ):
@@ -331,7 +332,7 @@ async def get_conversation(
     """
     try:
         service = ChatService(db)
-        conv = await service.get_conversation(conversation_id)
+        conv = run_async(service.get_conversation(conversation_id))
 
         # Build message responses
         messages = []
@@ -371,7 +372,7 @@ async def get_conversation(
 
 
 @router.patch("/conversations/{conversation_id}", response_model=ChatConversationResponse)
-async def update_conversation(
+def update_conversation(
     conversation_id: int,
     update: ChatConversationUpdate,
     db: Session = Depends(get_db),
@@ -388,11 +389,11 @@ async def update_conversation(
         service = ChatService(db)
 
         # Get existing conversation
-        conv = await service.get_conversation(conversation_id)
+        conv = run_async(service.get_conversation(conversation_id))
 
         # Update fields if provided
         if update.title is not None:
-            conv = await service.update_conversation_title(conversation_id, update.title)
+            conv = run_async(service.update_conversation_title(conversation_id, update.title))
 
         # For model updates, we need to update directly since the service
         # only has update_conversation_title method
@@ -428,7 +429,7 @@ async def update_conversation(
 
 
 @router.delete("/conversations/{conversation_id}", status_code=204)
-async def delete_conversation(
+def delete_conversation(
     conversation_id: int,
     db: Session = Depends(get_db),
 ):
@@ -439,7 +440,7 @@ async def delete_conversation(
     """
     try:
         service = ChatService(db)
-        deleted = await service.delete_conversation(conversation_id)
+        deleted = run_async(service.delete_conversation(conversation_id))
 
         if not deleted:
             raise HTTPException(
@@ -55,7 +55,7 @@ def _connection_to_response(connection, db: Session) -> ConnectionResponse:
 
 
 @router.get("", response_model=ConnectionListResponse)
-async def list_all_connections(
+def list_all_connections(
     type: str | None = None,
     db: Session = Depends(get_db),
 ) -> ConnectionListResponse:
@@ -66,7 +66,7 @@ async def list_all_connections(
 
 
 @router.post("", response_model=ConnectionResponse, status_code=201)
-async def create_new_connection(
+def create_new_connection(
     connection: ConnectionCreate,
     db: Session = Depends(get_db),
 ) -> ConnectionResponse:
@@ -95,7 +95,7 @@ async def create_new_connection(
 
 
 @router.get("/{connection_id}", response_model=ConnectionResponse)
-async def get_connection_by_id(
+def get_connection_by_id(
     connection_id: int,
     db: Session = Depends(get_db),
 ) -> ConnectionResponse:
@@ -107,7 +107,7 @@ async def get_connection_by_id(
 
 
 @router.patch("/{connection_id}", response_model=ConnectionResponse)
-async def update_connection_by_id(
+def update_connection_by_id(
     connection_id: int,
     connection_update: ConnectionUpdate,
     db: Session = Depends(get_db),
@@ -135,7 +135,7 @@ async def update_connection_by_id(
 
 
 @router.delete("/{connection_id}", status_code=204)
-async def delete_connection_by_id(
+def delete_connection_by_id(
     connection_id: int,
     force: bool = False,
     db: Session = Depends(get_db),
@@ -160,7 +160,7 @@ async def delete_connection_by_id(
 
 
 @router.post("/{connection_id}/test", response_model=ConnectionTestResult)
-async def test_connection(
+def test_connection(
     connection_id: int,
     db: Session = Depends(get_db),
 ) -> ConnectionTestResult:
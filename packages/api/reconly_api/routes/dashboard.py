@@ -3,15 +3,18 @@ from datetime import datetime, timedelta
 from enum import Enum
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session, joinedload
 
 from reconly_api.dependencies import get_db
 from reconly_api.schemas.dashboard import DashboardInsights
-from reconly_api.schemas.digest import DigestResponse, DigestList
+from reconly_api.schemas.digest import DigestResponse, DigestList, DigestListView
 from reconly_api.schemas.feeds import FeedResponse
-from reconly_core.database.models import Digest, Feed, FeedRun, LLMUsageLog, Source
+from reconly_core.database.models import Digest, Feed, FeedRun, Source
 from reconly_core.services.dashboard_service import DashboardService
+from reconly_core.services.digest_list_service import DigestListService
+from reconly_core.services.stats_cache import get_stats_cache
+from reconly_core.services.usage_rollup_service import UsageRollupService
 
 router = APIRouter()
 
@@ -24,54 +27,53 @@ class DigestTimeFilter(str, Enum):
 
 
 @router.get("/stats")
-async def get_dashboard_stats(db: Session = Depends(get_db)):
-    """Get dashboard statistics."""
-    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+def get_dashboard_stats(db: Session = Depends(get_db)):
+    """Get dashboard statistics.
+
+    Cached for a few seconds and invalidated on writes (see services/stats_cache.py).
+    """
+    return get_stats_cache().get_or_compute(("dashboard_stats",), lambda: _compute_dashboard_stats(db))
+
+
+def _compute_dashboard_stats(db: Session) -> dict:
+    """Compute dashboard statistics."""
+    today = datetime.utcnow().date()
     week_ago = datetime.utcnow() - timedelta(days=7)
 
     # Count entities
-    sources_count = db.query(func.count(Source.id)).scalar() or 0
-    feeds_count = db.query(func.count(Feed.id)).scalar() or 0
-    digests_count = db.query(func.count(Digest.id)).scalar() or 0
+    counts = db.query(
+        select(func.count(Source.id)).scalar_subquery().label('sources'),
+        select(func.count(Feed.id)).scalar_subquery().label('feeds'),
+        select(func.count(Digest.id)).scalar_subquery().label('digests'),
+    ).one()
 
-    # Token usage today
-    tokens_today = db.query(
-        func.sum(LLMUsageLog.tokens_in + LLMUsageLog.tokens_out)
-    ).filter(
-        LLMUsageLog.timestamp >= today
-    ).scalar() or 0
-
-    # Token usage this week
-    tokens_week = db.query(
-        func.sum(LLMUsageLog.tokens_in + LLMUsageLog.tokens_out)
-    ).filter(
-        LLMUsageLog.timestamp >= week_ago
-    ).scalar() or 0
+    # Token usage today and over the last 7 days (from the daily rollups)
+    rollup_service = UsageRollupService(db)
+    tokens_today = rollup_service.totals(since=today)
+    tokens_week = rollup_service.totals(since=today - timedelta(days=6))
 
     # Success rate (last week)
-    total_runs = db.query(func.count(FeedRun.id)).filter(
+    runs = db.query(
+        func.count(FeedRun.id).label('total'),
+        func.count(FeedRun.id).filter(FeedRun.status == 'completed').label('successful'),
+    ).filter(
         FeedRun.created_at >= week_ago
-    ).scalar() or 0
-
-    successful_runs = db.query(func.count(FeedRun.id)).filter(
-        FeedRun.created_at >= week_ago,
-        FeedRun.status == 'completed'
-    ).scalar() or 0
+    ).one()
 
-    success_rate = round((successful_runs / total_runs * 100), 1) if total_runs > 0 else 0
+    success_rate = round((runs.successful / runs.total * 100), 1) if runs.total > 0 else 0
 
     return {
-        "sources_count": sources_count,
-        "feeds_count": feeds_count,
-        "digests_count": digests_count,
-        "tokens_today": tokens_today,
-        "tokens_week": tokens_week,
+        "sources_count": counts.sources or 0,
+        "feeds_count": counts.feeds or 0,
+        "digests_count": counts.digests or 0,
+        "tokens_today": tokens_today["tokens_in"] + tokens_today["tokens_out"],
+        "tokens_week": tokens_week["tokens_in"] + tokens_week["tokens_out"],
         "success_rate": success_rate,
     }
 
 
 @router.get("/insights", response_model=DashboardInsights)
-async def get_dashboard_insights(db: Session = Depends(get_db)) -> DashboardInsights:
+def get_dashboard_insights(db: Session = Depends(get_db)) -> DashboardInsights:
     """Get actionable dashboard insights.
 
     Returns user-valuable metrics including:
@@ -82,57 +84,56 @@ async def get_dashboard_insights(db: Session = Depends(get_db)) -> DashboardInsi
     - feeds_failing: Count of feeds with recent errors
     - last_sync_at: Timestamp of most recent completed feed run
     """
-    service = DashboardService(db)
-    insights = service.get_insights()
+    insights = get_stats_cache().get_or_compute(
+        ("dashboard_insights",), lambda: DashboardService(db).get_insights()
+    )
     return DashboardInsights(**insights)
 
 
 @router.get("/digests", response_model=DigestList)
-async def get_dashboard_digests(
+def get_dashboard_digests(
     since: DigestTimeFilter = Query(
         DigestTimeFilter.ALL,
         description="Time filter: 'today', 'week', or 'all'"
     ),
     limit: int = Query(8, ge=1, le=20, description="Maximum number of digests to return"),
+    view: DigestListView = Query(DigestListView.FULL, description="Row projection: 'full' or 'summary'"),
     db: Session = Depends(get_db)
 ) -> DigestList:
     """Get recent digests for the dashboard with time filtering.
 
     - **since**: Time filter - 'today' (last 24h), 'week' (last 7 days), or 'all'
     - **limit**: Maximum number of digests (default 8, max 20)
+    - **view**: `summary` returns a truncated content preview without source items
 
     Returns digests ordered by creation date (newest first).
     """
-    # Build base query with eager loading
-    query = db.query(Digest).options(joinedload(Digest.llm_usage_logs))
+    filters = []
 
     # Apply time filter
     now = datetime.utcnow()
     if since == DigestTimeFilter.TODAY:
         # Last 24 hours
         cutoff = now - timedelta(hours=24)
-        query = query.filter(Digest.created_at >= cutoff)
+        filters.append(Digest.created_at >= cutoff)
     elif since == DigestTimeFilter.WEEK:
         # Last 7 days
         cutoff = now - timedelta(days=7)
-        query = query.filter(Digest.created_at >= cutoff)
+        filters.append(Digest.created_at >= cutoff)
     # For 'all', no time filter needed
 
-    # Get total count before applying limit
-    total_count = query.count()
-
-    # Order by created_at descending and apply limit
-    query = query.order_by(Digest.created_at.desc()).limit(limit)
-
-    # Execute query and convert to response format
-    digests_data = query.all()
-    digests = [DigestResponse(**digest.to_dict()) for digest in digests_data]
+    page = DigestListService(db).list_digests(
+        filters,
+        limit=limit,
+        summary=view == DigestListView.SUMMARY,
+    )
+    digests = [DigestResponse(**digest) for digest in page.digests]
 
-    return DigestList(total=total_count, digests=digests)
+    return DigestList(total=page.total, digests=digests)
 
 
 @router.get("/feeds", response_model=list[FeedResponse])
-async def get_dashboard_feeds(
+def get_dashboard_feeds(
     since: DigestTimeFilter = Query(
         DigestTimeFilter.ALL,
         description="Time filter: 'today', 'week', or 'all'"
@@ -1,9 +1,9 @@
 """Digest API endpoints."""
 from fastapi import APIRouter, HTTPException, Query, Depends, Request
-from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 from typing import Optional
-from sqlalchemy import text
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from reconly_core.exporters import get_exporter, list_exporters
 
@@ -11,6 +11,7 @@ from reconly_api.schemas.digest import (
     DigestCreate,
     DigestResponse,
     DigestList,
+    DigestListView,
     DigestStats,
     BatchProcessRequest,
     BatchProcessResponse,
@@ -22,6 +23,7 @@ from reconly_api.config import settings
 from reconly_api.dependencies import get_db, limiter
 from reconly_core.services.digest_service import DigestService, ProcessOptions
 from reconly_core.services.batch_service import BatchService, BatchOptions
+from reconly_core.services.digest_list_service import DigestListService, InvalidCursorError
 
 import logging
 
@@ -29,10 +31,13 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Digests loaded per round trip when streaming exports
+EXPORT_YIELD_PER = 500
+
 
 @router.post("", response_model=DigestResponse, status_code=201)
 @limiter.limit("10/minute")  # Limit digest creation to 10 per minute
-async def create_digest(
+def create_digest(
     request: Request,
     digest_request: DigestCreate,
     db: Session = Depends(get_db)
@@ -96,7 +101,7 @@ async def create_digest(
 
 
 @router.get("", response_model=DigestList)
-async def list_digests(
+def list_digests(
     feed_id: Optional[int] = Query(None, description="Filter by feed ID"),
     source_id: Optional[int] = Query(None, description="Filter by source ID"),
     tags: Optional[str] = Query(None, description="Comma-separated tags"),
@@ -104,6 +109,8 @@ async def list_digests(
     search: Optional[str] = Query(None, description="Search in title, content, summary"),
     limit: int = Query(10, ge=1, le=100, description="Result limit"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(None, description="Keyset cursor from a previous page (replaces offset)"),
+    view: DigestListView = Query(DigestListView.FULL, description="Row projection: 'full' or 'summary'"),
     db: Session = Depends(get_db)
 ):
     """
@@ -116,27 +123,34 @@ async def list_digests(
     - **search**: Search query (uses PostgreSQL full-text search)
     - **limit**: Maximum results (1-100)
     - **offset**: Offset for pagination
+    - **cursor**: `next_cursor` of the previous page for keyset pagination (total is not recounted)
+    - **view**: `summary` returns a truncated content preview without source items
     """
     try:
         from reconly_core.database.models import Digest, DigestTag, Tag, FeedRun
 
-        # Build base query with eager loading
-        query = db.query(Digest).options(joinedload(Digest.llm_usage_logs))
+        filters = []
 
         if feed_id:
             # Filter by feed through feed_run
-            query = query.join(FeedRun).filter(FeedRun.feed_id == feed_id)
+            filters.append(Digest.feed_run_id.in_(
+                select(FeedRun.id).where(FeedRun.feed_id == feed_id)
+            ))
 
         if source_id:
-            query = query.filter(Digest.source_id == source_id)
+            filters.append(Digest.source_id == source_id)
 
         if source_type:
-            query = query.filter(Digest.source_type == source_type)
+            filters.append(Digest.source_type == source_type)
 
         if tags:
             # Filter by tag through DigestTag
             tag_list = [t.strip() for t in tags.split(',')]
-            query = query.join(DigestTag).join(Tag).filter(Tag.name.in_(tag_list))
+            filters.append(Digest.id.in_(
+                select(DigestTag.digest_id)
+                .join(Tag, Tag.id == DigestTag.tag_id)
+                .where(Tag.name.in_(tag_list))
+            ))
 
         if search:
             # Use PostgreSQL full-text search with prefix matching for search-as-you-type
@@ -146,40 +160,38 @@ async def list_digests(
                 # Escape special characters and build tsquery with prefix on last word
                 safe_words = [w.replace("'", "''").replace('\\', '\\\\') for w in words if w]
                 if len(safe_words) == 1:
-                    tsquery_str = f"{safe_words[0]}:*"
+                    tsquery_str = f"{safe_words[0]}:*AB"
                 else:
                     # Join all but last with &, add :* to last word
-                    tsquery_str = " & ".join(safe_words[:-1]) + f" & {safe_words[-1]}:*"
-
-                fts_condition = text("""
-                    to_tsvector('english', COALESCE(title, '') || ' ' || COALESCE(summary, ''))
-                    @@ to_tsquery('english', :search_query)
-                """)
-                query = query.filter(fts_condition).params(search_query=tsquery_str)
+                    tsquery_str = " & ".join(f"{w}:AB" for w in safe_words[:-1]) + f" & {safe_words[-1]}:*AB"
 
-        # Get total count before applying limit
-        total_count = query.count()
+                # Match title (A) and summary (B) lexemes of the stored, GIN-indexed vector
+                filters.append(text(
+                    "digests.search_vector @@ to_tsquery('english', :search_query)"
+                ).bindparams(search_query=tsquery_str))
 
-        # Order by created_at descending and apply pagination
-        query = query.order_by(Digest.created_at.desc()).offset(offset).limit(limit)
-
-        # Execute query
-        digests_data = query.all()
-
-        # Convert to response format
-        digests = []
-        for digest in digests_data:
-            digest_dict = digest.to_dict()
-            digests.append(DigestResponse(**digest_dict))
+        try:
+            page = DigestListService(db).list_digests(
+                filters,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                summary=view == DigestListView.SUMMARY,
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-        return DigestList(total=total_count, digests=digests)
+        digests = [DigestResponse(**digest) for digest in page.digests]
+        return DigestList(total=page.total, digests=digests, next_cursor=page.next_cursor)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/search", response_model=DigestList)
-async def search_digests(
+def search_digests(
     query: str = Query(..., description="Search query"),
     tags: Optional[str] = Query(None, description="Comma-separated tags"),
     source_type: Optional[str] = Query(None, description="Filter by source type"),
@@ -222,7 +234,7 @@ async def search_digests(
 
 
 @router.get("/stats", response_model=DigestStats)
-async def get_statistics(
+def get_statistics(
     db: Session = Depends(get_db)
 ):
     """
@@ -245,7 +257,7 @@ async def get_statistics(
 
 @router.post("/batch", response_model=BatchProcessResponse)
 @limiter.limit("5/hour")  # Limit batch processing to 5 per hour
-async def batch_process(
+def batch_process(
     request: Request,
     batch_request: BatchProcessRequest,
     db: Session = Depends(get_db)
@@ -288,8 +300,40 @@ async def batch_process(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _stream_digests(query):
+    """
+    Iterate an export query in batches of EXPORT_YIELD_PER digests.
+
+    Uses a server-side cursor and loads the tags, token usage and source
+    items exporters read (via Digest.to_dict) with one query per batch.
+
+    The query runs on its own session, opened when iteration starts and
+    closed when it ends: a StreamingResponse consumes this iterator after
+    the handler has returned, when the request session may be closed.
+    """
+    from reconly_core.database.models import Digest, DigestSourceItem, DigestTag
+
+    with Session(bind=query.session.get_bind()) as session:
+        yield from query.with_session(session).options(
+            selectinload(Digest.tags).selectinload(DigestTag.tag),
+            selectinload(Digest.llm_usage_logs),
+            selectinload(Digest.source_items).selectinload(DigestSourceItem.source),
+        ).yield_per(EXPORT_YIELD_PER)
+
+
+def _streaming_export_response(exporter, digests) -> StreamingResponse:
+    """Stream an exporter's output for the digests as a file download."""
+    return StreamingResponse(
+        exporter.export_stream(digests),
+        media_type=exporter.get_content_type(),
+        headers={
+            "Content-Disposition": f"attachment; filename={exporter.get_stream_filename()}"
+        }
+    )
+
+
 @router.get("/export", response_model=None)
-async def export_digests(
+def export_digests(
     format: str = Query("json", description="Export format: json, csv, obsidian"),
     feed_id: Optional[int] = Query(None, description="Filter by feed ID"),
     source_id: Optional[int] = Query(None, description="Filter by source ID"),
@@ -334,9 +378,6 @@ async def export_digests(
                 (Digest.summary.ilike(search_pattern))
             )
 
-        # Execute query
-        digests = query.all()
-
         # Use exporter factory for format-specific export
         try:
             exporter = get_exporter(format)
@@ -347,15 +388,7 @@ async def export_digests(
                 detail=f"Unsupported format: {format}. Available formats: {available}"
             )
 
-        result = exporter.export(digests)
-
-        return Response(
-            content=result.content,
-            media_type=result.content_type,
-            headers={
-                "Content-Disposition": f"attachment; filename={result.filename}"
-            }
-        )
+        return _streaming_export_response(exporter, _stream_digests(query))
 
     except HTTPException:
         raise
@@ -364,7 +397,7 @@ async def export_digests(
 
 
 @router.post("/export", response_model=None)
-async def export_digests_by_ids(
+def export_digests_by_ids(
     request: ExportByIdsRequest,
     db: Session = Depends(get_db)
 ):
@@ -378,9 +411,9 @@ async def export_digests_by_ids(
         from reconly_core.database.models import Digest
 
         # Fetch digests by IDs
-        digests = db.query(Digest).filter(Digest.id.in_(request.ids)).all()
+        query = db.query(Digest).filter(Digest.id.in_(request.ids))
 
-        if not digests:
+        if not db.query(query.exists()).scalar():
             raise HTTPException(status_code=404, detail="No digests found with provided IDs")
 
         # Use exporter factory for format-specific export
@@ -393,15 +426,7 @@ async def export_digests_by_ids(
                 detail=f"Unsupported format: {request.format}. Available formats: {available}"
             )
 
-        result = exporter.export(digests)
-
-        return Response(
-            content=result.content,
-            media_type=result.content_type,
-            headers={
-                "Content-Disposition": f"attachment; filename={result.filename}"
-            }
-        )
+        return _streaming_export_response(exporter, _stream_digests(query))
 
     except HTTPException:
         raise
@@ -410,7 +435,7 @@ async def export_digests_by_ids(
 
 
 @router.post("/export-to-path", response_model=ExportToPathResponse)
-async def export_digests_to_path(
+def export_digests_to_path(
     request: ExportToPathRequest,
     db: Session = Depends(get_db)
 ):
@@ -516,9 +541,7 @@ async def export_digests_to_path(
                     (Digest.summary.ilike(search_pattern))
                 )
 
-        digests = query.all()
-
-        if not digests:
+        if not db.query(query.exists()).scalar():
             return ExportToPathResponse(
                 success=True,
                 files_written=0,
@@ -546,7 +569,7 @@ async def export_digests_to_path(
                 exporter_config[field.key] = field.default
 
         # Export to path
-        result = exporter.export_to_path(digests, target_path, exporter_config)
+        result = exporter.export_to_path(_stream_digests(query), target_path, exporter_config)
 
         return ExportToPathResponse(
             success=result.success,
@@ -563,7 +586,7 @@ async def export_digests_to_path(
 
 
 @router.get("/{digest_id}", response_model=DigestResponse)
-async def get_digest(
+def get_digest(
     digest_id: int,
     db: Session = Depends(get_db)
 ):
@@ -596,7 +619,7 @@ async def get_digest(
 
 
 @router.patch("/{digest_id}/tags", response_model=DigestResponse)
-async def update_digest_tags(
+def update_digest_tags(
     digest_id: int,
     request: DigestTagsUpdate,
     db: Session = Depends(get_db)
@@ -651,7 +674,7 @@ async def update_digest_tags(
 
 
 @router.delete("/{digest_id}", status_code=204)
-async def delete_digest(
+def delete_digest(
     digest_id: int,
     db: Session = Depends(get_db)
 ):
@@ -677,7 +700,7 @@ async def delete_digest(
 
 
 @router.post("/batch-delete", response_model=BatchDeleteResponse)
-async def batch_delete_digests(
+def batch_delete_digests(
     request: BatchDeleteRequest,
     db: Session = Depends(get_db)
 ):
@@ -102,7 +102,7 @@ def _build_exporter_response(
 
 
 @router.get("", response_model=ExporterListResponse)
-async def list_available_exporters(
+def list_available_exporters(
     enabled_only: bool = False,
     db: Session = Depends(get_db),
 ) -> ExporterListResponse:
@@ -128,7 +128,7 @@ async def list_available_exporters(
 
 
 @router.put("/{name}/enabled", response_model=ExporterResponse)
-async def toggle_exporter_enabled(
+def toggle_exporter_enabled(
     name: str,
     request: ExporterToggleRequest,
     db: Session = Depends(get_db),
@@ -157,7 +157,7 @@ def _build_extension_response(
 
 
 @router.get("", response_model=ExtensionListResponse)
-async def list_extensions(
+def list_extensions(
     type: Optional[str] = Query(None, description="Filter by type (exporter, fetcher, provider)"),
     extensions_only: bool = Query(True, description="Only show external extensions (not built-ins)"),
     db: Session = Depends(get_db),
@@ -207,7 +207,7 @@ async def list_extensions(
 
 
 @router.get("/catalog", response_model=CatalogResponse)
-async def get_catalog(
+def get_catalog(
     force_refresh: bool = Query(False, description="Bypass cache and fetch fresh catalog"),
 ):
     """
@@ -257,7 +257,7 @@ async def get_catalog(
 
 
 @router.get("/catalog/search", response_model=CatalogResponse)
-async def search_catalog_endpoint(
+def search_catalog_endpoint(
     q: Optional[str] = Query(None, description="Search query"),
     type: Optional[str] = Query(None, description="Filter by type (exporter, fetcher, provider)"),
     verified_only: bool = Query(False, description="Only show verified extensions"),
@@ -314,7 +314,7 @@ async def search_catalog_endpoint(
 
 
 @router.post("/install", response_model=ExtensionInstallResponse)
-async def install_extension(
+def install_extension(
     request: ExtensionInstallRequest,
 ):
     """
@@ -376,7 +376,7 @@ async def install_extension(
 
 
 @router.get("/{type}", response_model=ExtensionListResponse)
-async def list_extensions_by_type(
+def list_extensions_by_type(
     type: str,
     db: Session = Depends(get_db),
 ):
@@ -414,7 +414,7 @@ async def list_extensions_by_type(
 
 
 @router.get("/{type}/{name}", response_model=ExtensionResponse)
-async def get_extension(
+def get_extension(
     type: str,
     name: str,
     db: Session = Depends(get_db),
@@ -455,7 +455,7 @@ async def get_extension(
 
 
 @router.put("/{type}/{name}/enabled", response_model=ExtensionResponse)
-async def toggle_extension_enabled(
+def toggle_extension_enabled(
     type: str,
     name: str,
     request: ExtensionToggleRequest,
@@ -524,7 +524,7 @@ async def toggle_extension_enabled(
 
 
 @router.put("/{type}/{name}/settings")
-async def update_extension_settings_deprecated(
+def update_extension_settings_deprecated(
     type: str,
     name: str,
 ):
@@ -552,7 +552,7 @@ async def update_extension_settings_deprecated(
 
 
 @router.delete("/{type}/{name}", response_model=ExtensionInstallResponse)
-async def uninstall_extension(
+def uninstall_extension(
     type: str,
     name: str,
     db: Session = Depends(get_db),
@@ -69,7 +69,7 @@ def _build_feed_run_response(run: FeedRun) -> dict:
 
 
 @router.get("", response_model=FeedRunListResponse)
-async def list_feed_runs(
+def list_feed_runs(
     feed_id: Optional[int] = Query(None, description="Filter by feed ID"),
     status: Optional[str] = Query(None, description="Filter by status (pending, running, completed, failed)"),
     from_date: Optional[datetime] = Query(None, description="Filter by start date (inclusive)"),
@@ -110,7 +110,7 @@ async def list_feed_runs(
 
 
 @router.get("/{run_id}", response_model=FeedRunDetailResponse)
-async def get_feed_run(
+def get_feed_run(
     run_id: int,
     db: Session = Depends(get_db)
 ):
@@ -138,7 +138,7 @@ async def get_feed_run(
 
 
 @router.get("/{run_id}/sources", response_model=FeedRunSourcesResponse)
-async def get_feed_run_sources(
+def get_feed_run_sources(
     run_id: int,
     db: Session = Depends(get_db)
 ):
@@ -191,7 +191,7 @@ async def get_feed_run_sources(
 
 
 @router.get("/{run_id}/digests", response_model=List[DigestResponse])
-async def get_feed_run_digests(
+def get_feed_run_digests(
     run_id: int,
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of results"),
     offset: int = Query(0, ge=0, description="Number of results to skip"),
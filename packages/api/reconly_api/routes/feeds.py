@@ -36,7 +36,7 @@ def _remove_feed_schedule(feed_id: int) -> None:
 
 
 @router.get("", response_model=List[FeedResponse])
-async def list_feeds(
+def list_feeds(
     enabled_only: bool = False,
     db: Session = Depends(get_db)
 ):
@@ -98,7 +98,7 @@ async def list_feeds(
 
 @router.post("", response_model=FeedResponse, status_code=201)
 @limiter.limit("10/minute")
-async def create_feed(
+def create_feed(
     request: Request,
     feed: FeedCreate,
     db: Session = Depends(get_db)
@@ -152,7 +152,7 @@ async def create_feed(
 
 
 @router.get("/{feed_id}", response_model=FeedResponse)
-async def get_feed(
+def get_feed(
     feed_id: int,
     db: Session = Depends(get_db)
 ):
@@ -181,7 +181,7 @@ async def get_feed(
 
 
 @router.put("/{feed_id}", response_model=FeedResponse)
-async def update_feed(
+def update_feed(
     feed_id: int,
     feed_update: FeedUpdate,
     db: Session = Depends(get_db)
@@ -239,7 +239,7 @@ async def update_feed(
 
 
 @router.delete("/{feed_id}", status_code=204)
-async def delete_feed(
+def delete_feed(
     feed_id: int,
     db: Session = Depends(get_db)
 ):
@@ -258,7 +258,7 @@ async def delete_feed(
 
 
 @router.post("/{feed_id}/run")
-async def run_feed(
+def run_feed(
     feed_id: int,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
@@ -296,7 +296,7 @@ async def run_feed(
 
 
 @router.get("/{feed_id}/runs")
-async def get_feed_runs(
+def get_feed_runs(
     feed_id: int,
     page: int = 1,
     per_page: int = 20,
@@ -322,7 +322,7 @@ async def get_feed_runs(
 
 
 @router.post("/batch-delete", response_model=BatchDeleteResponse)
-async def batch_delete_feeds(
+def batch_delete_feeds(
     request: BatchDeleteRequest,
     db: Session = Depends(get_db)
 ):
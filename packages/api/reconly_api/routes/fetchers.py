@@ -100,7 +100,7 @@ def _build_fetcher_response(
 
 
 @router.get("", response_model=FetcherListResponse)
-async def list_available_fetchers(
+def list_available_fetchers(
     db: Session = Depends(get_db),
 ) -> FetcherListResponse:
     """List all available fetchers with their metadata and configuration schemas.
@@ -119,7 +119,7 @@ async def list_available_fetchers(
 
 
 @router.get("/{name}", response_model=FetcherResponse)
-async def get_fetcher_details(
+def get_fetcher_details(
     name: str,
     db: Session = Depends(get_db),
 ) -> FetcherResponse:
@@ -2,6 +2,7 @@
 from fastapi import APIRouter, HTTPException, Query, Depends, BackgroundTasks
 from sqlalchemy.orm import Session
 
+from reconly_api.concurrency import run_async
 from reconly_api.dependencies import get_db
 from reconly_api.schemas.graph import (
     GraphResponse,
@@ -16,7 +17,7 @@ router = APIRouter()
 
 
 @router.get("/nodes", response_model=GraphResponse)
-async def get_graph_nodes(
+def get_graph_nodes(
     center_digest_id: int | None = Query(
         None,
         description="Center the graph on this digest ID"
@@ -183,7 +184,7 @@ async def get_graph_nodes(
 
 
 @router.get("/expand/{node_id}", response_model=GraphResponse)
-async def expand_node(
+def expand_node(
     node_id: str,
     depth: int = Query(
         1,
@@ -287,7 +288,7 @@ async def expand_node(
 
 
 @router.get("/stats", response_model=GraphStatsResponse)
-async def get_graph_stats(
+def get_graph_stats(
     db: Session = Depends(get_db),
 ) -> GraphStatsResponse:
     """
@@ -322,7 +323,7 @@ async def get_graph_stats(
 
 
 @router.post("/compute", response_model=ComputeRelationshipsResponse)
-async def compute_relationships(
+def compute_relationships(
     request: ComputeRelationshipsRequest,
     db: Session = Depends(get_db),
 ) -> ComputeRelationshipsResponse:
@@ -361,12 +362,12 @@ async def compute_relationships(
         )
 
         # Compute relationships
-        count = await graph_service.compute_relationships(
+        count = run_async(graph_service.compute_relationships(
             digest_id=request.digest_id,
             include_semantic=request.include_semantic,
             include_tags=request.include_tags,
             include_source=request.include_source,
-        )
+        ))
 
         db.commit()
 
@@ -387,7 +388,7 @@ async def compute_relationships(
 
 
 @router.post("/compute-all")
-async def compute_all_relationships(
+def compute_all_relationships(
     background_tasks: BackgroundTasks,
     include_semantic: bool = Query(True, description="Compute semantic relationships"),
     include_tags: bool = Query(True, description="Compute tag relationships"),
@@ -447,7 +448,7 @@ async def compute_all_relationships(
     }
 
 
-async def _compute_relationships_background(
+def _compute_relationships_background(
     include_semantic: bool,
     include_tags: bool,
     include_source: bool,
@@ -470,41 +471,41 @@ async def _compute_relationships_background(
 
         # Get digests to process
         if force:
-            digests = db.query(Digest).all()
+            query = db.query(Digest.id)
         else:
             # Get digests without relationships
             digests_with_rels = db.query(
                 DigestRelationship.source_digest_id
             ).distinct().subquery()
-            digests = db.query(Digest).filter(
+            query = db.query(Digest.id).filter(
                 ~Digest.id.in_(db.query(digests_with_rels))
-            ).all()
+            )
+        digest_ids = [digest_id for (digest_id,) in query.order_by(Digest.id).all()]
 
-        total = len(digests)
+        total = len(digest_ids)
         processed = 0
         total_relationships = 0
+        batch_size = GraphService.DEFAULT_BATCH_SIZE
 
-        for digest in digests:
+        # One set-based pass per batch, committed as it goes
+        for start in range(0, total, batch_size):
+            batch = digest_ids[start:start + batch_size]
             try:
-                count = await graph_service.compute_relationships(
-                    digest_id=digest.id,
+                total_relationships += run_async(graph_service.compute_relationships_batch(
+                    batch,
                     include_semantic=include_semantic,
                     include_tags=include_tags,
                     include_source=include_source,
-                )
-                total_relationships += count
-                processed += 1
-
-                # Commit periodically
-                if processed % 10 == 0:
-                    db.commit()
-                    logger.info(f"Processed {processed}/{total} digests")
+                ))
+                db.commit()
+                processed += len(batch)
+                logger.info(f"Processed {processed}/{total} digests")
 
             except Exception as e:
-                logger.error(f"Error processing digest {digest.id}: {e}")
+                db.rollback()
+                logger.error(f"Error processing digests {batch[0]}-{batch[-1]}: {e}")
                 continue
 
-        db.commit()
         logger.info(
             f"Completed relationship computation: {processed}/{total} digests, "
             f"{total_relationships} relationships created"
@@ -518,7 +519,7 @@ async def _compute_relationships_background(
 
 
 @router.delete("/relationships/{digest_id}")
-async def delete_digest_relationships(
+def delete_digest_relationships(
     digest_id: int,
     db: Session = Depends(get_db),
 ) -> dict:
@@ -561,7 +562,7 @@ async def delete_digest_relationships(
 
 
 @router.post("/prune")
-async def prune_relationships(
+def prune_relationships(
     min_score: float | None = Query(
         None,
         ge=0.0,
@@ -107,7 +107,7 @@ def _is_authenticated_or_development(request: Request) -> bool:
 
 
 @router.get("/health", response_model=HealthStatus)
-async def health_check():
+def health_check():
     """Public health check endpoint.
 
     Returns a simple status indicating whether the service is running.
@@ -120,7 +120,7 @@ async def health_check():
 
 
 @router.get("/health/detailed", response_model=DetailedHealthStatus)
-async def health_check_detailed(
+def health_check_detailed(
     request: Request,
     db: Session = Depends(get_db),
 ):
@@ -184,7 +184,7 @@ async def health_check_detailed(
 
 
 @router.get("/health/sources", response_model=SourcesHealthSummary)
-async def get_sources_health_summary(
+def get_sources_health_summary(
     include_details: bool = False,
     enabled_only: bool = True,
     db: Session = Depends(get_db)
@@ -68,7 +68,7 @@ def _is_provider_configured(provider: str) -> bool:
 
 
 @router.get("/oauth/providers", response_model=OAuthProvidersResponse)
-async def list_oauth_providers():
+def list_oauth_providers():
     """
     List available OAuth providers and their configuration status.
 
@@ -90,7 +90,7 @@ async def list_oauth_providers():
 
 
 @router.get("/oauth/{provider}/authorize", response_model=OAuthAuthorizeResponse)
-async def get_authorization_url(
+def get_authorization_url(
     provider: str,
     source_id: int = Query(..., description="Source ID to associate with OAuth"),
     request: Request = None,
@@ -174,7 +174,7 @@ async def get_authorization_url(
 
 
 @router.get("/oauth/callback")
-async def oauth_callback(
+def oauth_callback(
     code: Optional[str] = Query(None, description="Authorization code from provider"),
     state: Optional[str] = Query(None, description="State parameter for CSRF protection"),
     error: Optional[str] = Query(None, description="Error code if authorization failed"),
@@ -325,7 +325,7 @@ async def oauth_callback(
 
 
 @router.get("/oauth/{source_id}/status", response_model=OAuthStatusResponse)
-async def get_oauth_status(
+def get_oauth_status(
     source_id: int,
     db: Session = Depends(get_db),
 ):
@@ -368,7 +368,7 @@ async def get_oauth_status(
 
 
 @router.delete("/oauth/{source_id}", response_model=OAuthRevokeResponse)
-async def revoke_oauth(
+def revoke_oauth(
     source_id: int,
     db: Session = Depends(get_db),
 ):
@@ -436,7 +436,7 @@ async def revoke_oauth(
 
 
 @router.get("/oauth/{source_id}/credential", response_model=OAuthCredentialResponse)
-async def get_oauth_credential(
+def get_oauth_credential(
     source_id: int,
     db: Session = Depends(get_db),
 ):
@@ -1,4 +1,5 @@
 """Provider status and configuration API routes."""
+import asyncio
 import logging
 from typing import List, Optional
 
@@ -6,6 +7,7 @@ import httpx
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
+from reconly_api.concurrency import run_async
 from reconly_api.dependencies import get_db
 from reconly_api.schemas.providers import (
     ProviderListResponse,
@@ -219,6 +221,21 @@ async def _check_local_provider_availability(provider_name: str) -> bool:
         return False
 
 
+async def _check_local_providers_availability(provider_names: list[str]) -> dict[str, bool]:
+    """Check several local providers concurrently.
+
+    Args:
+        provider_names: Names of the local providers to check
+
+    Returns:
+        Dict mapping provider name to availability
+    """
+    results = await asyncio.gather(
+        *(_check_local_provider_availability(name) for name in provider_names)
+    )
+    return dict(zip(provider_names, results))
+
+
 def _determine_provider_status(
     is_local: bool,
     requires_api_key: bool,
@@ -243,7 +260,7 @@ def _determine_provider_status(
 
 
 @router.get("", response_model=ProviderListResponse)
-async def get_provider_config(db: Session = Depends(get_db)):
+def get_provider_config(db: Session = Depends(get_db)):
     """Get provider configuration and status.
 
     Returns all registered providers with their status, available models,
@@ -258,7 +275,7 @@ async def get_provider_config(db: Session = Depends(get_db)):
         fallback_chain = _get_default_fallback_chain()
 
     # Pre-check local provider availability using metadata
-    local_availability = {}
+    local_providers = []
     for provider_name in list_providers():
         entry = get_provider_entry(provider_name)
         # Try metadata first, fall back to capabilities
@@ -270,7 +287,9 @@ async def get_provider_config(db: Session = Depends(get_db)):
             is_local = capabilities.is_local
 
         if is_local:
-            local_availability[provider_name] = await _check_local_provider_availability(provider_name)
+            local_providers.append(provider_name)
+
+    local_availability = run_async(_check_local_providers_availability(local_providers))
 
     # Iterate over all registered providers
     for provider_name in list_providers():
@@ -327,7 +346,7 @@ async def get_provider_config(db: Session = Depends(get_db)):
 
 
 @router.get("/{provider_name}/models")
-async def get_provider_models(provider_name: str):
+def get_provider_models(provider_name: str):
     """Get available models for a provider."""
     if not is_provider_registered(provider_name):
         raise HTTPException(status_code=404, detail=f"Unknown provider: {provider_name}")
@@ -338,7 +357,7 @@ async def get_provider_models(provider_name: str):
 
 
 @router.post("/refresh-models")
-async def refresh_models(provider_name: Optional[str] = None):
+def refresh_models(provider_name: Optional[str] = None):
     """Invalidate model cache and fetch fresh models.
 
     Args:
@@ -365,7 +384,7 @@ async def refresh_models(provider_name: Optional[str] = None):
 
 
 @router.get("/default", response_model=ResolvedProviderResponse)
-async def get_default_provider(db: Session = Depends(get_db)):
+def get_default_provider(db: Session = Depends(get_db)):
     """Get the resolved default provider (first available from fallback chain).
 
     Checks each provider in the fallback chain for actual availability:
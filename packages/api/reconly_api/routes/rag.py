@@ -2,6 +2,7 @@
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
 
+from reconly_api.concurrency import run_async
 from reconly_api.dependencies import get_db
 from reconly_api.schemas.rag import (
     ChunkSource as ChunkSourceSchema,
@@ -58,7 +59,7 @@ def _convert_filters(filters: RAGFiltersSchema | None):
 
 
 @router.post("/query", response_model=RAGQueryResponse)
-async def rag_query(
+def rag_query(
     request: RAGQueryRequest,
     db: Session = Depends(get_db),
 ) -> RAGQueryResponse:
@@ -95,12 +96,12 @@ async def rag_query(
         rag_service = _get_rag_service(db)
         filters = _convert_filters(request.filters)
 
-        result = await rag_service.query(
+        result = run_async(rag_service.query(
             question=request.question,
             filters=filters,
             max_chunks=request.max_chunks,
             include_answer=request.include_answer,
-        )
+        ))
 
         citations = [
             CitationSchema(
@@ -140,7 +141,7 @@ async def rag_query(
 
 
 @router.post("/search", response_model=RAGQueryResponse)
-async def rag_search(
+def rag_search(
     request: RAGQueryRequest,
     db: Session = Depends(get_db),
 ) -> RAGQueryResponse:
@@ -159,11 +160,11 @@ async def rag_search(
     # Force include_answer to False
     request.include_answer = False
 
-    return await rag_query(request, db)
+    return rag_query(request, db)
 
 
 @router.post("/export", response_model=RAGExportResponse)
-async def rag_export(
+def rag_export(
     request: RAGExportRequest,
     db: Session = Depends(get_db),
 ) -> RAGExportResponse:
@@ -211,11 +212,11 @@ async def rag_export(
         rag_service = _get_rag_service(db)
         filters = _convert_filters(request.filters)
 
-        result = await rag_service.search_only(
+        result = run_async(rag_service.search_only(
             question=request.question,
             filters=filters,
             max_chunks=request.max_chunks,
-        )
+        ))
 
         unique_sources = len({c.digest_id for c in result.citations})
 
@@ -6,6 +6,7 @@ from fastapi import APIRouter, HTTPException, Query, Depends, Request
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from reconly_api.concurrency import run_async
 from reconly_api.dependencies import get_db, limiter
 from reconly_api.schemas.search import (
     SearchResponse,
@@ -19,7 +20,7 @@ router = APIRouter()
 
 @router.get("/hybrid", response_model=SearchResponse)
 @limiter.limit("60/minute")
-async def hybrid_search(
+def hybrid_search(
     request: Request,
     q: str = Query(..., min_length=1, description="Search query text"),
     feed_id: int | None = Query(None, description="Filter by feed ID"),
@@ -71,7 +72,7 @@ async def hybrid_search(
             embedding_provider=embedding_provider,
         )
 
-        response = await search_service.search(
+        response = run_async(search_service.search(
             query=q,
             limit=limit,
             feed_id=feed_id,
@@ -79,7 +80,7 @@ async def hybrid_search(
             days=days,
             mode=mode,
             include_embedding=include_embedding,
-        )
+        ))
 
         results = [
             SearchResult(
@@ -120,7 +121,7 @@ async def hybrid_search(
 
 
 @router.get("/stats", response_model=SearchStatsResponse)
-async def get_search_stats(
+def get_search_stats(
     db: Session = Depends(get_db),
 ) -> SearchStatsResponse:
     """
@@ -168,7 +169,7 @@ async def get_search_stats(
 
 @router.get("/vector", response_model=SearchResponse)
 @limiter.limit("60/minute")
-async def vector_search(
+def vector_search(
     request: Request,
     q: str = Query(..., min_length=1, description="Search query text"),
     feed_id: int | None = Query(None, description="Filter by feed ID"),
@@ -202,20 +203,20 @@ async def vector_search(
 
         start_time = time.time()
 
-        results = await vector_service.search(
+        results = run_async(vector_service.search(
             query=q,
             limit=limit,
             feed_id=feed_id,
             source_id=source_id,
             days=days,
             min_score=min_score,
-        )
+        ))
 
         took_ms = (time.time() - start_time) * 1000
 
         query_embedding = None
         if include_embedding:
-            query_embedding = await embedding_provider.embed_single(q)
+            query_embedding = run_async(embedding_provider.embed_single(q))
 
         # Group results by digest
         digest_results: dict[int, SearchResult] = {}
@@ -266,7 +267,7 @@ async def vector_search(
 
 @router.get("/fts", response_model=SearchResponse)
 @limiter.limit("60/minute")
-async def fts_search(
+def fts_search(
     request: Request,
     q: str = Query(..., min_length=1, description="Search query text"),
     feed_id: int | None = Query(None, description="Filter by feed ID"),
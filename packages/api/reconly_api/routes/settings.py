@@ -19,7 +19,7 @@ router = APIRouter()
 
 
 @router.post("/test-email", response_model=TestEmailResponse)
-async def test_email(
+def test_email(
     request: TestEmailRequest,
     db: Session = Depends(get_db)
 ):
@@ -102,7 +102,7 @@ async def test_email(
 
 
 @router.get("", response_model=SettingsResponse)
-async def get_settings(
+def get_settings(
     category: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
@@ -167,7 +167,7 @@ async def get_settings(
 
 
 @router.put("", response_model=dict)
-async def update_settings(
+def update_settings(
     request: SettingsUpdateRequest,
     db: Session = Depends(get_db)
 ):
@@ -218,7 +218,7 @@ async def update_settings(
 
 
 @router.post("/reset", response_model=SettingsResetResponse)
-async def reset_settings(
+def reset_settings(
     request: SettingsResetRequest,
     db: Session = Depends(get_db)
 ):
@@ -220,7 +220,7 @@ def _validate_source_url(
 
 @router.post("/validate", response_model=ValidationResponse)
 @limiter.limit("30/minute")
-async def validate_source(
+def validate_source(
     request: Request,
     source: SourceCreate,
     test_fetch: bool = False,
@@ -259,7 +259,7 @@ async def validate_source(
 
 
 @router.get("", response_model=List[SourceResponse])
-async def list_sources(
+def list_sources(
     type: Optional[str] = None,
     enabled_only: bool = False,
     db: Session = Depends(get_db)
@@ -281,7 +281,7 @@ async def list_sources(
 
 @router.post("", response_model=SourceResponse, status_code=201)
 @limiter.limit("10/minute")
-async def create_source(
+def create_source(
     request: Request,
     source: SourceCreate,
     validate: bool = False,
@@ -342,7 +342,7 @@ async def create_source(
 
 @router.post("/imap", response_model=IMAPSourceCreateResponse, status_code=201)
 @limiter.limit("10/minute")
-async def create_imap_source(
+def create_imap_source(
     request: Request,
     imap_request: IMAPSourceCreateRequest,
     db: Session = Depends(get_db)
@@ -471,7 +471,7 @@ async def create_imap_source(
 
 
 @router.get("/{source_id}", response_model=SourceResponse)
-async def get_source(
+def get_source(
     source_id: int,
     db: Session = Depends(get_db)
 ):
@@ -501,7 +501,7 @@ def _source_to_health_response(source: Source) -> SourceHealthResponse:
 
 
 @router.get("/{source_id}/health", response_model=SourceHealthResponse)
-async def get_source_health(
+def get_source_health(
     source_id: int,
     db: Session = Depends(get_db)
 ):
@@ -550,7 +550,7 @@ def _apply_source_update(
 
 
 @router.put("/{source_id}", response_model=SourceResponse)
-async def update_source(
+def update_source(
     source_id: int,
     source_update: SourceUpdate,
     db: Session = Depends(get_db)
@@ -560,7 +560,7 @@ async def update_source(
 
 
 @router.delete("/{source_id}", status_code=204)
-async def delete_source(
+def delete_source(
     source_id: int,
     db: Session = Depends(get_db)
 ):
@@ -591,7 +591,7 @@ async def delete_source(
 
 
 @router.patch("/{source_id}", response_model=SourceResponse)
-async def patch_source(
+def patch_source(
     source_id: int,
     source_update: SourceUpdate,
     db: Session = Depends(get_db)
@@ -601,7 +601,7 @@ async def patch_source(
 
 
 @router.post("/batch-delete", response_model=BatchDeleteResponse)
-async def batch_delete_sources(
+def batch_delete_sources(
     request: BatchDeleteRequest,
     db: Session = Depends(get_db)
 ):
@@ -629,7 +629,7 @@ async def batch_delete_sources(
 
 
 @router.post("/{source_id}/reset-circuit-breaker")
-async def reset_source_circuit_breaker(
+def reset_source_circuit_breaker(
     source_id: int,
     db: Session = Depends(get_db)
 ):
@@ -653,7 +653,7 @@ async def reset_source_circuit_breaker(
 
 
 @router.post("/reset-all-circuit-breakers")
-async def reset_all_circuit_breakers(
+def reset_all_circuit_breakers(
     db: Session = Depends(get_db)
 ):
     """Reset circuit breakers for all sources.
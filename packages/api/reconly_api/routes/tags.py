@@ -18,7 +18,7 @@ router = APIRouter()
 
 
 @router.get("", response_model=TagListResponse)
-async def list_tags(
+def list_tags(
     db: Session = Depends(get_db),
 ):
     """
@@ -53,7 +53,7 @@ async def list_tags(
 
 
 @router.get("/suggestions", response_model=TagSuggestionsResponse)
-async def get_tag_suggestions(
+def get_tag_suggestions(
     q: str = Query("", description="Query string for autocomplete"),
     limit: int = Query(10, ge=1, le=50, description="Maximum suggestions to return"),
     db: Session = Depends(get_db),
@@ -103,7 +103,7 @@ async def get_tag_suggestions(
 
 
 @router.delete("/unused", response_model=TagBulkDeleteResponse)
-async def delete_unused_tags(
+def delete_unused_tags(
     db: Session = Depends(get_db),
 ):
     """
@@ -131,7 +131,7 @@ async def delete_unused_tags(
 
 
 @router.delete("/{tag_id}", response_model=TagDeleteResponse)
-async def delete_tag(
+def delete_tag(
     tag_id: int,
     db: Session = Depends(get_db),
 ):
@@ -19,7 +19,7 @@ router = APIRouter()
 # ============================================================================
 
 @router.get("/prompt", response_model=List[PromptTemplateResponse])
-async def list_prompt_templates(
+def list_prompt_templates(
     system_only: bool = False,
     user_only: bool = False,
     active_only: bool = False,
@@ -52,7 +52,7 @@ async def list_prompt_templates(
 
 
 @router.post("/prompt", response_model=PromptTemplateResponse, status_code=201)
-async def create_prompt_template(
+def create_prompt_template(
     template: PromptTemplateCreate,
     db: Session = Depends(get_db)
 ):
@@ -75,7 +75,7 @@ async def create_prompt_template(
 
 
 @router.get("/prompt/{template_id}", response_model=PromptTemplateResponse)
-async def get_prompt_template(
+def get_prompt_template(
     template_id: int,
     db: Session = Depends(get_db)
 ):
@@ -87,7 +87,7 @@ async def get_prompt_template(
 
 
 @router.put("/prompt/{template_id}", response_model=PromptTemplateResponse)
-async def update_prompt_template(
+def update_prompt_template(
     template_id: int,
     template_update: PromptTemplateUpdate,
     db: Session = Depends(get_db)
@@ -107,7 +107,7 @@ async def update_prompt_template(
 
 
 @router.delete("/prompt/{template_id}", status_code=204)
-async def delete_prompt_template(
+def delete_prompt_template(
     template_id: int,
     db: Session = Depends(get_db)
 ):
@@ -122,7 +122,7 @@ async def delete_prompt_template(
 
 
 @router.patch("/prompt/{template_id}/toggle", response_model=PromptTemplateResponse)
-async def toggle_prompt_template(
+def toggle_prompt_template(
     template_id: int,
     db: Session = Depends(get_db)
 ):
@@ -138,7 +138,7 @@ async def toggle_prompt_template(
 
 
 @router.post("/prompt/batch-delete", response_model=BatchDeleteResponse)
-async def batch_delete_prompt_templates(
+def batch_delete_prompt_templates(
     request: BatchDeleteRequest,
     db: Session = Depends(get_db)
 ):
@@ -167,7 +167,7 @@ async def batch_delete_prompt_templates(
 # ============================================================================
 
 @router.get("/report", response_model=List[ReportTemplateResponse])
-async def list_report_templates(
+def list_report_templates(
     system_only: bool = False,
     user_only: bool = False,
     active_only: bool = False,
@@ -200,7 +200,7 @@ async def list_report_templates(
 
 
 @router.post("/report", response_model=ReportTemplateResponse, status_code=201)
-async def create_report_template(
+def create_report_template(
     template: ReportTemplateCreate,
     db: Session = Depends(get_db)
 ):
@@ -219,7 +219,7 @@ async def create_report_template(
 
 
 @router.get("/report/{template_id}", response_model=ReportTemplateResponse)
-async def get_report_template(
+def get_report_template(
     template_id: int,
     db: Session = Depends(get_db)
 ):
@@ -231,7 +231,7 @@ async def get_report_template(
 
 
 @router.put("/report/{template_id}", response_model=ReportTemplateResponse)
-async def update_report_template(
+def update_report_template(
     template_id: int,
     template_update: ReportTemplateUpdate,
     db: Session = Depends(get_db)
@@ -251,7 +251,7 @@ async def update_report_template(
 
 
 @router.delete("/report/{template_id}", status_code=204)
-async def delete_report_template(
+def delete_report_template(
     template_id: int,
     db: Session = Depends(get_db)
 ):
@@ -266,7 +266,7 @@ async def delete_report_template(
 
 
 @router.patch("/report/{template_id}/toggle", response_model=ReportTemplateResponse)
-async def toggle_report_template(
+def toggle_report_template(
     template_id: int,
     db: Session = Depends(get_db)
 ):
@@ -282,7 +282,7 @@ async def toggle_report_template(
 
 
 @router.post("/report/batch-delete", response_model=BatchDeleteResponse)
-async def batch_delete_report_templates(
+def batch_delete_report_templates(
     request: BatchDeleteRequest,
     db: Session = Depends(get_db)
 ):
@@ -36,15 +36,15 @@ def _run_feed(feed_id: int, feed_name: str) -> None:
     logger.info(f"Scheduler triggering feed: {feed_name} (ID: {feed_id})")
 
     try:
-        service = FeedService(database_url=settings.database_url)
-
         options = FeedRunOptions(
             triggered_by="schedule",
             enable_fallback=True,
             show_progress=False,
         )
 
-        result = service.run_feed(feed_id, options)
+        # Shares the process-wide engine; the session is closed after the run
+        with FeedService(database_url=settings.database_url) as service:
+            result = service.run_feed(feed_id, options)
 
         logger.info(
             f"Scheduled feed completed: {feed_name} - "
@@ -186,16 +186,15 @@ def sync_all_feed_schedules() -> int:
         return 0
 
     from reconly_core.database.models import Feed
-    from reconly_core.database.crud import DigestDB
+    from reconly_core.database.engine import get_session_factory
 
     try:
-        db = DigestDB(database_url=settings.database_url)
-
         # Get all enabled scheduled feeds
-        feeds = db.session.query(Feed).filter(
-            Feed.schedule_enabled == True,
-            Feed.schedule_cron != None,
-        ).all()
+        with get_session_factory(settings.database_url)() as session:
+            feeds = session.query(Feed.id, Feed.name, Feed.schedule_cron).filter(
+                Feed.schedule_enabled == True,
+                Feed.schedule_cron != None,
+            ).all()
 
         # Remove all existing feed jobs
         existing_jobs = [j for j in _scheduler.get_jobs() if j.id.startswith("feed_")]
@@ -1,5 +1,6 @@
 """Digest-related schemas."""
 from datetime import datetime
+from enum import Enum
 from typing import Optional, List
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -84,10 +85,23 @@ class DigestResponse(BaseModel):
         return super().model_dump(**kwargs)
 
 
+class DigestListView(str, Enum):
+    """Projection of digest list rows."""
+    FULL = "full"  # Full content and source items
+    SUMMARY = "summary"  # Truncated content preview, no source items
+
+
 class DigestList(BaseModel):
     """Schema for list of digests."""
-    total: int
+    total: Optional[int] = Field(
+        default=None,
+        description="Digests matching the filters (not recounted on cursor pages)"
+    )
     digests: List[DigestResponse]
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for the next page, None on the last page"
+    )
 
 
 class DigestSearch(BaseModel):
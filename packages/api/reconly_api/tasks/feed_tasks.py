@@ -32,8 +32,6 @@ def run_feed_task(
     from reconly_core.services.feed_service import FeedService, FeedRunOptions
 
     try:
-        service = FeedService(database_url=settings.database_url)
-
         options = FeedRunOptions(
             triggered_by=triggered_by,
             triggered_by_user_id=triggered_by_user_id,
@@ -42,7 +40,9 @@ def run_feed_task(
             show_progress=False,
         )
 
-        result = service.run_feed(feed_id, options)
+        # Shares the process-wide engine; the session is closed after the run
+        with FeedService(database_url=settings.database_url) as service:
+            result = service.run_feed(feed_id, options)
 
         return {
             "success": True,
@@ -66,14 +66,10 @@ def run_feed_task(
         if feed_run_id:
             try:
                 from datetime import datetime
-                from sqlalchemy import create_engine
-                from sqlalchemy.orm import sessionmaker
+                from reconly_core.database.engine import get_session_factory
                 from reconly_core.database.models import FeedRun
 
-                engine = create_engine(settings.database_url)
-                Session = sessionmaker(bind=engine)
-                session = Session()
-                try:
+                with get_session_factory(settings.database_url)() as session:
                     feed_run = session.query(FeedRun).filter(FeedRun.id == feed_run_id).first()
                     if feed_run and feed_run.status == "running":
                         feed_run.status = "failed"
@@ -81,8 +77,6 @@ def run_feed_task(
                         feed_run.error_log = str(e)
                         session.commit()
                         logger.info(f"Updated FeedRun {feed_run_id} status to 'failed'")
-                finally:
-                    session.close()
             except Exception as db_error:
                 logger.error(f"Failed to update FeedRun {feed_run_id} status: {db_error}")
 
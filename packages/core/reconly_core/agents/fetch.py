@@ -10,6 +10,8 @@ from dataclasses import dataclass
 import httpx
 from bs4 import BeautifulSoup
 
+from reconly_core.utils.http_client import DEFAULT_USER_AGENT, get_http_client
+
 logger = logging.getLogger(__name__)
 
 # Default timeout for HTTP requests (seconds)
@@ -19,7 +21,7 @@ DEFAULT_TIMEOUT = 30.0
 DEFAULT_MAX_CONTENT_LENGTH = 8000
 
 # User agent for requests
-USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+USER_AGENT = DEFAULT_USER_AGENT
 
 
 class WebFetchError(Exception):
@@ -78,60 +80,58 @@ async def web_fetch(
     logger.debug("Fetching URL", extra={"url": url, "timeout": timeout})
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers={
-                    "User-Agent": USER_AGENT,
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.5",
-                },
-                timeout=timeout,
-                follow_redirects=True,
-            )
-
-            # Handle HTTP errors with descriptive messages
-            status = response.status_code
-            error_messages = {
-                401: "Authentication required",
-                403: "Access forbidden",
-                404: "Page not found",
-                410: "Page no longer exists",
-                429: "Rate limited by server",
-            }
-
-            if status in error_messages:
-                raise WebFetchHTTPError(error_messages[status], status)
-            if status >= 500:
-                raise WebFetchHTTPError(f"Server error: {status}", status)
-
-            response.raise_for_status()
-
-            # Extract content
-            title, content = _extract_content(response.content)
-
-            # Truncate if needed
-            truncated = False
-            if len(content) > max_content_length:
-                content = content[:max_content_length]
-                truncated = True
-
-            logger.debug(
-                "Fetch completed",
-                extra={
-                    "url": url,
-                    "title": title,
-                    "content_length": len(content),
-                    "truncated": truncated,
-                },
-            )
-
-            return FetchResult(
-                url=url,
-                title=title,
-                content=content,
-                truncated=truncated,
-            )
+        response = await get_http_client().aget(
+            url,
+            headers={
+                "User-Agent": USER_AGENT,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                "Accept-Language": "en-US,en;q=0.5",
+            },
+            timeout=timeout,
+        )
+
+        # Handle HTTP errors with descriptive messages
+        status = response.status_code
+        error_messages = {
+            401: "Authentication required",
+            403: "Access forbidden",
+            404: "Page not found",
+            410: "Page no longer exists",
+            429: "Rate limited by server",
+        }
+
+        if status in error_messages:
+            raise WebFetchHTTPError(error_messages[status], status)
+        if status >= 500:
+            raise WebFetchHTTPError(f"Server error: {status}", status)
+
+        response.raise_for_status()
+
+        # Extract content
+        title, content = _extract_content(response.content)
+
+        # Truncate if needed
+        truncated = False
+        if len(content) > max_content_length:
+            content = content[:max_content_length]
+            truncated = True
+
+        logger.debug(
+            "Fetch completed",
+            extra={
+                "url": url,
+                "title": title,
+                "content_length": len(content),
+                "truncated": truncated,
+            },
+        )
+
+        return FetchResult(
+            url=url,
+            title=title,
+            content=content,
+            truncated=truncated,
+        )
 
     except httpx.TimeoutException as e:
         logger.warning("Fetch timeout", extra={"url": url})
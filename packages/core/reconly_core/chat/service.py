@@ -692,21 +692,21 @@ class ChatService:
         Returns:
             Total token count.
         """
-        total = 0
+        texts = []
         for msg in messages:
             content = msg.get("content", "") or ""
             if isinstance(content, str):
-                total += self._count_tokens(content)
+                texts.append(content)
             elif isinstance(content, list):
                 # Anthropic-style content blocks
                 for block in content:
                     if isinstance(block, dict):
                         text = block.get("text", "") or block.get("content", "")
-                        total += self._count_tokens(str(text))
-            # Add overhead for message structure
-            total += CONTEXT_MESSAGE_OVERHEAD_TOKENS
+                        texts.append(str(text))
 
-        return total
+        # Count all texts in one batch, plus overhead for message structure
+        total = sum(self.chunking_service.count_tokens_batch(texts))
+        return total + len(messages) * CONTEXT_MESSAGE_OVERHEAD_TOKENS
 
     async def _prepare_context(
         self,
@@ -351,14 +351,14 @@ def run_feed_tool() -> ToolDefinition:
         # Run the feed synchronously in a thread pool to avoid blocking
         # This mirrors how the API handles it via BackgroundTasks
         def run_feed_sync():
-            service = FeedService(database_url=database_url)
             options = FeedRunOptions(
                 triggered_by="chat",
                 triggered_by_user_id=None,
                 enable_fallback=True,
                 show_progress=False,
             )
-            return service.run_feed(feed_id, options)
+            with FeedService(database_url=database_url) as service:
+                return service.run_feed(feed_id, options)
 
         loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(None, run_feed_sync)
@@ -634,14 +634,14 @@ def search_digests_tool() -> ToolDefinition:
             if words:
                 safe_words = [w.replace("'", "''").replace("\\", "\\\\") for w in words if w]
                 if len(safe_words) == 1:
-                    tsquery_str = f"{safe_words[0]}:*"
+                    tsquery_str = f"{safe_words[0]}:*AB"
                 else:
-                    tsquery_str = " & ".join(safe_words[:-1]) + f" & {safe_words[-1]}:*"
+                    tsquery_str = " & ".join(f"{w}:AB" for w in safe_words[:-1]) + f" & {safe_words[-1]}:*AB"
 
-                fts_condition = text("""
-                    to_tsvector('english', COALESCE(title, '') || ' ' || COALESCE(summary, ''))
-                    @@ to_tsquery('english', :search_query)
-                """)
+                # Match title (A) and summary (B) lexemes of the stored, GIN-indexed vector
+                fts_condition = text(
+                    "digests.search_vector @@ to_tsquery('english', :search_query)"
+                )
                 db_query = db_query.filter(fts_condition).params(search_query=tsquery_str)
 
         total = db_query.count()
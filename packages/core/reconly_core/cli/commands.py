@@ -631,10 +631,36 @@ class CommandHandler:
             print(f"❌ Error: {str(e)}")
             return 1
 
+    def handle_rebuild_usage_rollups(self) -> int:
+        """
+        Recompute the daily LLM usage rollups from the usage log.
+
+        Returns:
+            Exit code
+        """
+        try:
+            from reconly_core.services.usage_rollup_service import UsageRollupService
+
+            db = DigestDB(database_url=self.database_url)
+            try:
+                rows = UsageRollupService(db.session).rebuild()
+                db.session.commit()
+            finally:
+                db.session.close()
+
+            print(f"✅ Rebuilt usage rollups: {rows} rows")
+            return 0
+
+        except Exception as e:
+            print(f"❌ Error: {str(e)}")
+            return 1
+
     def handle_embed_all(
         self,
         limit: Optional[int] = None,
-        include_failed: bool = False
+        include_failed: bool = False,
+        reembed_all: bool = False,
+        concurrency: Optional[int] = None,
     ) -> int:
         """
         Backfill embeddings for all unembedded digests.
@@ -642,6 +668,8 @@ class CommandHandler:
         Args:
             limit: Maximum number of digests to process (None = all)
             include_failed: Also retry previously failed embeddings
+            reembed_all: Re-embed all digests, replacing existing chunks
+            concurrency: Embedding requests in flight (None = from settings)
 
         Returns:
             Exit code
@@ -662,18 +690,25 @@ class CommandHandler:
 
             not_started = status.get('not_started', 0)
             failed = status.get('failed', 0)
+            outdated = status.get('outdated_model', 0)
 
-            to_process = not_started
+            to_process = not_started + outdated
             if include_failed:
                 to_process += failed
+            if reembed_all:
+                to_process = stats.get('total_digests', 0)
 
             if to_process == 0:
                 print("✅ All digests are already embedded!")
                 return 0
 
             print(f"   Digests without embeddings: {not_started}")
+            if outdated:
+                print(f"   Digests embedded with another model: {outdated}")
             if include_failed:
                 print(f"   Previously failed digests: {failed}")
+            if reembed_all:
+                print("   Re-embedding all digests")
             print(f"   Total to process: {to_process}")
             if limit:
                 print(f"   Limit: {limit}")
@@ -689,10 +724,12 @@ class CommandHandler:
             loop = asyncio.new_event_loop()
             try:
                 results = loop.run_until_complete(
-                    service.embed_unembedded_digests(
+                    service.backfill_digests(
                         limit=limit,
                         include_failed=include_failed,
+                        reembed_all=reembed_all,
                         progress_callback=progress_callback,
+                        concurrency=concurrency,
                     )
                 )
                 db.session.commit()
@@ -743,6 +780,7 @@ class CommandHandler:
             print(f"      Pending: {status.get('pending', 0)}")
             print(f"      Failed: {status.get('failed', 0)}")
             print(f"      Not started: {status.get('not_started', 0)}")
+            print(f"      Outdated model: {status.get('outdated_model', 0)}")
 
             print("\n   Chunks:")
             print(f"      Total chunks: {stats['total_chunks']}")
@@ -55,6 +55,7 @@ def main():
     mode_group.add_argument('--sources', action='store_true', help='List all sources in database')
     mode_group.add_argument('--feeds', action='store_true', help='List all feeds in database')
     mode_group.add_argument('--run-feed', metavar='FEED_ID', type=int, help='Run a specific feed by ID')
+    mode_group.add_argument('--rebuild-usage-rollups', action='store_true', help='Recompute daily LLM usage rollups from the usage log')
     # RAG embedding commands
     mode_group.add_argument('--embed-all', action='store_true', help='Backfill embeddings for all unembedded digests')
     mode_group.add_argument('--embed-stats', action='store_true', help='Show embedding statistics')
@@ -174,6 +175,16 @@ def main():
         action='store_true',
         help='Also retry previously failed embeddings (for --embed-all)'
     )
+    parser.add_argument(
+        '--embed-reembed-all',
+        action='store_true',
+        help='Re-embed everything, e.g. after changing the embedding model (for --embed-all)'
+    )
+    parser.add_argument(
+        '--embed-concurrency',
+        type=int,
+        help='Embedding requests in flight (for --embed-all, default: embedding.backfill_concurrency)'
+    )
 
     # RAG graph rebuild options
     parser.add_argument(
@@ -320,11 +331,16 @@ def main():
                 enable_fallback=not args.no_fallback
             )
 
+        elif args.rebuild_usage_rollups:
+            return handler.handle_rebuild_usage_rollups()
+
         # RAG embedding commands
         elif args.embed_all:
             return handler.handle_embed_all(
                 limit=args.embed_limit,
-                include_failed=args.embed_retry_failed
+                include_failed=args.embed_retry_failed,
+                reembed_all=args.embed_reembed_all,
+                concurrency=args.embed_concurrency,
             )
 
         elif args.embed_stats:
@@ -358,6 +374,8 @@ def main():
             return rag_handler.handle_embed_source_content(
                 limit=args.embed_limit,
                 include_failed=args.embed_retry_failed,
+                reembed_all=args.embed_reembed_all,
+                concurrency=args.embed_concurrency,
             )
 
         elif args.rag_graph_stats:
@@ -74,12 +74,12 @@ class RAGCommandHandler:
                 print(f"   Deleted {deleted} existing relationships")
 
             # Get digests to process
-            query = db.session.query(Digest).order_by(Digest.id)
+            query = db.session.query(Digest.id).order_by(Digest.id)
             if limit:
                 query = query.limit(limit)
 
-            digests = query.all()
-            total = len(digests)
+            digest_ids = [digest_id for (digest_id,) in query.all()]
+            total = len(digest_ids)
 
             if total == 0:
                 print("\n   No digests found in database")
@@ -106,7 +106,7 @@ class RAGCommandHandler:
                 tag_threshold=tag_threshold,
             )
 
-            # Process digests in batches
+            # Process digests in batches (one set-based pass per batch)
             processed = 0
             total_relationships = 0
             errors = 0
@@ -115,39 +115,32 @@ class RAGCommandHandler:
 
             loop = asyncio.new_event_loop()
             try:
-                for i, digest in enumerate(digests):
+                for start in range(0, total, batch_size):
+                    batch = digest_ids[start:start + batch_size]
+                    print(f"   [{start + len(batch)}/{total}] Digests {batch[0]}-{batch[-1]}...", end=" ")
                     try:
-                        title = digest.title[:40] if digest.title else f"Digest {digest.id}"
-                        print(f"   [{i + 1}/{total}] {title}...", end=" ")
-
-                        # Compute relationships
                         count = loop.run_until_complete(
-                            graph_service.compute_relationships(
-                                digest_id=digest.id,
+                            graph_service.compute_relationships_batch(
+                                batch,
                                 include_semantic=True,
                                 include_tags=include_tag_relationships,
                                 include_source=include_source_relationships,
                                 chunk_source=chunk_source,
+                                batch_size=batch_size,
                             )
                         )
+                        db.session.commit()
                         total_relationships += count
-                        processed += 1
+                        processed += len(batch)
                         print(f"{count} relationships")
 
-                        # Commit after each batch
-                        if (i + 1) % batch_size == 0:
-                            db.session.commit()
-                            print(f"   [Committed batch, {processed} digests processed]")
-
                     except Exception as e:
-                        errors += 1
+                        db.session.rollback()
+                        errors += len(batch)
                         print(f"ERROR: {e}")
-                        logger.error(f"Error processing digest {digest.id}: {e}")
+                        logger.error(f"Error processing digests {batch[0]}-{batch[-1]}: {e}")
                         continue
 
-                # Final commit
-                db.session.commit()
-
             finally:
                 loop.close()
 
@@ -350,6 +343,8 @@ class RAGCommandHandler:
         self,
         limit: Optional[int] = None,
         include_failed: bool = False,
+        reembed_all: bool = False,
+        concurrency: Optional[int] = None,
     ) -> int:
         """
         Embed source content that hasn't been embedded yet.
@@ -359,6 +354,8 @@ class RAGCommandHandler:
         Args:
             limit: Maximum number of source contents to process
             include_failed: Also retry previously failed embeddings
+            reembed_all: Re-embed all source content, replacing existing chunks
+            concurrency: Embedding requests in flight (None = from settings)
 
         Returns:
             Exit code (0 for success, 1 for error)
@@ -378,18 +375,25 @@ class RAGCommandHandler:
 
             not_started = status.get('not_started', 0)
             failed = status.get('failed', 0)
+            outdated = status.get('outdated_model', 0)
 
-            to_process = not_started
+            to_process = not_started + outdated
             if include_failed:
                 to_process += failed
+            if reembed_all:
+                to_process = source_stats.get('total_source_contents', 0)
 
             if to_process == 0:
                 print("   All source content is already embedded!")
                 return 0
 
             print(f"   Source content without embeddings: {not_started}")
+            if outdated:
+                print(f"   Source content embedded with another model: {outdated}")
             if include_failed:
                 print(f"   Previously failed: {failed}")
+            if reembed_all:
+                print("   Re-embedding all source content")
             print(f"   Total to process: {to_process}")
             if limit:
                 print(f"   Limit: {limit}")
@@ -404,10 +408,12 @@ class RAGCommandHandler:
             loop = asyncio.new_event_loop()
             try:
                 results = loop.run_until_complete(
-                    service.embed_unembedded_source_contents(
+                    service.backfill_source_contents(
                         limit=limit,
                         include_failed=include_failed,
+                        reembed_all=reembed_all,
                         progress_callback=progress_callback,
+                        concurrency=concurrency,
                     )
                 )
                 db.session.commit()
@@ -496,6 +502,7 @@ class RAGCommandHandler:
             print(f"      Pending: {status.get('pending', 0)}")
             print(f"      Failed: {status.get('failed', 0)}")
             print(f"      Not started: {status.get('not_started', 0)}")
+            print(f"      Outdated model: {status.get('outdated_model', 0)}")
 
             print("\n   Chunks:")
             print(f"      Total chunks: {source_stats.get('total_chunks', 0)}")
@@ -1,5 +1,11 @@
 """Database package exports."""
 from reconly_core.database.crud import DigestDB
+from reconly_core.database.engine import (
+    get_shared_engine,
+    get_session_factory,
+    dispose_shared_engines,
+)
+from reconly_core.database.invalidation import invalidate_on_commit
 from reconly_core.database.models import (
     Base,
     User,
@@ -53,6 +59,12 @@ __all__ = [
     'EmbeddingStatus',
     # CRUD
     'DigestDB',
+    # Engines
+    'get_shared_engine',
+    'get_session_factory',
+    'dispose_shared_engines',
+    # Cache invalidation
+    'invalidate_on_commit',
     # Seeding
     'seed_default_templates',
     'get_default_prompt_template',
@@ -4,10 +4,11 @@ import logging
 import os
 from datetime import datetime
 from typing import List, Optional, Dict
-from sqlalchemy import create_engine, or_, desc
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import or_, desc
+from sqlalchemy.orm import Session
 
-from reconly_core.database.models import Base, Digest, Tag, DigestTag
+from reconly_core.database.engine import ensure_schema, get_session_factory
+from reconly_core.database.models import Digest, Tag, DigestTag
 
 logger = logging.getLogger(__name__)
 
@@ -36,10 +37,8 @@ class DigestDB:
                 database_url = os.getenv('DATABASE_URL', DEFAULT_DATABASE_URL)
 
             self.database_url = database_url
-            engine = create_engine(database_url, echo=False)
-            Base.metadata.create_all(engine)
-            SessionLocal = sessionmaker(bind=engine)
-            self.session = SessionLocal()
+            ensure_schema(database_url)
+            self.session = get_session_factory(database_url)()
 
     def create_digest(
         self,
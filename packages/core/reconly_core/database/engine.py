@@ -0,0 +1,113 @@
+"""Process-wide database engines.
+
+An engine owns a connection pool and is expensive to build, so everything
+that connects by URL (FeedService, DigestDB, scheduler jobs, task runners,
+the MCP server) shares one engine per database URL instead of creating a
+new engine, and new connections, for every service instance.
+
+Example:
+    >>> from reconly_core.database.engine import get_session_factory
+    >>> SessionLocal = get_session_factory("postgresql://localhost/reconly")
+    >>> with SessionLocal() as session:
+    ...     feeds = session.query(Feed).all()
+"""
+import threading
+from typing import Any, Dict, Set
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from reconly_core.database.models import Base
+from reconly_core.logging import get_logger
+
+logger = get_logger(__name__)
+
+_lock = threading.Lock()
+_engines: Dict[str, Engine] = {}
+_engine_options: Dict[str, Dict[str, Any]] = {}
+_session_factories: Dict[str, sessionmaker] = {}
+_schema_checked: Set[str] = set()
+
+
+def get_shared_engine(database_url: str, **engine_options: Any) -> Engine:
+    """Get the engine for a database URL, creating it on first use.
+
+    Args:
+        database_url: Database connection URL
+        **engine_options: Passed to create_engine() (pool_size, max_overflow, ...).
+            Only used by the call that creates the engine; later calls
+            passing different options log a warning and get the existing engine.
+
+    Returns:
+        The process-wide engine for this URL
+    """
+    engine = _engines.get(database_url)
+    if engine is None:
+        with _lock:
+            engine = _engines.get(database_url)
+            if engine is None:
+                engine_options.setdefault("pool_pre_ping", True)
+                engine = create_engine(database_url, **engine_options)
+                _engines[database_url] = engine
+                _engine_options[database_url] = dict(engine_options)
+                return engine
+
+    registered = _engine_options.get(database_url, {})
+    ignored = sorted(
+        key for key, value in engine_options.items()
+        if key not in registered or registered[key] != value
+    )
+    if ignored:
+        logger.warning(
+            "Shared engine already exists, ignoring engine options",
+            database_url=engine.url.render_as_string(hide_password=True),
+            ignored=ignored,
+        )
+    return engine
+
+
+def get_session_factory(database_url: str) -> sessionmaker:
+    """Get a session factory bound to the shared engine for a database URL.
+
+    Args:
+        database_url: Database connection URL
+
+    Returns:
+        sessionmaker for the shared engine
+    """
+    factory = _session_factories.get(database_url)
+    if factory is None:
+        engine = get_shared_engine(database_url)
+        with _lock:
+            factory = _session_factories.get(database_url)
+            if factory is None:
+                factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+                _session_factories[database_url] = factory
+    return factory
+
+
+def ensure_schema(database_url: str) -> None:
+    """Create missing tables once per process (standalone CLI convenience).
+
+    The schema is managed by Alembic migrations; this only fills in tables
+    for databases that were never migrated.
+
+    Args:
+        database_url: Database connection URL
+    """
+    if database_url in _schema_checked:
+        return
+    Base.metadata.create_all(get_shared_engine(database_url))
+    _schema_checked.add(database_url)
+
+
+def dispose_shared_engines() -> None:
+    """Close the pooled connections of every shared engine (e.g. on shutdown).
+
+    The engines stay registered and open new connections if used again.
+    """
+    with _lock:
+        engines = list(_engines.values())
+    for engine in engines:
+        engine.dispose()
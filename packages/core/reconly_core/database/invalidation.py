@@ -0,0 +1,98 @@
+"""Invalidate in-process caches when writes to given tables are committed.
+
+Caches of values derived from the database (dashboard aggregates, digest
+graphs) register the tables they read and a callback that drops their
+entries. A session remembers which registrations its flushes and bulk
+statements touched, and runs their callbacks once its root transaction
+commits:
+
+- a released SAVEPOINT does not invalidate anything, since its writes are
+  not visible to other sessions until the outer transaction commits
+- a rolled-back SAVEPOINT keeps what earlier writes recorded, so the outer
+  commit still invalidates (possibly once more than strictly needed)
+- a rolled-back or closed root transaction forgets its writes
+
+Example:
+    >>> invalidate_on_commit({'digests', 'sources'}, cache.clear)
+"""
+from typing import Callable, Iterable, List, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# session.info key holding the registrations written to in the current transaction
+_PENDING_KEY = 'invalidate_on_commit'
+
+
+class _Registration:
+    """Tables a cache reads and the callback that drops its entries."""
+
+    def __init__(self, tables: Iterable[str], callback: Callable[[], None], text_statements: bool):
+        self.tables = frozenset(tables)
+        self.callback = callback
+        self.text_statements = text_statements
+
+
+_registrations: List[_Registration] = []
+
+
+def invalidate_on_commit(
+    tables: Iterable[str],
+    callback: Callable[[], None],
+    *,
+    text_statements: bool = True,
+) -> None:
+    """Call callback after any session commits a write to one of the tables.
+
+    Args:
+        tables: Names of the tables the cache reads
+        callback: Drops the cached values; called once per committing session
+        text_statements: Whether textual SQL (which names no table) counts
+            as a write. Disable it for caches whose own reads use text().
+    """
+    _registrations.append(_Registration(tables, callback, text_statements))
+
+
+def _pending(session: Session) -> Set[_Registration]:
+    return session.info.setdefault(_PENDING_KEY, set())
+
+
+@event.listens_for(Session, 'after_flush')
+def _record_flushed_writes(session, flush_context):
+    """Remember ORM inserts/updates/deletes until the root transaction ends."""
+    written = {
+        getattr(obj, '__tablename__', None)
+        for instances in (session.new, session.dirty, session.deleted)
+        for obj in instances
+    }
+    for registration in _registrations:
+        if registration.tables & written:
+            _pending(session).add(registration)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _record_bulk_writes(orm_execute_state):
+    """Remember bulk query().update()/delete(), insert() and text statements."""
+    if orm_execute_state.is_select:
+        return
+    table = getattr(orm_execute_state.statement, 'table', None)
+    for registration in _registrations:
+        if registration.text_statements if table is None else table.name in registration.tables:
+            _pending(orm_execute_state.session).add(registration)
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_committed_writes(session):
+    """Run the callbacks of written registrations once the root transaction commits."""
+    # after_commit also fires when a SAVEPOINT is released
+    if session.in_nested_transaction():
+        return
+    for registration in session.info.pop(_PENDING_KEY, ()):
+        registration.callback()
+
+
+@event.listens_for(Session, 'after_transaction_end')
+def _forget_uncommitted_writes(session, transaction):
+    """Drop recorded writes when the root transaction rolls back or closes."""
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
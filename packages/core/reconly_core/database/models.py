@@ -11,6 +11,8 @@ ReportTemplate    → Output rendering templates
 FeedRun           → Execution history for feeds
 Digest            → Processed content output (existing)
 LLMUsageLog       → Per-request LLM usage tracking for billing
+SummaryCacheEntry → Content-addressed cache of LLM summaries
+FeedTrackingState → Incremental fetch state per feed URL
 ChatConversation  → LLM chat conversation metadata
 ChatMessage       → Individual messages in chat conversations
 
@@ -24,10 +26,11 @@ from typing import Literal
 
 from jinja2 import Template
 from sqlalchemy import (
-    Column, Integer, String, Text, Float, DateTime, Boolean, JSON,
-    ForeignKey, Index
+    Column, Integer, BigInteger, String, Text, Float, Date, DateTime, Boolean, JSON,
+    ForeignKey, Index, Computed, text
 )
-from sqlalchemy.orm import DeclarativeBase, relationship, backref
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import DeclarativeBase, relationship, backref, deferred
 from pgvector.sqlalchemy import Vector
 
 # Template origin types:
@@ -43,6 +46,19 @@ TemplateOrigin = Literal["builtin", "user", "imported"]
 # - 'failed': Embedding failed
 EmbeddingStatus = Literal["pending", "completed", "failed"]
 
+# Stored full-text search vectors, generated by PostgreSQL on every write.
+# Weights: A = title, B = summary, C = content. See rag/search/fts.py.
+SEARCH_TS_CONFIG = 'english'
+DIGEST_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', COALESCE(title, '')), 'A') || "
+    "setweight(to_tsvector('english', COALESCE(summary, '')), 'B') || "
+    "setweight(to_tsvector('english', COALESCE(content, '')), 'C')"
+)
+CHUNK_SEARCH_VECTOR_SQL = "to_tsvector('english', COALESCE(text, ''))"
+
+# Vector dimension matching BGE-M3 default
+VECTOR_DIMENSION = 1024
+
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
@@ -688,7 +704,7 @@ class LLMUsageLog(Base):
     # Context references
     user_id = Column(Integer, ForeignKey('users.id', ondelete='SET NULL'), nullable=True, index=True)
     feed_run_id = Column(Integer, ForeignKey('feed_runs.id', ondelete='SET NULL'), nullable=True, index=True)
-    digest_id = Column(Integer, ForeignKey('digests.id', ondelete='SET NULL'), nullable=True)
+    digest_id = Column(Integer, ForeignKey('digests.id', ondelete='SET NULL'), nullable=True, index=True)
 
     # Provider/Model info
     provider = Column(String(100), nullable=False, index=True)
@@ -741,6 +757,60 @@ class LLMUsageLog(Base):
         }
 
 
+class LLMUsageRollup(Base):
+    """
+    Daily LLM usage totals per feed, provider and model.
+
+    Pre-aggregated from llm_usage_logs so dashboard and analytics endpoints
+    read a few rows per day instead of scanning the usage log. Rows for a
+    feed's days are recomputed when one of its runs finishes. See
+    services/usage_rollup_service.py.
+
+    feed_id has no foreign key: rows of deleted feeds keep counting toward
+    the provider and daily totals, like their usage log rows do.
+    """
+    __tablename__ = 'llm_usage_daily_rollups'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    day = Column(Date, nullable=False, index=True)  # UTC date of the usage
+    feed_id = Column(Integer, nullable=True, index=True)  # NULL = usage outside a feed run
+
+    # Provider/Model info
+    provider = Column(String(100), nullable=False)
+    model = Column(String(100), nullable=False)
+
+    # Usage totals for the day
+    requests = Column(Integer, default=0, nullable=False)
+    tokens_in = Column(BigInteger, default=0, nullable=False)
+    tokens_out = Column(BigInteger, default=0, nullable=False)
+    cost = Column(Float, default=0.0, nullable=False)
+
+    # One row per day, feed, provider and model (upsert target)
+    __table_args__ = (
+        Index(
+            'ux_llm_usage_daily_rollups_key',
+            'day', text('COALESCE(feed_id, 0)'), 'provider', 'model',
+            unique=True,
+        ),
+    )
+
+    def __repr__(self):
+        return f"<LLMUsageRollup(day={self.day}, feed_id={self.feed_id}, provider='{self.provider}', model='{self.model}')>"
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'day': self.day.isoformat() if self.day else None,
+            'feed_id': self.feed_id,
+            'provider': self.provider,
+            'model': self.model,
+            'requests': self.requests,
+            'tokens_in': self.tokens_in,
+            'tokens_out': self.tokens_out,
+            'cost': self.cost,
+        }
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # DIGEST (existing, updated with feed_run_id)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -787,6 +857,14 @@ class Digest(Base):
     embedding_status = Column(String(20), nullable=True, index=True)
     embedding_error = Column(Text, nullable=True)  # Error message if embedding failed
 
+    # Weighted full-text search vector (generated; deferred so it is only loaded on demand)
+    search_vector = deferred(Column(TSVECTOR, Computed(DIGEST_SEARCH_VECTOR_SQL, persisted=True)))
+
+    # Mean of the digest's chunk embeddings (digest chunks / source content chunks),
+    # maintained by EmbeddingService for digest-level similarity (HNSW-indexed)
+    centroid_embedding = deferred(Column(Vector(VECTOR_DIMENSION), nullable=True))
+    source_centroid_embedding = deferred(Column(Vector(VECTOR_DIMENSION), nullable=True))
+
     # Foreign keys
     user_id = Column(Integer, ForeignKey('users.id', ondelete='SET NULL'), nullable=True, index=True)
     feed_run_id = Column(Integer, ForeignKey('feed_runs.id', ondelete='SET NULL'), nullable=True, index=True)
@@ -812,6 +890,12 @@ class Digest(Base):
                                            back_populates='target_digest',
                                            cascade='all, delete-orphan')
 
+    __table_args__ = (
+        Index('ix_digests_search_vector', 'search_vector', postgresql_using='gin'),
+        # Keyset pagination of digest lists (newest first)
+        Index('ix_digests_created_at_id', 'created_at', 'id'),
+    )
+
     def __repr__(self):
         return f"<Digest(id={self.id}, title='{self.title[:50] if self.title else ''}...', source={self.source_type})>"
 
@@ -1016,10 +1100,6 @@ class SourceContent(Base):
 # SOURCE CONTENT CHUNK (RAG Knowledge System - Chunked Source Content)
 # ═══════════════════════════════════════════════════════════════════════════════
 
-# Vector dimension matching BGE-M3 default
-VECTOR_DIMENSION = 1024
-
-
 class SourceContentChunk(Base):
     """
     Stores embedded text chunks from original source content for RAG retrieval.
@@ -1046,11 +1126,25 @@ class SourceContentChunk(Base):
     # Vector embedding using pgvector for efficient similarity search
     embedding = Column(Vector(VECTOR_DIMENSION), nullable=True)
 
+    # Full-text search vector (generated; deferred so it is only loaded on demand)
+    search_vector = deferred(Column(TSVECTOR, Computed(CHUNK_SEARCH_VECTOR_SQL, persisted=True)))
+
+    # SHA-256 of the text and the "provider:model" that embedded it, so
+    # re-embedding can reuse vectors of unchanged chunks (set by EmbeddingService)
+    text_hash = Column(String(64), nullable=True)
+    embedding_model = Column(String(255), nullable=True)
+
     token_count = Column(Integer, nullable=False)
     start_char = Column(Integer, nullable=False)  # Character offset in original content
     end_char = Column(Integer, nullable=False)
     extra_data = Column(JSON, nullable=True)  # {"heading": "...", "section": "..."}
 
+    # Denormalized digest attributes so vector search filters stay on the chunk
+    # table and can be combined with the HNSW index (set by EmbeddingService)
+    feed_id = Column(Integer, nullable=True)
+    source_id = Column(Integer, nullable=True)
+    digest_created_at = Column(DateTime, nullable=True)
+
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
@@ -1059,6 +1153,11 @@ class SourceContentChunk(Base):
     # Indexes - composite index for efficient chunk lookup, HNSW index for vector search
     __table_args__ = (
         Index('ix_source_content_chunks_content_chunk', 'source_content_id', 'chunk_index'),
+        Index('ix_source_content_chunks_search_vector', 'search_vector', postgresql_using='gin'),
+        Index('ix_source_content_chunks_feed_created', 'feed_id', 'digest_created_at'),
+        Index('ix_source_content_chunks_source_created', 'source_id', 'digest_created_at'),
+        Index('ix_source_content_chunks_digest_created_at', 'digest_created_at'),
+        Index('ix_source_content_chunks_embedding_model', 'embedding_model'),
     )
 
     def __repr__(self):
@@ -1105,11 +1204,25 @@ class DigestChunk(Base):
     # Vector embedding using pgvector for efficient similarity search
     embedding = Column(Vector(VECTOR_DIMENSION), nullable=True)
 
+    # Full-text search vector (generated; deferred so it is only loaded on demand)
+    search_vector = deferred(Column(TSVECTOR, Computed(CHUNK_SEARCH_VECTOR_SQL, persisted=True)))
+
+    # SHA-256 of the text and the "provider:model" that embedded it, so
+    # re-embedding can reuse vectors of unchanged chunks (set by EmbeddingService)
+    text_hash = Column(String(64), nullable=True)
+    embedding_model = Column(String(255), nullable=True)
+
     token_count = Column(Integer, nullable=False)
     start_char = Column(Integer, nullable=False)  # Character offset in original text
     end_char = Column(Integer, nullable=False)
     extra_data = Column(JSON, nullable=True)  # {"heading": "...", "section": "..."}
 
+    # Denormalized digest attributes so vector search filters stay on the chunk
+    # table and can be combined with the HNSW index (set by EmbeddingService)
+    feed_id = Column(Integer, nullable=True)
+    source_id = Column(Integer, nullable=True)
+    digest_created_at = Column(DateTime, nullable=True)
+
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Relationships
@@ -1118,6 +1231,11 @@ class DigestChunk(Base):
     # Indexes
     __table_args__ = (
         Index('ix_digest_chunks_digest_chunk', 'digest_id', 'chunk_index'),
+        Index('ix_digest_chunks_search_vector', 'search_vector', postgresql_using='gin'),
+        Index('ix_digest_chunks_feed_created', 'feed_id', 'digest_created_at'),
+        Index('ix_digest_chunks_source_created', 'source_id', 'digest_created_at'),
+        Index('ix_digest_chunks_digest_created_at', 'digest_created_at'),
+        Index('ix_digest_chunks_embedding_model', 'embedding_model'),
     )
 
     def __repr__(self):
@@ -1175,6 +1293,9 @@ class DigestRelationship(Base):
     __table_args__ = (
         Index('ix_digest_relationships_source_type', 'source_digest_id', 'relationship_type'),
         Index('ix_digest_relationships_type_score', 'relationship_type', 'score'),
+        # One edge per (source, target, type); lets bulk writes use ON CONFLICT DO NOTHING
+        Index('ix_digest_relationships_edge', 'source_digest_id', 'target_digest_id',
+              'relationship_type', unique=True),
     )
 
     def __repr__(self):
@@ -1192,6 +1313,125 @@ class DigestRelationship(Base):
         }
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# RAG INDEX JOB (Background Embedding Queue)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class RAGIndexJob(Base):
+    """
+    Pending RAG indexing work for one digest.
+
+    Feed runs enqueue the IDs of new digests; background workers embed the
+    digest and its source content and compute graph relationships. There is
+    at most one job per digest, so repeated enqueues coalesce. Jobs are
+    deleted once indexed. See rag/index_queue.py.
+
+    Status values:
+    - 'pending': Waiting for a worker (or for its retry time, available_at)
+    - 'running': Claimed by a worker (locked_at)
+    - 'failed': Gave up after max attempts
+    """
+    __tablename__ = 'rag_index_jobs'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    digest_id = Column(
+        Integer, ForeignKey('digests.id', ondelete='CASCADE'), nullable=False, unique=True, index=True
+    )
+    status = Column(String(20), default='pending', nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+
+    available_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # Earliest next attempt
+    locked_at = Column(DateTime, nullable=True)  # When a worker claimed the job
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index('ix_rag_index_jobs_status_available', 'status', 'available_at'),
+    )
+
+    def __repr__(self):
+        return f"<RAGIndexJob(id={self.id}, digest_id={self.digest_id}, status='{self.status}', attempts={self.attempts})>"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SUMMARY CACHE (Content-Addressed LLM Output)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class SummaryCacheEntry(Base):
+    """
+    Cached LLM summary keyed on content, model and prompts.
+
+    cache_key is the SHA-256 of (content hash, provider, model, language,
+    system prompt hash, user prompt hash), so the same content summarized
+    with the same model and template reuses the stored summary regardless
+    of the URL it was fetched from. See services/summary_cache.py.
+    """
+    __tablename__ = 'summary_cache'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    cache_key = Column(String(64), nullable=False, unique=True, index=True)
+    content_hash = Column(String(64), nullable=False, index=True)  # SHA-256 of summarized content
+
+    # Model that produced the summary
+    provider = Column(String(100), nullable=False)
+    model = Column(String(100), nullable=False)
+    language = Column(String(10), nullable=True)
+
+    # LLM output
+    summary = Column(Text, nullable=False)
+    title = Column(Text, nullable=True)  # LLM-extracted title, if any
+
+    # Usage tracking for TTL/LRU eviction
+    hit_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_hit_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<SummaryCacheEntry(id={self.id}, provider='{self.provider}', model='{self.model}', hits={self.hit_count})>"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# FEED TRACKING STATE (Incremental Fetch State)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+class FeedTrackingState(Base):
+    """
+    Incremental fetch state for one feed URL.
+
+    Replaces the whole-file rewrite of data/processed_feeds.json with one row
+    per URL, so concurrent feed runs only touch the rows of their own sources.
+    Also stores HTTP validators for conditional requests. See
+    tracking.DBFeedTracker.
+    """
+    __tablename__ = 'feed_tracking_state'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    feed_url = Column(String(2048), nullable=False, unique=True, index=True)
+
+    # Newest item timestamp seen for this feed
+    last_read = Column(DateTime, nullable=True)
+
+    # HTTP validators from the last response (conditional GET)
+    etag = Column(String(255), nullable=True)
+    last_modified = Column(String(100), nullable=True)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<FeedTrackingState(id={self.id}, feed_url='{self.feed_url}')>"
+
+    def to_dict(self):
+        return {
+            'last_read': self.last_read.isoformat() if self.last_read else None,
+            'etag': self.etag,
+            'last_modified': self.last_modified,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # OAUTH CREDENTIAL (Email OAuth2 Token Storage)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -2,10 +2,17 @@
 
 This module defines the abstract base class for all digest exporters.
 Exporters transform Digest objects into various output formats (JSON, CSV, Markdown, etc.).
+
+Exporters can stream: export_stream() yields the output piece by piece so
+large exports never hold the whole file in memory, and export_to_path()
+implementations write one-file-per-digest exports in parallel batches via
+_write_files().
 """
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Union
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Iterable, Iterator, List, Optional, Union
 
 from reconly_core.config_types import ConfigField, ComponentConfigSchema
 
@@ -16,6 +23,12 @@ if TYPE_CHECKING:
 # Re-export ConfigField for backwards compatibility
 __all__ = ["ConfigField", "ExporterConfigSchema", "ExportToPathResult", "ExportResult", "BaseExporter"]
 
+# Files rendered before their writes are awaited in export_to_path()
+EXPORT_WRITE_BATCH_SIZE = 100
+
+# Threads writing files in parallel in export_to_path()
+EXPORT_WRITE_WORKERS = 8
+
 
 @dataclass
 class ExporterConfigSchema(ComponentConfigSchema):
@@ -125,6 +138,36 @@ class BaseExporter(ABC):
         """
         pass
 
+    def export_stream(
+        self,
+        digests: Iterable[Any],
+        config: Dict[str, Any] = None
+    ) -> Iterator[Union[str, bytes]]:
+        """
+        Export digests to this format piece by piece.
+
+        Override this method in subclasses that can write incrementally.
+        The default implementation collects all digests and yields the
+        result of export() at once.
+
+        Args:
+            digests: Iterable of Digest model instances (e.g. a yield_per query)
+            config: Optional export configuration (format-specific options)
+
+        Yields:
+            Consecutive parts of the exported content
+        """
+        yield self.export(list(digests), config).content
+
+    def get_stream_filename(self) -> str:
+        """
+        Get the download filename for export_stream() output.
+
+        Returns:
+            Filename (e.g., 'digests.json')
+        """
+        return f"digests.{self.get_file_extension()}"
+
     @abstractmethod
     def get_format_name(self) -> str:
         """
@@ -204,3 +247,78 @@ class BaseExporter(ABC):
             f"{self.__class__.__name__} does not support direct file export. "
             f"Use export() method instead."
         )
+
+    def _write_files(
+        self,
+        directory: Path,
+        digests: Iterable[Any],
+        filename_for: Callable[[Any], str],
+        render: Callable[[Any], str],
+    ) -> tuple[List[str], int, List[Dict[str, str]]]:
+        """
+        Write one file per digest, in parallel batches.
+
+        Digests are rendered on the calling thread (they may lazy-load from
+        the database); the file writes of each batch of EXPORT_WRITE_BATCH_SIZE
+        files run on EXPORT_WRITE_WORKERS threads. Files that already exist,
+        or whose name was already used in this export, are skipped.
+
+        Args:
+            directory: Directory to write files to
+            digests: Iterable of Digest model instances
+            filename_for: Returns the filename for a digest
+            render: Returns the file content for a digest
+
+        Returns:
+            Tuple of (written filenames, skipped count, errors)
+        """
+        written: List[str] = []
+        skipped = 0
+        errors: List[Dict[str, str]] = []
+        seen: set = set()
+
+        def write(filepath: Path, content: str) -> None:
+            with open(filepath, 'w', encoding='utf-8', newline='') as f:
+                f.write(content)
+
+        def drain(batch: list) -> None:
+            for filename, future in batch:
+                try:
+                    future.result()
+                    written.append(filename)
+                except Exception as e:
+                    errors.append({"file": filename, "error": str(e)})
+            batch.clear()
+
+        with ThreadPoolExecutor(max_workers=EXPORT_WRITE_WORKERS) as pool:
+            batch: list = []
+            for digest in digests:
+                filename = filename_for(digest)
+                filepath = directory / filename
+                # Skip if file already exists
+                if filename in seen or filepath.exists():
+                    skipped += 1
+                    continue
+                seen.add(filename)
+                try:
+                    content = render(digest)
+                except Exception as e:
+                    errors.append({"file": filename, "error": str(e)})
+                    continue
+                batch.append((filename, pool.submit(write, filepath, content)))
+                if len(batch) >= EXPORT_WRITE_BATCH_SIZE:
+                    drain(batch)
+            drain(batch)
+
+        return written, skipped, errors
+
+    def _write_stream(
+        self,
+        filepath: Path,
+        digests: Iterable[Any],
+        config: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Write the export_stream() output for all digests to a single file."""
+        with open(filepath, 'w', encoding='utf-8', newline='') as f:
+            for part in self.export_stream(digests, config):
+                f.write(part)
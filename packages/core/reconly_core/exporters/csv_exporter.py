@@ -3,7 +3,7 @@ import csv
 from datetime import date
 from io import StringIO
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from reconly_core.exporters.base import (
     BaseExporter,
@@ -61,31 +61,60 @@ class CSVExporter(BaseExporter):
         Returns:
             ExportResult with CSV content
         """
-        config = config or {}
-        include_content = config.get('include_content', False)
-        fieldnames = config.get('fields', EXTENDED_FIELDS if include_content else DEFAULT_FIELDS)
-
-        output = StringIO()
-
-        if digests:
-            writer = csv.DictWriter(output, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for digest in digests:
-                digest_dict = digest.to_dict()
-                row = {k: digest_dict.get(k, '') for k in fieldnames}
-                # Format tags as comma-separated string for CSV
-                if 'tags' in row and isinstance(row['tags'], list):
-                    row['tags'] = ', '.join(row['tags'])
-                writer.writerow(row)
-
         return ExportResult(
-            content=output.getvalue(),
+            content=''.join(self.export_stream(digests, config)),
             filename='digests.csv',
             content_type=self.get_content_type(),
             digest_count=len(digests)
         )
 
+    def export_stream(
+        self,
+        digests: Iterable[Any],
+        config: Dict[str, Any] = None
+    ) -> Iterator[str]:
+        """
+        Export digests to CSV one row at a time.
+
+        Args:
+            digests: Iterable of Digest model instances
+            config: Optional config with 'fields' and 'include_content' keys
+
+        Yields:
+            The header line, then one line per digest (nothing if no digests)
+        """
+        config = config or {}
+        include_content = config.get('include_content', False)
+        fieldnames = config.get('fields', EXTENDED_FIELDS if include_content else DEFAULT_FIELDS)
+
+        output = StringIO()
+        writer = csv.DictWriter(output, fieldnames=fieldnames)
+
+        for i, digest in enumerate(digests):
+            if i == 0:
+                writer.writeheader()
+            writer.writerow(self._digest_row(digest, fieldnames))
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate()
+
+    def _digest_row(self, digest: Any, fieldnames: List[str]) -> Dict[str, Any]:
+        """Build the CSV row for a single digest."""
+        digest_dict = digest.to_dict()
+        row = {k: digest_dict.get(k, '') for k in fieldnames}
+        # Format tags as comma-separated string for CSV
+        if 'tags' in row and isinstance(row['tags'], list):
+            row['tags'] = ', '.join(row['tags'])
+        return row
+
+    def _render_single_digest(self, digest: Any, fieldnames: List[str]) -> str:
+        """Render a single digest as a CSV file with header."""
+        output = StringIO()
+        writer = csv.DictWriter(output, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerow(self._digest_row(digest, fieldnames))
+        return output.getvalue()
+
     def get_format_name(self) -> str:
         return 'csv'
 
@@ -171,35 +200,18 @@ class CSVExporter(BaseExporter):
         if one_per_file:
             # Create separate file for each digest
             fieldnames = EXTENDED_FIELDS if include_content else DEFAULT_FIELDS
-            for digest in digests:
-                filename = self._generate_filename(digest)
-                filepath = base / filename
-                # Skip if file already exists
-                if filepath.exists():
-                    skipped += 1
-                    continue
-                try:
-                    digest_dict = digest.to_dict()
-                    row = {k: digest_dict.get(k, '') for k in fieldnames}
-                    # Format tags as comma-separated string for CSV
-                    if 'tags' in row and isinstance(row['tags'], list):
-                        row['tags'] = ', '.join(row['tags'])
-
-                    with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                        writer = csv.DictWriter(f, fieldnames=fieldnames)
-                        writer.writeheader()
-                        writer.writerow(row)
-
-                    written.append(filename)
-                except Exception as e:
-                    errors.append({"file": filename, "error": str(e)})
+            written, skipped, errors = self._write_files(
+                base,
+                digests,
+                self._generate_filename,
+                lambda digest: self._render_single_digest(digest, fieldnames),
+            )
         else:
             # Create combined file
             filename = f"digests-{date.today().isoformat()}.csv"
             filepath = base / filename
             try:
-                result = self.export(digests, {"include_content": include_content})
-                filepath.write_text(result.content, encoding="utf-8")
+                self._write_stream(filepath, digests, {"include_content": include_content})
                 written.append(filename)
             except Exception as e:
                 errors.append({"file": filename, "error": str(e)})
@@ -18,6 +18,7 @@ logger = logging.getLogger(__name__)
 # Import exporters to ensure they're registered
 from reconly_core.exporters import json_exporter  # noqa: F401
 from reconly_core.exporters import csv_exporter  # noqa: F401
+from reconly_core.exporters import ndjson_exporter  # noqa: F401
 from reconly_core.exporters import markdown  # noqa: F401 (Obsidian exporter)
 from reconly_core.exporters import markdown_exporter  # noqa: F401 (plain Markdown)
 
@@ -1,8 +1,9 @@
 """JSON exporter for digests."""
 import json
+import textwrap
 from datetime import date
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from reconly_core.exporters.base import (
     BaseExporter,
@@ -49,25 +50,56 @@ class JSONExporter(BaseExporter):
         Returns:
             ExportResult with JSON content
         """
+        return ExportResult(
+            content=''.join(self.export_stream(digests, config)),
+            filename='digests.json',
+            content_type=self.get_content_type(),
+            digest_count=len(digests)
+        )
+
+    def export_stream(
+        self,
+        digests: Iterable[Any],
+        config: Dict[str, Any] = None
+    ) -> Iterator[str]:
+        """
+        Export digests to a JSON array one element at a time.
+
+        Produces the same output as json.dumps() of the whole list.
+
+        Args:
+            digests: Iterable of Digest model instances
+            config: Optional config with 'indent' and 'include_content' keys
+
+        Yields:
+            Parts of the JSON array
+        """
         config = config or {}
         indent = config.get('indent', 2)
         include_content = config.get('include_content', True)
 
-        digest_dicts = []
+        if indent is None:
+            opening, separator, closing = '[', ', ', ']'
+        else:
+            opening, separator, closing = '[\n', ',\n', '\n]'
+            prefix = ' ' * indent if isinstance(indent, int) else indent
+
+        first = True
         for digest in digests:
-            d = digest.to_dict()
-            if not include_content:
-                d.pop('content', None)
-            digest_dicts.append(d)
+            item = self._render_digest(digest, include_content, indent)
+            if indent is not None:
+                item = textwrap.indent(item, prefix, lambda line: True)
+            yield (opening if first else separator) + item
+            first = False
 
-        content = json.dumps(digest_dicts, indent=indent, ensure_ascii=False)
+        yield '[]' if first else closing
 
-        return ExportResult(
-            content=content,
-            filename='digests.json',
-            content_type=self.get_content_type(),
-            digest_count=len(digests)
-        )
+    def _render_digest(self, digest: Any, include_content: bool, indent: Any) -> str:
+        """Render a single digest as a JSON object."""
+        d = digest.to_dict()
+        if not include_content:
+            d.pop('content', None)
+        return json.dumps(d, indent=indent, ensure_ascii=False)
 
     def get_format_name(self) -> str:
         return 'json'
@@ -154,29 +186,18 @@ class JSONExporter(BaseExporter):
 
         if one_per_file:
             # Create separate file for each digest
-            for digest in digests:
-                filename = self._generate_filename(digest)
-                filepath = base / filename
-                # Skip if file already exists
-                if filepath.exists():
-                    skipped += 1
-                    continue
-                try:
-                    d = digest.to_dict()
-                    if not include_content:
-                        d.pop('content', None)
-                    content = json.dumps(d, indent=indent, ensure_ascii=False)
-                    filepath.write_text(content, encoding="utf-8")
-                    written.append(filename)
-                except Exception as e:
-                    errors.append({"file": filename, "error": str(e)})
+            written, skipped, errors = self._write_files(
+                base,
+                digests,
+                self._generate_filename,
+                lambda digest: self._render_digest(digest, include_content, indent),
+            )
         else:
             # Create combined file
-            filename = f"digests-{date.today().isoformat()}.json"
+            filename = f"digests-{date.today().isoformat()}.{self.get_file_extension()}"
             filepath = base / filename
             try:
-                result = self.export(digests, {"include_content": include_content, "indent": indent})
-                filepath.write_text(result.content, encoding="utf-8")
+                self._write_stream(filepath, digests, {"include_content": include_content, "indent": indent})
                 written.append(filename)
             except Exception as e:
                 errors.append({"file": filename, "error": str(e)})
@@ -196,7 +217,7 @@ class JSONExporter(BaseExporter):
         # Use digest ID for uniqueness
         digest_id = getattr(digest, 'id', 'unknown')
         title_slug = self._sanitize_filename(digest.title or "untitled")
-        return f"{today}-{title_slug}-{digest_id}.json"
+        return f"{today}-{title_slug}-{digest_id}.{self.get_file_extension()}"
 
     def _sanitize_filename(self, name: str, max_length: int = 50) -> str:
         """Sanitize a string for use as a filename."""
@@ -8,7 +8,7 @@ import unicodedata
 from datetime import date
 from io import StringIO
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from reconly_core.exporters.base import (
     BaseExporter,
@@ -59,21 +59,34 @@ class MarkdownExporter(BaseExporter):
         Returns:
             ExportResult with Markdown content
         """
-        config = config or {}
-        include_content = config.get('include_content', True)
-
-        output = StringIO()
-
-        for digest in digests:
-            self._write_digest(output, digest, include_content)
-
         return ExportResult(
-            content=output.getvalue(),
+            content=''.join(self.export_stream(digests, config)),
             filename='digests.md',
             content_type=self.get_content_type(),
             digest_count=len(digests)
         )
 
+    def export_stream(
+        self,
+        digests: Iterable[Any],
+        config: Dict[str, Any] = None
+    ) -> Iterator[str]:
+        """
+        Export digests to Obsidian-compatible Markdown one section at a time.
+
+        Args:
+            digests: Iterable of Digest model instances
+            config: Optional config with 'include_content' key (default: True)
+
+        Yields:
+            One Markdown section (with frontmatter) per digest
+        """
+        config = config or {}
+        include_content = config.get('include_content', True)
+
+        for digest in digests:
+            yield self._render_single_digest(digest, include_content)
+
     def _write_digest(
         self,
         output: StringIO,
@@ -221,26 +234,18 @@ class MarkdownExporter(BaseExporter):
 
         if one_per_file:
             # Create separate file for each digest
-            for digest in digests:
-                filename = self._generate_filename(digest, pattern)
-                filepath = target_dir / filename
-                # Skip if file already exists
-                if filepath.exists():
-                    skipped += 1
-                    continue
-                try:
-                    content = self._render_single_digest(digest, include_content)
-                    filepath.write_text(content, encoding="utf-8")
-                    written.append(filepath.name)
-                except Exception as e:
-                    errors.append({"file": filename, "error": str(e)})
+            written, skipped, errors = self._write_files(
+                target_dir,
+                digests,
+                lambda digest: self._generate_filename(digest, pattern),
+                lambda digest: self._render_single_digest(digest, include_content),
+            )
         else:
             # Create combined file
             filename = f"digests-{date.today().isoformat()}.md"
             filepath = target_dir / filename
             try:
-                result = self.export(digests, {"include_content": include_content})
-                filepath.write_text(result.content, encoding="utf-8")
+                self._write_stream(filepath, digests, {"include_content": include_content})
                 written.append(filename)
             except Exception as e:
                 errors.append({"file": filename, "error": str(e)})
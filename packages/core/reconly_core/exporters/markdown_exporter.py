@@ -6,7 +6,7 @@ suitable for general-purpose markdown viewing and sharing.
 from datetime import date
 from io import StringIO
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from reconly_core.exporters.base import (
     BaseExporter,
@@ -54,23 +54,35 @@ class MarkdownExporter(BaseExporter):
         Returns:
             ExportResult with Markdown content
         """
-        config = config or {}
-        include_content = config.get('include_content', True)
-
-        output = StringIO()
-
-        for i, digest in enumerate(digests):
-            if i > 0:
-                output.write("\n---\n\n")
-            self._write_digest(output, digest, include_content)
-
         return ExportResult(
-            content=output.getvalue(),
+            content=''.join(self.export_stream(digests, config)),
             filename='digests.md',
             content_type=self.get_content_type(),
             digest_count=len(digests)
         )
 
+    def export_stream(
+        self,
+        digests: Iterable[Any],
+        config: Dict[str, Any] = None
+    ) -> Iterator[str]:
+        """
+        Export digests to plain Markdown one section at a time.
+
+        Args:
+            digests: Iterable of Digest model instances
+            config: Optional config with 'include_content' key (default: True)
+
+        Yields:
+            One Markdown section per digest
+        """
+        config = config or {}
+        include_content = config.get('include_content', True)
+
+        for i, digest in enumerate(digests):
+            section = self._render_single_digest(digest, include_content)
+            yield f"\n---\n\n{section}" if i > 0 else section
+
     def _write_digest(
         self,
         output: StringIO,
@@ -192,26 +204,18 @@ class MarkdownExporter(BaseExporter):
 
         if one_per_file:
             # Create separate file for each digest
-            for digest in digests:
-                filename = self._generate_filename(digest)
-                filepath = base / filename
-                # Skip if file already exists
-                if filepath.exists():
-                    skipped += 1
-                    continue
-                try:
-                    content = self._render_single_digest(digest, include_content)
-                    filepath.write_text(content, encoding="utf-8")
-                    written.append(filename)
-                except Exception as e:
-                    errors.append({"file": filename, "error": str(e)})
+            written, skipped, errors = self._write_files(
+                base,
+                digests,
+                self._generate_filename,
+                lambda digest: self._render_single_digest(digest, include_content),
+            )
         else:
             # Create combined file
             filename = f"digests-{date.today().isoformat()}.md"
             filepath = base / filename
             try:
-                result = self.export(digests, {"include_content": include_content})
-                filepath.write_text(result.content, encoding="utf-8")
+                self._write_stream(filepath, digests, {"include_content": include_content})
                 written.append(filename)
             except Exception as e:
                 errors.append({"file": filename, "error": str(e)})
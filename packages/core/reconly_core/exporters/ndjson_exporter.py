@@ -0,0 +1,120 @@
+"""NDJSON (JSON Lines) exporter for digests."""
+import json
+from typing import Any, Dict, Iterable, Iterator, List
+
+from reconly_core.exporters.base import (
+    ConfigField,
+    ExporterConfigSchema,
+    ExportResult,
+)
+from reconly_core.exporters.json_exporter import JSONExporter
+from reconly_core.exporters.metadata import ExporterMetadata
+from reconly_core.exporters.registry import register_exporter
+
+
+@register_exporter('ndjson')
+class NDJSONExporter(JSONExporter):
+    """Export digests as newline-delimited JSON.
+
+    Writes one compact JSON object per line, so exports can be streamed and
+    processed line by line without parsing the whole file.
+    Supports direct export to filesystem.
+    """
+
+    metadata = ExporterMetadata(
+        name='ndjson',
+        display_name='NDJSON',
+        description='Export digests as newline-delimited JSON',
+        icon='mdi:code-json',
+        file_extension='.ndjson',
+        mime_type='application/x-ndjson',
+        path_setting_key='export_path',
+        ui_color='#F7DF1E',  # JSON yellow
+    )
+
+    def export(
+        self,
+        digests: List[Any],
+        config: Dict[str, Any] = None
+    ) -> ExportResult:
+        """
+        Export digests to NDJSON format.
+
+        Args:
+            digests: List of Digest model instances
+            config: Optional config with 'include_content' key (default: True)
+
+        Returns:
+            ExportResult with NDJSON content
+        """
+        return ExportResult(
+            content=''.join(self.export_stream(digests, config)),
+            filename='digests.ndjson',
+            content_type=self.get_content_type(),
+            digest_count=len(digests)
+        )
+
+    def export_stream(
+        self,
+        digests: Iterable[Any],
+        config: Dict[str, Any] = None
+    ) -> Iterator[str]:
+        """
+        Export digests to NDJSON one line at a time.
+
+        Args:
+            digests: Iterable of Digest model instances
+            config: Optional config with 'include_content' key (default: True)
+
+        Yields:
+            One JSON line per digest
+        """
+        config = config or {}
+        include_content = config.get('include_content', True)
+
+        for digest in digests:
+            yield self._render_digest(digest, include_content, None)
+
+    def _render_digest(self, digest: Any, include_content: bool, indent: Any) -> str:
+        """Render a single digest as one compact JSON line (indent is ignored)."""
+        d = digest.to_dict()
+        if not include_content:
+            d.pop('content', None)
+        return json.dumps(d, ensure_ascii=False) + '\n'
+
+    def get_format_name(self) -> str:
+        return 'ndjson'
+
+    def get_content_type(self) -> str:
+        return 'application/x-ndjson'
+
+    def get_file_extension(self) -> str:
+        return 'ndjson'
+
+    def get_description(self) -> str:
+        return 'Newline-delimited JSON, one digest per line'
+
+    def get_config_schema(self) -> ExporterConfigSchema:
+        """Return configuration schema for NDJSON export."""
+        return ExporterConfigSchema(
+            fields=[
+                ConfigField(
+                    key="export_path",
+                    type="path",
+                    label="Export Path",
+                    description="Directory to save exported NDJSON files (required for direct export)",
+                    default=None,
+                    required=False,
+                    placeholder="/path/to/export/folder"
+                ),
+                ConfigField(
+                    key="include_content",
+                    type="boolean",
+                    label="Include Full Content",
+                    description="Include full article content (can be large)",
+                    default=True,
+                    required=False
+                ),
+            ],
+            supports_direct_export=True
+        )
@@ -10,6 +10,7 @@ from reconly_core.fetchers.factory import (
 from reconly_core.fetchers.base import (
     BaseFetcher,
     FetchedItem,
+    HTTPValidators,
     ConfigField,
     FetcherConfigSchema,
 )
@@ -29,6 +30,7 @@ __all__ = [
     'get_available_fetchers',
     'BaseFetcher',
     'FetchedItem',
+    'HTTPValidators',
     'ConfigField',
     'FetcherConfigSchema',
     'FetcherMetadata',
@@ -9,7 +9,11 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional
 from urllib.parse import urlparse
 
+import feedparser
+import httpx
+
 from reconly_core.config_types import ConfigField, ComponentConfigSchema
+from reconly_core.utils.http_client import get_http_client
 
 if TYPE_CHECKING:
     from reconly_core.fetchers.metadata import FetcherMetadata
@@ -20,6 +24,8 @@ __all__ = [
     "ConfigField",
     "FetcherConfigSchema",
     "FetchedItem",
+    "HTTPValidators",
+    "parse_feed",
     "BaseFetcher",
     "ValidationResult",
 ]
@@ -156,6 +162,65 @@ class FetchedItem:
         return result
 
 
+@dataclass
+class HTTPValidators:
+    """HTTP cache validators for conditional feed requests.
+
+    Passed to fetchers that support conditional GET (``validators=`` kwarg).
+    The fetcher sends the stored values as If-None-Match / If-Modified-Since
+    and updates them from the response. On HTTP 304 it sets ``not_modified``
+    and returns no items without parsing.
+
+    Attributes:
+        etag: ETag from the last response
+        last_modified: Last-Modified from the last response
+        not_modified: True if the server answered 304 Not Modified
+    """
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False
+
+
+def parse_feed(feed_url: str, validators: Optional[HTTPValidators] = None, **request_kwargs: Any):
+    """
+    Download a feed through the shared HTTP client and parse it.
+
+    Sends and refreshes HTTP validators if given. Network errors are
+    reported like feedparser reports them: ``bozo`` set, no entries.
+
+    Args:
+        feed_url: Feed URL
+        validators: Validators from the previous response (updated in place)
+        **request_kwargs: Passed to HTTPClient.get() (timeout, retry, ...)
+
+    Returns:
+        feedparser result (no entries when the server answered 304)
+    """
+    headers = {}
+    if validators is not None:
+        if validators.etag:
+            headers['If-None-Match'] = validators.etag
+        if validators.last_modified:
+            headers['If-Modified-Since'] = validators.last_modified
+
+    try:
+        response = get_http_client().get(feed_url, headers=headers, **request_kwargs)
+    except httpx.HTTPError as e:
+        return feedparser.FeedParserDict(bozo=True, bozo_exception=e, entries=[], feed=feedparser.FeedParserDict())
+
+    if validators is not None:
+        validators.not_modified = response.status_code == 304
+        if validators.not_modified:
+            return feedparser.FeedParserDict(status=304, bozo=False, entries=[], feed=feedparser.FeedParserDict())
+        validators.etag = response.headers.get('etag')
+        validators.last_modified = response.headers.get('last-modified')
+
+    # Relative links in the feed resolve against the final (redirected) URL
+    response_headers = dict(response.headers)
+    response_headers.setdefault('content-location', str(response.url))
+    return feedparser.parse(response.content, response_headers=response_headers)
+
+
 class BaseFetcher(ABC):
     """Abstract base class for content fetchers.
 
@@ -1,14 +1,16 @@
 """RSS feed fetcher module."""
 import os
 import time
-import feedparser
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 from dateutil import parser as date_parser
 
 from reconly_core.config_types import ConfigField
-from reconly_core.utils.images import extract_preview_image, fetch_og_image
-from reconly_core.fetchers.base import BaseFetcher, FetcherConfigSchema, ValidationResult
+from reconly_core.utils.images import fetch_og_image
+from reconly_core.fetchers.base import (
+    BaseFetcher, FetcherConfigSchema, HTTPValidators, ValidationResult, parse_feed,
+)
 from reconly_core.fetchers.metadata import FetcherMetadata
 from reconly_core.fetchers.registry import register_fetcher
 from reconly_core.logging import get_logger
@@ -32,6 +34,13 @@ def get_first_run_max_age_days() -> int:
     return DEFAULT_FIRST_RUN_MAX_AGE_DAYS
 
 
+# Defaults for article enrichment (full content and preview images), which
+# downloads each article page concurrently after the feed has been parsed
+DEFAULT_ENRICHMENT_WORKERS = 8
+DEFAULT_ENRICHMENT_MAX_PER_HOST = 2
+DEFAULT_ENRICHMENT_TIMEOUT = 60.0
+
+
 @register_fetcher('rss')
 class RSSFetcher(BaseFetcher):
     """Fetches and parses RSS/Atom feeds."""
@@ -56,6 +65,10 @@ class RSSFetcher(BaseFetcher):
         since: Optional[datetime] = None,
         max_items: Optional[int] = None,
         fetch_full_content: bool = False,
+        validators: Optional[HTTPValidators] = None,
+        enrichment_workers: Optional[int] = None,
+        enrichment_max_per_host: Optional[int] = None,
+        enrichment_timeout: Optional[float] = None,
         **kwargs,
     ) -> List[Dict[str, str]]:
         """
@@ -69,6 +82,15 @@ class RSSFetcher(BaseFetcher):
                        Applied after date filtering, newest first.
             fetch_full_content: If True, follow article links to scrape full content.
                                Full content is stored in 'full_content' field.
+            validators: HTTP validators for a conditional request (optional).
+                        Updated in place from the response; on 304 Not Modified
+                        ``validators.not_modified`` is set and [] is returned.
+            enrichment_workers: Article pages downloaded concurrently for full
+                                content and preview images (default: 8)
+            enrichment_max_per_host: Concurrent article downloads per host (default: 2)
+            enrichment_timeout: Overall deadline in seconds for article downloads
+                                (default: 60, 0 = none). Articles not enriched in
+                                time keep their RSS summary.
 
         Returns:
             List of article dictionaries, each containing:
@@ -89,8 +111,11 @@ class RSSFetcher(BaseFetcher):
                     since = datetime.now() - timedelta(days=max_age_days)
                 # If max_age_days is 0, since remains None (fetch all)
 
-            # Parse the feed
-            feed = feedparser.parse(feed_url)
+            # Parse the feed (conditional GET when validators are known)
+            feed = parse_feed(feed_url, validators)
+            if validators is not None and validators.not_modified:
+                logger.debug("feed_not_modified", feed_url=feed_url)
+                return []
 
             if feed.bozo and not feed.entries:
                 raise Exception(f"Failed to parse RSS feed: {feed.bozo_exception}")
@@ -126,19 +151,6 @@ class RSSFetcher(BaseFetcher):
                     'feed_title': feed.feed.get('title', 'Unknown Feed')
                 }
 
-                # Optionally fetch full article content by following the link
-                if fetch_full_content and article_url:
-                    full_content, image_url = self._fetch_full_article_content(article_url)
-                    if full_content:
-                        article['full_content'] = full_content
-                    if image_url:
-                        article['image_url'] = image_url
-
-                # Always try to get preview image if not already found
-                # (fetch_full_content may be disabled or image extraction may have failed)
-                if not article.get('image_url') and article_url:
-                    article['image_url'] = fetch_og_image(article_url, timeout=5)
-
                 articles.append(article)
 
             # Sort by published date (newest first) and apply max_items limit
@@ -150,6 +162,15 @@ class RSSFetcher(BaseFetcher):
             if max_items and len(articles) > max_items:
                 articles = articles[:max_items]
 
+            # Follow article links only for articles that are returned
+            self._enrich_articles(
+                articles,
+                fetch_full_content=fetch_full_content,
+                workers=enrichment_workers or DEFAULT_ENRICHMENT_WORKERS,
+                max_per_host=enrichment_max_per_host or DEFAULT_ENRICHMENT_MAX_PER_HOST,
+                timeout=DEFAULT_ENRICHMENT_TIMEOUT if enrichment_timeout is None else enrichment_timeout,
+            )
+
             return articles
 
         except Exception as e:
@@ -215,13 +236,97 @@ class RSSFetcher(BaseFetcher):
 
         return None
 
+    def _enrich_articles(
+        self,
+        articles: List[Dict[str, Any]],
+        fetch_full_content: bool,
+        workers: int,
+        max_per_host: int,
+        timeout: float,
+    ) -> None:
+        """
+        Add full content and preview images to articles, in place.
+
+        Article pages are downloaded concurrently, with at most
+        ``max_per_host`` downloads per host. Downloads still running when
+        the deadline passes are abandoned and those articles keep their RSS
+        summary, so one slow site cannot stall the whole source.
+
+        Args:
+            articles: Articles to enrich
+            fetch_full_content: Scrape full content (otherwise only preview images)
+            workers: Maximum concurrent downloads
+            max_per_host: Maximum concurrent downloads per host
+            timeout: Overall deadline in seconds (0 = none)
+        """
+        # Import here to avoid circular dependency
+        from reconly_core.services.concurrency import HostThrottle
+
+        for article in articles:
+            article.setdefault('image_url', None)
+        targets = [article for article in articles if article.get('url')]
+        if not targets:
+            return
+
+        throttle = HostThrottle(max_per_host=max_per_host)
+        deadline = time.monotonic() + timeout if timeout and timeout > 0 else None
+
+        def enrich(url: str) -> Tuple[Optional[str], Optional[str]]:
+            with throttle.acquire(url):
+                if deadline is not None and time.monotonic() >= deadline:
+                    return None, None
+                return self._enrich_article(url, fetch_full_content)
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(targets))),
+            thread_name_prefix='rss-enrich',
+        )
+        futures = {executor.submit(enrich, article['url']): article for article in targets}
+        done, pending = wait(futures, timeout=timeout if deadline is not None else None)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        for future in done:
+            article = futures[future]
+            try:
+                full_content, image_url = future.result()
+            except Exception as e:
+                logger.warning("article_enrichment_failed", url=article['url'], error=str(e))
+                continue
+            if full_content:
+                article['full_content'] = full_content
+            article['image_url'] = image_url
+
+        if pending:
+            logger.warning(
+                "article_enrichment_timed_out",
+                timeout=timeout,
+                enriched=len(done),
+                skipped=len(pending),
+            )
+
+    def _enrich_article(self, url: str, fetch_full_content: bool) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Fetch full content and/or preview image for one article.
+
+        Returns:
+            Tuple of (full_content, image_url), either or both may be None
+        """
+        full_content, image_url = None, None
+        if fetch_full_content:
+            full_content, image_url = self._fetch_full_article_content(url)
+
+        # Fall back to the og:image when scraping is disabled or found no image
+        if not image_url:
+            image_url = fetch_og_image(url, timeout=5)
+        return full_content, image_url
+
     def _fetch_full_article_content(self, url: str) -> Tuple[Optional[str], Optional[str]]:
         """
         Fetch full article content and preview image by scraping the article URL.
 
-        Uses WebsiteFetcher to scrape the article page and extracts og:image
-        for preview thumbnails. On failure, logs a warning and returns None
-        (graceful fallback to RSS summary).
+        Uses WebsiteFetcher to scrape the article page; the preview image is
+        extracted from the same response. On failure, logs a warning and
+        returns None (graceful fallback to RSS summary).
 
         Args:
             url: The article URL to fetch
@@ -232,7 +337,6 @@ class RSSFetcher(BaseFetcher):
         try:
             # Import here to avoid circular dependency
             from reconly_core.fetchers.website import WebsiteFetcher
-            import requests
 
             fetcher = WebsiteFetcher(timeout=10)
             result = fetcher.fetch(url)
@@ -243,35 +347,19 @@ class RSSFetcher(BaseFetcher):
             # WebsiteFetcher returns a list with a single dict
             if result:
                 content = result[0].get('content', '')
+                image_url = result[0].get('image_url')
                 if content:
                     logger.debug(
                         "full_content_fetched",
                         url=url,
                         content_length=len(content),
                     )
-
-            # Fetch the raw HTML to extract og:image
-            # (WebsiteFetcher strips meta tags, so we need separate fetch)
-            try:
-                response = requests.get(
-                    url,
-                    headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
-                    timeout=5,
-                )
-                if response.status_code == 200:
-                    image_url = extract_preview_image(response.text, url)
-                    if image_url:
-                        logger.debug(
-                            "preview_image_extracted",
-                            url=url,
-                            image_url=image_url,
-                        )
-            except Exception as img_err:
-                logger.debug(
-                    "preview_image_extraction_failed",
-                    url=url,
-                    error=str(img_err),
-                )
+                if image_url:
+                    logger.debug(
+                        "preview_image_extracted",
+                        url=url,
+                        image_url=image_url,
+                    )
 
             if not content:
                 logger.warning(
@@ -389,12 +477,7 @@ class RSSFetcher(BaseFetcher):
             try:
                 start_time = time.time()
 
-                # feedparser doesn't have native timeout, but we can set request_headers
-                # Use a simple timeout by setting agent timeout
-                feed = feedparser.parse(
-                    url,
-                    request_headers={'User-Agent': 'Reconly/1.0'},
-                )
+                feed = parse_feed(url, timeout=timeout, retry=False)
 
                 elapsed_ms = (time.time() - start_time) * 1000
                 result.response_time_ms = round(elapsed_ms, 2)
@@ -4,12 +4,14 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import html2text
-import requests
+import httpx
 from bs4 import BeautifulSoup
 
 from reconly_core.fetchers.base import BaseFetcher, ValidationResult
 from reconly_core.fetchers.metadata import FetcherMetadata
 from reconly_core.fetchers.registry import register_fetcher
+from reconly_core.utils.http_client import get_http_client
+from reconly_core.utils.images import extract_preview_image
 
 
 def _html_to_markdown(html_content: str) -> str:
@@ -49,10 +51,6 @@ class WebsiteFetcher(BaseFetcher):
 
     def __init__(self, timeout: int = 10):
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
 
     def fetch(
         self,
@@ -70,14 +68,18 @@ class WebsiteFetcher(BaseFetcher):
             max_items: Ignored for websites (single page fetch)
 
         Returns:
-            List containing a single dictionary with 'title', 'content', 'url', and 'source_type' keys
+            List containing a single dictionary with 'title', 'content', 'url',
+            'source_type' and 'image_url' (preview image, may be None) keys
         """
         try:
-            response = self.session.get(url, timeout=self.timeout)
+            response = get_http_client().get(url, timeout=self.timeout)
             response.raise_for_status()
 
             soup = BeautifulSoup(response.content, 'html.parser')
 
+            # Read meta tags before the head is stripped below
+            image_url = extract_preview_image(response.text, url)
+
             # Remove script and style elements
             for script in soup(["script", "style", "nav", "footer", "header"]):
                 script.decompose()
@@ -144,10 +146,11 @@ class WebsiteFetcher(BaseFetcher):
                 'url': url,
                 'title': title_text,
                 'content': content,
-                'source_type': 'website'
+                'source_type': 'website',
+                'image_url': image_url,
             }]
 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             raise Exception(f"Failed to fetch website: {str(e)}")
 
     def get_source_type(self) -> str:
@@ -175,11 +178,6 @@ class WebsiteFetcher(BaseFetcher):
         """Get a human-readable description of this fetcher."""
         return 'Website content extractor'
 
-    def __del__(self):
-        """Close the session."""
-        if hasattr(self, 'session'):
-            self.session.close()
-
     def validate(
         self,
         url: str,
@@ -237,10 +235,10 @@ class WebsiteFetcher(BaseFetcher):
                 start_time = time.time()
 
                 # Use HEAD request for quick validation (no body download)
-                response = self.session.head(
+                response = get_http_client().head(
                     url,
                     timeout=timeout,
-                    allow_redirects=True,
+                    retry=False,
                 )
 
                 elapsed_ms = (time.time() - start_time) * 1000
@@ -314,17 +312,17 @@ class WebsiteFetcher(BaseFetcher):
                 # Mark as successfully validated
                 result.test_item_count = 1
 
-            except requests.Timeout:
+            except httpx.TimeoutException:
                 result.add_error(
                     f"Request timed out after {timeout} seconds. "
                     "Website may be slow or unreachable."
                 )
-            except requests.ConnectionError:
+            except httpx.NetworkError:
                 result.add_error(
                     "Could not connect to website. "
                     "Please check the URL and network connectivity."
                 )
-            except requests.RequestException as e:
+            except httpx.HTTPError as e:
                 result.add_error(f"Failed to validate website: {str(e)}")
 
         return result
@@ -9,13 +9,13 @@ import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-import feedparser
-import requests
+import httpx
 from youtube_transcript_api import YouTubeTranscriptApi
 
-from reconly_core.fetchers.base import BaseFetcher, ValidationResult
+from reconly_core.fetchers.base import BaseFetcher, HTTPValidators, ValidationResult, parse_feed
 from reconly_core.fetchers.metadata import FetcherMetadata
 from reconly_core.fetchers.registry import register_fetcher
+from reconly_core.utils.http_client import get_http_client, get_requests_session
 
 logger = logging.getLogger(__name__)
 
@@ -112,7 +112,7 @@ class YouTubeFetcher(BaseFetcher):
         # For handle (@), custom (/c/), and user (/user/) URLs, we need to fetch the page
         if re.search(r'youtube\.com/(@|c/|user/)', url, re.IGNORECASE):
             try:
-                response = requests.get(url, timeout=10)
+                response = get_http_client().get(url, timeout=10)
                 response.raise_for_status()
 
                 # Look for channel ID in page content
@@ -136,7 +136,8 @@ class YouTubeFetcher(BaseFetcher):
     def _fetch_channel_rss(
         self,
         channel_id: str,
-        since: Optional[datetime] = None
+        since: Optional[datetime] = None,
+        validators: Optional[HTTPValidators] = None,
     ) -> List[Dict]:
         """
         Fetch video list from a YouTube channel's RSS feed.
@@ -144,6 +145,7 @@ class YouTubeFetcher(BaseFetcher):
         Args:
             channel_id: YouTube channel ID (UCxxxxx format)
             since: Only return videos published after this datetime
+            validators: HTTP validators for a conditional request (updated in place)
 
         Returns:
             List of video metadata dicts with url, title, video_id, published, channel_title
@@ -151,7 +153,10 @@ class YouTubeFetcher(BaseFetcher):
         rss_url = YOUTUBE_CHANNEL_RSS_URL.format(channel_id=channel_id)
 
         try:
-            feed = feedparser.parse(rss_url)
+            feed = parse_feed(rss_url, validators)
+            if validators is not None and validators.not_modified:
+                logger.debug(f"Channel feed not modified: {channel_id}")
+                return []
 
             if feed.bozo and not feed.entries:
                 raise Exception(f"Failed to parse YouTube channel RSS: {feed.bozo_exception}")
@@ -205,7 +210,7 @@ class YouTubeFetcher(BaseFetcher):
         """
         try:
             oembed_url = f"https://www.youtube.com/oembed?url=https://www.youtube.com/watch?v={video_id}&format=json"
-            response = requests.get(oembed_url, timeout=10)
+            response = get_http_client().get(oembed_url, timeout=10)
             response.raise_for_status()
             data = response.json()
             return data.get('title')
@@ -229,7 +234,7 @@ class YouTubeFetcher(BaseFetcher):
             Dict with content and language, or None if transcript unavailable
         """
         try:
-            api = YouTubeTranscriptApi()
+            api = YouTubeTranscriptApi(http_client=get_requests_session())
             transcript = api.fetch(video_id, languages=tuple(languages))
             content = '\n'.join([snippet.text for snippet in transcript.snippets])
 
@@ -246,7 +251,8 @@ class YouTubeFetcher(BaseFetcher):
         url: str,
         since: Optional[datetime] = None,
         languages: Optional[List[str]] = None,
-        max_items: int = 5
+        max_items: int = 5,
+        validators: Optional[HTTPValidators] = None,
     ) -> List[Dict]:
         """
         Fetch transcripts for recent videos from a YouTube channel.
@@ -256,6 +262,7 @@ class YouTubeFetcher(BaseFetcher):
             since: Only fetch videos published after this datetime
             languages: Preferred language codes
             max_items: Maximum number of videos to fetch per run (default: 5)
+            validators: HTTP validators for the channel feed (updated in place)
 
         Returns:
             List of video transcript dicts
@@ -269,7 +276,7 @@ class YouTubeFetcher(BaseFetcher):
             raise ValueError(f"Could not extract channel ID from URL: {url}")
 
         # Fetch video list from RSS
-        videos = self._fetch_channel_rss(channel_id, since=since)
+        videos = self._fetch_channel_rss(channel_id, since=since, validators=validators)
 
         if not videos:
             return []
@@ -310,6 +317,7 @@ class YouTubeFetcher(BaseFetcher):
         since: Optional[datetime] = None,
         languages: Optional[List[str]] = None,
         max_items: int = 5,
+        validators: Optional[HTTPValidators] = None,
         **kwargs,
     ) -> List[Dict]:
         """
@@ -323,6 +331,8 @@ class YouTubeFetcher(BaseFetcher):
             since: For channels, only fetch videos after this datetime
             languages: List of preferred language codes (default: ['de', 'en'])
             max_items: For channels, max videos to fetch per run (default: 5)
+            validators: For channels, HTTP validators for a conditional request
+                        of the channel feed (updated in place)
 
         Returns:
             List of dictionaries, each containing:
@@ -341,7 +351,9 @@ class YouTubeFetcher(BaseFetcher):
 
         # Check if this is a channel URL
         if self.is_channel_url(url):
-            return self._fetch_channel(url, since=since, languages=languages, max_items=max_items)
+            return self._fetch_channel(
+                url, since=since, languages=languages, max_items=max_items, validators=validators,
+            )
 
         # Single video - extract video ID
         video_id = self.extract_video_id(url)
@@ -350,7 +362,7 @@ class YouTubeFetcher(BaseFetcher):
 
         try:
             # Initialize API instance
-            api = YouTubeTranscriptApi()
+            api = YouTubeTranscriptApi(http_client=get_requests_session())
 
             # Fetch transcript with language preferences
             transcript = api.fetch(video_id, languages=tuple(languages))
@@ -520,7 +532,7 @@ class YouTubeFetcher(BaseFetcher):
 
             # First check if video exists via oEmbed
             oembed_url = f"https://www.youtube.com/oembed?url=https://www.youtube.com/watch?v={video_id}&format=json"
-            response = requests.get(oembed_url, timeout=timeout)
+            response = get_http_client().get(oembed_url, timeout=timeout, retry=False)
 
             elapsed_ms = (time.time() - start_time) * 1000
             result.response_time_ms = round(elapsed_ms, 2)
@@ -539,7 +551,7 @@ class YouTubeFetcher(BaseFetcher):
             # Try to get transcript availability
             try:
                 languages = config.get('languages', ['de', 'en']) if config else ['de', 'en']
-                api = YouTubeTranscriptApi()
+                api = YouTubeTranscriptApi(http_client=get_requests_session())
                 transcript_list = api.list(video_id)
 
                 # Check if any requested language is available
@@ -572,12 +584,12 @@ class YouTubeFetcher(BaseFetcher):
                         f"Could not verify transcript availability: {error_msg}"
                     )
 
-        except requests.Timeout:
+        except httpx.TimeoutException:
             result.add_error(
                 f"Request timed out after {timeout} seconds. "
                 "YouTube may be slow or unreachable."
             )
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             result.add_error(f"Failed to validate video: {str(e)}")
 
         return result
@@ -619,7 +631,7 @@ class YouTubeFetcher(BaseFetcher):
 
             # Try to fetch channel RSS feed
             rss_url = YOUTUBE_CHANNEL_RSS_URL.format(channel_id=channel_id)
-            feed = feedparser.parse(rss_url)
+            feed = parse_feed(rss_url, timeout=timeout, retry=False)
 
             if feed.bozo and not feed.entries:
                 result.add_warning(
@@ -11,6 +11,7 @@ Components:
     - rag_service: RAG service for question answering with citations
     - citations: Citation formatting and parsing
     - graph_service: Knowledge graph relationships between digests
+    - index_queue: Background indexing queue for new digests
 
 Usage:
     >>> from reconly_core.rag import get_embedding_provider, ChunkingService
@@ -84,6 +85,12 @@ from reconly_core.rag.graph_service import (
     GraphEdge,
     GraphData,
 )
+from reconly_core.rag.index_queue import (
+    RAGIndexQueue,
+    RAGIndexWorker,
+    start_index_workers,
+    stop_index_workers,
+)
 
 __all__ = [
     # Embedding functions
@@ -132,4 +139,9 @@ __all__ = [
     'GraphNode',
     'GraphEdge',
     'GraphData',
+    # Indexing queue
+    'RAGIndexQueue',
+    'RAGIndexWorker',
+    'start_index_workers',
+    'stop_index_workers',
 ]
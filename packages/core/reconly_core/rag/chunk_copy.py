@@ -0,0 +1,145 @@
+"""Binary COPY writer for chunk rows.
+
+Chunk rows carry 1024-dimension embeddings, so inserting them as SQL
+parameters spends most of the time formatting and parsing float literals.
+COPY in binary format sends each vector as packed float32 values and
+bypasses the ORM entirely.
+
+Only the column types used by the chunk tables are supported.
+"""
+import io
+import json
+import struct
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+
+import numpy as np
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import JSON, BigInteger, DateTime, Integer, SmallInteger, String
+
+if TYPE_CHECKING:
+    from sqlalchemy import Table
+    from sqlalchemy.orm import Session
+
+_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+_TRAILER = struct.pack('>h', -1)
+_NULL = struct.pack('>i', -1)
+_POSTGRES_EPOCH = datetime(2000, 1, 1)
+
+
+def _encode_int2(value: int) -> bytes:
+    return struct.pack('>h', value)
+
+
+def _encode_int4(value: int) -> bytes:
+    return struct.pack('>i', value)
+
+
+def _encode_int8(value: int) -> bytes:
+    return struct.pack('>q', value)
+
+
+def _encode_text(value: str) -> bytes:
+    return value.encode('utf-8')
+
+
+def _encode_json(value: Any) -> bytes:
+    return json.dumps(value).encode('utf-8')
+
+
+def _encode_timestamp(value: datetime) -> bytes:
+    # Microseconds since 2000-01-01; naive datetimes are stored as given
+    delta = value.replace(tzinfo=None) - _POSTGRES_EPOCH
+    return struct.pack('>q', (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds)
+
+
+def _encode_vector(value: Sequence[float]) -> bytes:
+    # pgvector wire format: dimension, unused, big-endian float32 values
+    array = np.asarray(value, dtype='>f4')
+    return struct.pack('>HH', array.shape[0], 0) + array.tobytes()
+
+
+def _encoder(column_type) -> Callable[[Any], bytes]:
+    """Binary encoder for a column type."""
+    if isinstance(column_type, Vector):
+        return _encode_vector
+    if isinstance(column_type, BigInteger):
+        return _encode_int8
+    if isinstance(column_type, SmallInteger):
+        return _encode_int2
+    if isinstance(column_type, Integer):
+        return _encode_int4
+    if isinstance(column_type, DateTime):
+        return _encode_timestamp
+    if isinstance(column_type, JSON):
+        return _encode_json
+    if isinstance(column_type, String):
+        return _encode_text
+    raise TypeError(f"Binary COPY does not support column type {column_type!r}")
+
+
+def encode_copy_rows(table: "Table", columns: list[str], rows: list[dict]) -> bytes:
+    """Encode rows in PostgreSQL's binary COPY format.
+
+    Args:
+        table: Target table (for column types)
+        columns: Columns to write, in order
+        rows: Row dictionaries; missing keys and None values are written as NULL
+
+    Returns:
+        The complete COPY payload
+    """
+    encoders = [_encoder(table.c[name].type) for name in columns]
+    field_count = struct.pack('>h', len(columns))
+
+    buffer = io.BytesIO()
+    buffer.write(_HEADER)
+    for row in rows:
+        buffer.write(field_count)
+        for name, encode in zip(columns, encoders):
+            value = row.get(name)
+            if value is None:
+                buffer.write(_NULL)
+                continue
+            data = encode(value)
+            buffer.write(struct.pack('>i', len(data)))
+            buffer.write(data)
+    buffer.write(_TRAILER)
+    return buffer.getvalue()
+
+
+def copy_rows(db: "Session", table: "Table", rows: list[dict]) -> bool:
+    """Write rows with binary COPY inside the session's transaction.
+
+    Column defaults are not applied, so rows must include every non-nullable
+    column without a server default.
+
+    Args:
+        db: Database session
+        table: Target table
+        rows: Row dictionaries
+
+    Returns:
+        False if the database driver doesn't support COPY (nothing was written)
+    """
+    if not rows:
+        return True
+
+    connection = db.connection()
+    if connection.dialect.name != 'postgresql':
+        return False
+
+    present = set().union(*rows)
+    columns = [column.name for column in table.columns if column.name in present]
+    quote = connection.dialect.identifier_preparer.quote
+    sql = (
+        f"COPY {quote(table.name)} ({', '.join(quote(name) for name in columns)}) "
+        f"FROM STDIN WITH (FORMAT BINARY)"
+    )
+
+    with connection.connection.dbapi_connection.cursor() as cursor:
+        # psycopg2 API; other drivers use the regular INSERT path
+        if not hasattr(cursor, 'copy_expert'):
+            return False
+        cursor.copy_expert(sql, io.BytesIO(encode_copy_rows(table, columns, rows)))
+    return True
@@ -2,6 +2,10 @@
 
 Splits text into semantic chunks suitable for embedding and retrieval.
 Respects paragraph and heading boundaries while maintaining overlap.
+
+Each section (and each sentence of an oversized section) is tokenized exactly
+once, in a single batched encode. Chunk token counts and overlap are derived
+from those per-section counts instead of re-encoding merged chunk text.
 """
 import re
 from dataclasses import dataclass, field
@@ -153,6 +157,25 @@ class ChunkingService:
             # This is less accurate but works without tiktoken
             return len(text) // 4
 
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens in many texts at once.
+
+        Encodes all texts in one tiktoken batch call (which runs on several
+        threads), so it is much cheaper than calling count_tokens() per text.
+
+        Args:
+            texts: Texts to count tokens in
+
+        Returns:
+            Token counts in the same order as texts
+        """
+        if not texts:
+            return []
+        if self.encoding is not None:
+            return [len(tokens) for tokens in self.encoding.encode_batch(texts)]
+        return [len(text) // 4 for text in texts]
+
     def chunk_text(self, text: str) -> List[TextChunk]:
         """
         Split text into semantic chunks.
@@ -178,6 +201,11 @@ class ChunkingService:
         if not sections:
             return []
 
+        # Tokenize all sections in one pass
+        token_counts = self.count_tokens_batch([section['text'] for section in sections])
+        for section, tokens in zip(sections, token_counts):
+            section['tokens'] = tokens
+
         # Build chunks from sections
         chunks = self._build_chunks_from_sections(sections, text)
 
@@ -188,6 +216,7 @@ class ChunkingService:
         Split text into sections (paragraphs or heading-bounded blocks).
 
         Returns list of dicts with 'text', 'start', 'end', 'heading' keys.
+        chunk_text() adds each section's token count under 'tokens'.
         """
         sections = []
 
@@ -237,6 +266,7 @@ class ChunkingService:
         """Build chunks from sections, respecting token limits and overlap."""
         chunks = []
         current_chunk_texts = []
+        current_chunk_tokens = []  # Token count of each text in current_chunk_texts
         current_chunk_start = sections[0]['start'] if sections else 0
         current_token_count = 0
         current_heading = None
@@ -244,7 +274,7 @@ class ChunkingService:
 
         for i, section in enumerate(sections):
             section_text = section['text']
-            section_tokens = self.count_tokens(section_text)
+            section_tokens = section['tokens']
 
             # Update heading if changed
             if section['heading']:
@@ -265,11 +295,14 @@ class ChunkingService:
                 chunk_index += 1
 
                 # Start new chunk with overlap
-                overlap_texts, overlap_tokens = self._get_overlap(
+                overlap_texts, overlap_counts = self._get_overlap(
                     current_chunk_texts,
+                    current_chunk_tokens,
                     self.overlap_tokens
                 )
+                overlap_tokens = sum(overlap_counts)
                 current_chunk_texts = overlap_texts + [section_text]
+                current_chunk_tokens = overlap_counts + [section_tokens]
                 current_chunk_start = section['start'] - sum(
                     len(t) + 2 for t in overlap_texts
                 )
@@ -302,12 +335,14 @@ class ChunkingService:
 
                 # Reset
                 current_chunk_texts = []
+                current_chunk_tokens = []
                 current_chunk_start = section['end']
                 current_token_count = 0
 
             else:
                 # Add section to current chunk
                 current_chunk_texts.append(section_text)
+                current_chunk_tokens.append(section_tokens)
                 current_token_count += section_tokens
 
                 # Check if we've reached target size
@@ -324,11 +359,14 @@ class ChunkingService:
                     chunk_index += 1
 
                     # Start new chunk with overlap
-                    overlap_texts, overlap_tokens = self._get_overlap(
+                    overlap_texts, overlap_counts = self._get_overlap(
                         current_chunk_texts,
+                        current_chunk_tokens,
                         self.overlap_tokens
                     )
+                    overlap_tokens = sum(overlap_counts)
                     current_chunk_texts = overlap_texts
+                    current_chunk_tokens = overlap_counts
                     current_chunk_start = section['end'] - sum(
                         len(t) + 2 for t in overlap_texts
                     )
@@ -356,7 +394,7 @@ class ChunkingService:
                     text=merged_text,
                     start_char=prev_chunk.start_char,
                     end_char=final_chunk.end_char,
-                    token_count=self.count_tokens(merged_text),
+                    token_count=prev_chunk.token_count + final_chunk.token_count,
                     chunk_index=prev_chunk.chunk_index,
                     extra_data=prev_chunk.extra_data,
                 )
@@ -390,29 +428,32 @@ class ChunkingService:
     def _get_overlap(
         self,
         texts: List[str],
+        token_counts: List[int],
         target_overlap_tokens: int
-    ) -> tuple[List[str], int]:
+    ) -> tuple[List[str], List[int]]:
         """
         Get texts for overlap from the end of current chunk.
 
-        Returns tuple of (overlap_texts, overlap_token_count).
+        Uses the already known token count of each text instead of
+        re-encoding it.
+
+        Returns tuple of (overlap_texts, overlap_token_counts).
         """
         if not texts:
-            return [], 0
+            return [], []
 
-        overlap_texts = []
         overlap_tokens = 0
+        start = len(texts)
 
         # Work backwards from the end
-        for text in reversed(texts):
-            text_tokens = self.count_tokens(text)
+        for text_tokens in reversed(token_counts):
             if overlap_tokens + text_tokens <= target_overlap_tokens:
-                overlap_texts.insert(0, text)
+                start -= 1
                 overlap_tokens += text_tokens
             else:
                 break
 
-        return overlap_texts, overlap_tokens
+        return texts[start:], token_counts[start:]
 
     def _split_large_section(
         self,
@@ -422,22 +463,19 @@ class ChunkingService:
     ) -> List[TextChunk]:
         """Split a large section into smaller chunks by sentences."""
         text = section['text']
-        sentences = self.SENTENCE_PATTERN.split(text)
+        sentences = [s.strip() for s in self.SENTENCE_PATTERN.split(text)]
+        sentences = [s for s in sentences if s]
+        sentence_counts = self.count_tokens_batch(sentences)
 
         chunks = []
         current_sentences = []
+        current_counts = []  # Token count of each sentence in current_sentences
         current_tokens = 0
         chunk_index = start_chunk_index
 
         start_pos = section['start']
 
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-
-            sentence_tokens = self.count_tokens(sentence)
-
+        for sentence, sentence_tokens in zip(sentences, sentence_counts):
             if current_tokens + sentence_tokens > self.max_tokens and current_sentences:
                 # Create chunk
                 chunk_text = " ".join(current_sentences)
@@ -461,9 +499,11 @@ class ChunkingService:
 
                 # Start new chunk with some overlap
                 current_sentences = current_sentences[-2:] if len(current_sentences) > 2 else []
-                current_tokens = sum(self.count_tokens(s) for s in current_sentences)
+                current_counts = current_counts[-2:] if len(current_counts) > 2 else []
+                current_tokens = sum(current_counts)
 
             current_sentences.append(sentence)
+            current_counts.append(sentence_tokens)
             current_tokens += sentence_tokens
 
         # Handle remaining sentences
@@ -5,11 +5,28 @@ DigestChunk and SourceContentChunk records in the database. Tracks embedding
 status on both digests and source content.
 
 Uses PostgreSQL with pgvector for efficient vector storage and similarity search.
+
+Chunk rows are written in bulk: existing chunks are replaced with a single
+DELETE, single-record embeds use one multi-row INSERT, and backfills
+(backfill_digests / backfill_source_contents) stream their rows with binary
+COPY. Backfills also pack chunks from many records into full provider
+batches and keep several embedding requests in flight, committing after
+each window.
+
+Each chunk row stores a hash of its text and the "provider:model" identity
+that embedded it. Re-embedding a record reuses the stored vectors of chunks
+whose text didn't change and only sends new text to the provider. Records
+embedded with a different model count as outdated and are picked up again
+by the backfills, so a model switch is re-embedded incrementally and
+resumably.
 """
 import asyncio
+import hashlib
 import logging
+from datetime import datetime
 from typing import Callable, List, Optional, Union, TYPE_CHECKING
 
+from reconly_core.rag.chunk_copy import copy_rows
 from reconly_core.rag.chunking import ChunkingService
 from reconly_core.rag.embeddings import get_embedding_provider, EmbeddingProvider
 
@@ -28,6 +45,72 @@ EMBEDDING_STATUS_PENDING = "pending"
 EMBEDDING_STATUS_COMPLETED = "completed"
 EMBEDDING_STATUS_FAILED = "failed"
 
+# Backfill defaults (overridden by embedding.backfill_* settings)
+DEFAULT_BACKFILL_CONCURRENCY = 4
+DEFAULT_BACKFILL_COMMIT_EVERY = 100
+
+# Digest attributes copied onto chunk rows for filtered vector search
+CHUNK_FILTER_COLUMNS = ('feed_id', 'source_id', 'digest_created_at')
+
+# Digest column holding the mean chunk embedding, per chunk source
+CENTROID_COLUMNS = {
+    'digest': 'centroid_embedding',
+    'source_content': 'source_centroid_embedding',
+}
+
+# Mean embedding of a digest's chunks (correlated on digests AS d)
+_CENTROID_SQL = {
+    'digest': """
+        SELECT AVG(c.embedding)
+        FROM digest_chunks c
+        WHERE c.digest_id = d.id AND c.embedding IS NOT NULL
+    """,
+    'source_content': """
+        SELECT AVG(c.embedding)
+        FROM source_content_chunks c
+        JOIN source_contents sc ON sc.id = c.source_content_id
+        JOIN digest_source_items dsi ON dsi.id = sc.digest_source_item_id
+        WHERE dsi.digest_id = d.id AND c.embedding IS NOT NULL
+    """,
+}
+
+
+def chunk_text_hash(text: str) -> str:
+    """SHA-256 hex digest of a chunk's text, used to match unchanged chunks."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def refresh_digest_centroids(
+    db: "Session",
+    digest_ids: List[int],
+    chunk_source: str,
+    only_missing: bool = False,
+) -> None:
+    """
+    Recompute digests' centroid embeddings from their current chunks.
+
+    Digests without embedded chunks get a NULL centroid.
+
+    Args:
+        db: Database session
+        digest_ids: Digests to update
+        chunk_source: 'digest' or 'source_content'
+        only_missing: Only fill digests whose centroid is NULL
+    """
+    from sqlalchemy import text
+
+    if not digest_ids:
+        return
+
+    column = CENTROID_COLUMNS[chunk_source]
+    sql = (
+        f"UPDATE digests AS d SET {column} = ({_CENTROID_SQL[chunk_source]}) "
+        f"WHERE d.id = ANY(:digest_ids)"
+    )
+    if only_missing:
+        sql += f" AND d.{column} IS NULL"
+    db.execute(text(sql), {'digest_ids': list(digest_ids)})
+
 
 class EmbeddingService:
     """Service for creating embeddings from digests and source content.
@@ -79,6 +162,16 @@ class EmbeddingService:
         else:
             self.chunker = chunking_service
 
+    @property
+    def model_identity(self) -> str:
+        """'provider:model' identifying the vectors this service produces."""
+        info = self.provider.get_model_info()
+        if not isinstance(info, dict):
+            info = {}
+        provider = info.get('provider') or self.provider.get_provider_name()
+        model = info.get('model') or 'unknown'
+        return f"{provider}:{model}"[:255]
+
     async def embed_digest(
         self,
         digest: "Digest",
@@ -105,7 +198,7 @@ class EmbeddingService:
             >>> chunks = await service.embed_digest(digest)
             >>> print(f"Embedded {len(chunks)} chunks for digest {digest.id}")
         """
-        from reconly_core.database.models import DigestChunk
+        from reconly_core.database.models import Digest, DigestChunk
 
         logger.info(f"Embedding digest {digest.id}: {digest.title[:50] if digest.title else 'Untitled'}...")
 
@@ -116,16 +209,6 @@ class EmbeddingService:
             self.db.flush()
 
         try:
-            # Delete existing chunks if requested
-            if replace_existing:
-                existing_chunks = self.db.query(DigestChunk).filter(
-                    DigestChunk.digest_id == digest.id
-                ).all()
-                for chunk in existing_chunks:
-                    self.db.delete(chunk)
-                self.db.flush()
-                logger.debug(f"Deleted {len(existing_chunks)} existing chunks for digest {digest.id}")
-
             # Create text chunks
             text_chunks = self.chunker.chunk_digest(
                 digest,
@@ -133,35 +216,35 @@ class EmbeddingService:
                 include_summary=include_summary,
             )
 
+            # Generate embeddings, reusing stored vectors of unchanged chunks
+            hashes = [chunk_text_hash(chunk.text) for chunk in text_chunks]
+            reusable = self._reusable_embeddings(DigestChunk, 'digest_id', [digest.id])
+            embeddings = await self._embed_missing(
+                [chunk.text for chunk in text_chunks], hashes, reusable
+            )
+
+            # Delete existing chunks if requested
+            if replace_existing:
+                deleted = self._delete_chunks(DigestChunk, 'digest_id', [digest.id])
+                logger.debug(f"Deleted {deleted} existing chunks for digest {digest.id}")
+
             if not text_chunks:
                 logger.warning(f"No chunks created for digest {digest.id}")
                 if update_status:
                     digest.embedding_status = EMBEDDING_STATUS_COMPLETED
                     self.db.flush()
+                if replace_existing:
+                    self._refresh_centroids(Digest, [digest.id])
                 return []
 
             logger.debug(f"Created {len(text_chunks)} text chunks for digest {digest.id}")
 
-            # Generate embeddings in batches
-            all_texts = [chunk.text for chunk in text_chunks]
-            embeddings = await self._embed_with_batching(all_texts)
-
             # Create DigestChunk records
-            db_chunks = []
-            for i, (text_chunk, embedding) in enumerate(zip(text_chunks, embeddings)):
-                # pgvector handles embedding storage directly
-                db_chunk = DigestChunk(
-                    digest_id=digest.id,
-                    chunk_index=i,
-                    text=text_chunk.text,
-                    embedding=embedding,
-                    token_count=text_chunk.token_count,
-                    start_char=text_chunk.start_char,
-                    end_char=text_chunk.end_char,
-                    extra_data=text_chunk.extra_data if text_chunk.extra_data else None,
-                )
-                self.db.add(db_chunk)
-                db_chunks.append(db_chunk)
+            filters = self._chunk_filter_values(Digest, [digest.id])[digest.id]
+            db_chunks = self._insert_chunks(
+                DigestChunk,
+                self._chunk_rows('digest_id', digest.id, text_chunks, embeddings, hashes, filters),
+            )
 
             # Mark as completed
             if update_status:
@@ -169,6 +252,7 @@ class EmbeddingService:
                 digest.embedding_error = None
 
             self.db.flush()
+            self._refresh_centroids(Digest, [digest.id])
             logger.info(f"Created {len(db_chunks)} chunks with embeddings for digest {digest.id}")
 
             return db_chunks
@@ -244,36 +328,7 @@ class EmbeddingService:
         Returns:
             Dictionary mapping digest_id -> list of created chunks
         """
-        from reconly_core.database.models import Digest, DigestChunk
-        from sqlalchemy import or_
-
-        # Build filter for unembedded digests
-        # NULL status = never attempted (legacy digests)
-        # Also check for digests without chunks (backward compatibility)
-        subquery = self.db.query(DigestChunk.digest_id).distinct()
-
-        status_conditions = [
-            Digest.embedding_status.is_(None),  # Never attempted
-        ]
-        if include_failed:
-            status_conditions.append(Digest.embedding_status == EMBEDDING_STATUS_FAILED)
-
-        # Find digests that either:
-        # 1. Have no embedding_status set (NULL - legacy or never attempted)
-        # 2. Have failed status (if include_failed=True)
-        # 3. Have no chunks (backward compatibility for digests before status tracking)
-        query = self.db.query(Digest).filter(
-            or_(
-                or_(*status_conditions),
-                ~Digest.id.in_(subquery)
-            )
-        ).filter(
-            # Exclude digests already completed
-            or_(
-                Digest.embedding_status.is_(None),
-                Digest.embedding_status != EMBEDDING_STATUS_COMPLETED
-            )
-        )
+        query = self._unembedded_digests_query(include_failed)
 
         if limit:
             query = query.limit(limit)
@@ -318,7 +373,7 @@ class EmbeddingService:
             >>> chunks = await service.embed_source_content(source_content)
             >>> print(f"Embedded {len(chunks)} chunks for source content {source_content.id}")
         """
-        from reconly_core.database.models import SourceContentChunk
+        from reconly_core.database.models import SourceContent, SourceContentChunk
 
         logger.info(f"Embedding source content {source_content.id} (length: {source_content.content_length})...")
 
@@ -329,47 +384,42 @@ class EmbeddingService:
             self.db.flush()
 
         try:
-            # Delete existing chunks if requested
-            if replace_existing:
-                existing_chunks = self.db.query(SourceContentChunk).filter(
-                    SourceContentChunk.source_content_id == source_content.id
-                ).all()
-                for chunk in existing_chunks:
-                    self.db.delete(chunk)
-                self.db.flush()
-                logger.debug(f"Deleted {len(existing_chunks)} existing chunks for source content {source_content.id}")
-
             # Create text chunks using ChunkingService.chunk_source_content()
             text_chunks = self.chunker.chunk_source_content(source_content)
 
+            # Generate embeddings, reusing stored vectors of unchanged chunks
+            hashes = [chunk_text_hash(chunk.text) for chunk in text_chunks]
+            reusable = self._reusable_embeddings(
+                SourceContentChunk, 'source_content_id', [source_content.id]
+            )
+            embeddings = await self._embed_missing(
+                [chunk.text for chunk in text_chunks], hashes, reusable
+            )
+
+            # Delete existing chunks if requested
+            if replace_existing:
+                deleted = self._delete_chunks(SourceContentChunk, 'source_content_id', [source_content.id])
+                logger.debug(f"Deleted {deleted} existing chunks for source content {source_content.id}")
+
             if not text_chunks:
                 logger.warning(f"No chunks created for source content {source_content.id}")
                 if update_status:
                     source_content.embedding_status = EMBEDDING_STATUS_COMPLETED
                     self.db.flush()
+                if replace_existing:
+                    self._refresh_centroids(SourceContent, [source_content.id])
                 return []
 
             logger.debug(f"Created {len(text_chunks)} text chunks for source content {source_content.id}")
 
-            # Generate embeddings in batches
-            all_texts = [chunk.text for chunk in text_chunks]
-            embeddings = await self._embed_with_batching(all_texts)
-
             # Create SourceContentChunk records
-            db_chunks = []
-            for i, (text_chunk, embedding) in enumerate(zip(text_chunks, embeddings)):
-                db_chunk = SourceContentChunk(
-                    source_content_id=source_content.id,
-                    chunk_index=i,
-                    text=text_chunk.text,
-                    embedding=embedding,
-                    token_count=text_chunk.token_count,
-                    start_char=text_chunk.start_char,
-                    end_char=text_chunk.end_char,
-                    extra_data=text_chunk.extra_data if text_chunk.extra_data else None,
-                )
-                self.db.add(db_chunk)
-                db_chunks.append(db_chunk)
+            filters = self._chunk_filter_values(SourceContent, [source_content.id])[source_content.id]
+            db_chunks = self._insert_chunks(
+                SourceContentChunk,
+                self._chunk_rows(
+                    'source_content_id', source_content.id, text_chunks, embeddings, hashes, filters
+                ),
+            )
 
             # Mark as completed
             if update_status:
@@ -377,6 +427,7 @@ class EmbeddingService:
                 source_content.embedding_error = None
 
             self.db.flush()
+            self._refresh_centroids(SourceContent, [source_content.id])
             logger.info(f"Created {len(db_chunks)} chunks with embeddings for source content {source_content.id}")
 
             return db_chunks
@@ -449,34 +500,7 @@ class EmbeddingService:
         Returns:
             Dictionary mapping source_content_id -> list of created chunks
         """
-        from reconly_core.database.models import SourceContent, SourceContentChunk
-        from sqlalchemy import or_
-
-        # Build filter for unembedded source contents
-        subquery = self.db.query(SourceContentChunk.source_content_id).distinct()
-
-        status_conditions = [
-            SourceContent.embedding_status.is_(None),  # Never attempted
-        ]
-        if include_failed:
-            status_conditions.append(SourceContent.embedding_status == EMBEDDING_STATUS_FAILED)
-
-        # Find source contents that either:
-        # 1. Have no embedding_status set (NULL - never attempted)
-        # 2. Have failed status (if include_failed=True)
-        # 3. Have no chunks (backward compatibility)
-        query = self.db.query(SourceContent).filter(
-            or_(
-                or_(*status_conditions),
-                ~SourceContent.id.in_(subquery)
-            )
-        ).filter(
-            # Exclude source contents already completed
-            or_(
-                SourceContent.embedding_status.is_(None),
-                SourceContent.embedding_status != EMBEDDING_STATUS_COMPLETED
-            )
-        )
+        query = self._unembedded_source_contents_query(include_failed)
 
         if limit:
             query = query.limit(limit)
@@ -525,15 +549,564 @@ class EmbeddingService:
         Returns:
             Number of chunks deleted
         """
-        from reconly_core.database.models import SourceContentChunk
+        from reconly_core.database.models import SourceContent, SourceContentChunk
 
         count = self.db.query(SourceContentChunk).filter(
             SourceContentChunk.source_content_id == source_content_id
         ).delete()
 
         self.db.flush()
+        self._refresh_centroids(SourceContent, [source_content_id])
         return count
 
+    def _unembedded_digests_query(self, include_failed: bool = False):
+        """Build the query for digests that don't have embeddings yet."""
+        from reconly_core.database.models import Digest, DigestChunk
+        from sqlalchemy import and_, or_
+
+        # Build filter for unembedded digests
+        # NULL status = never attempted (legacy digests)
+        # Also check for digests without chunks (backward compatibility)
+        subquery = self.db.query(DigestChunk.digest_id).distinct()
+
+        status_conditions = [
+            Digest.embedding_status.is_(None),  # Never attempted
+        ]
+        if include_failed:
+            status_conditions.append(Digest.embedding_status == EMBEDDING_STATUS_FAILED)
+
+        # Find digests that either:
+        # 1. Have no embedding_status set (NULL - legacy or never attempted)
+        # 2. Have failed status (if include_failed=True)
+        # 3. Have no chunks (backward compatibility for digests before status tracking)
+        # and aren't completed, or
+        # 4. Have chunks embedded with a different model
+        query = self.db.query(Digest).filter(
+            or_(
+                and_(
+                    or_(
+                        or_(*status_conditions),
+                        ~Digest.id.in_(subquery)
+                    ),
+                    # Exclude digests already completed
+                    or_(
+                        Digest.embedding_status.is_(None),
+                        Digest.embedding_status != EMBEDDING_STATUS_COMPLETED
+                    ),
+                ),
+                self._outdated_model_condition(Digest, DigestChunk, 'digest_id'),
+            )
+        )
+
+        return query
+
+    def _unembedded_source_contents_query(self, include_failed: bool = False):
+        """Build the query for source contents that don't have embeddings yet."""
+        from reconly_core.database.models import SourceContent, SourceContentChunk
+        from sqlalchemy import and_, or_
+
+        # Build filter for unembedded source contents
+        subquery = self.db.query(SourceContentChunk.source_content_id).distinct()
+
+        status_conditions = [
+            SourceContent.embedding_status.is_(None),  # Never attempted
+        ]
+        if include_failed:
+            status_conditions.append(SourceContent.embedding_status == EMBEDDING_STATUS_FAILED)
+
+        # Find source contents that either:
+        # 1. Have no embedding_status set (NULL - never attempted)
+        # 2. Have failed status (if include_failed=True)
+        # 3. Have no chunks (backward compatibility)
+        # and aren't completed, or
+        # 4. Have chunks embedded with a different model
+        query = self.db.query(SourceContent).filter(
+            or_(
+                and_(
+                    or_(
+                        or_(*status_conditions),
+                        ~SourceContent.id.in_(subquery)
+                    ),
+                    # Exclude source contents already completed
+                    or_(
+                        SourceContent.embedding_status.is_(None),
+                        SourceContent.embedding_status != EMBEDDING_STATUS_COMPLETED
+                    ),
+                ),
+                self._outdated_model_condition(SourceContent, SourceContentChunk, 'source_content_id'),
+            )
+        )
+
+        return query
+
+    def _outdated_model_condition(self, entity_model, chunk_model, foreign_key: str):
+        """
+        Filter for entities with chunks embedded by a different model.
+
+        Chunks without a recorded model predate model tracking and are not
+        considered outdated.
+        """
+        from sqlalchemy import exists
+
+        return exists().where(
+            getattr(chunk_model, foreign_key) == entity_model.id,
+            chunk_model.embedding_model.isnot(None),
+            chunk_model.embedding_model != self.model_identity,
+        )
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # BACKFILL METHODS
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    async def backfill_digests(
+        self,
+        limit: Optional[int] = None,
+        include_failed: bool = False,
+        reembed_all: bool = False,
+        include_summary: bool = True,
+        progress_callback: Optional[Callable[[int, int, "Digest"], None]] = None,
+        concurrency: Optional[int] = None,
+        commit_every: Optional[int] = None,
+    ) -> dict[int, int]:
+        """
+        Embed digests in bulk, e.g. after installing RAG or changing the model.
+
+        Unlike embed_unembedded_digests(), chunks from many digests are packed
+        into full provider batches, up to ``concurrency`` embedding requests
+        run at once, and chunk rows are bulk-inserted. Work is committed every
+        ``commit_every`` digests, so an interrupted backfill keeps its progress.
+
+        Digests embedded with a different model than the current one are
+        always included, so running the backfill after a model switch
+        re-embeds them (and resumes where it stopped if interrupted).
+
+        Args:
+            limit: Maximum number of digests to process (None = all)
+            include_failed: If True, also retry digests that previously failed
+            reembed_all: If True, re-embed every digest, replacing existing chunks
+            include_summary: If True, include summary as a separate chunk
+            progress_callback: Optional callback(current, total, digest) called
+                as each digest is chunked
+            concurrency: Embedding requests in flight (default: embedding.backfill_concurrency)
+            commit_every: Digests per commit (default: embedding.backfill_commit_every)
+
+        Returns:
+            Dictionary mapping digest_id -> number of chunks created (0 on failure)
+        """
+        from reconly_core.database.models import Digest, DigestChunk
+
+        if reembed_all:
+            query = self.db.query(Digest)
+        else:
+            query = self._unembedded_digests_query(include_failed)
+
+        return await self._backfill(
+            query,
+            Digest,
+            DigestChunk,
+            'digest_id',
+            lambda digest: self.chunker.chunk_digest(
+                digest,
+                include_title=True,
+                include_summary=include_summary,
+            ),
+            limit=limit,
+            progress_callback=progress_callback,
+            concurrency=concurrency,
+            commit_every=commit_every,
+        )
+
+    async def backfill_source_contents(
+        self,
+        limit: Optional[int] = None,
+        include_failed: bool = False,
+        reembed_all: bool = False,
+        progress_callback: Optional[Callable[[int, int, "SourceContent"], None]] = None,
+        concurrency: Optional[int] = None,
+        commit_every: Optional[int] = None,
+    ) -> dict[int, int]:
+        """
+        Embed source content in bulk. See backfill_digests().
+
+        Args:
+            limit: Maximum number of source contents to process (None = all)
+            include_failed: If True, also retry source contents that previously failed
+            reembed_all: If True, re-embed all source content, replacing existing chunks
+            progress_callback: Optional callback(current, total, source_content)
+            concurrency: Embedding requests in flight (default: embedding.backfill_concurrency)
+            commit_every: Records per commit (default: embedding.backfill_commit_every)
+
+        Returns:
+            Dictionary mapping source_content_id -> number of chunks created (0 on failure)
+        """
+        from reconly_core.database.models import SourceContent, SourceContentChunk
+
+        if reembed_all:
+            query = self.db.query(SourceContent)
+        else:
+            query = self._unembedded_source_contents_query(include_failed)
+
+        return await self._backfill(
+            query,
+            SourceContent,
+            SourceContentChunk,
+            'source_content_id',
+            self.chunker.chunk_source_content,
+            limit=limit,
+            progress_callback=progress_callback,
+            concurrency=concurrency,
+            commit_every=commit_every,
+        )
+
+    def _backfill_settings(
+        self,
+        concurrency: Optional[int],
+        commit_every: Optional[int],
+    ) -> tuple[int, int]:
+        """Resolve backfill concurrency and commit interval from settings."""
+        if concurrency is None or commit_every is None:
+            try:
+                from reconly_core.services.settings_service import SettingsService
+                settings = SettingsService(self.db)
+                if concurrency is None:
+                    concurrency = settings.get("embedding.backfill_concurrency")
+                if commit_every is None:
+                    commit_every = settings.get("embedding.backfill_commit_every")
+            except Exception:
+                pass
+
+        return (
+            max(1, int(concurrency or DEFAULT_BACKFILL_CONCURRENCY)),
+            max(1, int(commit_every or DEFAULT_BACKFILL_COMMIT_EVERY)),
+        )
+
+    async def _backfill(
+        self,
+        query,
+        entity_model,
+        chunk_model,
+        chunk_foreign_key: str,
+        chunk_entity: Callable[[Embeddable], list],
+        limit: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int, Embeddable], None]] = None,
+        concurrency: Optional[int] = None,
+        commit_every: Optional[int] = None,
+    ) -> dict[int, int]:
+        """
+        Embed entities window by window.
+
+        Each window of ``commit_every`` entities is chunked, its chunks are
+        embedded in provider-sized batches with up to ``concurrency``
+        requests in flight, and the chunk rows are replaced with one bulk
+        DELETE and one binary COPY before committing.
+        """
+        concurrency, commit_every = self._backfill_settings(concurrency, commit_every)
+
+        # Load IDs up front; entities are loaded one window at a time
+        id_query = query.with_entities(entity_model.id).order_by(entity_model.id)
+        if limit:
+            id_query = id_query.limit(limit)
+        entity_ids = [row[0] for row in id_query.all()]
+        total = len(entity_ids)
+
+        logger.info(
+            f"Backfilling embeddings for {total} {entity_model.__tablename__} "
+            f"(concurrency={concurrency}, commit_every={commit_every})"
+        )
+
+        results: dict[int, int] = {}
+        processed = 0
+
+        for start in range(0, total, commit_every):
+            window_ids = entity_ids[start:start + commit_every]
+            entities = self.db.query(entity_model).filter(
+                entity_model.id.in_(window_ids)
+            ).order_by(entity_model.id).all()
+
+            # Chunk every entity in the window
+            chunked = []
+            for entity in entities:
+                processed += 1
+                if progress_callback:
+                    progress_callback(processed, total, entity)
+                try:
+                    chunked.append((entity, chunk_entity(entity)))
+                except Exception as e:
+                    logger.error(f"Failed to chunk {entity_model.__name__} {entity.id}: {e}")
+                    entity.embedding_status = EMBEDDING_STATUS_FAILED
+                    entity.embedding_error = str(e)[:1000]
+                    results[entity.id] = 0
+
+            # Embed the window's new chunk text in full batches; unchanged
+            # chunks keep their stored vectors
+            texts = [chunk.text for _, text_chunks in chunked for chunk in text_chunks]
+            hashes = [chunk_text_hash(text) for text in texts]
+            reusable = self._reusable_embeddings(
+                chunk_model, chunk_foreign_key, [entity.id for entity, _ in chunked]
+            )
+            missing = self._missing_texts(texts, hashes, reusable)
+            new_embeddings, new_errors = await self._embed_concurrently(
+                list(missing.values()), concurrency
+            )
+            embedded = dict(zip(missing, zip(new_embeddings, new_errors)))
+            embeddings = []
+            errors = []
+            for text_hash in hashes:
+                embedding, error = embedded.get(text_hash, (reusable.get(text_hash), None))
+                embeddings.append(embedding)
+                errors.append(error)
+
+            filters = self._chunk_filter_values(entity_model, [entity.id for entity, _ in chunked])
+            rows = []
+            completed_ids = []
+            offset = 0
+            for entity, text_chunks in chunked:
+                count = len(text_chunks)
+                entity_embeddings = embeddings[offset:offset + count]
+                entity_hashes = hashes[offset:offset + count]
+                entity_errors = [error for error in errors[offset:offset + count] if error]
+                offset += count
+
+                if entity_errors:
+                    entity.embedding_status = EMBEDDING_STATUS_FAILED
+                    entity.embedding_error = str(entity_errors[0])[:1000]
+                    results[entity.id] = 0
+                    continue
+
+                rows.extend(self._chunk_rows(
+                    chunk_foreign_key, entity.id, text_chunks, entity_embeddings,
+                    entity_hashes, filters[entity.id],
+                ))
+                entity.embedding_status = EMBEDDING_STATUS_COMPLETED
+                entity.embedding_error = None
+                completed_ids.append(entity.id)
+                results[entity.id] = count
+
+            self._delete_chunks(chunk_model, chunk_foreign_key, completed_ids)
+            self._copy_chunks(chunk_model, rows)
+            self._refresh_centroids(entity_model, completed_ids)
+            self.db.commit()
+
+            logger.info(
+                f"Backfill progress: {processed}/{total} {entity_model.__tablename__}, "
+                f"{len(rows)} chunks written, {len(missing)} texts embedded"
+            )
+
+        return results
+
+    def _chunk_rows(
+        self,
+        foreign_key: str,
+        entity_id: int,
+        text_chunks: list,
+        embeddings: List[List[float]],
+        hashes: List[str],
+        filters: dict,
+    ) -> List[dict]:
+        """Build chunk table rows for one entity's embedded text chunks."""
+        now = datetime.utcnow()
+        model = self.model_identity
+        return [
+            {
+                foreign_key: entity_id,
+                'chunk_index': i,
+                'text': text_chunk.text,
+                'embedding': embedding,
+                'token_count': text_chunk.token_count,
+                'start_char': text_chunk.start_char,
+                'end_char': text_chunk.end_char,
+                'extra_data': text_chunk.extra_data if text_chunk.extra_data else None,
+                'text_hash': text_hash,
+                'embedding_model': model,
+                'created_at': now,
+                **filters,
+            }
+            for i, (text_chunk, embedding, text_hash) in enumerate(zip(text_chunks, embeddings, hashes))
+        ]
+
+    def _reusable_embeddings(self, chunk_model, foreign_key: str, entity_ids: List[int]) -> dict:
+        """
+        Load the stored vectors of these entities' chunks that the current
+        model produced.
+
+        Returns:
+            Dictionary mapping chunk text hash -> embedding
+        """
+        if not entity_ids:
+            return {}
+
+        rows = self.db.query(chunk_model.text_hash, chunk_model.embedding).filter(
+            getattr(chunk_model, foreign_key).in_(entity_ids),
+            chunk_model.embedding_model == self.model_identity,
+            chunk_model.text_hash.isnot(None),
+            chunk_model.embedding.isnot(None),
+        ).all()
+        return {text_hash: embedding for text_hash, embedding in rows}
+
+    @staticmethod
+    def _missing_texts(texts: List[str], hashes: List[str], reusable: dict) -> dict[str, str]:
+        """Texts without a reusable vector, deduplicated, keyed by hash."""
+        missing: dict[str, str] = {}
+        for text, text_hash in zip(texts, hashes):
+            if text_hash not in reusable:
+                missing.setdefault(text_hash, text)
+        return missing
+
+    async def _embed_missing(
+        self,
+        texts: List[str],
+        hashes: List[str],
+        reusable: dict,
+    ) -> List[List[float]]:
+        """Embed texts, only sending those without a reusable vector to the provider."""
+        missing = self._missing_texts(texts, hashes, reusable)
+        if missing:
+            embedded = dict(zip(missing, await self._embed_with_batching(list(missing.values()))))
+        else:
+            embedded = {}
+
+        reused = sum(1 for h in hashes if h in reusable)
+        if reused:
+            logger.debug(f"Reused stored embeddings for {reused} of {len(texts)} chunks")
+        return [embedded[h] if h in embedded else reusable[h] for h in hashes]
+
+    def _delete_chunks(self, chunk_model, foreign_key: str, entity_ids: List[int]) -> int:
+        """Delete the chunks of several entities with a single DELETE."""
+        if not entity_ids:
+            return 0
+        return self.db.query(chunk_model).filter(
+            getattr(chunk_model, foreign_key).in_(entity_ids)
+        ).delete(synchronize_session=False)
+
+    def _insert_chunks(self, chunk_model, rows: List[dict]) -> List[ChunkType]:
+        """
+        Insert chunk rows with a multi-row INSERT, bypassing the unit of work.
+
+        Returns:
+            Chunk instances for the new rows, detached from the session
+        """
+        from sqlalchemy import insert
+        from sqlalchemy.orm import make_transient_to_detached
+
+        if not rows:
+            return []
+
+        ids = self.db.scalars(
+            insert(chunk_model).returning(chunk_model.id, sort_by_parameter_order=True),
+            rows,
+        ).all()
+
+        chunks = []
+        for chunk_id, row in zip(ids, rows):
+            chunk = chunk_model(id=chunk_id, **row)
+            make_transient_to_detached(chunk)
+            chunks.append(chunk)
+        return chunks
+
+    def _copy_chunks(self, chunk_model, rows: List[dict]) -> None:
+        """Write chunk rows with binary COPY (multi-row INSERT if unsupported)."""
+        from sqlalchemy import insert
+
+        if rows and not copy_rows(self.db, chunk_model.__table__, rows):
+            self.db.execute(insert(chunk_model), rows)
+
+    def _refresh_centroids(self, entity_model, entity_ids: List[int]) -> None:
+        """Recompute the centroid embeddings of the digests owning these entities."""
+        from reconly_core.database.models import DigestSourceItem, SourceContent
+
+        if not entity_ids:
+            return
+
+        if entity_model is SourceContent:
+            digest_ids = [
+                row[0] for row in self.db.query(DigestSourceItem.digest_id).join(
+                    SourceContent, SourceContent.digest_source_item_id == DigestSourceItem.id
+                ).filter(SourceContent.id.in_(entity_ids)).distinct().all()
+            ]
+            refresh_digest_centroids(self.db, digest_ids, 'source_content')
+        else:
+            refresh_digest_centroids(self.db, entity_ids, 'digest')
+
+    def _chunk_filter_values(self, entity_model, entity_ids: List[int]) -> dict[int, dict]:
+        """
+        Load the digest attributes stored on chunk rows for filtered search.
+
+        Returns:
+            Dictionary mapping entity ID -> {feed_id, source_id, digest_created_at};
+            every requested ID is present (values are None if not found)
+        """
+        from reconly_core.database.models import (
+            Digest, DigestSourceItem, FeedRun, SourceContent,
+        )
+
+        values = {entity_id: dict.fromkeys(CHUNK_FILTER_COLUMNS) for entity_id in entity_ids}
+        if not entity_ids:
+            return values
+
+        if entity_model is SourceContent:
+            # Source content chunks filter on the source item's source
+            query = self.db.query(
+                SourceContent.id, FeedRun.feed_id, DigestSourceItem.source_id, Digest.created_at,
+            ).join(
+                DigestSourceItem, SourceContent.digest_source_item_id == DigestSourceItem.id
+            ).join(
+                Digest, DigestSourceItem.digest_id == Digest.id
+            ).filter(SourceContent.id.in_(entity_ids))
+        else:
+            query = self.db.query(
+                Digest.id, FeedRun.feed_id, Digest.source_id, Digest.created_at,
+            ).filter(Digest.id.in_(entity_ids))
+
+        query = query.outerjoin(FeedRun, Digest.feed_run_id == FeedRun.id)
+        for entity_id, feed_id, source_id, created_at in query.all():
+            values[entity_id] = {
+                'feed_id': feed_id,
+                'source_id': source_id,
+                'digest_created_at': created_at,
+            }
+
+        return values
+
+    async def _embed_concurrently(
+        self,
+        texts: List[str],
+        concurrency: int,
+    ) -> tuple[List[List[float]], List[Optional[Exception]]]:
+        """
+        Embed texts in batches of batch_size with up to ``concurrency`` batches in flight.
+
+        Returns:
+            Tuple of (embeddings, errors) aligned with texts; texts of a failed
+            batch get an empty embedding and the batch's exception
+        """
+        batches = [
+            texts[i:i + self.batch_size]
+            for i in range(0, len(texts), self.batch_size)
+        ]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self.provider.embed(batch)
+
+        batch_results = await asyncio.gather(
+            *(embed_batch(batch) for batch in batches),
+            return_exceptions=True,
+        )
+
+        embeddings: List[List[float]] = []
+        errors: List[Optional[Exception]] = []
+        for batch, result in zip(batches, batch_results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error embedding batch: {result}")
+                embeddings.extend([] for _ in batch)
+                errors.extend(result for _ in batch)
+            else:
+                embeddings.extend(result)
+                errors.extend(None for _ in batch)
+
+        return embeddings, errors
+
     async def _embed_with_batching(
         self,
         texts: List[str],
@@ -587,13 +1160,14 @@ class EmbeddingService:
         Returns:
             Number of chunks deleted
         """
-        from reconly_core.database.models import DigestChunk
+        from reconly_core.database.models import Digest, DigestChunk
 
         count = self.db.query(DigestChunk).filter(
             DigestChunk.digest_id == digest_id
         ).delete()
 
         self.db.flush()
+        self._refresh_centroids(Digest, [digest_id])
         return count
 
     def _get_entity_statistics(
@@ -638,6 +1212,10 @@ class EmbeddingService:
             'not_started': self.db.query(func.count(entity_model.id)).filter(
                 entity_model.embedding_status.is_(None)
             ).scalar() or 0,
+            # Embedded with a different model than the current one
+            'outdated_model': self.db.query(func.count(entity_model.id)).filter(
+                self._outdated_model_condition(entity_model, chunk_model, chunk_foreign_key)
+            ).scalar() or 0,
         }
 
         return {
@@ -668,6 +1246,7 @@ class EmbeddingService:
             'total_chunks': digest_stats['total_chunks'] + source_stats['total_chunks'],
             'embedding_provider': self.provider.get_provider_name(),
             'embedding_dimension': self.provider.get_dimension(),
+            'embedding_model': self.model_identity,
             # Digest statistics (with field name mapping)
             'digests': {
                 'total_chunks': digest_stats['total_chunks'],
@@ -49,6 +49,12 @@ OLLAMA_EMBEDDING_MODELS = {
 # Default model if not specified
 DEFAULT_OLLAMA_EMBEDDING_MODEL = 'bge-m3'
 
+# Texts sent per /api/embed request
+OLLAMA_EMBED_BATCH_SIZE = 32
+
+# Default number of /api/embed requests in flight per embed() call
+DEFAULT_OLLAMA_EMBED_CONCURRENCY = 2
+
 
 class OllamaEmbedding(EmbeddingProvider):
     """Generates embeddings using local Ollama server.
@@ -68,6 +74,7 @@ class OllamaEmbedding(EmbeddingProvider):
         model: Optional[str] = None,
         base_url: Optional[str] = None,
         timeout: int = 120,
+        max_concurrency: Optional[int] = None,
     ):
         """
         Initialize the Ollama embedding provider.
@@ -77,11 +84,18 @@ class OllamaEmbedding(EmbeddingProvider):
             model: Model name to use (e.g., 'bge-m3', 'nomic-embed-text')
             base_url: Ollama server URL (default: http://localhost:11434)
             timeout: Request timeout in seconds
+            max_concurrency: Batch requests in flight per embed() call
+                (default: OLLAMA_EMBED_CONCURRENCY or 2)
         """
         super().__init__(api_key=None)
         self.base_url = base_url or os.getenv('OLLAMA_BASE_URL', 'http://localhost:11434')
         self.timeout = timeout
         self.model = model or os.getenv('EMBEDDING_MODEL', DEFAULT_OLLAMA_EMBEDDING_MODEL)
+        self.max_concurrency = max(1, max_concurrency or int(
+            os.getenv('OLLAMA_EMBED_CONCURRENCY', DEFAULT_OLLAMA_EMBED_CONCURRENCY)
+        ))
+        # Set once the server turns out to predate /api/embed (Ollama < 0.3)
+        self._legacy_api = False
 
         # Get dimension from model config or default
         model_config = OLLAMA_EMBEDDING_MODELS.get(self.model, {})
@@ -112,7 +126,7 @@ class OllamaEmbedding(EmbeddingProvider):
             is_local=True,
             requires_api_key=False,
             supports_batch=True,
-            max_batch_size=32,
+            max_batch_size=OLLAMA_EMBED_BATCH_SIZE,
             max_tokens_per_text=8192,
             dimension=1024,  # Default for bge-m3
         )
@@ -224,6 +238,11 @@ class OllamaEmbedding(EmbeddingProvider):
         """
         Generate embeddings for a list of texts using Ollama.
 
+        Texts are sent in batches to the multi-input ``/api/embed`` endpoint,
+        with up to ``max_concurrency`` batch requests in flight. Servers
+        without that endpoint are handled one text at a time via the legacy
+        ``/api/embeddings`` endpoint.
+
         Args:
             texts: List of text strings to embed
 
@@ -237,24 +256,72 @@ class OllamaEmbedding(EmbeddingProvider):
         if not texts:
             raise ValueError("Cannot embed empty list of texts")
 
-        embeddings = []
+        batches = [
+            texts[i:i + OLLAMA_EMBED_BATCH_SIZE]
+            for i in range(0, len(texts), OLLAMA_EMBED_BATCH_SIZE)
+        ]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        loop = asyncio.get_running_loop()
+
+        async def embed_batch(batch: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await loop.run_in_executor(None, self._embed_batch_sync, batch)
 
-        # Ollama's embedding API handles one text at a time
-        # We process sequentially to avoid overwhelming the server
-        for text in texts:
-            embedding = await self._embed_single(text)
-            embeddings.append(embedding)
+        results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+        return [embedding for batch_embeddings in results for embedding in batch_embeddings]
+
+    def _embed_batch_sync(self, texts: List[str]) -> List[List[float]]:
+        """Synchronous embedding for one batch of texts."""
+        if self._legacy_api:
+            return [self._embed_sync(text) for text in texts]
+
+        try:
+            response = requests.post(
+                f"{self.base_url}/api/embed",
+                json={
+                    "model": self.model,
+                    "input": texts,
+                },
+                timeout=self.timeout
+            )
+        except requests.Timeout:
+            raise RuntimeError(
+                f"Ollama embedding request timed out after {self.timeout}s"
+            )
+        except requests.ConnectionError:
+            raise RuntimeError(
+                f"Could not connect to Ollama server at {self.base_url}. "
+                "Make sure Ollama is running."
+            )
+
+        if response.status_code == 404 and not self._is_api_error(response):
+            # Unknown route (not a missing model): server predates /api/embed
+            self._legacy_api = True
+            return [self._embed_sync(text) for text in texts]
+
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"Ollama API error {response.status_code}: {response.text}"
+            )
+
+        embeddings = response.json().get('embeddings') or []
+        if len(embeddings) != len(texts) or not all(embeddings):
+            raise RuntimeError(
+                f"Ollama returned {len(embeddings)} embeddings for {len(texts)} texts"
+            )
 
         return embeddings
 
-    async def _embed_single(self, text: str) -> List[float]:
-        """Generate embedding for a single text."""
-        # Run synchronous request in thread pool to make it async
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._embed_sync, text)
+    @staticmethod
+    def _is_api_error(response) -> bool:
+        """Check whether a response carries an Ollama JSON error (e.g. model not found)."""
+        try:
+            return bool(response.json().get('error'))
+        except (ValueError, AttributeError):
+            return False
 
     def _embed_sync(self, text: str) -> List[float]:
-        """Synchronous embedding for a single text."""
+        """Synchronous embedding for a single text (legacy /api/embeddings)."""
         try:
             response = requests.post(
                 f"{self.base_url}/api/embeddings",
@@ -11,13 +11,23 @@ Relationship types:
 Chunk Sources:
 - source_content: Use SourceContentChunk embeddings (cleaner, recommended)
 - digest: Use DigestChunk embeddings (fallback for legacy data)
+
+Semantic similarity compares digest centroids (the mean of a digest's chunk
+embeddings, kept on the digest row by EmbeddingService) with an HNSW
+nearest-neighbour search over digests.
 """
 import logging
+import threading
+from collections import Counter, OrderedDict, defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Iterable, Literal
+
+from sqlalchemy import text
 
-from reconly_core.rag.search.vector import ChunkSource
+from reconly_core.database.invalidation import invalidate_on_commit
+from reconly_core.rag.embedding_service import CENTROID_COLUMNS, refresh_digest_centroids
+from reconly_core.rag.search.vector import DEFAULT_EF_SEARCH, MAX_EF_SEARCH, ChunkSource
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -28,6 +38,85 @@ logger = logging.getLogger(__name__)
 # Relationship types
 RelationshipType = Literal["semantic", "tag", "source"]
 
+# Edge key (source_digest_id, target_digest_id, relationship_type) -> (score, extra_data)
+EdgeMap = dict[tuple[int, int, str], tuple[float, dict]]
+
+# Rows per INSERT statement when writing edges
+EDGE_INSERT_BATCH_SIZE = 1000
+
+# Nearest digests by centroid embedding: one HNSW scan per digest (LATERAL)
+_CENTROID_NEIGHBOURS_SQL = """
+    SELECT d.id, nearest.id AS other_id, nearest.distance
+    FROM digests d
+    CROSS JOIN LATERAL (
+        SELECT o.id, o.{column} <=> d.{column} AS distance
+        FROM digests o
+        WHERE o.{column} IS NOT NULL AND o.id <> d.id
+        ORDER BY o.{column} <=> d.{column}
+        LIMIT :limit
+    ) AS nearest
+    WHERE d.id = ANY(:digest_ids) AND d.{column} IS NOT NULL
+"""
+
+
+# Graph traversal strategies for get_graph_data()
+GraphTraversal = Literal["frontier", "recursive"]
+
+# Assembled graphs kept by the graph cache
+GRAPH_CACHE_SIZE = 32
+
+# Reachable digests from a center in one statement: top-N outgoing edges per
+# digest (LATERAL), expanding only digests that pass the filters. Each digest
+# is reported at the first hop it was reached, via its strongest edge.
+_GRAPH_WALK_SQL = """
+    WITH RECURSIVE walk(digest_id, hop, score) AS (
+        SELECT CAST(:center_id AS integer), 0, CAST(1.0 AS double precision)
+        UNION
+        SELECT edge.target_digest_id, walk.hop + 1, edge.score
+        FROM walk
+        CROSS JOIN LATERAL (
+            SELECT r.target_digest_id, r.score
+            FROM digest_relationships r
+            WHERE r.source_digest_id = walk.digest_id
+              AND r.relationship_type = ANY(:rel_types)
+              AND r.score >= :min_sim
+            ORDER BY r.score DESC, r.id
+            LIMIT :max_edges
+        ) AS edge
+        WHERE walk.hop < :depth
+          AND (walk.digest_id = :center_id OR NOT :filtered OR walk.digest_id = ANY(:allowed_ids))
+    )
+    SELECT digest_id, hop
+    FROM (
+        SELECT DISTINCT ON (digest_id) digest_id, hop, score
+        FROM walk
+        ORDER BY digest_id, hop, score DESC
+    ) AS first_visit
+    ORDER BY hop, score DESC, digest_id
+"""
+
+# Changes whenever relationships, digests, tags or tag assignments are added
+# or removed, or a feed or source is edited, including by other processes.
+# Edits without a version column (e.g. a renamed tag) made in this process
+# invalidate the cache on commit instead (see _GRAPH_TABLES).
+_GRAPH_VERSION_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM digest_relationships),
+        (SELECT MAX(id) FROM digest_relationships),
+        (SELECT COUNT(*) FROM digests),
+        (SELECT MAX(id) FROM digests),
+        (SELECT COUNT(*) FROM digest_tags),
+        (SELECT COUNT(*) FROM tags),
+        (SELECT MAX(id) FROM tags),
+        (SELECT MAX(updated_at) FROM feeds),
+        (SELECT MAX(updated_at) FROM sources)
+"""
+
+# Committed writes to these tables drop all cached graphs
+_GRAPH_TABLES = frozenset({
+    'digests', 'digest_relationships', 'digest_tags', 'tags', 'feeds', 'feed_runs', 'sources',
+})
+
 
 @dataclass
 class GraphNode:
@@ -75,6 +164,135 @@ class GraphData:
     edges: list[GraphEdge] = field(default_factory=list)
 
 
+class _GraphAssembly:
+    """Nodes and edges collected while building a graph."""
+
+    def __init__(self, rel_types: list[str]):
+        self.rel_types = rel_types
+        self.nodes: dict[str, GraphNode] = {}
+        self.edges: list[GraphEdge] = []
+        # Digest ID -> target digest IDs, in edge order
+        self.targets: dict[int, list[int]] = defaultdict(list)
+
+    def add_digest(
+        self,
+        row,
+        tags: list[tuple[int, str]],
+        tag_counts: dict[int, int],
+    ) -> None:
+        """Add a digest node with its feed and tag nodes and edges."""
+        node_id = f"d_{row.id}"
+        feed_id = row.feed_id
+        feed_name = (row.feed_name or f"Feed {feed_id}") if feed_id else None
+
+        self.nodes[node_id] = GraphNode(
+            id=node_id,
+            type="digest",
+            label=row.title[:50] if row.title else f"Digest {row.id}",
+            data={
+                "digest_id": row.id,
+                "title": row.title,
+                "created_at": row.created_at.isoformat() if row.created_at else None,
+                "source_id": row.source_id,
+                "feed_id": feed_id,
+                "feed_name": feed_name,
+            }
+        )
+
+        # Add feed node as cluster anchor (only if source relationships requested)
+        if feed_id and "source" in self.rel_types:
+            feed_node_id = f"f_{feed_id}"
+            if feed_node_id not in self.nodes:
+                self.nodes[feed_node_id] = GraphNode(
+                    id=feed_node_id,
+                    type="feed",
+                    label=feed_name,
+                    data={"feed_id": feed_id, "name": feed_name}
+                )
+            self.edges.append(GraphEdge(
+                source=node_id,
+                target=feed_node_id,
+                type="source",
+                score=0.5,  # Lower score so it doesn't dominate
+            ))
+
+        # Add tag nodes (only if tag relationships requested)
+        if "tag" in self.rel_types:
+            for tag_id, tag_name in tags:
+                tag_node_id = f"t_{tag_name}"
+                if tag_node_id not in self.nodes:
+                    self.nodes[tag_node_id] = GraphNode(
+                        id=tag_node_id,
+                        type="tag",
+                        label=tag_name,
+                        data={"tag_id": tag_id, "count": tag_counts.get(tag_id, 0)}
+                    )
+                self.edges.append(GraphEdge(
+                    source=node_id,
+                    target=tag_node_id,
+                    type="tag",
+                    score=1.0,
+                ))
+
+    def add_relationship(self, rel) -> None:
+        """Add a digest-to-digest edge."""
+        self.edges.append(GraphEdge(
+            source=f"d_{rel.source_digest_id}",
+            target=f"d_{rel.target_digest_id}",
+            type=rel.relationship_type,
+            score=rel.score,
+            extra_data=rel.extra_data or {},
+        ))
+        self.targets[rel.source_digest_id].append(rel.target_digest_id)
+
+
+class _GraphCache:
+    """LRU cache of assembled graphs, each tagged with the table version it was built from."""
+
+    def __init__(self, max_entries: int = GRAPH_CACHE_SIZE):
+        self._entries: OrderedDict[tuple, tuple[tuple, GraphData]] = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, version: tuple) -> GraphData | None:
+        """Return a copy of the cached graph, or None if missing or stale."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != version:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            data = entry[1]
+        return GraphData(nodes=list(data.nodes), edges=list(data.edges))
+
+    def put(self, key: tuple, version: tuple, data: GraphData) -> None:
+        """Store a copy of a graph."""
+        with self._lock:
+            self._entries[key] = (version, GraphData(nodes=list(data.nodes), edges=list(data.edges)))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached graphs."""
+        with self._lock:
+            self._entries.clear()
+
+
+_graph_cache = _GraphCache()
+
+
+def clear_graph_cache() -> None:
+    """Drop all cached graphs (they are also invalidated automatically on change)."""
+    _graph_cache.clear()
+
+
+# Text statements are not writes here: the graph's own text() queries are reads
+invalidate_on_commit(_GRAPH_TABLES, _graph_cache.clear, text_statements=False)
+
+
 class GraphService:
     """Service for computing and managing digest relationships.
 
@@ -100,6 +318,9 @@ class GraphService:
         >>> # Fallback to digest chunks for legacy data
         >>> await graph.compute_relationships(digest_id=42, chunk_source='digest')
         >>>
+        >>> # Rebuild relationships for many digests at once
+        >>> await graph.compute_relationships_batch([42, 43, 44])
+        >>>
         >>> # Query graph centered on a digest
         >>> data = graph.get_graph_data(center_digest_id=42, depth=2)
         >>> print(f"Found {len(data.nodes)} nodes, {len(data.edges)} edges")
@@ -111,6 +332,9 @@ class GraphService:
     DEFAULT_MAX_EDGES_PER_DIGEST = 10
     DEFAULT_TAG_THRESHOLD = 0.15
 
+    # Digests per pass of compute_relationships_batch()
+    DEFAULT_BATCH_SIZE = 200
+
     def __init__(
         self,
         db: "Session",
@@ -222,23 +446,14 @@ class GraphService:
             logger.debug("No embedding provider, skipping semantic relationships")
             return 0
 
-        # Get representative embedding based on chunk source
-        if chunk_source == 'source_content':
-            digest_embedding = self._get_source_content_embedding(digest)
-        else:
-            digest_embedding = self._get_digest_chunk_embedding(digest)
-
-        if digest_embedding is None:
-            logger.debug(f"Digest {digest.id} has no embedded chunks (chunk_source={chunk_source})")
-            return 0
-
-        # Find similar digests
         similar_digests = self._find_similar_digests(
             digest.id,
-            digest_embedding,
             chunk_source=chunk_source,
             limit=self.max_edges_per_digest * 2,  # Get more to filter
         )
+        if not similar_digests:
+            logger.debug(f"No similar digests for digest {digest.id} (chunk_source={chunk_source})")
+            return 0
 
         # Create relationships
         created = 0
@@ -260,179 +475,58 @@ class GraphService:
 
         return created
 
-    def _get_digest_chunk_embedding(self, digest) -> list[float] | None:
-        """Get a representative embedding from DigestChunk.
-
-        Uses the first chunk's embedding as representative.
-        """
-        from reconly_core.database.models import DigestChunk
-
-        chunk = self.db.query(DigestChunk).filter(
-            DigestChunk.digest_id == digest.id,
-            DigestChunk.embedding.isnot(None)
-        ).first()
-
-        if not chunk:
-            return None
-
-        return self._embedding_to_list(chunk.embedding)
-
-    def _get_source_content_embedding(self, digest) -> list[float] | None:
-        """Get a representative embedding from SourceContentChunk.
-
-        Uses the first chunk's embedding from the digest's source content.
-        The relationship chain is:
-        Digest -> DigestSourceItem -> SourceContent -> SourceContentChunk
-        """
-        from reconly_core.database.models import (
-            DigestSourceItem, SourceContent, SourceContentChunk
-        )
-
-        # Get the first source content chunk with an embedding for this digest
-        chunk = self.db.query(SourceContentChunk).join(
-            SourceContent, SourceContentChunk.source_content_id == SourceContent.id
-        ).join(
-            DigestSourceItem, SourceContent.digest_source_item_id == DigestSourceItem.id
-        ).filter(
-            DigestSourceItem.digest_id == digest.id,
-            SourceContentChunk.embedding.isnot(None)
-        ).order_by(
-            SourceContentChunk.chunk_index
-        ).first()
-
-        if not chunk:
-            return None
-
-        return self._embedding_to_list(chunk.embedding)
-
     def _find_similar_digests(
         self,
-        exclude_digest_id: int,
-        query_embedding: list[float],
+        digest_id: int,
         chunk_source: ChunkSource = 'source_content',
         limit: int = 20,
     ) -> list[tuple[int, float]]:
-        """Find digests with similar embeddings using pgvector.
-
-        Uses cosine distance to find similar chunks, grouped by digest,
-        taking the minimum distance (maximum similarity) per digest.
+        """Find digests with similar centroid embeddings.
 
         Args:
-            exclude_digest_id: Digest to exclude from results
-            query_embedding: Embedding to compare against
-            chunk_source: Which chunks to search ('source_content' or 'digest')
+            digest_id: Digest to find neighbours for
+            chunk_source: Which centroid to compare ('source_content' or 'digest')
             limit: Maximum results to return
 
         Returns:
-            List of (digest_id, similarity_score) tuples
+            List of (digest_id, similarity_score) tuples, most similar first
         """
-        if chunk_source == 'source_content':
-            return self._find_similar_digests_from_source_content(
-                exclude_digest_id, query_embedding, limit
-            )
-        else:
-            return self._find_similar_digests_from_digest_chunks(
-                exclude_digest_id, query_embedding, limit
-            )
+        neighbours = self._nearest_digests([digest_id], chunk_source, limit)
+        return neighbours.get(digest_id, [])
 
-    def _find_similar_digests_from_digest_chunks(
+    def _nearest_digests(
         self,
-        exclude_digest_id: int,
-        query_embedding: list[float],
-        limit: int = 20,
-    ) -> list[tuple[int, float]]:
-        """Find similar digests using DigestChunk embeddings.
-
-        Uses cosine distance to find similar digest chunks, grouped by digest,
-        taking the minimum distance (maximum similarity) per digest.
+        digest_ids: list[int],
+        chunk_source: ChunkSource,
+        limit: int,
+    ) -> dict[int, list[tuple[int, float]]]:
+        """Nearest neighbours of many digests by centroid embedding.
 
-        Args:
-            exclude_digest_id: Digest to exclude from results
-            query_embedding: Embedding to compare against
-            limit: Maximum results to return
+        Centroids missing for these digests (e.g. chunks written outside
+        EmbeddingService) are filled in first.
 
         Returns:
-            List of (digest_id, similarity_score) tuples
+            Dictionary mapping digest ID -> [(other_digest_id, similarity)],
+            most similar first
         """
-        from sqlalchemy import func
-        from reconly_core.database.models import DigestChunk
-
-        query = self.db.query(
-            DigestChunk.digest_id,
-            func.min(DigestChunk.embedding.cosine_distance(query_embedding)).label('min_distance')
-        ).filter(
-            DigestChunk.digest_id != exclude_digest_id,
-            DigestChunk.embedding.isnot(None)
-        ).group_by(
-            DigestChunk.digest_id
-        ).order_by(
-            'min_distance'
-        ).limit(limit)
-
-        results = []
-        for digest_id, distance in query.all():
-            similarity = max(0.0, 1.0 - distance)
-            results.append((digest_id, similarity))
-
-        return results
-
-    def _find_similar_digests_from_source_content(
-        self,
-        exclude_digest_id: int,
-        query_embedding: list[float],
-        limit: int = 20,
-    ) -> list[tuple[int, float]]:
-        """Find similar digests using SourceContentChunk embeddings.
-
-        Uses cosine distance to find similar source content chunks from other
-        digests. Results are grouped by the parent digest, taking the minimum
-        distance (maximum similarity) per digest.
-
-        The relationship chain is:
-        SourceContentChunk -> SourceContent -> DigestSourceItem -> Digest
-
-        This provides cleaner semantic relationships by using original source
-        content instead of processed digest summaries with template noise.
-
-        Args:
-            exclude_digest_id: Digest to exclude from results
-            query_embedding: Embedding to compare against
-            limit: Maximum results to return
+        refresh_digest_centroids(self.db, digest_ids, chunk_source, only_missing=True)
 
-        Returns:
-            List of (digest_id, similarity_score) tuples
-        """
-        from sqlalchemy import func
-        from reconly_core.database.models import (
-            SourceContentChunk, SourceContent, DigestSourceItem
+        # The HNSW index returns at most ef_search rows per scan
+        self.db.execute(
+            text("SELECT set_config('hnsw.ef_search', :value, true)"),
+            {'value': str(min(MAX_EF_SEARCH, max(DEFAULT_EF_SEARCH, limit)))},
         )
-
-        # Query SourceContentChunk with joins to get digest_id
-        # Group by digest_id and take minimum distance
-        query = self.db.query(
-            DigestSourceItem.digest_id,
-            func.min(
-                SourceContentChunk.embedding.cosine_distance(query_embedding)
-            ).label('min_distance')
-        ).join(
-            SourceContent, SourceContentChunk.source_content_id == SourceContent.id
-        ).join(
-            DigestSourceItem, SourceContent.digest_source_item_id == DigestSourceItem.id
-        ).filter(
-            DigestSourceItem.digest_id != exclude_digest_id,
-            SourceContentChunk.embedding.isnot(None)
-        ).group_by(
-            DigestSourceItem.digest_id
-        ).order_by(
-            'min_distance'
-        ).limit(limit)
-
-        results = []
-        for digest_id, distance in query.all():
-            similarity = max(0.0, 1.0 - distance)
-            results.append((digest_id, similarity))
-
-        return results
+        sql = _CENTROID_NEIGHBOURS_SQL.format(column=CENTROID_COLUMNS[chunk_source])
+        rows = self.db.execute(
+            text(sql), {'digest_ids': list(digest_ids), 'limit': limit}
+        ).all()
+
+        neighbours: dict[int, list[tuple[int, float]]] = defaultdict(list)
+        for digest_id, other_id, distance in rows:
+            neighbours[digest_id].append((other_id, max(0.0, 1.0 - distance)))
+        for similar in neighbours.values():
+            similar.sort(key=lambda item: item[1], reverse=True)
+        return neighbours
 
     def _compute_tag_relationships(self, digest) -> int:
         """Compute tag-based relationships.
@@ -510,13 +604,7 @@ class GraphService:
         digest_time = digest.created_at or datetime.utcnow()
 
         for other in other_digests:
-            other_time = other.created_at or datetime.utcnow()
-
-            # Calculate temporal score (exponential decay over ~25 days)
-            time_diff = abs((digest_time - other_time).total_seconds())
-            days_diff = time_diff / 86400  # Convert to days
-            # Score decays from 1.0 to ~0.55 over 30 days
-            score = max(0.1, min(1.0, 1.0 * (0.98 ** days_diff)))
+            score = self._temporal_score(digest_time, other.created_at)
 
             if score < self.min_similarity:
                 continue
@@ -530,6 +618,230 @@ class GraphService:
 
         return created
 
+    @staticmethod
+    def _temporal_score(digest_time: datetime, other_time: datetime | None) -> float:
+        """Score two digests from the same source by temporal proximity."""
+        other_time = other_time or datetime.utcnow()
+
+        # Calculate temporal score (exponential decay over ~25 days)
+        time_diff = abs((digest_time - other_time).total_seconds())
+        days_diff = time_diff / 86400  # Convert to days
+        # Score decays from 1.0 to ~0.55 over 30 days
+        return max(0.1, min(1.0, 1.0 * (0.98 ** days_diff)))
+
+    # ═══════════════════════════════════════════════════════════════════════════════
+    # BULK RELATIONSHIP COMPUTATION
+    # ═══════════════════════════════════════════════════════════════════════════════
+
+    async def compute_relationships_batch(
+        self,
+        digest_ids: Iterable[int],
+        include_semantic: bool = True,
+        include_tags: bool = True,
+        include_source: bool = True,
+        chunk_source: ChunkSource | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> int:
+        """Compute relationships for many digests at once.
+
+        Set-based counterpart of compute_relationships(). Each batch of
+        digests takes one kNN query (LATERAL join over the HNSW index), two
+        tag queries and one source query. Edges are deduplicated in memory
+        and written with INSERT ... ON CONFLICT DO NOTHING.
+
+        Args:
+            digest_ids: IDs of the digests to compute relationships for
+            include_semantic: Whether to compute semantic relationships
+            include_tags: Whether to compute tag relationships
+            include_source: Whether to compute source relationships
+            chunk_source: Which chunks to use for semantic similarity
+                          ('source_content' or 'digest'). If None, uses default.
+            batch_size: Digests per pass
+
+        Returns:
+            Number of relationships created
+        """
+        effective_chunk_source = chunk_source if chunk_source is not None else self.default_chunk_source
+        ids = list(dict.fromkeys(digest_ids))
+
+        total_created = 0
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            edges: EdgeMap = {}
+
+            if include_semantic:
+                self._collect_semantic_edges(batch, effective_chunk_source, edges)
+            if include_tags:
+                self._collect_tag_edges(batch, edges)
+            if include_source:
+                self._collect_source_edges(batch, edges)
+
+            total_created += self._insert_edges(edges)
+
+        self.db.flush()
+        logger.info(f"Created {total_created} relationships for {len(ids)} digests")
+
+        return total_created
+
+    @staticmethod
+    def _add_edge(
+        edges: EdgeMap,
+        source_id: int,
+        target_id: int,
+        rel_type: str,
+        score: float,
+        extra_data: dict,
+    ) -> None:
+        """Add an edge, keeping the higher score when it was already found."""
+        key = (source_id, target_id, rel_type)
+        if key not in edges or edges[key][0] < score:
+            edges[key] = (score, extra_data)
+
+    def _collect_semantic_edges(
+        self,
+        digest_ids: list[int],
+        chunk_source: ChunkSource,
+        edges: EdgeMap,
+    ) -> None:
+        """Add bidirectional semantic edges for a batch of digests."""
+        if not self.embedding_provider:
+            logger.debug("No embedding provider, skipping semantic relationships")
+            return
+
+        neighbours = self._nearest_digests(digest_ids, chunk_source, self.max_edges_per_digest)
+
+        extra_data = {"method": "cosine_similarity", "chunk_source": chunk_source}
+        for digest_id, similar in neighbours.items():
+            for other_id, similarity in similar[:self.max_edges_per_digest]:
+                if similarity < self.semantic_threshold:
+                    break
+                self._add_edge(edges, digest_id, other_id, "semantic", similarity, extra_data)
+                self._add_edge(edges, other_id, digest_id, "semantic", similarity, extra_data)
+
+    def _collect_tag_edges(self, digest_ids: list[int], edges: EdgeMap) -> None:
+        """Add tag edges (Jaccard similarity of tag sets) for a batch of digests."""
+        from reconly_core.database.models import DigestTag, Tag
+
+        own_tags: dict[int, set[int]] = defaultdict(set)
+        for digest_id, tag_id in self.db.query(DigestTag.digest_id, DigestTag.tag_id).filter(
+            DigestTag.digest_id.in_(digest_ids)
+        ):
+            own_tags[digest_id].add(tag_id)
+
+        tag_ids = set().union(*own_tags.values())
+        if not tag_ids:
+            return
+
+        # Full tag sets of every digest sharing at least one tag
+        sharing = self.db.query(DigestTag.digest_id).filter(DigestTag.tag_id.in_(tag_ids))
+        other_tags: dict[int, set[int]] = defaultdict(set)
+        digests_by_tag: dict[int, list[int]] = defaultdict(list)
+        for digest_id, tag_id in self.db.query(DigestTag.digest_id, DigestTag.tag_id).filter(
+            DigestTag.digest_id.in_(sharing.scalar_subquery())
+        ):
+            other_tags[digest_id].add(tag_id)
+            if tag_id in tag_ids:
+                digests_by_tag[tag_id].append(digest_id)
+
+        tag_names = dict(self.db.query(Tag.id, Tag.name).filter(Tag.id.in_(tag_ids)).all())
+
+        for digest_id, tags in own_tags.items():
+            shared_counts = Counter(
+                other_id
+                for tag_id in tags
+                for other_id in digests_by_tag[tag_id]
+                if other_id != digest_id
+            )
+            scored = []
+            for other_id, shared in shared_counts.items():
+                jaccard = shared / (len(tags) + len(other_tags[other_id]) - shared)
+                if jaccard >= self.tag_threshold:
+                    scored.append((jaccard, other_id))
+
+            scored.sort(key=lambda item: item[0], reverse=True)
+            for jaccard, other_id in scored[:self.max_edges_per_digest]:
+                shared_tag_names = sorted(tag_names[t] for t in tags & other_tags[other_id])
+                self._add_edge(edges, digest_id, other_id, "tag", jaccard, {"shared_tags": shared_tag_names})
+
+    def _collect_source_edges(self, digest_ids: list[int], edges: EdgeMap) -> None:
+        """Add same-source edges (temporal proximity) for a batch of digests."""
+        from sqlalchemy import func
+        from reconly_core.database.models import Digest
+
+        digests = self.db.query(Digest.id, Digest.source_id, Digest.created_at).filter(
+            Digest.id.in_(digest_ids),
+            Digest.source_id.isnot(None),
+        ).all()
+        if not digests:
+            return
+
+        # Most recent digests of each source; one extra to allow excluding self
+        limit = self.max_edges_per_digest * 2
+        recent = self.db.query(
+            Digest.id,
+            Digest.source_id,
+            Digest.created_at,
+            func.row_number().over(
+                partition_by=Digest.source_id,
+                order_by=Digest.created_at.desc(),
+            ).label('position'),
+        ).filter(
+            Digest.source_id.in_({d.source_id for d in digests})
+        ).subquery()
+
+        by_source: dict[int, list] = defaultdict(list)
+        for row in self.db.query(recent).filter(
+            recent.c.position <= limit + 1
+        ).order_by(recent.c.source_id, recent.c.position):
+            by_source[row.source_id].append(row)
+
+        for digest in digests:
+            digest_time = digest.created_at or datetime.utcnow()
+            others = [other for other in by_source[digest.source_id] if other.id != digest.id][:limit]
+
+            kept = 0
+            for other in others:
+                score = self._temporal_score(digest_time, other.created_at)
+                if score < self.min_similarity:
+                    continue
+                self._add_edge(edges, digest.id, other.id, "source", score, {"source_id": digest.source_id})
+                kept += 1
+                if kept >= self.max_edges_per_digest:
+                    break
+
+    def _insert_edges(self, edges: EdgeMap) -> int:
+        """Write edges, skipping ones that already exist.
+
+        Returns:
+            Number of relationships created
+        """
+        from sqlalchemy.dialects.postgresql import insert
+        from reconly_core.database.models import DigestRelationship
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                'source_digest_id': source_id,
+                'target_digest_id': target_id,
+                'relationship_type': rel_type,
+                'score': score,
+                'extra_data': extra_data,
+                'created_at': now,
+            }
+            for (source_id, target_id, rel_type), (score, extra_data) in edges.items()
+        ]
+
+        created = 0
+        for start in range(0, len(rows), EDGE_INSERT_BATCH_SIZE):
+            stmt = insert(DigestRelationship).values(
+                rows[start:start + EDGE_INSERT_BATCH_SIZE]
+            ).on_conflict_do_nothing(
+                index_elements=['source_digest_id', 'target_digest_id', 'relationship_type']
+            )
+            created += self.db.execute(stmt).rowcount
+
+        return created
+
     # ═══════════════════════════════════════════════════════════════════════════════
     # GRAPH QUERYING
     # ═══════════════════════════════════════════════════════════════════════════════
@@ -546,9 +858,19 @@ class GraphService:
         from_date: str | None = None,
         to_date: str | None = None,
         tag_names: list[str] | None = None,
+        traversal: GraphTraversal = 'frontier',
+        use_cache: bool = True,
     ) -> GraphData:
         """Get graph data for visualization.
 
+        Centered graphs are expanded a level at a time: each hop loads the
+        digests, tags and relationships of the whole frontier with one bulk
+        query each. With ``traversal='recursive'`` the reachable digests are
+        found by a single recursive CTE instead and then loaded in bulk.
+
+        Assembled graphs are cached per parameter set until the relationship
+        table (or the set of digests) changes.
+
         Args:
             center_digest_id: Optional digest to center the graph on
             depth: How many relationship hops to traverse
@@ -560,288 +882,349 @@ class GraphService:
             from_date: Filter digests created on or after this date (ISO format)
             to_date: Filter digests created on or before this date (ISO format)
             tag_names: Filter digests that have any of these tags
+            traversal: 'frontier' (level-at-a-time) or 'recursive' (recursive CTE)
+            use_cache: Whether to serve and store the result in the graph cache
 
         Returns:
             GraphData with nodes and edges for visualization
         """
-        from reconly_core.database.models import (
-            Digest, DigestRelationship, Tag, DigestTag, FeedRun, Feed
-        )
-        from datetime import datetime
-
-        # Build a cache of feed names for cluster labels
-        feed_cache: dict[int, str] = {}
-        def get_feed_name(feed_run_id: int | None) -> tuple[int | None, str | None]:
-            """Get feed ID and name from feed run ID."""
-            if not feed_run_id:
-                return None, None
-            feed_run = self.db.query(FeedRun).filter(FeedRun.id == feed_run_id).first()
-            if not feed_run:
-                return None, None
-            if feed_run.feed_id not in feed_cache:
-                feed = self.db.query(Feed).filter(Feed.id == feed_run.feed_id).first()
-                feed_cache[feed_run.feed_id] = feed.name if feed else f"Feed {feed_run.feed_id}"
-            return feed_run.feed_id, feed_cache[feed_run.feed_id]
-
         min_sim = min_similarity or self.min_similarity
         # Build default relationship types based on include_tags if not explicitly provided
         if relationship_types:
-            rel_types = relationship_types
+            rel_types = list(relationship_types)
         elif include_tags:
             rel_types = ["semantic", "tag", "source"]
         else:
             rel_types = ["semantic", "source"]
 
-        # Build base digest query with filters
-        def build_filtered_digest_ids() -> set[int]:
-            """Build set of digest IDs that match all filters."""
-            query = self.db.query(Digest.id)
-
-            # Filter by feed
-            if feed_id:
-                query = query.join(FeedRun, Digest.feed_run_id == FeedRun.id).filter(
-                    FeedRun.feed_id == feed_id
-                )
-
-            # Filter by date range
-            if from_date:
-                try:
-                    from_dt = datetime.fromisoformat(from_date)
-                    query = query.filter(Digest.created_at >= from_dt)
-                except ValueError:
-                    pass
-
-            if to_date:
-                try:
-                    to_dt = datetime.fromisoformat(to_date)
-                    query = query.filter(Digest.created_at <= to_dt)
-                except ValueError:
-                    pass
-
-            # Filter by tags
-            if tag_names:
-                # Get digests that have any of the specified tags
-                tag_subquery = self.db.query(DigestTag.digest_id).join(
-                    Tag, DigestTag.tag_id == Tag.id
-                ).filter(Tag.name.in_(tag_names)).subquery()
-                query = query.filter(Digest.id.in_(tag_subquery))
-
-            return set(row[0] for row in query.all())
+        cache_key = None
+        version = None
+        if use_cache:
+            cache_key = (
+                center_digest_id, depth, min_sim, tuple(rel_types), limit,
+                self.max_edges_per_digest, feed_id, from_date, to_date,
+                tuple(sorted(tag_names)) if tag_names else None,
+                traversal if center_digest_id else None,
+            )
+            version = self._graph_version()
+            cached = _graph_cache.get(cache_key, version)
+            if cached is not None:
+                return cached
 
         # Get filtered digest IDs if any filters are active
         filtered_ids = None
         if feed_id or from_date or to_date or tag_names:
-            filtered_ids = build_filtered_digest_ids()
-
-        def is_digest_allowed(digest_id: int) -> bool:
-            """Check if a digest passes the filters."""
-            return filtered_ids is None or digest_id in filtered_ids
+            filtered_ids = self._filtered_digest_ids(feed_id, from_date, to_date, tag_names)
 
-        nodes: dict[str, GraphNode] = {}
-        edges: list[GraphEdge] = []
+        assembly = _GraphAssembly(rel_types)
 
         if center_digest_id:
-            # Start from a specific digest and traverse
-            visited_digests = set()
-            to_visit = [(center_digest_id, 0)]
+            if traversal == 'recursive':
+                self._assemble_recursive(
+                    assembly, center_digest_id, depth, min_sim, limit, filtered_ids
+                )
+            else:
+                self._assemble_frontier(
+                    assembly, center_digest_id, depth, min_sim, limit, filtered_ids
+                )
+        else:
+            self._assemble_overview(assembly, min_sim, limit, filtered_ids)
 
-            while to_visit and len(nodes) < limit:
-                digest_id, current_depth = to_visit.pop(0)
+        data = GraphData(nodes=list(assembly.nodes.values()), edges=assembly.edges)
+        if cache_key is not None:
+            _graph_cache.put(cache_key, version, data)
+        return data
 
-                if digest_id in visited_digests:
-                    continue
-                visited_digests.add(digest_id)
+    def _assemble_frontier(
+        self,
+        assembly: "_GraphAssembly",
+        center_digest_id: int,
+        depth: int,
+        min_sim: float,
+        limit: int,
+        filtered_ids: set[int] | None,
+    ) -> None:
+        """Breadth-first expansion from the center, one level per round trip."""
+        visited: set[int] = set()
+        frontier = [center_digest_id]
+        level = 0
+
+        while frontier and len(assembly.nodes) < limit:
+            visited.update(frontier)
+            # Filters apply to everything except the center node
+            frontier = [
+                digest_id for digest_id in frontier
+                if digest_id == center_digest_id
+                or filtered_ids is None
+                or digest_id in filtered_ids
+            ]
+            expand = level < depth
+            processed = self._add_digest_level(
+                assembly, frontier, min_sim, limit,
+                relationship_limit=self.max_edges_per_digest if expand else None,
+            )
+            if not expand:
+                break
 
-                # Skip if digest doesn't pass filters (except center node)
-                if digest_id != center_digest_id and not is_digest_allowed(digest_id):
-                    continue
+            # Next level in the order edges were discovered
+            next_frontier: list[int] = []
+            seen: set[int] = set()
+            for digest_id in processed:
+                for target_id in assembly.targets.get(digest_id, []):
+                    if target_id not in visited and target_id not in seen:
+                        seen.add(target_id)
+                        next_frontier.append(target_id)
+            frontier = next_frontier
+            level += 1
+
+    def _assemble_recursive(
+        self,
+        assembly: "_GraphAssembly",
+        center_digest_id: int,
+        depth: int,
+        min_sim: float,
+        limit: int,
+        filtered_ids: set[int] | None,
+    ) -> None:
+        """Find every reachable digest with one recursive CTE, then load them in bulk."""
+        rows = self.db.execute(text(_GRAPH_WALK_SQL), {
+            'center_id': center_digest_id,
+            'depth': depth,
+            'rel_types': assembly.rel_types,
+            'min_sim': min_sim,
+            'max_edges': self.max_edges_per_digest,
+            'filtered': filtered_ids is not None,
+            'allowed_ids': list(filtered_ids or ()),
+        }).fetchall()
+
+        levels: dict[int, list[int]] = defaultdict(list)
+        for digest_id, hop in rows:
+            if (
+                digest_id == center_digest_id
+                or filtered_ids is None
+                or digest_id in filtered_ids
+            ):
+                levels[hop].append(digest_id)
+
+        for hop in sorted(levels):
+            if len(assembly.nodes) >= limit:
+                break
+            self._add_digest_level(
+                assembly, levels[hop], min_sim, limit,
+                relationship_limit=self.max_edges_per_digest if hop < depth else None,
+            )
 
-                # Get the digest
-                digest = self.db.query(Digest).filter(Digest.id == digest_id).first()
-                if not digest:
-                    continue
+    def _assemble_overview(
+        self,
+        assembly: "_GraphAssembly",
+        min_sim: float,
+        limit: int,
+        filtered_ids: set[int] | None,
+    ) -> None:
+        """Most recent digests plus the relationships among them."""
+        from reconly_core.database.models import Digest
 
-                # Get feed info for clustering
-                digest_feed_id, digest_feed_name = get_feed_name(digest.feed_run_id)
-
-                # Add digest node
-                node_id = f"d_{digest_id}"
-                nodes[node_id] = GraphNode(
-                    id=node_id,
-                    type="digest",
-                    label=digest.title[:50] if digest.title else f"Digest {digest_id}",
-                    data={
-                        "digest_id": digest.id,
-                        "title": digest.title,
-                        "created_at": digest.created_at.isoformat() if digest.created_at else None,
-                        "source_id": digest.source_id,
-                        "feed_id": digest_feed_id,
-                        "feed_name": digest_feed_name,
-                    }
-                )
+        query = self.db.query(Digest.id)
+        if filtered_ids is not None:
+            query = query.filter(Digest.id.in_(filtered_ids))
+        digest_ids = [
+            row[0] for row in query.order_by(Digest.created_at.desc()).limit(limit).all()
+        ]
 
-                # Add feed node as cluster anchor (only if source relationships requested)
-                if digest_feed_id and "source" in rel_types:
-                    feed_node_id = f"f_{digest_feed_id}"
-                    if feed_node_id not in nodes:
-                        nodes[feed_node_id] = GraphNode(
-                            id=feed_node_id,
-                            type="feed",
-                            label=digest_feed_name or f"Feed {digest_feed_id}",
-                            data={"feed_id": digest_feed_id, "name": digest_feed_name}
-                        )
-                    # Add edge from digest to feed
-                    edges.append(GraphEdge(
-                        source=node_id,
-                        target=feed_node_id,
-                        type="source",
-                        score=0.5,  # Lower score so it doesn't dominate
-                    ))
-
-                # Add tag nodes (only if tag relationships requested)
-                if "tag" in rel_types:
-                    for dt in digest.tags:
-                        tag_node_id = f"t_{dt.tag.name}"
-                        if tag_node_id not in nodes:
-                            # Count digests with this tag
-                            tag_count = self.db.query(DigestTag).filter(
-                                DigestTag.tag_id == dt.tag_id
-                            ).count()
-                            nodes[tag_node_id] = GraphNode(
-                                id=tag_node_id,
-                                type="tag",
-                                label=dt.tag.name,
-                                data={"tag_id": dt.tag_id, "count": tag_count}
-                            )
-                        # Add edge to tag
-                        edges.append(GraphEdge(
-                            source=node_id,
-                            target=tag_node_id,
-                            type="tag",
-                            score=1.0,
-                        ))
-
-                # Stop traversing at max depth
-                if current_depth >= depth:
-                    continue
+        self._add_digest_level(assembly, digest_ids, min_sim, limit=None)
 
-                # Get relationships from this digest
-                relationships = self.db.query(DigestRelationship).filter(
-                    DigestRelationship.source_digest_id == digest_id,
-                    DigestRelationship.relationship_type.in_(rel_types),
-                    DigestRelationship.score >= min_sim
-                ).order_by(
-                    DigestRelationship.score.desc()
-                ).limit(self.max_edges_per_digest).all()
+        for rel in self._load_relationships(
+            digest_ids, assembly.rel_types, min_sim, target_ids=digest_ids
+        ):
+            assembly.add_relationship(rel)
 
-                for rel in relationships:
-                    target_node_id = f"d_{rel.target_digest_id}"
+    def _add_digest_level(
+        self,
+        assembly: "_GraphAssembly",
+        digest_ids: list[int],
+        min_sim: float,
+        limit: int | None,
+        relationship_limit: int | None = None,
+    ) -> list[int]:
+        """Add one batch of digests (with feed/tag nodes and edges) to the graph.
+
+        Digests, tags, tag counts and relationships are each loaded with a
+        single query for the whole batch. Digests are added in order until
+        the node limit is reached.
 
-                    # Add edge
-                    edges.append(GraphEdge(
-                        source=node_id,
-                        target=target_node_id,
-                        type=rel.relationship_type,
-                        score=rel.score,
-                        extra_data=rel.extra_data or {},
-                    ))
+        Args:
+            assembly: Graph being assembled
+            digest_ids: Digests to add, in order
+            min_sim: Minimum relationship score
+            limit: Stop once the graph has this many nodes (None = no limit)
+            relationship_limit: Load up to this many outgoing relationships per
+                digest (None = don't load relationships)
 
-                    # Queue for traversal
-                    if rel.target_digest_id not in visited_digests:
-                        to_visit.append((rel.target_digest_id, current_depth + 1))
+        Returns:
+            IDs of the digests that were added
+        """
+        from sqlalchemy import func
+        from reconly_core.database.models import Digest, DigestTag, Feed, FeedRun, Tag
+
+        ids = list(dict.fromkeys(digest_ids))
+        if not ids:
+            return []
+
+        digest_rows = {
+            row.id: row
+            for row in self.db.query(
+                Digest.id,
+                Digest.title,
+                Digest.created_at,
+                Digest.source_id,
+                FeedRun.feed_id,
+                Feed.name.label('feed_name'),
+            ).outerjoin(
+                FeedRun, Digest.feed_run_id == FeedRun.id
+            ).outerjoin(
+                Feed, FeedRun.feed_id == Feed.id
+            ).filter(Digest.id.in_(ids)).all()
+        }
 
-        else:
-            # Return all nodes up to limit (for overview)
-            query = self.db.query(Digest)
-
-            # Apply filters
-            if filtered_ids is not None:
-                query = query.filter(Digest.id.in_(filtered_ids))
-
-            digests = query.order_by(
-                Digest.created_at.desc()
-            ).limit(limit).all()
-
-            for digest in digests:
-                # Get feed info for clustering
-                digest_feed_id, digest_feed_name = get_feed_name(digest.feed_run_id)
-
-                node_id = f"d_{digest.id}"
-                nodes[node_id] = GraphNode(
-                    id=node_id,
-                    type="digest",
-                    label=digest.title[:50] if digest.title else f"Digest {digest.id}",
-                    data={
-                        "digest_id": digest.id,
-                        "title": digest.title,
-                        "created_at": digest.created_at.isoformat() if digest.created_at else None,
-                        "source_id": digest.source_id,
-                        "feed_id": digest_feed_id,
-                        "feed_name": digest_feed_name,
-                    }
-                )
+        digest_tags: dict[int, list[tuple[int, str]]] = defaultdict(list)
+        tag_counts: dict[int, int] = {}
+        if "tag" in assembly.rel_types:
+            for digest_id, tag_id, tag_name in self.db.query(
+                DigestTag.digest_id, Tag.id, Tag.name
+            ).join(
+                Tag, DigestTag.tag_id == Tag.id
+            ).filter(
+                DigestTag.digest_id.in_(ids)
+            ).order_by(DigestTag.digest_id, Tag.id).all():
+                digest_tags[digest_id].append((tag_id, tag_name))
+
+            tag_ids = {tag_id for tags in digest_tags.values() for tag_id, _ in tags}
+            if tag_ids:
+                tag_counts = dict(self.db.query(
+                    DigestTag.tag_id, func.count(DigestTag.digest_id)
+                ).filter(
+                    DigestTag.tag_id.in_(tag_ids)
+                ).group_by(DigestTag.tag_id).all())
+
+        relationships: dict[int, list] = defaultdict(list)
+        if relationship_limit:
+            for rel in self._load_relationships(
+                [digest_id for digest_id in ids if digest_id in digest_rows],
+                assembly.rel_types,
+                min_sim,
+                per_digest_limit=relationship_limit,
+            ):
+                relationships[rel.source_digest_id].append(rel)
+
+        added = []
+        for digest_id in ids:
+            if limit is not None and len(assembly.nodes) >= limit:
+                break
+            row = digest_rows.get(digest_id)
+            if row is None:
+                continue
+            assembly.add_digest(row, digest_tags.get(digest_id, []), tag_counts)
+            for rel in relationships.get(digest_id, []):
+                assembly.add_relationship(rel)
+            added.append(digest_id)
+        return added
 
-                # Add feed node as cluster anchor (only if source relationships requested)
-                if digest_feed_id and "source" in rel_types:
-                    feed_node_id = f"f_{digest_feed_id}"
-                    if feed_node_id not in nodes:
-                        nodes[feed_node_id] = GraphNode(
-                            id=feed_node_id,
-                            type="feed",
-                            label=digest_feed_name or f"Feed {digest_feed_id}",
-                            data={"feed_id": digest_feed_id, "name": digest_feed_name}
-                        )
-                    # Add edge from digest to feed
-                    edges.append(GraphEdge(
-                        source=node_id,
-                        target=feed_node_id,
-                        type="source",
-                        score=0.5,
-                    ))
-
-                # Add tag nodes (only if tag relationships requested)
-                if "tag" in rel_types:
-                    for dt in digest.tags:
-                        tag_node_id = f"t_{dt.tag.name}"
-                        if tag_node_id not in nodes:
-                            tag_count = self.db.query(DigestTag).filter(
-                                DigestTag.tag_id == dt.tag_id
-                            ).count()
-                            nodes[tag_node_id] = GraphNode(
-                                id=tag_node_id,
-                                type="tag",
-                                label=dt.tag.name,
-                                data={"tag_id": dt.tag_id, "count": tag_count}
-                            )
-                        edges.append(GraphEdge(
-                            source=node_id,
-                            target=tag_node_id,
-                            type="tag",
-                            score=1.0,
-                        ))
-
-            # Get relationships between these digests
-            digest_ids = [d.id for d in digests]
-            relationships = self.db.query(DigestRelationship).filter(
-                DigestRelationship.source_digest_id.in_(digest_ids),
-                DigestRelationship.target_digest_id.in_(digest_ids),
-                DigestRelationship.relationship_type.in_(rel_types),
-                DigestRelationship.score >= min_sim
-            ).all()
+    def _load_relationships(
+        self,
+        digest_ids: list[int],
+        rel_types: list[str],
+        min_sim: float,
+        per_digest_limit: int | None = None,
+        target_ids: list[int] | None = None,
+    ) -> list:
+        """Load outgoing relationships of many digests in one query.
 
-            for rel in relationships:
-                edges.append(GraphEdge(
-                    source=f"d_{rel.source_digest_id}",
-                    target=f"d_{rel.target_digest_id}",
-                    type=rel.relationship_type,
-                    score=rel.score,
-                    extra_data=rel.extra_data or {},
-                ))
+        Args:
+            digest_ids: Source digests
+            rel_types: Relationship types to include
+            min_sim: Minimum relationship score
+            per_digest_limit: Keep only the top-scoring N per source digest
+            target_ids: Only relationships pointing at these digests
+
+        Returns:
+            Rows with source/target digest IDs, type, score and extra_data,
+            ordered by source digest and descending score
+        """
+        from sqlalchemy import func
+        from reconly_core.database.models import DigestRelationship
 
-        return GraphData(
-            nodes=list(nodes.values()),
-            edges=edges,
+        if not digest_ids:
+            return []
+
+        rank = func.row_number().over(
+            partition_by=DigestRelationship.source_digest_id,
+            order_by=(DigestRelationship.score.desc(), DigestRelationship.id),
+        ).label('rank')
+        query = self.db.query(
+            DigestRelationship.source_digest_id,
+            DigestRelationship.target_digest_id,
+            DigestRelationship.relationship_type,
+            DigestRelationship.score,
+            DigestRelationship.extra_data,
+            rank,
+        ).filter(
+            DigestRelationship.source_digest_id.in_(digest_ids),
+            DigestRelationship.relationship_type.in_(rel_types),
+            DigestRelationship.score >= min_sim,
         )
+        if target_ids is not None:
+            query = query.filter(DigestRelationship.target_digest_id.in_(target_ids))
+
+        ranked = query.subquery()
+        outer = self.db.query(ranked)
+        if per_digest_limit:
+            outer = outer.filter(ranked.c.rank <= per_digest_limit)
+        return outer.order_by(ranked.c.source_digest_id, ranked.c.rank).all()
+
+    def _filtered_digest_ids(
+        self,
+        feed_id: int | None,
+        from_date: str | None,
+        to_date: str | None,
+        tag_names: list[str] | None,
+    ) -> set[int]:
+        """Build set of digest IDs that match all filters."""
+        from reconly_core.database.models import Digest, DigestTag, FeedRun, Tag
+
+        query = self.db.query(Digest.id)
+
+        # Filter by feed
+        if feed_id:
+            query = query.join(FeedRun, Digest.feed_run_id == FeedRun.id).filter(
+                FeedRun.feed_id == feed_id
+            )
+
+        # Filter by date range
+        if from_date:
+            try:
+                query = query.filter(Digest.created_at >= datetime.fromisoformat(from_date))
+            except ValueError:
+                pass
+
+        if to_date:
+            try:
+                query = query.filter(Digest.created_at <= datetime.fromisoformat(to_date))
+            except ValueError:
+                pass
+
+        # Filter by tags
+        if tag_names:
+            # Get digests that have any of the specified tags
+            tag_subquery = self.db.query(DigestTag.digest_id).join(
+                Tag, DigestTag.tag_id == Tag.id
+            ).filter(Tag.name.in_(tag_names)).subquery()
+            query = query.filter(Digest.id.in_(tag_subquery))
+
+        return set(row[0] for row in query.all())
+
+    def _graph_version(self) -> tuple:
+        """Cheap fingerprint of the relationship and digest tables for the graph cache."""
+        return tuple(self.db.execute(text(_GRAPH_VERSION_SQL)).one())
 
     # ═══════════════════════════════════════════════════════════════════════════════
     # RELATIONSHIP PRUNING
@@ -975,24 +1358,6 @@ class GraphService:
     # HELPERS
     # ═══════════════════════════════════════════════════════════════════════════════
 
-    def _embedding_to_list(self, embedding) -> list[float] | None:
-        """Convert a pgvector embedding to a Python list.
-
-        pgvector may return embeddings as numpy arrays or other array types.
-        This normalizes to a Python list for consistent handling.
-
-        Args:
-            embedding: Embedding value from database (may be None, list, or ndarray)
-
-        Returns:
-            List of floats, or None if embedding is None
-        """
-        if embedding is None:
-            return None
-        if hasattr(embedding, 'tolist'):
-            return embedding.tolist()
-        return embedding
-
     def _create_relationship_if_not_exists(
         self,
         source_id: int,
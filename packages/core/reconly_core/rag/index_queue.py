@@ -0,0 +1,475 @@
+"""Background RAG indexing queue.
+
+Feed runs enqueue the IDs of new digests in the rag_index_jobs table and
+finish; indexing workers claim jobs in batches, embed the digests and their
+source content, and compute graph relationships.
+
+- Coalescing: there is one job per digest. Enqueueing a digest that is
+  already queued resets its job instead of adding another one.
+- Retry: failed jobs are retried with exponential backoff, up to
+  max_attempts, and then kept with status 'failed'.
+- Durability: jobs survive restarts. Jobs left 'running' by a worker that
+  died are released after STALE_JOB_TIMEOUT, by the next claim().
+
+Workers are started with the API (rag.index.workers). Without workers in
+the process (CLI runs, rag.index.workers = 0), FeedService indexes the
+digests of a run inline through the same queue.
+
+Example:
+    >>> from reconly_core.rag.index_queue import RAGIndexQueue, start_index_workers
+    >>> RAGIndexQueue(db).enqueue([digest.id])
+    >>> db.commit()
+    >>> start_index_workers(SessionLocal)
+"""
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import func, or_
+from sqlalchemy.dialects.postgresql import insert
+
+from reconly_core.database.models import Digest, DigestSourceItem, RAGIndexJob, SourceContent
+from reconly_core.rag.embedding_service import EmbeddingService, EMBEDDING_STATUS_COMPLETED
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Job status constants
+JOB_STATUS_PENDING = "pending"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_FAILED = "failed"
+
+# Defaults (overridden by rag.index.* settings)
+DEFAULT_INDEX_WORKERS = 1
+DEFAULT_BATCH_SIZE = 20
+DEFAULT_MAX_ATTEMPTS = 5
+
+# Retry backoff: RETRY_BASE_DELAY * 2^(attempt - 1), capped at RETRY_MAX_DELAY
+RETRY_BASE_DELAY = 60
+RETRY_MAX_DELAY = 3600
+
+# Running jobs older than this are assumed orphaned by a dead worker
+STALE_JOB_TIMEOUT = 1800
+
+# Seconds an idle worker waits before checking the queue again
+POLL_INTERVAL = 5.0
+
+
+class RAGIndexQueue:
+    """Database-backed queue of digests waiting for RAG indexing.
+
+    Callers own the transaction: enqueue() only adds to the session, while
+    claim() commits so claimed jobs are visible to other workers.
+    """
+
+    def __init__(self, db: "Session", max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        """
+        Initialize the queue.
+
+        Args:
+            db: Database session
+            max_attempts: Attempts before a job is marked failed
+        """
+        self.db = db
+        self.max_attempts = max(1, max_attempts)
+
+    def enqueue(self, digest_ids: Sequence[int]) -> int:
+        """
+        Queue digests for indexing.
+
+        Digests that already have a job are reset to pending with a fresh
+        attempt count; jobs currently being processed are left alone.
+
+        Args:
+            digest_ids: IDs of digests to index
+
+        Returns:
+            Number of distinct digests queued
+        """
+        digest_ids = list(dict.fromkeys(digest_ids))
+        if not digest_ids:
+            return 0
+
+        now = datetime.utcnow()
+        stmt = insert(RAGIndexJob).values([
+            {
+                'digest_id': digest_id,
+                'status': JOB_STATUS_PENDING,
+                'attempts': 0,
+                'available_at': now,
+                'created_at': now,
+            }
+            for digest_id in digest_ids
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RAGIndexJob.digest_id],
+            set_={
+                'status': JOB_STATUS_PENDING,
+                'attempts': 0,
+                'last_error': None,
+                'available_at': now,
+            },
+            where=RAGIndexJob.status != JOB_STATUS_RUNNING,
+        )
+        self.db.execute(stmt)
+        return len(digest_ids)
+
+    def claim(
+        self,
+        limit: int = DEFAULT_BATCH_SIZE,
+        digest_ids: Optional[Sequence[int]] = None,
+    ) -> List[RAGIndexJob]:
+        """
+        Claim pending jobs that are due, and commit.
+
+        Uses SELECT ... FOR UPDATE SKIP LOCKED, so concurrent workers
+        (in this or other processes) never claim the same job. Stale
+        running jobs are released first, so they are picked up again.
+
+        Args:
+            limit: Maximum number of jobs to claim
+            digest_ids: Only claim jobs for these digests
+
+        Returns:
+            Claimed jobs, oldest first
+        """
+        released = self.release_stale()
+        if released:
+            logger.info(f"Released {released} stale RAG index job(s)")
+
+        now = datetime.utcnow()
+        query = self.db.query(RAGIndexJob).filter(
+            RAGIndexJob.status == JOB_STATUS_PENDING,
+            RAGIndexJob.available_at <= now,
+        )
+        if digest_ids is not None:
+            query = query.filter(RAGIndexJob.digest_id.in_(list(digest_ids)))
+
+        jobs = query.order_by(RAGIndexJob.id).limit(limit).with_for_update(skip_locked=True).all()
+        for job in jobs:
+            job.status = JOB_STATUS_RUNNING
+            job.locked_at = now
+            job.attempts += 1
+        self.db.commit()
+        return jobs
+
+    def complete(self, jobs: Sequence[RAGIndexJob]) -> None:
+        """Remove indexed jobs from the queue."""
+        job_ids = [job.id for job in jobs]
+        if job_ids:
+            self.db.query(RAGIndexJob).filter(
+                RAGIndexJob.id.in_(job_ids)
+            ).delete(synchronize_session=False)
+
+    def fail(self, job: RAGIndexJob, error: str) -> None:
+        """Schedule a retry with backoff, or mark the job failed after max_attempts."""
+        job.last_error = error[:1000]
+        job.locked_at = None
+        if job.attempts >= self.max_attempts:
+            job.status = JOB_STATUS_FAILED
+            logger.error(f"RAG indexing of digest {job.digest_id} failed after {job.attempts} attempts: {error}")
+            return
+
+        delay = min(RETRY_BASE_DELAY * 2 ** (job.attempts - 1), RETRY_MAX_DELAY)
+        job.status = JOB_STATUS_PENDING
+        job.available_at = datetime.utcnow() + timedelta(seconds=delay)
+        logger.warning(
+            f"RAG indexing of digest {job.digest_id} failed (attempt {job.attempts}), "
+            f"retrying in {delay}s: {error}"
+        )
+
+    def release_stale(self, timeout: float = STALE_JOB_TIMEOUT) -> int:
+        """
+        Return jobs stuck in 'running' for longer than timeout to the queue.
+
+        Returns:
+            Number of jobs released
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=timeout)
+        return self.db.query(RAGIndexJob).filter(
+            RAGIndexJob.status == JOB_STATUS_RUNNING,
+            or_(RAGIndexJob.locked_at.is_(None), RAGIndexJob.locked_at < cutoff),
+        ).update(
+            {'status': JOB_STATUS_PENDING, 'locked_at': None},
+            synchronize_session=False,
+        )
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Count jobs by status."""
+        counts = dict(
+            self.db.query(RAGIndexJob.status, func.count(RAGIndexJob.id))
+            .group_by(RAGIndexJob.status)
+            .all()
+        )
+        return {
+            status: counts.get(status, 0)
+            for status in (JOB_STATUS_PENDING, JOB_STATUS_RUNNING, JOB_STATUS_FAILED)
+        }
+
+
+async def index_digests(db: "Session", digest_ids: Sequence[int]) -> Dict[int, Optional[str]]:
+    """
+    Embed digests and their source content, then compute graph relationships.
+
+    Args:
+        db: Database session (committed after each step)
+        digest_ids: IDs of digests to index
+
+    Returns:
+        Dictionary mapping digest_id -> error message, or None when indexed
+    """
+    from reconly_core.rag.embeddings import get_embedding_provider
+    from reconly_core.rag.graph_service import GraphService
+    from reconly_core.services.settings_service import SettingsService
+
+    errors: Dict[int, Optional[str]] = {digest_id: None for digest_id in digest_ids}
+    digests = db.query(Digest).filter(Digest.id.in_(list(digest_ids))).all()
+    if not digests:
+        return errors
+
+    embedding_service = EmbeddingService(db)
+
+    # 1. Generate embeddings for digests
+    for digest in digests:
+        if digest.embedding_status != EMBEDDING_STATUS_COMPLETED:
+            try:
+                await embedding_service.embed_digest(digest, update_status=True)
+            except Exception as e:
+                errors[digest.id] = f"Digest embedding failed: {e}"
+    db.commit()
+
+    # 2. Generate embeddings for source content (if stored)
+    # Use or_() to handle NULL status since NULL != 'completed' is NULL in SQL
+    source_contents = db.query(SourceContent, DigestSourceItem.digest_id).join(
+        DigestSourceItem,
+        SourceContent.digest_source_item_id == DigestSourceItem.id
+    ).filter(
+        DigestSourceItem.digest_id.in_([d.id for d in digests]),
+        or_(
+            SourceContent.embedding_status.is_(None),
+            SourceContent.embedding_status != EMBEDDING_STATUS_COMPLETED
+        )
+    ).all()
+
+    for source_content, digest_id in source_contents:
+        try:
+            await embedding_service.embed_source_content(source_content, update_status=True)
+        except Exception as e:
+            logger.error(f"Failed to embed source content {source_content.id}: {e}")
+            errors[digest_id] = errors[digest_id] or f"Source content embedding failed: {e}"
+    if source_contents:
+        db.commit()
+
+    # 3. Compute graph relationships (if auto-compute enabled)
+    settings_service = SettingsService(db)
+    if settings_service.get("rag.graph.auto_compute"):
+        graph_service = GraphService(
+            db,
+            get_embedding_provider(db=db),
+            semantic_threshold=settings_service.get("rag.graph.semantic_threshold"),
+            max_edges_per_digest=settings_service.get("rag.graph.max_edges_per_digest"),
+            default_chunk_source=settings_service.get("rag.source_content.default_chunk_source"),
+            tag_threshold=settings_service.get("rag.graph.tag_threshold"),
+        )
+        graph_ids = [digest.id for digest in digests if not errors[digest.id]]
+        try:
+            await graph_service.compute_relationships_batch(graph_ids)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            for digest_id in graph_ids:
+                errors[digest_id] = f"Relationship computation failed: {e}"
+
+    return errors
+
+
+def process_index_jobs(
+    db: "Session",
+    limit: Optional[int] = None,
+    digest_ids: Optional[Sequence[int]] = None,
+    max_attempts: Optional[int] = None,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> int:
+    """
+    Claim one batch of jobs, index it, and record the outcome.
+
+    Args:
+        db: Database session
+        limit: Jobs to claim (default: rag.index.batch_size)
+        digest_ids: Only process jobs for these digests
+        max_attempts: Attempts before a job is marked failed (default: rag.index.max_attempts)
+        loop: Event loop to run indexing on (default: a temporary loop)
+
+    Returns:
+        Number of jobs processed (0 when the queue has nothing due)
+    """
+    if limit is None or max_attempts is None:
+        from reconly_core.services.settings_service import SettingsService
+        settings_service = SettingsService(db)
+        if limit is None:
+            limit = settings_service.get("rag.index.batch_size") or DEFAULT_BATCH_SIZE
+        if max_attempts is None:
+            max_attempts = settings_service.get("rag.index.max_attempts") or DEFAULT_MAX_ATTEMPTS
+
+    queue = RAGIndexQueue(db, max_attempts=max_attempts)
+    jobs = queue.claim(limit, digest_ids)
+    if not jobs:
+        return 0
+
+    job_digest_ids = [job.digest_id for job in jobs]
+    owns_loop = loop is None
+    if owns_loop:
+        loop = asyncio.new_event_loop()
+    try:
+        errors = loop.run_until_complete(index_digests(db, job_digest_ids))
+    except Exception as e:
+        db.rollback()
+        logger.error(f"RAG indexing batch failed: {e}")
+        errors = {digest_id: str(e) for digest_id in job_digest_ids}
+    finally:
+        if owns_loop:
+            loop.close()
+
+    queue.complete([job for job in jobs if not errors.get(job.digest_id)])
+    for job in jobs:
+        if errors.get(job.digest_id):
+            queue.fail(job, errors[job.digest_id])
+    db.commit()
+
+    logger.info(f"RAG indexed {sum(1 for e in errors.values() if not e)}/{len(jobs)} digest(s)")
+    return len(jobs)
+
+
+class RAGIndexWorker:
+    """Thread that processes the RAG indexing queue until stopped.
+
+    Each worker runs its own event loop and opens a session per batch.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], "Session"],
+        name: str = "rag-index",
+        poll_interval: float = POLL_INTERVAL,
+        wakeup: Optional[threading.Event] = None,
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            session_factory: Callable returning a new database session
+            name: Thread name
+            poll_interval: Seconds to wait when the queue has nothing due
+            wakeup: Event that interrupts the wait when new jobs are queued
+        """
+        self.session_factory = session_factory
+        self.poll_interval = poll_interval
+        self._wakeup = wakeup or threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+
+    def start(self) -> None:
+        """Start processing in the background."""
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop after the current batch, waiting up to timeout seconds."""
+        self._stopped.set()
+        self._wakeup.set()
+        self._thread.join(timeout)
+
+    def is_alive(self) -> bool:
+        """Whether the worker thread is running."""
+        return self._thread.is_alive()
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        try:
+            while not self._stopped.is_set():
+                try:
+                    with self.session_factory() as db:
+                        processed = process_index_jobs(db, loop=loop)
+                except Exception as e:
+                    logger.error(f"RAG index worker error: {e}", exc_info=True)
+                    processed = 0
+
+                if not processed and not self._stopped.is_set():
+                    self._wakeup.wait(self.poll_interval)
+                    self._wakeup.clear()
+        finally:
+            loop.close()
+
+
+_workers: List[RAGIndexWorker] = []
+_workers_lock = threading.Lock()
+_wakeup = threading.Event()
+
+
+def start_index_workers(
+    session_factory: Callable[[], "Session"],
+    workers: Optional[int] = None,
+) -> int:
+    """
+    Start background indexing workers for this process.
+
+    Also releases jobs orphaned by a previous process for longer than
+    STALE_JOB_TIMEOUT. Jobs running in other live processes are left alone.
+
+    Args:
+        session_factory: Callable returning a new database session
+        workers: Number of workers (default: rag.index.workers; 0 = none)
+
+    Returns:
+        Number of workers running
+    """
+    with _workers_lock:
+        if _workers:
+            return len(_workers)
+
+        with session_factory() as db:
+            if workers is None:
+                from reconly_core.services.settings_service import SettingsService
+                workers = SettingsService(db).get("rag.index.workers")
+                workers = DEFAULT_INDEX_WORKERS if workers is None else workers
+            if workers <= 0:
+                return 0
+            released = RAGIndexQueue(db).release_stale()
+            db.commit()
+
+        if released:
+            logger.info(f"Released {released} stale RAG index job(s)")
+
+        for i in range(workers):
+            worker = RAGIndexWorker(session_factory, name=f"rag-index-{i}", wakeup=_wakeup)
+            worker.start()
+            _workers.append(worker)
+
+        logger.info(f"Started {workers} RAG index worker(s)")
+        return workers
+
+
+def stop_index_workers(timeout: float = 10.0) -> None:
+    """Stop the background indexing workers; unfinished jobs stay queued."""
+    with _workers_lock:
+        workers = list(_workers)
+        _workers.clear()
+
+    for worker in workers:
+        worker._stopped.set()
+    _wakeup.set()
+    for worker in workers:
+        worker.stop(timeout)
+
+
+def index_workers_running() -> bool:
+    """Whether background indexing workers run in this process."""
+    return any(worker.is_alive() for worker in _workers)
+
+
+def notify_index_workers() -> None:
+    """Wake idle workers after new jobs were queued."""
+    _wakeup.set()
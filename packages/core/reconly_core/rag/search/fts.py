@@ -8,7 +8,10 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING
 
-from sqlalchemy import text
+from sqlalchemy import func, text
+
+from reconly_core.database.models import SEARCH_TS_CONFIG
+from reconly_core.rag.search.vector import ChunkSource
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -39,8 +42,8 @@ class FTSSearchResult:
 class FTSService:
     """Service for full-text search over digests.
 
-    Uses PostgreSQL's to_tsvector and plainto_tsquery for powerful
-    text search with ranking.
+    Uses PostgreSQL's plainto_tsquery against the stored, GIN-indexed
+    ``search_vector`` columns for text search with ranking.
 
     Example:
         >>> from reconly_core.rag.search import FTSService
@@ -51,7 +54,10 @@ class FTSService:
     """
 
     # Default text search configuration (language)
-    DEFAULT_TS_CONFIG = 'english'
+    DEFAULT_TS_CONFIG = SEARCH_TS_CONFIG
+
+    # Weight of each digest field in the search vector (A = highest)
+    FIELD_WEIGHTS = {'title': 'A', 'summary': 'B', 'content': 'C'}
 
     def __init__(
         self,
@@ -97,52 +103,26 @@ class FTSService:
 
         if search_fields is None:
             search_fields = ['title', 'summary', 'content']
-        # Build tsvector expression for combined fields
-        # Weight: A = title (highest), B = summary, C = content
-        tsvector_parts = []
-        if 'title' in search_fields:
-            tsvector_parts.append(
-                f"setweight(to_tsvector('{self.ts_config}', COALESCE(title, '')), 'A')"
-            )
-        if 'summary' in search_fields:
-            tsvector_parts.append(
-                f"setweight(to_tsvector('{self.ts_config}', COALESCE(summary, '')), 'B')"
-            )
-        if 'content' in search_fields:
-            tsvector_parts.append(
-                f"setweight(to_tsvector('{self.ts_config}', COALESCE(content, '')), 'C')"
-            )
-
-        if not tsvector_parts:
+        search_fields = [field for field in self.FIELD_WEIGHTS if field in search_fields]
+        if not search_fields:
             return []
 
-        tsvector_expr = " || ".join(tsvector_parts)
-
-        # Build the query using raw SQL for PostgreSQL-specific functions
+        # Rank and limit first, then build matched_field and headlines for the
+        # final top-k rows only (ts_headline re-parses the whole document).
+        tsvector_expr = self._tsvector_expr(search_fields)
+        match_clause = f"{tsvector_expr} @@ tsq"
+        if tsvector_expr.startswith('ts_filter('):
+            # ts_filter() can't use the index; pre-filter on the full vector
+            match_clause = f"search_vector @@ tsq AND {match_clause}"
         sql = f"""
-            SELECT
-                id,
-                title,
-                summary,
-                ts_rank({tsvector_expr}, plainto_tsquery('{self.ts_config}', :query)) as rank,
-                CASE
-                    WHEN title ILIKE '%' || :query_like || '%' THEN 'title'
-                    WHEN summary ILIKE '%' || :query_like || '%' THEN 'summary'
-                    ELSE 'content'
-                END as matched_field,
-                ts_headline(
-                    '{self.ts_config}',
-                    COALESCE(summary, content, ''),
-                    plainto_tsquery('{self.ts_config}', :query),
-                    'MaxWords=30, MinWords=15, StartSel=<mark>, StopSel=</mark>'
-                ) as snippet
-            FROM digests
-            WHERE ({tsvector_expr}) @@ plainto_tsquery('{self.ts_config}', :query)
+            WITH ranked AS (
+                SELECT id, ts_rank({tsvector_expr}, tsq) AS rank
+                FROM digests, plainto_tsquery('{self.ts_config}', :query) AS tsq
+                WHERE {match_clause}
         """
 
         params = {
             'query': query,
-            'query_like': query,
         }
 
         # Add filters
@@ -163,7 +143,35 @@ class FTSService:
         if filter_clauses:
             sql += " AND " + " AND ".join(filter_clauses)
 
-        sql += " ORDER BY rank DESC LIMIT :limit"
+        matched_cases = " ".join(
+            f"WHEN {self._tsvector_expr([field])} @@ tsq THEN '{field}'"
+            for field in search_fields[:-1]
+        )
+        matched_field_expr = (
+            f"CASE {matched_cases} ELSE '{search_fields[-1]}' END"
+            if matched_cases else f"'{search_fields[-1]}'"
+        )
+        sql += f"""
+                ORDER BY rank DESC
+                LIMIT :limit
+            )
+            SELECT
+                d.id,
+                d.title,
+                d.summary,
+                ranked.rank,
+                {matched_field_expr} AS matched_field,
+                ts_headline(
+                    '{self.ts_config}',
+                    COALESCE(d.summary, d.content, ''),
+                    tsq,
+                    'MaxWords=30, MinWords=15, StartSel=<mark>, StopSel=</mark>'
+                ) AS snippet
+            FROM ranked
+            JOIN digests d ON d.id = ranked.id
+            CROSS JOIN plainto_tsquery('{self.ts_config}', :query) AS tsq
+            ORDER BY ranked.rank DESC
+        """
         params['limit'] = limit
 
         # Execute query
@@ -184,6 +192,25 @@ class FTSService:
 
         return results
 
+    def _tsvector_expr(self, fields: list[str]) -> str:
+        """Build the tsvector SQL expression for the given digest fields.
+
+        Uses the stored ``digests.search_vector`` column (GIN indexed) when the
+        configured language matches it, filtering by weight for a subset of
+        fields. Other languages fall back to computing the vector per row.
+        """
+        if self.ts_config == SEARCH_TS_CONFIG:
+            if len(fields) == len(self.FIELD_WEIGHTS):
+                return "search_vector"
+            weights = ",".join(self.FIELD_WEIGHTS[field].lower() for field in fields)
+            return f"ts_filter(search_vector, '{{{weights}}}')"
+
+        return "(" + " || ".join(
+            f"setweight(to_tsvector('{self.ts_config}', COALESCE({field}, '')), "
+            f"'{self.FIELD_WEIGHTS[field]}')"
+            for field in fields
+        ) + ")"
+
     def search_chunks(
         self,
         query: str,
@@ -191,9 +218,10 @@ class FTSService:
         feed_id: int | None = None,
         source_id: int | None = None,
         days: int | None = None,
+        chunk_source: ChunkSource = 'digest',
     ) -> list[dict]:
         """
-        Search digest chunks using full-text search.
+        Search chunks using full-text search.
 
         Returns chunk-level results for more granular matching.
 
@@ -203,25 +231,41 @@ class FTSService:
             feed_id: Optional filter by feed ID
             source_id: Optional filter by source ID
             days: Optional filter for digests created within N days
+            chunk_source: Search DigestChunk ('digest') or SourceContentChunk
+                          ('source_content')
 
         Returns:
-            List of dicts with chunk match information
+            List of dicts with chunk match information, sorted by ts_rank
         """
-        from reconly_core.database.models import DigestChunk, Digest, FeedRun
+        from reconly_core.database.models import (
+            DigestChunk, Digest, DigestSourceItem, FeedRun, SourceContent, SourceContentChunk,
+        )
 
         if not query or not query.strip():
             return []
 
+        chunk_model = SourceContentChunk if chunk_source == 'source_content' else DigestChunk
+        if self.ts_config == SEARCH_TS_CONFIG:
+            tsvector = chunk_model.search_vector
+        else:
+            tsvector = func.to_tsvector(self.ts_config, chunk_model.text)
+        tsquery = func.plainto_tsquery(self.ts_config, query)
+        rank = func.ts_rank(tsvector, tsquery).label('rank')
+
         # Build base query
-        db_query = self.db.query(DigestChunk).join(
-            Digest, DigestChunk.digest_id == Digest.id
-        )
+        db_query = self.db.query(chunk_model, Digest.id.label('digest_id'), rank)
+        if chunk_model is SourceContentChunk:
+            db_query = db_query.join(
+                SourceContent, SourceContentChunk.source_content_id == SourceContent.id
+            ).join(
+                DigestSourceItem, SourceContent.digest_source_item_id == DigestSourceItem.id
+            ).join(
+                Digest, DigestSourceItem.digest_id == Digest.id
+            )
+        else:
+            db_query = db_query.join(Digest, DigestChunk.digest_id == Digest.id)
 
-        # Apply text filter using PostgreSQL FTS on chunk text
-        fts_condition = text(
-            f"to_tsvector('{self.ts_config}', text) @@ plainto_tsquery('{self.ts_config}', :query)"
-        )
-        db_query = db_query.filter(fts_condition).params(query=query)
+        db_query = db_query.filter(tsvector.op('@@')(tsquery))
 
         # Apply filters
         if feed_id is not None:
@@ -236,31 +280,16 @@ class FTSService:
             cutoff = datetime.now(timezone.utc) - timedelta(days=days)
             db_query = db_query.filter(Digest.created_at >= cutoff)
 
-        # Limit results
-        db_query = db_query.limit(limit)
-
-        chunks = db_query.all()
-
-        # Convert to result dicts
-        results = []
-        query_lower = query.lower()
-
-        for chunk in chunks:
-            # Calculate simple score based on match frequency
-            text_lower = chunk.text.lower()
-            match_count = text_lower.count(query_lower)
-            score = min(1.0, match_count * 0.2)  # Cap at 1.0
+        rows = db_query.order_by(rank.desc()).limit(limit).all()
 
-            results.append({
+        return [
+            {
                 'chunk_id': chunk.id,
-                'digest_id': chunk.digest_id,
+                'digest_id': digest_id,
                 'chunk_index': chunk.chunk_index,
                 'text': chunk.text,
-                'score': score,
+                'score': float(score) if score else 0.0,
                 'extra_data': chunk.extra_data,
-            })
-
-        # Sort by score
-        results.sort(key=lambda x: x['score'], reverse=True)
-
-        return results
+            }
+            for chunk, digest_id, score in rows
+        ]
@@ -3,6 +3,8 @@
 Uses Reciprocal Rank Fusion (RRF) to merge results from both
 search methods for improved relevance.
 """
+import asyncio
+import copy
 import logging
 import time
 import threading
@@ -10,11 +12,13 @@ from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Literal, TYPE_CHECKING
 
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
 from reconly_core.rag.search.vector import VectorSearchService, VectorSearchResult, ChunkSource
 from reconly_core.rag.search.fts import FTSService, FTSSearchResult
 
 if TYPE_CHECKING:
-    from sqlalchemy.orm import Session
     from reconly_core.rag.embeddings.base import EmbeddingProvider
 
 logger = logging.getLogger(__name__)
@@ -242,6 +246,8 @@ class HybridSearchService:
         - Query embedding caching with configurable TTL (15 min default)
         - LRU eviction when cache reaches max size (1000 entries default)
         - Thread-safe cache operations
+        - FTS starts while the query embedding is computed; vector and FTS
+          queries run concurrently on separate sessions when bound to an Engine
 
     Example:
         >>> from reconly_core.rag.search import HybridSearchService
@@ -343,14 +349,32 @@ class HybridSearchService:
         fts_results: list[FTSSearchResult] = []
         query_embedding: list[float] | None = None
 
+        # Start FTS right away so it overlaps with computing the query embedding
+        # (always uses digest-level search)
+        fts_task: asyncio.Task | None = None
+        if mode in ('hybrid', 'fts'):
+            fts_task = asyncio.create_task(self._run_leg(
+                self.fts_service, 'search',
+                query,
+                limit=limit * 2,  # Get more results for fusion
+                feed_id=feed_id,
+                source_id=source_id,
+                days=days,
+            ))
+
         # Get vector search results
         if mode in ('hybrid', 'vector'):
             try:
                 # Get query embedding (check cache first)
                 query_embedding = await self._get_query_embedding(query)
 
+                if fts_task is not None and not self._isolated_sessions():
+                    # Both legs share one session; wait for FTS to release it
+                    await asyncio.wait([fts_task])
+
                 # Search using embedding (with chunk_source selection)
-                vector_results = self.vector_service.search_sync(
+                vector_results = await self._run_leg(
+                    self.vector_service, 'search_sync',
                     query_embedding,
                     limit=limit * 2,  # Get more results for fusion
                     feed_id=feed_id,
@@ -365,17 +389,10 @@ class HybridSearchService:
                     # If vector-only mode, we need to raise
                     raise
 
-        # Get FTS results (always uses digest-level search for now)
-        # Note: FTS on source content chunks can be added later if needed
-        if mode in ('hybrid', 'fts'):
+        # Get FTS results
+        if fts_task is not None:
             try:
-                fts_results = self.fts_service.search(
-                    query,
-                    limit=limit * 2,  # Get more results for fusion
-                    feed_id=feed_id,
-                    source_id=source_id,
-                    days=days,
-                )
+                fts_results = await fts_task
                 logger.debug(f"FTS returned {len(fts_results)} results")
             except Exception as e:
                 logger.error(f"FTS failed: {e}")
@@ -485,14 +502,9 @@ class HybridSearchService:
             if data['fts_rank'] is not None:
                 rrf_score += self.fts_weight * (1.0 / (self.k + data['fts_rank']))
 
-            # Fetch title if not available
-            title = data['title']
-            if title is None:
-                title = self._get_digest_title(digest_id)
-
             results.append(HybridSearchResult(
                 digest_id=digest_id,
-                title=title,
+                title=data['title'],
                 matched_chunks=data['chunks'],
                 score=rrf_score,
                 vector_rank=data['vector_rank'],
@@ -503,7 +515,15 @@ class HybridSearchService:
 
         # Sort by RRF score and limit
         results.sort(key=lambda x: x.score, reverse=True)
-        return results[:limit]
+        results = results[:limit]
+
+        # Fill in titles for vector-only matches in one query
+        titles = self._get_digest_titles([r.digest_id for r in results if r.title is None])
+        for result in results:
+            if result.title is None:
+                result.title = titles.get(result.digest_id)
+
+        return results
 
     def _convert_vector_results(
         self,
@@ -527,9 +547,11 @@ class HybridSearchService:
                 source_item_url=vr.source_item_url,
             ))
 
+        titles = self._get_digest_titles(list(digest_chunks))
+
         results = []
         for idx, (digest_id, chunks) in enumerate(digest_chunks.items(), start=1):
-            title = self._get_digest_title(digest_id)
+            title = titles.get(digest_id)
             # Use best chunk score as overall score
             best_score = max(c.score for c in chunks) if chunks else 0.0
 
@@ -582,15 +604,48 @@ class HybridSearchService:
 
         return results
 
-    def _get_digest_title(self, digest_id: int) -> str | None:
-        """Fetch digest title from database."""
+    def _get_digest_titles(self, digest_ids: list[int]) -> dict[int, str | None]:
+        """Fetch titles for several digests in a single query."""
         from reconly_core.database.models import Digest
 
-        digest = self.db.query(Digest.title).filter(
-            Digest.id == digest_id
-        ).first()
+        if not digest_ids:
+            return {}
+
+        rows = self.db.query(Digest.id, Digest.title).filter(
+            Digest.id.in_(digest_ids)
+        ).all()
+
+        return {row.id: row.title for row in rows}
+
+    def _isolated_sessions(self) -> bool:
+        """Whether search legs can run on their own sessions and connections.
+
+        Only possible when the session is bound to an Engine. Sessions bound to
+        a Connection (e.g. an outer transaction) are shared, so the legs must
+        not use it at the same time.
+        """
+        try:
+            return isinstance(self.db.get_bind(), Engine)
+        except Exception:
+            return False
+
+    async def _run_leg(self, service, method: str, *args, **kwargs):
+        """Run a blocking search method in a worker thread.
+
+        When possible the call gets a short-lived session of its own, so the
+        vector and FTS legs can query the database concurrently.
+        """
+        if not self._isolated_sessions():
+            return await asyncio.to_thread(getattr(service, method), *args, **kwargs)
+
+        def run():
+            with Session(bind=self.db.get_bind()) as session:
+                # Shallow copy keeps the service's configuration, swaps the session
+                leg = copy.copy(service)
+                leg.db = session
+                return getattr(leg, method)(*args, **kwargs)
 
-        return digest.title if digest else None
+        return await asyncio.to_thread(run)
 
     async def _get_query_embedding(self, query: str) -> list[float]:
         """
@@ -2,12 +2,20 @@
 
 Provides semantic search over digest chunks and source content chunks
 using pgvector's cosine distance operator for efficient similarity search.
+
+Filters (feed, source, age) are applied to columns denormalized onto the
+chunk rows. Small filtered candidate sets are scanned exactly through the
+btree indexes; larger ones use the HNSW index with ``hnsw.ef_search`` raised
+to the limit and, on pgvector 0.8+, iterative index scans so selective
+filters still return ``limit`` results.
 """
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Literal
 
+from sqlalchemy import func, select, text
+
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
     from reconly_core.rag.embeddings.base import EmbeddingProvider
@@ -17,6 +25,19 @@ logger = logging.getLogger(__name__)
 # Type alias for chunk source selection
 ChunkSource = Literal['source_content', 'digest']
 
+# Filtered search defaults (overridden by rag.search.* settings)
+DEFAULT_EF_SEARCH = 100
+DEFAULT_EXACT_SCAN_THRESHOLD = 2000
+
+# hnsw.ef_search upper bound enforced by pgvector
+MAX_EF_SEARCH = 1000
+
+# First pgvector release with hnsw.iterative_scan
+ITERATIVE_SCAN_MIN_VERSION = (0, 8)
+
+# Database URL -> whether the installed pgvector supports iterative scans
+_iterative_scan_support: dict[str, bool] = {}
+
 
 @dataclass
 class VectorSearchResult:
@@ -80,6 +101,7 @@ class VectorSearchService:
         """
         self.db = db
         self.embedding_provider = embedding_provider
+        self._scan_settings: tuple[int, int] | None = None
 
     async def search(
         self,
@@ -162,47 +184,26 @@ class VectorSearchService:
         Uses the <=> operator for cosine distance (1 - cosine_similarity).
         This searches processed/summarized digest content.
         """
-        from reconly_core.database.models import DigestChunk, Digest, FeedRun
+        from reconly_core.database.models import DigestChunk
+
+        distance = DigestChunk.embedding.cosine_distance(query_embedding)
+        conditions = self._filter_conditions(DigestChunk, feed_id, source_id, days)
 
-        # Build the query with pgvector cosine distance
         # Note: <=> returns cosine distance (1 - similarity), so lower is better
         # We convert to similarity score: score = 1 - distance
-
-        # Base query with distance calculation
-        query = self.db.query(
-            DigestChunk,
-            DigestChunk.embedding.cosine_distance(query_embedding).label('distance')
-        ).join(
-            Digest, DigestChunk.digest_id == Digest.id
-        )
-
-        # Apply filters
-        if feed_id is not None:
-            query = query.join(
-                FeedRun, Digest.feed_run_id == FeedRun.id
-            ).filter(FeedRun.feed_id == feed_id)
-
-        if source_id is not None:
-            query = query.filter(Digest.source_id == source_id)
-
-        if days is not None:
-            cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-            query = query.filter(Digest.created_at >= cutoff)
+        query = self.db.query(DigestChunk, distance.label('distance')).filter(*conditions)
 
         # Filter by minimum score (convert to max distance)
         # distance = 1 - score, so max_distance = 1 - min_score
         if min_score > 0:
-            max_distance = 1.0 - min_score
-            query = query.filter(
-                DigestChunk.embedding.cosine_distance(query_embedding) <= max_distance
-            )
+            query = query.filter(distance <= 1.0 - min_score)
 
-        # Order by distance and limit
-        query = query.order_by('distance').limit(limit)
+        query = query.filter(DigestChunk.embedding.isnot(None))
+        query = query.order_by(self._plan_scan(DigestChunk, conditions, distance, limit)).limit(limit)
 
         # Execute and convert to results
         results = []
-        for chunk, distance in query.all():
+        for chunk, distance in sorted(query.all(), key=lambda row: row.distance):
             score = max(0.0, 1.0 - distance)  # Convert distance to similarity
             results.append(VectorSearchResult(
                 chunk_id=chunk.id,
@@ -236,54 +237,38 @@ class VectorSearchService:
         SourceContentChunk -> SourceContent -> DigestSourceItem -> Digest
         """
         from reconly_core.database.models import (
-            SourceContentChunk, SourceContent, DigestSourceItem, Digest, FeedRun
+            SourceContentChunk, SourceContent, DigestSourceItem
         )
 
-        # Build the query with pgvector cosine distance
+        distance = SourceContentChunk.embedding.cosine_distance(query_embedding)
+        conditions = self._filter_conditions(SourceContentChunk, feed_id, source_id, days)
+
         # Join through the relationship chain to get digest context
         query = self.db.query(
             SourceContentChunk,
-            SourceContentChunk.embedding.cosine_distance(query_embedding).label('distance'),
-            Digest.id.label('digest_id'),
+            distance.label('distance'),
+            DigestSourceItem.digest_id,
             DigestSourceItem.item_title,
             DigestSourceItem.item_url,
         ).join(
             SourceContent, SourceContentChunk.source_content_id == SourceContent.id
         ).join(
             DigestSourceItem, SourceContent.digest_source_item_id == DigestSourceItem.id
-        ).join(
-            Digest, DigestSourceItem.digest_id == Digest.id
-        )
-
-        # Apply filters
-        if feed_id is not None:
-            query = query.join(
-                FeedRun, Digest.feed_run_id == FeedRun.id
-            ).filter(FeedRun.feed_id == feed_id)
-
-        if source_id is not None:
-            query = query.filter(DigestSourceItem.source_id == source_id)
-
-        if days is not None:
-            cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-            query = query.filter(Digest.created_at >= cutoff)
+        ).filter(*conditions)
 
         # Filter by minimum score (convert to max distance)
         if min_score > 0:
-            max_distance = 1.0 - min_score
-            query = query.filter(
-                SourceContentChunk.embedding.cosine_distance(query_embedding) <= max_distance
-            )
+            query = query.filter(distance <= 1.0 - min_score)
 
         # Only include chunks that have embeddings
         query = query.filter(SourceContentChunk.embedding.isnot(None))
 
-        # Order by distance and limit
-        query = query.order_by('distance').limit(limit)
+        query = query.order_by(self._plan_scan(SourceContentChunk, conditions, distance, limit)).limit(limit)
 
         # Execute and convert to results
         results = []
-        for chunk, distance, digest_id, item_title, item_url in query.all():
+        rows = sorted(query.all(), key=lambda row: row.distance)
+        for chunk, distance, digest_id, item_title, item_url in rows:
             score = max(0.0, 1.0 - distance)  # Convert distance to similarity
             results.append(VectorSearchResult(
                 chunk_id=chunk.id,
@@ -300,6 +285,107 @@ class VectorSearchService:
 
         return results
 
+    def _filter_conditions(
+        self,
+        chunk_model,
+        feed_id: int | None,
+        source_id: int | None,
+        days: int | None,
+    ) -> list:
+        """Build filters on the chunk's denormalized feed/source/date columns."""
+        conditions = []
+
+        if feed_id is not None:
+            conditions.append(chunk_model.feed_id == feed_id)
+
+        if source_id is not None:
+            conditions.append(chunk_model.source_id == source_id)
+
+        if days is not None:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+            conditions.append(chunk_model.digest_created_at >= cutoff)
+
+        return conditions
+
+    def _plan_scan(self, chunk_model, conditions: list, distance, limit: int):
+        """
+        Choose between an exact scan and an HNSW index scan.
+
+        Filtered searches whose candidate set is at most the exact-scan
+        threshold are ordered by an expression the HNSW index can't serve,
+        so PostgreSQL reads the candidates through the btree filter indexes
+        and sorts them exactly. Everything else uses the HNSW index with
+        ef_search of at least ``limit`` and, for filtered searches,
+        iterative scans where pgvector supports them.
+
+        Returns:
+            ORDER BY expression for the query
+        """
+        ef_search, exact_scan_threshold = self._get_scan_settings()
+
+        if conditions and exact_scan_threshold > 0:
+            candidates = self.db.execute(
+                select(func.count()).select_from(
+                    select(chunk_model.id)
+                    .filter(*conditions, chunk_model.embedding.isnot(None))
+                    .limit(exact_scan_threshold + 1)
+                    .subquery()
+                )
+            ).scalar()
+            if candidates <= exact_scan_threshold:
+                logger.debug(f"Exact vector scan over {candidates} filtered chunks")
+                return distance + 0
+
+        # Settings are transaction-local (set_config(..., true))
+        self.db.execute(
+            text("SELECT set_config('hnsw.ef_search', :value, true)"),
+            {'value': str(min(MAX_EF_SEARCH, max(ef_search, limit)))},
+        )
+        if conditions and self._supports_iterative_scan():
+            # Keep scanning the graph until enough rows pass the filters;
+            # rows may come back slightly out of order, callers re-sort
+            self.db.execute(text("SELECT set_config('hnsw.iterative_scan', 'relaxed_order', true)"))
+
+        return distance
+
+    def _get_scan_settings(self) -> tuple[int, int]:
+        """Resolve ef_search and the exact-scan threshold from settings (cached per service)."""
+        if self._scan_settings is None:
+            ef_search, exact_scan_threshold = DEFAULT_EF_SEARCH, DEFAULT_EXACT_SCAN_THRESHOLD
+            try:
+                from reconly_core.services.settings_service import SettingsService
+                settings = SettingsService(self.db)
+                ef_search = int(settings.get("rag.search.ef_search"))
+                exact_scan_threshold = int(settings.get("rag.search.exact_scan_threshold"))
+            except Exception:
+                pass
+            self._scan_settings = (ef_search, exact_scan_threshold)
+
+        return self._scan_settings
+
+    def _supports_iterative_scan(self) -> bool:
+        """Check (once per database) whether pgvector is 0.8 or newer."""
+        try:
+            bind = self.db.get_bind()
+            key = str(getattr(bind, 'engine', bind).url)
+        except Exception:
+            return False
+
+        if key not in _iterative_scan_support:
+            supported = False
+            try:
+                version = self.db.execute(
+                    text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+                ).scalar()
+                if version:
+                    parts = tuple(int(part) for part in version.split('.')[:2])
+                    supported = parts >= ITERATIVE_SCAN_MIN_VERSION
+            except Exception as e:
+                logger.debug(f"Could not determine pgvector version: {e}")
+            _iterative_scan_support[key] = supported
+
+        return _iterative_scan_support[key]
+
     async def get_query_embedding(self, query: str) -> list[float]:
         """
         Generate embedding for a query string.
@@ -7,6 +7,7 @@ import re
 from enum import Enum
 from typing import Any, Dict, Optional, Union
 
+import httpx
 import requests
 
 
@@ -227,14 +228,18 @@ def _classify_exception(error: Exception) -> ErrorCategory:
     error_type = type(error).__name__
     error_msg = str(error).lower()
 
+    # HTTP status errors - classify by the response status
+    if isinstance(error, httpx.HTTPStatusError):
+        return _classify_http_status(error.response.status_code)
+
     # Timeout errors - transient
-    if isinstance(error, (requests.Timeout,)):
+    if isinstance(error, (requests.Timeout, httpx.TimeoutException)):
         return ErrorCategory.TRANSIENT
     if "timeout" in error_type.lower() or "timeout" in error_msg:
         return ErrorCategory.TRANSIENT
 
     # Connection errors - transient
-    if isinstance(error, (requests.ConnectionError, ConnectionError, OSError)):
+    if isinstance(error, (requests.ConnectionError, httpx.NetworkError, ConnectionError, OSError)):
         return ErrorCategory.TRANSIENT
 
     if "connection" in error_type.lower():
@@ -0,0 +1,142 @@
+"""Concurrency primitives for parallel source processing.
+
+Provides the limits used by FeedService when sources are processed in
+parallel:
+
+- A process-wide slot pool that caps concurrent source workers across all
+  feed runs (scheduler jobs, API-triggered runs, CLI).
+- A per-host throttle that caps concurrent requests to one host and spaces
+  consecutive requests to the same host by ``delay_between`` seconds.
+"""
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+
+def get_host(url: Optional[str]) -> Optional[str]:
+    """Extract the lowercase hostname from a URL.
+
+    Returns None for values without a network location (e.g. agent research
+    prompts stored in ``Source.url``), which are not host-throttled.
+    """
+    if not url:
+        return None
+    try:
+        host = urlparse(url).hostname
+    except ValueError:
+        return None
+    return host.lower() if host else None
+
+
+class GlobalWorkerPool:
+    """Process-wide cap on concurrently running source workers.
+
+    All FeedService instances share one pool so that parallel scheduled runs
+    cannot multiply their per-feed limits into an unbounded number of
+    workers. The limit can be raised or lowered between runs; workers that
+    already hold a slot are not affected.
+    """
+
+    def __init__(self, limit: int = 8):
+        self._cond = threading.Condition()
+        self._limit = max(1, limit)
+        self._active = 0
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    def set_limit(self, limit: int) -> None:
+        """Update the slot limit (takes effect for the next acquire)."""
+        with self._cond:
+            self._limit = max(1, limit)
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Block until a worker slot is free and hold it for the block."""
+        with self._cond:
+            while self._active >= self._limit:
+                self._cond.wait()
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify()
+
+
+class HostThrottle:
+    """Per-host politeness limits.
+
+    Limits the number of concurrent requests per host and enforces a minimum
+    spacing between request starts on the same host. Sources on different
+    hosts never wait on each other.
+
+    Example:
+        >>> throttle = HostThrottle(max_per_host=2, delay_between=2.0)
+        >>> with throttle.acquire("https://example.com/feed.xml"):
+        ...     fetch()
+    """
+
+    def __init__(self, max_per_host: int = 2, delay_between: float = 0.0):
+        self.max_per_host = max(1, max_per_host)
+        self.delay_between = max(0.0, delay_between)
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    def _semaphore_for(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._semaphores.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.max_per_host)
+                self._semaphores[host] = sem
+            return sem
+
+    def _reserve_start(self, host: str) -> float:
+        """Reserve the next start time for a host and return seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start_at + self.delay_between
+            return start_at - now
+
+    @contextmanager
+    def acquire(self, url: Optional[str]) -> Iterator[None]:
+        """Hold a per-host slot for the duration of the block.
+
+        URLs without a host pass through without limits.
+        """
+        host = get_host(url)
+        if host is None:
+            yield
+            return
+
+        sem = self._semaphore_for(host)
+        sem.acquire()
+        try:
+            if self.delay_between > 0:
+                wait = self._reserve_start(host)
+                if wait > 0:
+                    time.sleep(wait)
+            yield
+        finally:
+            sem.release()
+
+
+_global_pool = GlobalWorkerPool()
+
+
+def get_global_worker_pool(limit: Optional[int] = None) -> GlobalWorkerPool:
+    """Get the shared worker pool, optionally updating its limit."""
+    if limit is not None and limit != _global_pool.limit:
+        _global_pool.set_limit(limit)
+    return _global_pool
@@ -2,7 +2,7 @@
 
 Provides metrics focused on user-valuable information rather than system telemetry.
 """
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from typing import Optional
 
 from sqlalchemy import and_, func
@@ -36,20 +36,30 @@ class DashboardService:
         """
         now = datetime.utcnow()
         today_start = now - timedelta(hours=24)
+        yesterday_start = now - timedelta(hours=48)
         week_start = now - timedelta(days=7)
+        last_week_start = now - timedelta(days=14)
 
-        # Count digests created in last 24 hours
-        new_today = self.db.query(func.count(Digest.id)).filter(
-            Digest.created_at >= today_start
-        ).scalar() or 0
-
-        # Count digests created in last 7 days
-        new_this_week = self.db.query(func.count(Digest.id)).filter(
-            Digest.created_at >= week_start
-        ).scalar() or 0
-
-        # Total digest count
-        total_digests = self.db.query(func.count(Digest.id)).scalar() or 0
+        # All digest window counts in one pass over the digests index
+        counts = self.db.query(
+            func.count(Digest.id).label("total"),
+            func.count(Digest.id).filter(Digest.created_at >= today_start).label("today"),
+            func.count(Digest.id).filter(
+                Digest.created_at >= yesterday_start,
+                Digest.created_at < today_start,
+            ).label("yesterday"),
+            func.count(Digest.id).filter(Digest.created_at >= week_start).label("week"),
+            func.count(Digest.id).filter(
+                Digest.created_at >= last_week_start,
+                Digest.created_at < week_start,
+            ).label("last_week"),
+        ).one()
+
+        new_today = counts.today or 0
+        new_this_week = counts.week or 0
+        total_digests = counts.total or 0
+        new_yesterday = counts.yesterday or 0
+        new_last_week = counts.last_week or 0
 
         # Feed health: count feeds with recent successful vs failed runs
         # A feed is "healthy" if its most recent run was successful
@@ -62,22 +72,6 @@ class DashboardService:
         # Get daily counts for sparkline (last 7 days)
         daily_counts = self._get_daily_digest_counts(7)
 
-        # Get change from yesterday
-        yesterday_start = now - timedelta(hours=48)
-        yesterday_end = now - timedelta(hours=24)
-        new_yesterday = self.db.query(func.count(Digest.id)).filter(
-            Digest.created_at >= yesterday_start,
-            Digest.created_at < yesterday_end
-        ).scalar() or 0
-
-        # Get change from last week
-        last_week_start = now - timedelta(days=14)
-        last_week_end = now - timedelta(days=7)
-        new_last_week = self.db.query(func.count(Digest.id)).filter(
-            Digest.created_at >= last_week_start,
-            Digest.created_at < last_week_end
-        ).scalar() or 0
-
         return {
             "new_today": new_today,
             "new_this_week": new_this_week,
@@ -162,18 +156,16 @@ class DashboardService:
         Returns:
             List of daily counts, oldest first (e.g., [5, 10, 8, 12, 3, 15, 7])
         """
-        now = datetime.utcnow()
-        counts = []
-
-        for i in range(days - 1, -1, -1):
-            day_start = (now - timedelta(days=i)).replace(hour=0, minute=0, second=0, microsecond=0)
-            day_end = day_start + timedelta(days=1)
-
-            count = self.db.query(func.count(Digest.id)).filter(
-                Digest.created_at >= day_start,
-                Digest.created_at < day_end
-            ).scalar() or 0
-
-            counts.append(count)
-
-        return counts
+        today = datetime.utcnow().date()
+        first_day = today - timedelta(days=days - 1)
+        day = func.date(Digest.created_at)
+
+        rows = self.db.query(day, func.count(Digest.id)).filter(
+            Digest.created_at >= datetime.combine(first_day, time.min)
+        ).group_by(day).all()
+        counts_by_day = {str(d): count for d, count in rows}
+
+        return [
+            counts_by_day.get(str(first_day + timedelta(days=i)), 0)
+            for i in range(days)
+        ]
@@ -0,0 +1,235 @@
+"""Digest list projection for paginated digest lists.
+
+Loads only the columns a list needs instead of full Digest objects:
+token usage is summed in SQL, tags and source items are fetched with one
+grouped query each for the whole page, and the summary view ships a
+truncated content preview instead of the full body. Pages are addressed
+either by offset (the total comes from a window count in the same query)
+or by a (created_at, id) keyset cursor.
+"""
+import base64
+import binascii
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import func, literal, select, tuple_
+from sqlalchemy.orm import Session
+
+from reconly_core.database.models import (
+    Digest,
+    DigestSourceItem,
+    DigestTag,
+    LLMUsageLog,
+    Source,
+    Tag,
+)
+
+# Characters of content kept in the summary view
+SUMMARY_CONTENT_CHARS = 500
+
+# Columns selected for every list row (content is added per view)
+_LIST_COLUMNS = (
+    Digest.id,
+    Digest.url,
+    Digest.title,
+    Digest.summary,
+    Digest.source_type,
+    Digest.feed_url,
+    Digest.feed_title,
+    Digest.image_url,
+    Digest.author,
+    Digest.published_at,
+    Digest.created_at,
+    Digest.provider,
+    Digest.language,
+    Digest.estimated_cost,
+    Digest.consolidated_count,
+)
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor can't be decoded."""
+
+
+@dataclass
+class DigestPage:
+    """One page of digest list rows.
+
+    Attributes:
+        digests: Row dicts shaped like Digest.to_dict()
+        total: Number of digests matching the filters (None on cursor pages)
+        next_cursor: Cursor for the next page, or None on the last page
+    """
+    digests: list[dict[str, Any]] = field(default_factory=list)
+    total: Optional[int] = None
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(created_at: datetime, digest_id: int) -> str:
+    """Encode a (created_at, id) keyset position as an opaque cursor."""
+    raw = f"{created_at.isoformat()}|{digest_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor from encode_cursor().
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        created_at, digest_id = raw.rsplit('|', 1)
+        return datetime.fromisoformat(created_at), int(digest_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+
+class DigestListService:
+    """Service for loading paginated digest lists."""
+
+    def __init__(self, db: Session):
+        """Initialize the digest list service.
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    def list_digests(
+        self,
+        filters: Optional[list] = None,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        summary: bool = False,
+    ) -> DigestPage:
+        """Load one page of digests, newest first.
+
+        Args:
+            filters: SQLAlchemy criteria on Digest columns
+            limit: Maximum number of digests
+            offset: Rows to skip (ignored when a cursor is given)
+            cursor: Keyset cursor from a previous page's next_cursor
+            summary: Truncate content to SUMMARY_CONTENT_CHARS and skip source items
+
+        Returns:
+            DigestPage with the rows, total (offset pages only) and next cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        filters = list(filters or [])
+
+        if summary:
+            content = func.left(Digest.content, SUMMARY_CONTENT_CHARS).label('content')
+        else:
+            content = Digest.content
+
+        tokens_in = (
+            select(func.coalesce(func.sum(LLMUsageLog.tokens_in), 0))
+            .where(LLMUsageLog.digest_id == Digest.id)
+            .scalar_subquery()
+            .label('tokens_in')
+        )
+        tokens_out = (
+            select(func.coalesce(func.sum(LLMUsageLog.tokens_out), 0))
+            .where(LLMUsageLog.digest_id == Digest.id)
+            .scalar_subquery()
+            .label('tokens_out')
+        )
+
+        if cursor:
+            created_at, digest_id = decode_cursor(cursor)
+            filters.append(tuple_(Digest.created_at, Digest.id) < tuple_(created_at, digest_id))
+            # Totals aren't recounted on cursor pages
+            total_column = literal(None).label('total')
+        else:
+            total_column = func.count().over().label('total')
+
+        query = (
+            self.db.query(*_LIST_COLUMNS, content, tokens_in, tokens_out, total_column)
+            .filter(*filters)
+            .order_by(Digest.created_at.desc(), Digest.id.desc())
+        )
+        if not cursor and offset:
+            query = query.offset(offset)
+        # One extra row tells whether there is a next page
+        rows = query.limit(limit + 1).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        if cursor:
+            total = None
+        elif rows:
+            total = rows[0].total
+        elif offset:
+            # Past the last page: no row to carry the window count
+            total = self.db.query(func.count(Digest.id)).filter(*filters).scalar() or 0
+        else:
+            total = 0
+
+        next_cursor = None
+        if has_more and rows[-1].created_at is not None:
+            next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+        digest_ids = [row.id for row in rows]
+        tags = self._tags_by_digest(digest_ids)
+        source_items = {} if summary else self._source_items_by_digest(digest_ids)
+
+        digests = []
+        for row in rows:
+            digest = {
+                column: getattr(row, column)
+                for column in row._fields
+                if column != 'total'
+            }
+            digest['tags'] = tags.get(row.id, [])
+            if row.id in source_items:
+                digest['source_items'] = source_items[row.id]
+            digests.append(digest)
+
+        return DigestPage(digests=digests, total=total, next_cursor=next_cursor)
+
+    def _tags_by_digest(self, digest_ids: list[int]) -> dict[int, list[str]]:
+        """Load tag names for several digests in one grouped query."""
+        if not digest_ids:
+            return {}
+
+        rows = (
+            self.db.query(DigestTag.digest_id, func.array_agg(Tag.name))
+            .join(Tag, Tag.id == DigestTag.tag_id)
+            .filter(DigestTag.digest_id.in_(digest_ids))
+            .group_by(DigestTag.digest_id)
+            .all()
+        )
+        return {digest_id: sorted(names) for digest_id, names in rows}
+
+    def _source_items_by_digest(self, digest_ids: list[int]) -> dict[int, list[dict]]:
+        """Load source items (with source names) for several digests in one query."""
+        if not digest_ids:
+            return {}
+
+        rows = (
+            self.db.query(DigestSourceItem, Source.name)
+            .outerjoin(Source, Source.id == DigestSourceItem.source_id)
+            .filter(DigestSourceItem.digest_id.in_(digest_ids))
+            .order_by(DigestSourceItem.digest_id, DigestSourceItem.id)
+            .all()
+        )
+
+        items: dict[int, list[dict]] = {}
+        for item, source_name in rows:
+            items.setdefault(item.digest_id, []).append({
+                'id': item.id,
+                'digest_id': item.digest_id,
+                'source_id': item.source_id,
+                'source_name': source_name,
+                'item_url': item.item_url,
+                'item_title': item.item_title,
+                'item_published_at': item.item_published_at,
+                'created_at': item.created_at,
+            })
+        return items
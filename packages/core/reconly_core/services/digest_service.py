@@ -11,6 +11,7 @@ from reconly_core.providers import get_summarizer
 from reconly_core.providers.base import BaseProvider
 from reconly_core.tracking import FeedTracker
 from reconly_core.database import DigestDB
+from reconly_core.services.summary_cache import SummaryCache
 
 logger = logging.getLogger(__name__)
 
@@ -94,6 +95,50 @@ class DigestService:
             enable_fallback=options.enable_fallback
         )
 
+    def _summarize(
+        self,
+        summarizer: BaseProvider,
+        content_data: Dict[str, Any],
+        options: ProcessOptions,
+    ) -> Dict[str, Any]:
+        """
+        Summarize content through the persistent summary cache.
+
+        Cache errors (e.g. no database available) never fail summarization;
+        the summarizer is then called directly.
+
+        Args:
+            summarizer: Summarizer instance
+            content_data: Fetched content item
+            options: Process options
+
+        Returns:
+            Summarizer result dictionary
+        """
+        try:
+            session = self._get_db().session
+            cache = SummaryCache(session)
+            cache_key = cache.make_key(summarizer, content_data, options.language)
+            cached = cache.get(cache_key, content_data)
+        except Exception as e:
+            if self.db is not None:
+                self.db.session.rollback()
+            logger.debug(f"Summary cache unavailable: {e}")
+            return summarizer.summarize(content_data, language=options.language)
+
+        if cached is not None:
+            session.commit()  # Persist hit counters
+            return cached
+
+        result = summarizer.summarize(content_data, language=options.language)
+        try:
+            cache.put(cache_key, result, content_data)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.warning(f"Failed to store summary in cache: {e}")
+        return result
+
     def _save_to_database(
         self,
         result_data: Dict[str, Any],
@@ -202,7 +247,7 @@ class DigestService:
             content_data = fetcher.fetch(url)
 
             # Summarize
-            result = summarizer.summarize(content_data, language=options.language)
+            result = self._summarize(summarizer, content_data, options)
 
             # Save if requested
             digest_id = None
@@ -272,7 +317,7 @@ class DigestService:
             # For single video, return simple result
             if not is_channel:
                 content_data = content_items[0]
-                result = summarizer.summarize(content_data, language=options.language)
+                result = self._summarize(summarizer, content_data, options)
 
                 digest_id = None
                 if options.save:
@@ -296,7 +341,7 @@ class DigestService:
 
             for content_data in content_items:
                 try:
-                    result = summarizer.summarize(content_data, language=options.language)
+                    result = self._summarize(summarizer, content_data, options)
                     results.append(result)
 
                     if options.save:
@@ -381,7 +426,7 @@ class DigestService:
             for article in articles:
                 try:
                     # Summarize article
-                    result = summarizer.summarize(article, language=options.language)
+                    result = self._summarize(summarizer, article, options)
                     results.append(result)
 
                     # Save if requested
@@ -9,8 +9,9 @@ import time
 import hmac
 import hashlib
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterable, Set
 from dataclasses import dataclass, field
 
 import httpx
@@ -30,22 +31,26 @@ def _get_cached_template(template_string: str):
         _template_cache[cache_key] = _jinja_env.from_string(template_string)
     return _template_cache[cache_key]
 
-from sqlalchemy import create_engine, or_
-from sqlalchemy.orm import sessionmaker
 
 from reconly_core.database.models import (
-    Base, Feed, Source, FeedSource, FeedRun, Digest, LLMUsageLog,
+    Feed, Source, FeedSource, FeedRun, Digest, LLMUsageLog,
     PromptTemplate, DigestSourceItem, SourceContent
 )
 from reconly_core.database.crud import DEFAULT_DATABASE_URL
+from reconly_core.database.engine import get_session_factory, get_shared_engine
 from reconly_core.database.seed import get_default_prompt_template, get_default_consolidated_template
 from reconly_core.fetchers import get_fetcher
+from reconly_core.fetchers.base import HTTPValidators
 from reconly_core.providers import get_summarizer
 from reconly_core.providers.base import BaseProvider
-from reconly_core.tracking import FeedTracker
-from reconly_core.logging import get_logger, generate_trace_id, clear_trace_id
+from reconly_core.tracking import DBFeedTracker
+from reconly_core.logging import get_logger, generate_trace_id, clear_trace_id, trace_id_var
 from reconly_core.services.email_service import EmailService
+from reconly_core.services.usage_rollup_service import UsageRollupService
 from reconly_core.services.content_filter import ContentFilter
+from reconly_core.services.concurrency import GlobalWorkerPool, HostThrottle, get_global_worker_pool
+from reconly_core.services.pipeline import SummarizePipeline
+from reconly_core.services.summary_cache import SummaryCache, get_summary_cache_stats
 from reconly_core.services.connection_service import (
     get_connection,
     get_connection_decrypted,
@@ -66,6 +71,12 @@ ERROR_TYPE_TIMEOUT = "TimeoutError"
 ERROR_TYPE_CIRCUIT_OPEN = "CircuitOpenError"
 ERROR_TYPE_EXPORT = "ExportError"
 
+# Source types whose fetchers support conditional GET (validators= kwarg)
+CONDITIONAL_FETCH_SOURCE_TYPES = ("rss", "youtube")
+
+# Max URLs per IN query when checking a fetched batch for existing digests
+DIGEST_URL_LOOKUP_CHUNK = 500
+
 
 def _detect_error_type(error_msg: str, default_type: str = ERROR_TYPE_FETCH) -> str:
     """Detect error type from error message."""
@@ -197,8 +208,9 @@ class FeedRunOptions:
     enable_fallback: bool = True
     api_key: Optional[str] = None
     show_progress: bool = True
-    delay_between: int = 2
+    delay_between: int = 2  # Seconds between sources (per host when running concurrently)
     dry_run: bool = False  # If True, don't save digests or update run status
+    max_workers: Optional[int] = None  # Parallel sources (None = fetch.concurrency.max_workers setting)
 
 
 @dataclass
@@ -215,6 +227,7 @@ class FeedRunResult:
     total_cost: float
     duration_seconds: Optional[float] = None
     errors: List[str] = field(default_factory=list)
+    sources_not_modified: int = 0
 
 
 @dataclass
@@ -232,6 +245,7 @@ class _RunMetrics:
     sources_processed: int = 0
     sources_failed: int = 0
     sources_skipped: int = 0
+    sources_not_modified: int = 0
     items_processed: int = 0
     total_tokens_in: int = 0
     total_tokens_out: int = 0
@@ -239,6 +253,19 @@ class _RunMetrics:
     errors: list = field(default_factory=list)
     structured_errors: list = field(default_factory=list)
 
+    def merge(self, other: "_RunMetrics") -> None:
+        """Add another metrics instance (e.g. from a source worker) into this one."""
+        self.sources_processed += other.sources_processed
+        self.sources_failed += other.sources_failed
+        self.sources_skipped += other.sources_skipped
+        self.sources_not_modified += other.sources_not_modified
+        self.items_processed += other.items_processed
+        self.total_tokens_in += other.total_tokens_in
+        self.total_tokens_out += other.total_tokens_out
+        self.total_cost += other.total_cost
+        self.errors.extend(other.errors)
+        self.structured_errors.extend(other.structured_errors)
+
 
 def _batch_items_by_mode(
     items: List[Dict[str, Any]],
@@ -296,6 +323,19 @@ def _batch_items_by_mode(
         ]
 
 
+def _latest_published(current: Optional[datetime], item: Dict[str, Any]) -> Optional[datetime]:
+    """Return the later of ``current`` and the item's ISO ``published`` timestamp."""
+    if not item.get("published"):
+        return current
+    try:
+        item_dt = datetime.fromisoformat(item["published"])
+    except Exception:
+        return current
+    if current is None or item_dt > current:
+        return item_dt
+    return current
+
+
 def _generate_consolidated_url(feed_id: int, feed_run_id: int, mode: str, source_id: Optional[int] = None) -> str:
     """
     Generate synthetic URL for consolidated digests.
@@ -328,19 +368,45 @@ class FeedService:
         self.database_url = database_url or DEFAULT_DATABASE_URL
         self._session: Optional[Session] = None
         self._engine = None
-        self.tracker = FeedTracker()
+        self._tracker: Optional[DBFeedTracker] = None
         self.circuit_breaker = SourceCircuitBreaker(CircuitBreakerConfig.from_env())
 
+    @property
+    def tracker(self) -> DBFeedTracker:
+        """Incremental fetch state, stored in the feed_tracking_state table."""
+        if self._tracker is None:
+            bind = self._engine if self._engine is not None else self._get_session().get_bind()
+            self._tracker = DBFeedTracker(bind)
+        return self._tracker
+
     def _get_session(self) -> Session:
-        """Get or create database session."""
+        """Get or create database session.
+
+        Sessions come from the process-wide engine for database_url, so
+        repeated service instances (scheduled runs, task runners) share one
+        connection pool. The schema is managed by migrations, not here.
+        """
         if self._session is None:
             if self._engine is None:
-                self._engine = create_engine(self.database_url, echo=False)
-                Base.metadata.create_all(self._engine)
-            SessionLocal = sessionmaker(bind=self._engine)
-            self._session = SessionLocal()
+                self._engine = get_shared_engine(self.database_url)
+            self._session = get_session_factory(self.database_url)()
         return self._session
 
+    def close(self) -> None:
+        """Close the service's database session, returning its connection to the pool."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        self._tracker = None
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
     def get_feed(self, feed_id: int, user_id: Optional[int] = None) -> Optional[Feed]:
         """
         Get a feed by ID.
@@ -488,122 +554,299 @@ class FeedService:
             print(f"   Run ID: {feed_run.id}")
             print()
 
-        # Get summarizer
-        summarizer = self._get_summarizer(feed, options)
+        feed_run_id = feed_run.id
+        try:
+            # Get summarizer
+            summarizer = self._get_summarizer(feed, options)
 
-        # Store LLM info on feed run
-        feed_run.llm_provider = summarizer.get_provider_name()
-        feed_run.llm_model = getattr(summarizer, 'model', None)
-        session.commit()
+            # Store LLM info on feed run
+            feed_run.llm_provider = summarizer.get_provider_name()
+            feed_run.llm_model = getattr(summarizer, 'model', None)
+            session.commit()
+
+            # Track metrics
+            metrics = _RunMetrics()
+
+            # For all_sources mode, collect items from all sources first
+            if feed.digest_mode == 'all_sources':
+                all_items_result = self._collect_all_source_items(
+                    sources=sources,
+                    feed=feed,
+                    feed_run=feed_run,
+                    summarizer=summarizer,
+                    options=options,
+                    session=session,
+                )
+                metrics.sources_processed = all_items_result.get("sources_processed", 0)
+                metrics.sources_failed = all_items_result.get("sources_failed", 0)
+                metrics.sources_skipped = all_items_result.get("sources_skipped", 0)
+                metrics.sources_not_modified = all_items_result.get("sources_not_modified", 0)
+                metrics.items_processed = all_items_result.get("items_count", 0)
+                metrics.total_tokens_in = all_items_result.get("tokens_in", 0)
+                metrics.total_tokens_out = all_items_result.get("tokens_out", 0)
+                metrics.total_cost = all_items_result.get("cost", 0.0)
+                metrics.errors = all_items_result.get("errors", [])
+                metrics.structured_errors = all_items_result.get("structured_errors", [])
+            else:
+                # Process each source (individual or per_source mode)
+                # Concurrent mode needs an engine so each worker can open its own
+                # session; injected sessions (tests, callers) run sequentially.
+                max_workers = self._resolve_max_workers(options, session)
+                if max_workers > 1 and len(sources) > 1 and self._engine is not None:
+                    self._process_sources_concurrently(
+                        sources, feed, feed_run, options, metrics, max_workers, session,
+                    )
+                else:
+                    for idx, source in enumerate(sources, 1):
+                        self._process_source_guarded(
+                            source, feed, feed_run, summarizer, options, session,
+                            metrics, idx, len(sources),
+                        )
 
-        # Track metrics
-        metrics = _RunMetrics()
+                        # Delay between sources
+                        if idx < len(sources) and options.delay_between > 0:
+                            time.sleep(options.delay_between)
 
-        # For all_sources mode, collect items from all sources first
-        if feed.digest_mode == 'all_sources':
-            all_items_result = self._collect_all_source_items(
-                sources=sources,
+            return self._update_metrics(
+                feed_run, feed, metrics, len(sources), session, options,
+            )
+        except Exception:
+            # Usage already logged by a failed run still counts in analytics
+            self._refresh_usage_rollups(feed_run_id, session)
+            raise
+
+    def _refresh_usage_rollups(self, feed_run_id: int, session: Session) -> None:
+        """Fold a failed run's LLM usage into the rollups without masking its error."""
+        try:
+            session.rollback()
+            UsageRollupService(session).refresh_feed_run(feed_run_id)
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            logger.warning("Could not refresh usage rollups", feed_run_id=feed_run_id, error=str(e))
+
+    def _resolve_max_workers(self, options: FeedRunOptions, session: Session) -> int:
+        """Resolve per-feed source concurrency (options override > settings)."""
+        if options.max_workers is not None:
+            return max(1, options.max_workers)
+
+        from reconly_core.services.settings_service import SettingsService
+
+        try:
+            return max(1, int(SettingsService(session).get("fetch.concurrency.max_workers") or 1))
+        except Exception as e:
+            logger.warning("Could not read source concurrency setting, running sequentially", error=str(e))
+            return 1
+
+    def _process_source_guarded(
+        self,
+        source: Source,
+        feed: Feed,
+        feed_run: FeedRun,
+        summarizer: BaseProvider,
+        options: FeedRunOptions,
+        session: Session,
+        metrics: _RunMetrics,
+        idx: int,
+        sources_total: int,
+    ) -> None:
+        """Process one source with circuit breaker checks, recording into metrics."""
+        try:
+            if options.show_progress:
+                print(f"📌 [{idx}/{sources_total}] {source.name}")
+
+            # Check circuit breaker before processing
+            should_skip, skip_reason = self.circuit_breaker.should_skip(source)
+            if should_skip:
+                metrics.sources_skipped += 1
+                logger.info(
+                    "Source skipped due to circuit breaker",
+                    source_id=source.id,
+                    source_name=source.name,
+                    reason=skip_reason,
+                    health_status=source.health_status,
+                )
+                metrics.structured_errors.append({
+                    "source_id": source.id,
+                    "source_name": source.name,
+                    "error_type": ERROR_TYPE_CIRCUIT_OPEN,
+                    "message": skip_reason,
+                    "timestamp": datetime.utcnow().isoformat(),
+                })
+
+                if options.show_progress:
+                    print(f"   ⏸️ Skipped (circuit open): {source.health_status}")
+                return
+
+            result = self._process_source(
+                source=source,
                 feed=feed,
                 feed_run=feed_run,
                 summarizer=summarizer,
                 options=options,
                 session=session,
             )
-            metrics.sources_processed = all_items_result.get("sources_processed", 0)
-            metrics.sources_failed = all_items_result.get("sources_failed", 0)
-            metrics.sources_skipped = all_items_result.get("sources_skipped", 0)
-            metrics.items_processed = all_items_result.get("items_count", 0)
-            metrics.total_tokens_in = all_items_result.get("tokens_in", 0)
-            metrics.total_tokens_out = all_items_result.get("tokens_out", 0)
-            metrics.total_cost = all_items_result.get("cost", 0.0)
-            metrics.errors = all_items_result.get("errors", [])
-            metrics.structured_errors = all_items_result.get("structured_errors", [])
-        else:
-            # Process each source (individual or per_source mode)
-            for idx, source in enumerate(sources, 1):
-                try:
-                    if options.show_progress:
-                        print(f"📌 [{idx}/{len(sources)}] {source.name}")
 
-                    # Check circuit breaker before processing
-                    should_skip, skip_reason = self.circuit_breaker.should_skip(source)
-                    if should_skip:
-                        metrics.sources_skipped += 1
-                        logger.info(
-                            "Source skipped due to circuit breaker",
-                            source_id=source.id,
-                            source_name=source.name,
-                            reason=skip_reason,
-                            health_status=source.health_status,
-                        )
-                        metrics.structured_errors.append({
-                            "source_id": source.id,
-                            "source_name": source.name,
-                            "error_type": ERROR_TYPE_CIRCUIT_OPEN,
-                            "message": skip_reason,
-                            "timestamp": datetime.utcnow().isoformat(),
-                        })
+            if result["success"]:
+                metrics.sources_processed += 1
+                if result.get("not_modified"):
+                    metrics.sources_not_modified += 1
+                metrics.items_processed += result.get("items_count", 1)
+                metrics.total_tokens_in += result.get("tokens_in", 0)
+                metrics.total_tokens_out += result.get("tokens_out", 0)
+                metrics.total_cost += result.get("cost", 0.0)
 
-                        if options.show_progress:
-                            print(f"   ⏸️ Skipped (circuit open): {source.health_status}")
-                        continue
+                # Record success with circuit breaker
+                self.circuit_breaker.record_success(source, session)
 
-                    result = self._process_source(
-                        source=source,
-                        feed=feed,
-                        feed_run=feed_run,
-                        summarizer=summarizer,
-                        options=options,
-                        session=session,
-                    )
+                logger.info(
+                    "Source processed successfully",
+                    source_id=source.id,
+                    source_name=source.name,
+                    items_count=result.get("items_count", 1),
+                )
 
-                    if result["success"]:
-                        metrics.sources_processed += 1
-                        metrics.items_processed += result.get("items_count", 1)
-                        metrics.total_tokens_in += result.get("tokens_in", 0)
-                        metrics.total_tokens_out += result.get("tokens_out", 0)
-                        metrics.total_cost += result.get("cost", 0.0)
+                if options.show_progress:
+                    if result.get("not_modified"):
+                        print("   ⏭️ Not modified since last run")
+                    else:
+                        print(f"   ✅ {result.get('items_count', 1)} item(s) processed")
+            else:
+                metrics.sources_failed += 1
+                error_msg = result.get('error', 'Unknown error')
+                error_type = result.get('error_type', ERROR_TYPE_FETCH)
+                self._handle_source_error(
+                    source, error_msg, error_type,
+                    metrics.errors, metrics.structured_errors,
+                    session, options,
+                )
 
-                        # Record success with circuit breaker
-                        self.circuit_breaker.record_success(source, session)
+        except Exception as e:
+            metrics.sources_failed += 1
+            error_msg = str(e)
+            error_type = _detect_error_type(error_msg, ERROR_TYPE_FETCH)
+            self._handle_source_error(
+                source, error_msg, error_type,
+                metrics.errors, metrics.structured_errors,
+                session, options,
+                exception=e,
+            )
 
-                        logger.info(
-                            "Source processed successfully",
-                            source_id=source.id,
-                            source_name=source.name,
-                            items_count=result.get("items_count", 1),
-                        )
+    def _process_sources_concurrently(
+        self,
+        sources: List[Source],
+        feed: Feed,
+        feed_run: FeedRun,
+        options: FeedRunOptions,
+        metrics: _RunMetrics,
+        max_workers: int,
+        session: Session,
+    ) -> None:
+        """Process sources in parallel with bounded concurrency.
 
-                        if options.show_progress:
-                            print(f"   ✅ {result.get('items_count', 1)} item(s) processed")
-                    else:
-                        metrics.sources_failed += 1
-                        error_msg = result.get('error', 'Unknown error')
-                        error_type = result.get('error_type', ERROR_TYPE_FETCH)
-                        self._handle_source_error(
-                            source, error_msg, error_type,
-                            metrics.errors, metrics.structured_errors,
-                            session, options,
-                        )
+        Limits applied:
+        - ``max_workers`` sources in flight for this feed run
+        - ``fetch.concurrency.max_workers_global`` workers across all feed runs
+        - ``fetch.concurrency.max_per_host`` workers per source host, with
+          ``options.delay_between`` spacing applied per host instead of globally
 
-                    # Delay between sources
-                    if idx < len(sources) and options.delay_between > 0:
-                        time.sleep(options.delay_between)
+        Each worker uses its own session and summarizer. Workers commit their
+        digests and circuit breaker updates independently; per-worker metrics
+        are merged into ``metrics`` as workers complete.
+        """
+        from reconly_core.services.settings_service import SettingsService
+
+        settings = SettingsService(session)
+        pool = get_global_worker_pool(settings.get("fetch.concurrency.max_workers_global"))
+        throttle = HostThrottle(
+            max_per_host=settings.get("fetch.concurrency.max_per_host"),
+            delay_between=options.delay_between,
+        )
+        worker_count = min(max_workers, len(sources))
 
+        logger.info(
+            "Processing sources concurrently",
+            feed_id=feed.id,
+            feed_run_id=feed_run.id,
+            sources_count=len(sources),
+            max_workers=worker_count,
+            global_limit=pool.limit,
+            max_per_host=throttle.max_per_host,
+        )
+
+        trace_id = feed_run.trace_id
+        with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix=f"feed-{feed.id}") as executor:
+            futures = {
+                executor.submit(
+                    self._run_source_worker,
+                    source.id, feed.id, feed_run.id, trace_id, options,
+                    pool, throttle, idx, len(sources),
+                ): source
+                for idx, source in enumerate(sources, 1)
+            }
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    metrics.merge(future.result())
                 except Exception as e:
+                    # Worker infrastructure failure (session/summarizer setup)
                     metrics.sources_failed += 1
                     error_msg = str(e)
-                    error_type = _detect_error_type(error_msg, ERROR_TYPE_FETCH)
-                    self._handle_source_error(
-                        source, error_msg, error_type,
-                        metrics.errors, metrics.structured_errors,
-                        session, options,
-                        exception=e,
+                    metrics.errors.append(f"{source.name}: {error_msg}")
+                    metrics.structured_errors.append({
+                        "source_id": source.id,
+                        "source_name": source.name,
+                        "error_type": _detect_error_type(error_msg, ERROR_TYPE_FETCH),
+                        "message": error_msg,
+                        "timestamp": datetime.utcnow().isoformat(),
+                    })
+                    logger.exception(
+                        "Source worker failed",
+                        source_id=source.id,
+                        source_name=source.name,
+                        error=error_msg,
                     )
 
-        return self._update_metrics(
-            feed_run, feed, metrics, len(sources), session, options,
-        )
+        # Sources were updated in worker sessions; refresh health fields on ours
+        for source in sources:
+            session.expire(source)
+
+    def _run_source_worker(
+        self,
+        source_id: int,
+        feed_id: int,
+        feed_run_id: int,
+        trace_id: Optional[str],
+        options: FeedRunOptions,
+        pool: GlobalWorkerPool,
+        throttle: HostThrottle,
+        idx: int,
+        sources_total: int,
+    ) -> _RunMetrics:
+        """Process a single source on a worker thread with its own session."""
+        worker_metrics = _RunMetrics()
+        session = get_session_factory(self.database_url)()
+        try:
+            source = session.get(Source, source_id)
+            feed = session.get(Feed, feed_id)
+            feed_run = session.get(FeedRun, feed_run_id)
+
+            with throttle.acquire(source.url), pool.slot():
+                if trace_id:
+                    trace_id_var.set(trace_id)
+                summarizer = self._get_summarizer(feed, options, session=session)
+                self._process_source_guarded(
+                    source, feed, feed_run, summarizer, options, session,
+                    worker_metrics, idx, sources_total,
+                )
+                session.commit()
+            return worker_metrics
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            clear_trace_id()
+            session.close()
 
     def _handle_source_error(
         self,
@@ -693,13 +936,29 @@ class FeedService:
             sources_processed=metrics.sources_processed,
             sources_failed=metrics.sources_failed,
             sources_skipped=metrics.sources_skipped,
+            sources_not_modified=metrics.sources_not_modified,
             items_processed=metrics.items_processed,
             total_cost=metrics.total_cost,
             duration_seconds=feed_run.duration_seconds,
         )
 
+        # Evict expired and least recently used cached summaries
+        if not options.dry_run:
+            SummaryCache(session).prune()
+
+        stats = get_summary_cache_stats()
+        logger.debug(
+            "Summary cache stats",
+            hits=stats.hits,
+            misses=stats.misses,
+            hit_rate=round(stats.hit_rate, 3),
+        )
+
         clear_trace_id()
 
+        # Fold this run's LLM usage into the daily analytics rollups
+        UsageRollupService(session).refresh_feed_run(feed_run.id)
+
         feed.last_run_at = datetime.utcnow()
         session.commit()
 
@@ -748,6 +1007,8 @@ class FeedService:
             print(f"   Sources: {metrics.sources_processed}/{sources_total} successful")
             if metrics.sources_skipped > 0:
                 print(f"   Skipped: {metrics.sources_skipped} (circuit breaker)")
+            if metrics.sources_not_modified > 0:
+                print(f"   Not modified: {metrics.sources_not_modified}")
             if metrics.sources_failed > 0:
                 print(f"   Failed: {metrics.sources_failed}")
             if export_errors:
@@ -768,9 +1029,15 @@ class FeedService:
             total_cost=metrics.total_cost,
             duration_seconds=feed_run.duration_seconds,
             errors=metrics.errors,
+            sources_not_modified=metrics.sources_not_modified,
         )
 
-    def _get_summarizer(self, feed: Feed, options: FeedRunOptions) -> BaseProvider:
+    def _get_summarizer(
+        self,
+        feed: Feed,
+        options: FeedRunOptions,
+        session: Optional[Session] = None,
+    ) -> BaseProvider:
         """Get summarizer based on feed/template settings.
 
         Priority order:
@@ -795,7 +1062,7 @@ class FeedService:
             model=model,
             api_key=options.api_key,
             enable_fallback=options.enable_fallback,
-            db=self._get_session(),
+            db=session or self._get_session(),
         )
 
     def _get_language(self, feed: Feed, source: Source) -> str:
@@ -908,11 +1175,13 @@ class FeedService:
         if template:
             system_prompt, user_prompt = _build_prompts_from_template(template, content_data)
 
-        result = summarizer.summarize(
+        result = SummaryCache(session).summarize(
+            summarizer,
             content_data,
             language=language,
             system_prompt=system_prompt,
             user_prompt=user_prompt,
+            store=not options.dry_run,
         )
 
         # Save digest
@@ -1000,11 +1269,13 @@ class FeedService:
                 message="No prompt template found, using fallback",
             )
 
-        result = summarizer.summarize(
+        result = SummaryCache(session).summarize(
+            summarizer,
             content_data,
             language=language,
             system_prompt=system_prompt,
             user_prompt=user_prompt,
+            store=not options.dry_run,
         )
 
         # Log summarization result
@@ -1233,10 +1504,6 @@ class FeedService:
             if not emails:
                 return {"success": True, "items_count": 0}
 
-        items_count = 0
-        total_tokens_in = 0
-        total_tokens_out = 0
-        total_cost = 0.0
         latest_timestamp = last_read
         new_message_ids = []
 
@@ -1249,8 +1516,14 @@ class FeedService:
         if not template:
             template = get_default_prompt_template(session, language=language)
 
-        for email in emails:
-            try:
+        def track_published(email: Dict[str, Any]) -> None:
+            nonlocal latest_timestamp
+            latest_timestamp = _latest_published(latest_timestamp, email)
+
+        def new_emails():
+            # Resolve existing digests for the whole batch in one query
+            seen_urls = self._existing_digest_urls((e.get("url") for e in emails), session)
+            for email in emails:
                 # Track message ID for incremental fetching
                 message_id = email.get("message_id")
                 if message_id:
@@ -1258,55 +1531,35 @@ class FeedService:
 
                 # Skip if digest already exists for this message
                 email_url = email.get("url")
-                if email_url and self._digest_exists(email_url, session):
+                if email_url in seen_urls:
                     logger.debug(f"Digest already exists for email: {email_url}, skipping")
                     continue
+                if email_url:
+                    seen_urls.add(email_url)
+                yield email
 
-                # Build prompts from template
-                system_prompt, user_prompt = None, None
-                if template:
-                    system_prompt, user_prompt = _build_prompts_from_template(template, email)
-
-                result = summarizer.summarize(
-                    email,
-                    language=language,
-                    system_prompt=system_prompt,
-                    user_prompt=user_prompt,
-                )
-
-                # Save digest
-                if not options.dry_run:
-                    digest = self._save_digest(
-                        result, source, feed, feed_run, session
-                    )
-                    self._log_llm_usage(
-                        result, source, feed, feed_run, digest, session
-                    )
-
-                items_count += 1
-                total_tokens_in += result.get("model_info", {}).get("input_tokens", 0)
-                total_tokens_out += result.get("model_info", {}).get("output_tokens", 0)
-                total_cost += result.get("estimated_cost", 0.0)
-
-                # Track latest timestamp
-                if email.get("published"):
-                    try:
-                        email_dt = datetime.fromisoformat(email["published"])
-                        if latest_timestamp is None or email_dt > latest_timestamp:
-                            latest_timestamp = email_dt
-                    except Exception:
-                        pass
+        def log_email_error(email: Dict[str, Any], error: Exception) -> None:
+            logger.error(
+                "imap_email_process_error",
+                source_id=source.id,
+                connection_id=connection.id,
+                connection_name=connection.name,
+                email_subject=email.get("title", "unknown"),
+                error=str(error),
+                exc_info=error,
+            )
 
-            except Exception as e:
-                logger.error(
-                    "imap_email_process_error",
-                    source_id=source.id,
-                    connection_id=connection.id,
-                    connection_name=connection.name,
-                    email_subject=email.get("title", "unknown"),
-                    error=str(e),
-                    exc_info=True,
-                )
+        totals = self._summarize_items(
+            new_emails(), source, feed, feed_run, summarizer, language,
+            template, options, session,
+            item_label="email",
+            on_saved=track_published,
+            on_error=log_email_error,
+        )
+        items_count = totals["items_count"]
+        total_tokens_in = totals["tokens_in"]
+        total_tokens_out = totals["tokens_out"]
+        total_cost = totals["cost"]
 
         # Update processed message IDs in source config (keep last 1000)
         if new_message_ids and not options.dry_run:
@@ -1364,10 +1617,18 @@ class FeedService:
         source_config = source.config or {}
         max_items = source_config.get('max_items', 5)
 
-        # Fetch content (returns list for both videos and channels)
-        content_items = fetcher.fetch(source.url, since=last_read, max_items=max_items)
+        # Fetch content (returns list for both videos and channels).
+        # Channel feeds are requested conditionally with stored validators.
+        validators = self._load_validators(source.url) if is_channel else None
+        fetch_kwargs = {"validators": validators} if validators is not None else {}
+        content_items = fetcher.fetch(source.url, since=last_read, max_items=max_items, **fetch_kwargs)
+
+        if validators is not None and validators.not_modified:
+            return {"success": True, "items_count": 0, "not_modified": True}
 
         if not content_items:
+            if validators is not None:
+                self._store_validators(source.url, validators, options)
             return {"success": True, "items_count": 0}
 
         # Apply content filter if configured
@@ -1396,6 +1657,8 @@ class FeedService:
                     filtered_out=original_count - len(content_items),
                 )
             if not content_items:
+                if validators is not None:
+                    self._store_validators(source.url, validators, options)
                 return {"success": True, "items_count": 0}
 
         items_count = 0
@@ -1420,6 +1683,7 @@ class FeedService:
                 session=session,
             )
 
+            complete = bool(result.get("success"))
             if result.get("success"):
                 items_count = result.get("items_count", 0)
                 total_tokens_in = result.get("tokens_in", 0)
@@ -1446,62 +1710,44 @@ class FeedService:
             if not template:
                 template = get_default_prompt_template(session, language=language)
 
-            for content_data in content_items:
-                try:
+            def track_published(content_data: Dict[str, Any]) -> None:
+                nonlocal latest_timestamp
+                latest_timestamp = _latest_published(latest_timestamp, content_data)
+
+            def new_videos():
+                # Resolve existing digests for the whole batch in one query
+                seen_urls = self._existing_digest_urls(
+                    (item.get("url") for item in content_items), session
+                )
+                for content_data in content_items:
                     # Skip if digest already exists for this URL (fast pre-check)
                     video_url = content_data.get("url")
-                    if video_url and self._digest_exists(video_url, session):
+                    if video_url in seen_urls:
                         logger.info(f"Digest already exists for URL: {video_url}, skipping summarization")
                         # Still track timestamp for proper feed tracking
-                        if content_data.get("published"):
-                            try:
-                                item_dt = datetime.fromisoformat(content_data["published"])
-                                if latest_timestamp is None or item_dt > latest_timestamp:
-                                    latest_timestamp = item_dt
-                            except Exception:
-                                pass
+                        track_published(content_data)
                         continue
-
-                    # Build prompts from template
-                    system_prompt, user_prompt = None, None
-                    if template:
-                        system_prompt, user_prompt = _build_prompts_from_template(template, content_data)
-
-                    result = summarizer.summarize(
-                        content_data,
-                        language=language,
-                        system_prompt=system_prompt,
-                        user_prompt=user_prompt,
-                    )
-
-                    if not options.dry_run:
-                        digest = self._save_digest(
-                            result, source, feed, feed_run, session
-                        )
-                        self._log_llm_usage(
-                            result, source, feed, feed_run, digest, session
-                        )
-
-                    items_count += 1
-                    total_tokens_in += result.get("model_info", {}).get("input_tokens", 0)
-                    total_tokens_out += result.get("model_info", {}).get("output_tokens", 0)
-                    total_cost += result.get("estimated_cost", 0.0)
-
-                    # Track latest timestamp for channel sources
-                    if content_data.get("published"):
-                        try:
-                            item_dt = datetime.fromisoformat(content_data["published"])
-                            if latest_timestamp is None or item_dt > latest_timestamp:
-                                latest_timestamp = item_dt
-                        except Exception:
-                            pass
-
-                except Exception as e:
-                    logger.warning(f"Failed to process video: {e}")
+                    if video_url:
+                        seen_urls.add(video_url)
+                    yield content_data
+
+            totals = self._summarize_items(
+                new_videos(), source, feed, feed_run, summarizer, language,
+                template, options, session,
+                item_label="video",
+                on_saved=track_published,
+            )
+            items_count = totals["items_count"]
+            total_tokens_in = totals["tokens_in"]
+            total_tokens_out = totals["tokens_out"]
+            total_cost = totals["cost"]
+            complete = totals["failed"] == 0
 
         # Update tracking for channel sources
         if is_channel and latest_timestamp and not options.dry_run:
             self.tracker.update_last_read(source.url, latest_timestamp)
+        if validators is not None and complete:
+            self._store_validators(source.url, validators, options)
 
         return {
             "success": True,
@@ -1538,14 +1784,23 @@ class FeedService:
 
         if fetcher is None:
             fetcher = get_fetcher('rss')
+        validators = self._load_validators(source.url)
         articles = fetcher.fetch(
             source.url,
             since=last_read,
             max_items=max_items,
             fetch_full_content=fetch_full_content,
+            validators=validators,
+            enrichment_workers=settings.get("fetch.rss.enrichment_workers"),
+            enrichment_max_per_host=settings.get("fetch.rss.enrichment_max_per_host"),
+            enrichment_timeout=settings.get("fetch.rss.enrichment_timeout"),
         )
 
+        if validators.not_modified:
+            return {"success": True, "items_count": 0, "not_modified": True}
+
         if not articles:
+            self._store_validators(source.url, validators, options)
             return {"success": True, "items_count": 0}
 
         # Apply content filter if configured
@@ -1570,6 +1825,7 @@ class FeedService:
                 filtered_out=original_count - len(articles),
             )
             if not articles:
+                self._store_validators(source.url, validators, options)
                 return {"success": True, "items_count": 0}
 
         items_count = 0
@@ -1594,6 +1850,7 @@ class FeedService:
                 session=session,
             )
 
+            complete = bool(result.get("success"))
             if result.get("success"):
                 items_count = result.get("items_count", 0)
                 total_tokens_in = result.get("tokens_in", 0)
@@ -1620,63 +1877,48 @@ class FeedService:
             if not template:
                 template = get_default_prompt_template(session, language=language)
 
-            for article in articles:
-                try:
+            def track_published(article: Dict[str, Any]) -> None:
+                nonlocal latest_timestamp
+                latest_timestamp = _latest_published(latest_timestamp, article)
+
+            def new_articles():
+                # Resolve existing digests for the whole batch in one query
+                seen_urls = self._existing_digest_urls(
+                    (item.get("url") for item in articles), session
+                )
+                for article in articles:
                     # Skip if digest already exists for this URL (fast pre-check)
                     article_url = article.get("url")
-                    if article_url and self._digest_exists(article_url, session):
+                    if article_url in seen_urls:
                         logger.info(f"Digest already exists for URL: {article_url}, skipping summarization")
                         # Still track timestamp for proper feed tracking
-                        if article.get("published"):
-                            try:
-                                article_dt = datetime.fromisoformat(article["published"])
-                                if latest_timestamp is None or article_dt > latest_timestamp:
-                                    latest_timestamp = article_dt
-                            except Exception:
-                                pass
+                        track_published(article)
                         continue
-
-                    # Build prompts from template
-                    system_prompt, user_prompt = None, None
-                    if template:
-                        system_prompt, user_prompt = _build_prompts_from_template(template, article)
-
-                    result = summarizer.summarize(
-                        article,
-                        language=language,
-                        system_prompt=system_prompt,
-                        user_prompt=user_prompt,
-                    )
-
-                    if not options.dry_run:
-                        digest = self._save_digest(
-                            result, source, feed, feed_run, session
-                        )
-                        self._log_llm_usage(
-                            result, source, feed, feed_run, digest, session
-                        )
-
-                    items_count += 1
-                    total_tokens_in += result.get("model_info", {}).get("input_tokens", 0)
-                    total_tokens_out += result.get("model_info", {}).get("output_tokens", 0)
-                    total_cost += result.get("estimated_cost", 0.0)
-
-                    # Track latest timestamp
-                    if article.get("published"):
-                        try:
-                            article_dt = datetime.fromisoformat(article["published"])
-                            if latest_timestamp is None or article_dt > latest_timestamp:
-                                latest_timestamp = article_dt
-                        except Exception:
-                            pass
-
-                except Exception as e:
-                    logger.warning(f"Failed to process article: {e}")
+                    if article_url:
+                        seen_urls.add(article_url)
+                    yield article
+
+            totals = self._summarize_items(
+                new_articles(), source, feed, feed_run, summarizer, language,
+                template, options, session,
+                item_label="article",
+                on_saved=track_published,
+            )
+            items_count = totals["items_count"]
+            total_tokens_in = totals["tokens_in"]
+            total_tokens_out = totals["tokens_out"]
+            total_cost = totals["cost"]
+            complete = totals["failed"] == 0
 
         # Update tracking
         if latest_timestamp and not options.dry_run:
             self.tracker.update_last_read(source.url, latest_timestamp)
 
+        # Only remember validators once every fetched article was handled, so
+        # a 304 on the next run cannot hide articles that failed this time
+        if complete:
+            self._store_validators(source.url, validators, options)
+
         return {
             "success": True,
             "items_count": items_count,
@@ -1685,6 +1927,128 @@ class FeedService:
             "cost": total_cost,
         }
 
+    def _summarize_items(
+        self,
+        items: Iterable[Dict[str, Any]],
+        source: Source,
+        feed: Feed,
+        feed_run: FeedRun,
+        summarizer: BaseProvider,
+        language: str,
+        template: Optional[PromptTemplate],
+        options: FeedRunOptions,
+        session: Session,
+        item_label: str = "item",
+        on_saved: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_error: Optional[Callable[[Dict[str, Any], Exception], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Summarize items into one digest each through a SummarizePipeline.
+
+        Items are consumed lazily, so filtering/dedup generators drop items
+        before they reach the summarizer. Prompts are rendered and digests are
+        written on the calling thread; only summarizer calls run on pipeline
+        workers (``summarization.workers``). Digests are committed once per
+        ``summarization.write_batch_size`` results.
+
+        Args:
+            items: Item dicts still needing a digest
+            source: Source the items came from
+            feed: Feed being processed
+            feed_run: Current FeedRun
+            summarizer: Summarizer instance
+            language: Target language
+            template: Prompt template (None = summarizer defaults)
+            options: Run options
+            session: Database session
+            item_label: Item noun for failure logs (article, video, email)
+            on_saved: Called with each item after its digest was written
+            on_error: Called with (item, exception) when summarization fails
+
+        Returns:
+            Dict with items_count, tokens_in, tokens_out, cost, failed
+        """
+        from reconly_core.services.settings_service import SettingsService
+
+        settings = SettingsService(session)
+        cache = SummaryCache(session)
+        totals = {"items_count": 0, "tokens_in": 0, "tokens_out": 0, "cost": 0.0, "failed": 0}
+
+        def prepared():
+            for item in items:
+                system_prompt, user_prompt = None, None
+                if template:
+                    system_prompt, user_prompt = _build_prompts_from_template(template, item)
+                # Cache lookups use the session, so they stay on this thread
+                cache_key = cache.make_key(summarizer, item, language, system_prompt, user_prompt)
+                yield item, system_prompt, user_prompt, cache_key, cache.get(cache_key, item)
+
+        def summarize(prepared_item):
+            item, system_prompt, user_prompt, _, cached = prepared_item
+            if cached is not None:
+                return cached
+            return summarizer.summarize(
+                item,
+                language=language,
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+            )
+
+        def persist(batch):
+            for (item, _, _, cache_key, _), result in batch:
+                try:
+                    if not options.dry_run:
+                        # Savepoint per item: a failed write is rolled back
+                        # without losing the batch's other digests
+                        with session.begin_nested():
+                            cache.put(cache_key, result, item)
+                            digest = self._save_digest(
+                                result, source, feed, feed_run, session
+                            )
+                            self._log_llm_usage(
+                                result, source, feed, feed_run, digest, session
+                            )
+                except Exception as e:
+                    report_error((item,), e)
+                    continue
+
+                totals["items_count"] += 1
+                totals["tokens_in"] += result.get("model_info", {}).get("input_tokens", 0)
+                totals["tokens_out"] += result.get("model_info", {}).get("output_tokens", 0)
+                totals["cost"] += result.get("estimated_cost", 0.0)
+                if on_saved:
+                    on_saved(item)
+
+            if not options.dry_run:
+                session.commit()
+
+        def report_error(prepared_item, error):
+            item = prepared_item[0]
+            totals["failed"] += 1
+            if on_error:
+                on_error(item, error)
+            else:
+                logger.warning(f"Failed to process {item_label}: {error}")
+
+        pipeline = SummarizePipeline(
+            summarize=summarize,
+            persist=persist,
+            workers=settings.get("summarization.workers"),
+            batch_size=settings.get("summarization.write_batch_size"),
+            on_error=report_error,
+        )
+        stats = pipeline.run(prepared())
+
+        logger.debug(
+            "Summarize pipeline complete",
+            source_id=source.id,
+            submitted=stats.submitted,
+            summarized=stats.summarized,
+            failed=stats.failed,
+            batches_written=stats.batches_written,
+        )
+        return totals
+
     def _process_consolidated_batch(
         self,
         articles: List[Dict[str, Any]],
@@ -1856,31 +2220,42 @@ class FeedService:
             source_count = len(set(item.get('source_name') for item in (all_source_items or []) if item.get('source_name')))
             title = f"Briefing: {feed.name} ({len(articles)} items from {source_count} sources)"
 
-        # Use summarizer with custom prompt
-        try:
-            result = summarizer.summarize_with_prompt(
-                content=combined_content,
-                system_prompt=prompts['system'],
-                title=title,
-                url=synthetic_url,
-                language=language,
-            )
-        except AttributeError:
-            # Fallback if summarizer doesn't have summarize_with_prompt
-            # Create a content_data dict and use regular summarize
-            content_data = {
-                'title': title,
-                'content': combined_content,
-                'url': synthetic_url,
-                'source_type': 'consolidated',
-            }
-            result = summarizer.summarize(
-                content_data,
-                language=language,
-                system_prompt=prompts['system'],
-                user_prompt=prompts['user'],
-            )
-            result['url'] = synthetic_url
+        content_data = {
+            'title': title,
+            'content': combined_content,
+            'url': synthetic_url,
+            'source_type': 'consolidated',
+        }
+
+        # Reuse a cached briefing when the same articles were already consolidated
+        cache = SummaryCache(session)
+        cache_key = cache.make_key(
+            summarizer, content_data, language, prompts['system'], prompts['user']
+        )
+        result = cache.get(cache_key, content_data)
+
+        if result is None:
+            # Use summarizer with custom prompt
+            try:
+                result = summarizer.summarize_with_prompt(
+                    content=combined_content,
+                    system_prompt=prompts['system'],
+                    title=title,
+                    url=synthetic_url,
+                    language=language,
+                )
+            except AttributeError:
+                # Fallback if summarizer doesn't have summarize_with_prompt
+                result = summarizer.summarize(
+                    content_data,
+                    language=language,
+                    system_prompt=prompts['system'],
+                    user_prompt=prompts['user'],
+                )
+                result['url'] = synthetic_url
+
+            if not options.dry_run:
+                cache.put(cache_key, result, content_data)
 
         if not options.dry_run:
             # Save consolidated digest
@@ -2093,6 +2468,7 @@ class FeedService:
         sources_processed = 0
         sources_failed = 0
         sources_skipped = 0  # Skipped due to circuit breaker
+        sources_not_modified = 0  # Feed answered 304 Not Modified
         errors = []
         structured_errors = []
         language = self._get_language(feed, sources[0]) if sources else "de"
@@ -2138,18 +2514,27 @@ class FeedService:
                 # Each fetcher picks what it needs via **kwargs
                 last_read = self.tracker.get_last_read(source.url)
                 settings = SettingsService(session)
+                validators = (
+                    self._load_validators(source.url)
+                    if source.type in CONDITIONAL_FETCH_SOURCE_TYPES else None
+                )
 
                 fetch_kwargs = {
                     'since': last_read,
                     'max_items': source_config.get('max_items'),
                     # RSS-specific
                     'fetch_full_content': settings.get("fetch.rss.fetch_full_content"),
+                    'enrichment_workers': settings.get("fetch.rss.enrichment_workers"),
+                    'enrichment_max_per_host': settings.get("fetch.rss.enrichment_max_per_host"),
+                    'enrichment_timeout': settings.get("fetch.rss.enrichment_timeout"),
                     # Agent-specific
                     'db': session,
                     'source_id': source.id,
                     'config': source_config,
                     'trace_id': feed_run.trace_id if feed_run else None,
                 }
+                if validators is not None:
+                    fetch_kwargs['validators'] = validators
 
                 # Show appropriate progress message
                 if options.show_progress and source.type == "agent":
@@ -2157,6 +2542,17 @@ class FeedService:
 
                 articles = fetcher.fetch(source.url, **fetch_kwargs)
 
+                if validators is not None and validators.not_modified:
+                    sources_not_modified += 1
+                    self.circuit_breaker.record_success(source, session)
+                    sources_processed += 1
+                    if options.show_progress:
+                        print("      ⏭️ Not modified since last run")
+                    continue
+                if validators is not None:
+                    # Items are collected (and tracked) below before any summarization
+                    self._store_validators(source.url, validators, options)
+
                 # Apply content filter if configured (works for all source types)
                 if articles and (source.include_keywords or source.exclude_keywords):
                     content_filter = ContentFilter(
@@ -2244,6 +2640,7 @@ class FeedService:
                 "sources_processed": sources_processed,
                 "sources_failed": sources_failed,
                 "sources_skipped": sources_skipped,
+                "sources_not_modified": sources_not_modified,
                 "items_count": 0,
                 "tokens_in": 0,
                 "tokens_out": 0,
@@ -2328,6 +2725,7 @@ class FeedService:
             "sources_processed": sources_processed,
             "sources_failed": sources_failed,
             "sources_skipped": sources_skipped,
+            "sources_not_modified": sources_not_modified,
             "items_count": result.get("items_count", 0),
             "tokens_in": result.get("tokens_in", 0),
             "tokens_out": result.get("tokens_out", 0),
@@ -2342,6 +2740,47 @@ class FeedService:
             return False
         return session.query(Digest).filter(Digest.url == url).first() is not None
 
+    def _existing_digest_urls(self, urls: Iterable[Optional[str]], session: Session) -> Set[str]:
+        """
+        Resolve which of the given URLs already have a digest.
+
+        Replaces per-item _digest_exists() calls for fetched batches: all
+        candidate URLs are checked with one IN query per
+        DIGEST_URL_LOOKUP_CHUNK URLs.
+
+        Args:
+            urls: Candidate URLs (None/empty values are ignored)
+            session: Database session
+
+        Returns:
+            Set of URLs that already have a digest
+        """
+        candidates = list({url for url in urls if url})
+        existing: Set[str] = set()
+        for start in range(0, len(candidates), DIGEST_URL_LOOKUP_CHUNK):
+            chunk = candidates[start:start + DIGEST_URL_LOOKUP_CHUNK]
+            rows = session.query(Digest.url).filter(Digest.url.in_(chunk)).all()
+            existing.update(row.url for row in rows)
+        return existing
+
+    def _load_validators(self, url: Optional[str]) -> HTTPValidators:
+        """Load stored HTTP validators for a conditional feed request."""
+        if not url:
+            return HTTPValidators()
+        return HTTPValidators(**self.tracker.get_validators(url))
+
+    def _store_validators(
+        self,
+        url: Optional[str],
+        validators: HTTPValidators,
+        options: FeedRunOptions,
+    ) -> None:
+        """Persist HTTP validators from the latest feed response."""
+        if not url or options.dry_run or validators.not_modified:
+            return
+        if validators.etag or validators.last_modified:
+            self.tracker.update_validators(url, validators.etag, validators.last_modified)
+
     def _save_digest(
         self,
         result: Dict[str, Any],
@@ -2428,8 +2867,10 @@ class FeedService:
         digest: Digest,
         session: Session,
     ) -> None:
-        """Log LLM usage for billing."""
+        """Log LLM usage for billing (skipped for summary cache hits)."""
         model_info = result.get("model_info", {})
+        if model_info.get("cached"):
+            return
 
         usage_log = LLMUsageLog(
             user_id=feed.user_id,
@@ -2889,105 +3330,48 @@ class FeedService:
         session: Session,
         show_progress: bool = False,
     ) -> None:
-        """Process RAG embeddings and graph relationships for digests in a feed run.
+        """Queue RAG indexing for the digests of a feed run.
 
-        Runs after feed completion to:
-        1. Generate embeddings for new digests
-        2. Generate embeddings for source content (original fetched content)
-        3. Compute graph relationships
+        Digest IDs are added to the RAG indexing queue, where background
+        workers embed the digests and their source content and compute graph
+        relationships. When no workers run in this process (CLI, or
+        rag.index.workers = 0), the queued digests are indexed here instead.
 
         Args:
             feed_run: The completed feed run
             session: Database session
             show_progress: Whether to print progress
         """
-        import asyncio
-
         try:
-            from reconly_core.rag import EmbeddingService
-            from reconly_core.rag.embeddings import get_embedding_provider
-            from reconly_core.rag.graph_service import GraphService
+            from reconly_core.rag.index_queue import (
+                RAGIndexQueue,
+                index_workers_running,
+                notify_index_workers,
+                process_index_jobs,
+            )
 
-            digests = session.query(Digest).filter(
-                Digest.feed_run_id == feed_run.id
-            ).all()
+            digest_ids = [
+                row[0] for row in session.query(Digest.id).filter(
+                    Digest.feed_run_id == feed_run.id
+                ).all()
+            ]
 
-            if not digests:
+            if not digest_ids:
                 return
 
-            if show_progress:
-                print(f"\n📊 Processing RAG for {len(digests)} digest(s)...")
-
-            embedding_service = EmbeddingService(session)
-            loop = asyncio.new_event_loop()
-            try:
-                # 1. Generate embeddings for digests
-                for digest in digests:
-                    if digest.embedding_status != 'completed':
-                        loop.run_until_complete(
-                            embedding_service.embed_digest(digest, update_status=True)
-                        )
-                session.commit()
-
-                # 2. Generate embeddings for source content (if stored)
-                # Use or_() to handle NULL status since NULL != 'completed' is NULL in SQL
-                digest_ids = [d.id for d in digests]
-                source_contents = session.query(SourceContent).join(
-                    DigestSourceItem,
-                    SourceContent.digest_source_item_id == DigestSourceItem.id
-                ).filter(
-                    DigestSourceItem.digest_id.in_(digest_ids),
-                    or_(
-                        SourceContent.embedding_status.is_(None),
-                        SourceContent.embedding_status != 'completed'
-                    )
-                ).all()
-
-                if source_contents:
-                    if show_progress:
-                        print(f"   📄 Embedding {len(source_contents)} source content record(s)...")
+            RAGIndexQueue(session).enqueue(digest_ids)
+            session.commit()
 
-                    for source_content in source_contents:
-                        try:
-                            loop.run_until_complete(
-                                embedding_service.embed_source_content(
-                                    source_content, update_status=True
-                                )
-                            )
-                        except Exception as e:
-                            logger.error(
-                                f"Failed to embed source content {source_content.id}: {e}"
-                            )
-                    session.commit()
+            if index_workers_running():
+                notify_index_workers()
+                if show_progress:
+                    print(f"\n📊 Queued {len(digest_ids)} digest(s) for RAG indexing")
+                return
 
-                # 3. Compute graph relationships (if auto-compute enabled)
-                from reconly_core.services.settings_service import SettingsService
-                settings_service = SettingsService(session)
-
-                auto_compute = settings_service.get("rag.graph.auto_compute")
-                if auto_compute:
-                    provider = get_embedding_provider(db=session)
-                    default_chunk_source = settings_service.get("rag.source_content.default_chunk_source")
-                    semantic_threshold = settings_service.get("rag.graph.semantic_threshold")
-                    max_edges = settings_service.get("rag.graph.max_edges_per_digest")
-                    tag_threshold = settings_service.get("rag.graph.tag_threshold")
-
-                    graph_service = GraphService(
-                        session,
-                        provider,
-                        semantic_threshold=semantic_threshold,
-                        max_edges_per_digest=max_edges,
-                        default_chunk_source=default_chunk_source,
-                        tag_threshold=tag_threshold,
-                    )
+            if show_progress:
+                print(f"\n📊 Processing RAG for {len(digest_ids)} digest(s)...")
 
-                    for digest in digests:
-                        loop.run_until_complete(
-                            graph_service.compute_relationships(digest.id)
-                        )
-                    session.commit()
-            finally:
-                loop.close()
+            process_index_jobs(session, limit=len(digest_ids), digest_ids=digest_ids)
 
             if show_progress:
                 print("   ✅ RAG processing complete")
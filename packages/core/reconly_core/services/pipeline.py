@@ -0,0 +1,144 @@
+"""Staged summarize → persist pipeline for feed items.
+
+Items flow through three stages:
+
+1. Intake (calling thread): items are pulled lazily from an iterable, so
+   content filtering and duplicate checks in a generator drop items before
+   they reach the LLM. Intake pauses while ``max_pending`` items are in
+   flight (backpressure keeps memory flat on huge feeds).
+2. Summarize (worker threads): up to ``workers`` summarizer calls run
+   concurrently to keep the LLM provider busy.
+3. Persist (calling thread): completed results are handed to ``persist`` in
+   batches of ``batch_size`` so database writes are grouped into few
+   transactions and overlap with in-flight LLM calls.
+
+All database work stays on the calling thread, which owns the session.
+Worker threads only run the ``summarize`` callable. With ``workers <= 1``
+summarization runs inline on the calling thread.
+"""
+import contextvars
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from reconly_core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# (item, summarizer result) pairs handed to the persist stage
+PersistBatch = List[Tuple[Any, Dict[str, Any]]]
+
+
+@dataclass
+class PipelineStats:
+    """Counters for a pipeline run."""
+    submitted: int = 0
+    summarized: int = 0
+    failed: int = 0
+    batches_written: int = 0
+
+
+class SummarizePipeline:
+    """Bounded summarize → persist pipeline.
+
+    Example:
+        >>> pipeline = SummarizePipeline(
+        ...     summarize=lambda item: summarizer.summarize(item),
+        ...     persist=save_batch,
+        ...     workers=4,
+        ... )
+        >>> stats = pipeline.run(new_items())
+    """
+
+    def __init__(
+        self,
+        summarize: Callable[[Any], Dict[str, Any]],
+        persist: Callable[[PersistBatch], None],
+        workers: int = 1,
+        batch_size: int = 10,
+        max_pending: Optional[int] = None,
+        on_error: Optional[Callable[[Any, Exception], None]] = None,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            summarize: Called with an item, returns the summarizer result
+            persist: Called on the calling thread with batches of (item, result)
+            workers: Concurrent summarize calls (1 = inline)
+            batch_size: Results per persist call
+            max_pending: Items in flight before intake pauses (default: 2 x workers)
+            on_error: Called with (item, exception) when summarize fails
+        """
+        self.summarize = summarize
+        self.persist = persist
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.max_pending = max(self.workers, max_pending or self.workers * 2)
+        self.on_error = on_error
+
+    def run(self, items: Iterable[Any]) -> PipelineStats:
+        """Run all items through the pipeline and return counters."""
+        stats = PipelineStats()
+        batch: PersistBatch = []
+
+        def collect(item: Any, result: Optional[Dict[str, Any]], error: Optional[Exception]) -> None:
+            if error is not None:
+                stats.failed += 1
+                if self.on_error:
+                    self.on_error(item, error)
+                else:
+                    logger.warning("Pipeline item failed", error=str(error))
+                return
+            stats.summarized += 1
+            batch.append((item, result))
+            if len(batch) >= self.batch_size:
+                self._flush(batch, stats)
+
+        if self.workers == 1:
+            for item in items:
+                stats.submitted += 1
+                try:
+                    result = self.summarize(item)
+                except Exception as e:
+                    collect(item, None, e)
+                else:
+                    collect(item, result, None)
+            self._flush(batch, stats)
+            return stats
+
+        pending: Dict[Future, Any] = {}
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="summarize") as executor:
+            for item in items:
+                if len(pending) >= self.max_pending:
+                    self._drain(pending, collect, return_when=FIRST_COMPLETED)
+                stats.submitted += 1
+                # Propagate context (trace IDs) into the worker thread
+                ctx = contextvars.copy_context()
+                pending[executor.submit(ctx.run, self.summarize, item)] = item
+            self._drain(pending, collect)
+
+        self._flush(batch, stats)
+        return stats
+
+    def _drain(
+        self,
+        pending: Dict[Future, Any],
+        collect: Callable[[Any, Optional[Dict[str, Any]], Optional[Exception]], None],
+        return_when: str = ALL_COMPLETED,
+    ) -> None:
+        """Wait for in-flight items and hand completed ones to collect()."""
+        done: Set[Future]
+        done, _ = wait(list(pending), return_when=return_when)
+        for future in done:
+            item = pending.pop(future)
+            error = future.exception()
+            collect(item, None if error else future.result(), error)
+
+    def _flush(self, batch: PersistBatch, stats: PipelineStats) -> None:
+        """Persist and clear the current batch."""
+        if not batch:
+            return
+        self.persist(list(batch))
+        stats.batches_written += 1
+        batch.clear()
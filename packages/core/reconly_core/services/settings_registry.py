@@ -173,6 +173,22 @@ SETTINGS_REGISTRY: dict[str, SettingDef] = {
         env_var="EMBEDDING_CHUNK_OVERLAP",
         description="Token overlap between chunks (10-20% of chunk_size)",
     ),
+    "embedding.backfill_concurrency": SettingDef(
+        category="embedding",
+        type=int,
+        default=4,
+        editable=True,
+        env_var="EMBEDDING_BACKFILL_CONCURRENCY",
+        description="Embedding batch requests in flight during backfills",
+    ),
+    "embedding.backfill_commit_every": SettingDef(
+        category="embedding",
+        type=int,
+        default=100,
+        editable=True,
+        env_var="EMBEDDING_BACKFILL_COMMIT_EVERY",
+        description="Records embedded per database commit during backfills",
+    ),
 
     # ─────────────────────────────────────────────────────────────────────────
     # Agent Settings
@@ -330,6 +346,54 @@ SETTINGS_REGISTRY: dict[str, SettingDef] = {
         env_var="FETCH_RSS_FULL_CONTENT",
         description="Follow article links to scrape full content instead of using RSS summary. Adds latency but improves RAG quality.",
     ),
+    "fetch.rss.enrichment_workers": SettingDef(
+        category="fetch",
+        type=int,
+        default=8,
+        editable=True,
+        env_var="FETCH_RSS_ENRICHMENT_WORKERS",
+        description="Article pages downloaded in parallel per RSS source for full content and preview images",
+    ),
+    "fetch.rss.enrichment_max_per_host": SettingDef(
+        category="fetch",
+        type=int,
+        default=2,
+        editable=True,
+        env_var="FETCH_RSS_ENRICHMENT_MAX_PER_HOST",
+        description="Parallel article page downloads allowed against the same host",
+    ),
+    "fetch.rss.enrichment_timeout": SettingDef(
+        category="fetch",
+        type=int,
+        default=60,
+        editable=True,
+        env_var="FETCH_RSS_ENRICHMENT_TIMEOUT",
+        description="Seconds allowed for article page downloads per RSS source (0 = no limit); slower articles keep the RSS summary",
+    ),
+    "fetch.concurrency.max_workers": SettingDef(
+        category="fetch",
+        type=int,
+        default=1,
+        editable=True,
+        env_var="FETCH_MAX_WORKERS",
+        description="Sources processed in parallel per feed run (1 = sequential)",
+    ),
+    "fetch.concurrency.max_workers_global": SettingDef(
+        category="fetch",
+        type=int,
+        default=8,
+        editable=True,
+        env_var="FETCH_MAX_WORKERS_GLOBAL",
+        description="Maximum parallel source workers across all running feeds",
+    ),
+    "fetch.concurrency.max_per_host": SettingDef(
+        category="fetch",
+        type=int,
+        default=2,
+        editable=True,
+        env_var="FETCH_MAX_PER_HOST",
+        description="Maximum parallel source workers hitting the same host",
+    ),
 
     "rag.graph.semantic_threshold": SettingDef(
         category="rag",
@@ -363,6 +427,46 @@ SETTINGS_REGISTRY: dict[str, SettingDef] = {
         env_var="RAG_GRAPH_AUTO_COMPUTE",
         description="Automatically compute relationships when digests are created",
     ),
+    "rag.search.ef_search": SettingDef(
+        category="rag",
+        type=int,
+        default=100,
+        editable=True,
+        env_var="RAG_SEARCH_EF_SEARCH",
+        description="HNSW candidate list size for vector search (raised to the result limit, max 1000)",
+    ),
+    "rag.search.exact_scan_threshold": SettingDef(
+        category="rag",
+        type=int,
+        default=2000,
+        editable=True,
+        env_var="RAG_SEARCH_EXACT_SCAN_THRESHOLD",
+        description="Filtered vector searches over at most this many chunks use an exact scan instead of the HNSW index (0 = always use the index)",
+    ),
+    "rag.index.workers": SettingDef(
+        category="rag",
+        type=int,
+        default=1,
+        editable=False,
+        env_var="RAG_INDEX_WORKERS",
+        description="Background RAG indexing workers started with the API (0 = index at the end of each feed run)",
+    ),
+    "rag.index.batch_size": SettingDef(
+        category="rag",
+        type=int,
+        default=20,
+        editable=True,
+        env_var="RAG_INDEX_BATCH_SIZE",
+        description="Digests a RAG indexing worker claims at once",
+    ),
+    "rag.index.max_attempts": SettingDef(
+        category="rag",
+        type=int,
+        default=5,
+        editable=True,
+        env_var="RAG_INDEX_MAX_ATTEMPTS",
+        description="Attempts before a RAG indexing job is marked failed",
+    ),
 
     # ─────────────────────────────────────────────────────────────────────────
     # Summarization Settings
@@ -376,6 +480,46 @@ SETTINGS_REGISTRY: dict[str, SettingDef] = {
         env_var="SUMMARIZATION_MAX_CONTENT_CHARS",
         description="Default max content length (chars) for summarization. Provider settings override this. 0 = no limit.",
     ),
+    "summarization.workers": SettingDef(
+        category="provider",
+        type=int,
+        default=1,
+        editable=True,
+        env_var="SUMMARIZATION_WORKERS",
+        description="Concurrent summarization requests per source (1 = sequential)",
+    ),
+    "summarization.write_batch_size": SettingDef(
+        category="provider",
+        type=int,
+        default=10,
+        editable=True,
+        env_var="SUMMARIZATION_WRITE_BATCH_SIZE",
+        description="Digests written per database commit during feed runs",
+    ),
+    "summarization.cache.enabled": SettingDef(
+        category="provider",
+        type=bool,
+        default=True,
+        editable=True,
+        env_var="SUMMARIZATION_CACHE_ENABLED",
+        description="Reuse stored summaries for identical content, model and prompt",
+    ),
+    "summarization.cache.ttl_days": SettingDef(
+        category="provider",
+        type=int,
+        default=30,
+        editable=True,
+        env_var="SUMMARIZATION_CACHE_TTL_DAYS",
+        description="Days before a cached summary expires (0 = never)",
+    ),
+    "summarization.cache.max_entries": SettingDef(
+        category="provider",
+        type=int,
+        default=50000,
+        editable=True,
+        env_var="SUMMARIZATION_CACHE_MAX_ENTRIES",
+        description="Maximum cached summaries; least recently used are evicted first (0 = unlimited)",
+    ),
 }
 
 
@@ -0,0 +1,93 @@
+"""In-process TTL cache for dashboard and analytics aggregates.
+
+Every open browser tab polls the dashboard, so the same counts would be
+recomputed many times a second. Results are cached per key for a short
+TTL and dropped as soon as a session's transaction commits a write to a table the
+aggregates read (digests, feeds, sources, feed runs, usage logs and
+rollups), so the numbers never lag behind the app's own writes.
+
+The cache is per process; with several API workers the TTL bounds how
+stale another worker's view can be.
+
+Example:
+    >>> cache = get_stats_cache()
+    >>> stats = cache.get_or_compute(("dashboard_stats",), lambda: compute_stats(db))
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple, TypeVar
+
+from reconly_core.database.invalidation import invalidate_on_commit
+from reconly_core.database.models import (
+    Digest,
+    Feed,
+    FeedRun,
+    LLMUsageLog,
+    LLMUsageRollup,
+    Source,
+)
+
+T = TypeVar('T')
+
+# Seconds a cached aggregate is served before it is recomputed
+STATS_CACHE_TTL_SECONDS = 30
+
+# Committed writes to these tables invalidate the cache
+_TRACKED_TABLES = frozenset(
+    model.__tablename__ for model in (Digest, Feed, FeedRun, LLMUsageLog, LLMUsageRollup, Source)
+)
+
+
+class StatsCache:
+    """Thread-safe cache of computed aggregates with TTL-based expiration."""
+
+    def __init__(self, ttl_seconds: float = STATS_CACHE_TTL_SECONDS):
+        """
+        Initialize the stats cache.
+
+        Args:
+            ttl_seconds: Time-to-live in seconds (default: 30)
+        """
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Return the cached value for key, computing it on a miss.
+
+        Cached values are shared between callers and must not be mutated.
+
+        Args:
+            key: Cache key (e.g. endpoint name and parameters)
+            compute: Called to produce the value on a miss or after expiry
+
+        Returns:
+            The cached or freshly computed value
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+        value = compute()
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop all cached values."""
+        with self._lock:
+            self._entries.clear()
+
+
+_stats_cache = StatsCache()
+
+
+def get_stats_cache() -> StatsCache:
+    """Get the process-wide stats cache."""
+    return _stats_cache
+
+
+invalidate_on_commit(_TRACKED_TABLES, _stats_cache.invalidate)
@@ -0,0 +1,331 @@
+"""Persistent cache for LLM summaries.
+
+Summaries are content-addressed: the cache key is derived from the SHA-256
+of the content, the provider and model, the rendered system/user prompts and
+the target language. The same article reappearing under a different URL
+(syndication, tracking parameters, mirrored feeds) or a feed re-run with the
+same template therefore reuses the stored summary instead of calling the LLM.
+
+Only the LLM output (summary, extracted title) is stored. On a hit the result
+dict is rebuilt from the current item, so URL, feed and author metadata always
+describe the item being processed. Cached results report zero tokens and
+zero cost and are flagged with ``model_info["cached"] = True``.
+
+Eviction:
+- Entries older than ``summarization.cache.ttl_days`` are treated as misses.
+- ``prune()`` removes expired entries and keeps at most
+  ``summarization.cache.max_entries`` entries, dropping the least recently
+  used ones first.
+"""
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from hashlib import sha256
+from typing import Any, Dict, Optional
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from reconly_core.database.models import SummaryCacheEntry
+from reconly_core.logging import get_logger
+from reconly_core.providers.base import BaseProvider
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class SummaryCacheStats:
+    """Process-wide hit/miss counters for the summary cache."""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+_stats = SummaryCacheStats()
+_stats_lock = threading.Lock()
+
+
+def _count(field: str, amount: int = 1) -> None:
+    with _stats_lock:
+        setattr(_stats, field, getattr(_stats, field) + amount)
+
+
+def get_summary_cache_stats() -> SummaryCacheStats:
+    """Get a snapshot of the process-wide cache counters."""
+    with _stats_lock:
+        return SummaryCacheStats(**asdict(_stats))
+
+
+def reset_summary_cache_stats() -> None:
+    """Reset the process-wide cache counters."""
+    global _stats
+    with _stats_lock:
+        _stats = SummaryCacheStats()
+
+
+def _sha256(text: Optional[str]) -> str:
+    return sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def compute_cache_key(
+    content: str,
+    provider: str,
+    model: str,
+    language: str,
+    system_prompt: Optional[str] = None,
+    user_prompt: Optional[str] = None,
+) -> str:
+    """
+    Compute the content-addressed cache key for a summarization request.
+
+    Args:
+        content: Content being summarized
+        provider: Provider name
+        model: Model identifier
+        language: Target language
+        system_prompt: Rendered system prompt (None = provider default)
+        user_prompt: Rendered user prompt (None = provider default)
+
+    Returns:
+        64-character hex SHA-256 digest
+    """
+    parts = [
+        _sha256(content),
+        provider or "",
+        model or "",
+        language or "",
+        _sha256(system_prompt),
+        _sha256(user_prompt),
+    ]
+    return _sha256("\x1f".join(parts))
+
+
+class SummaryCache:
+    """Database-backed summary cache bound to a session.
+
+    All methods use the session passed at construction and must be called
+    from the thread that owns it.
+
+    Example:
+        >>> cache = SummaryCache(session)
+        >>> result = cache.summarize(summarizer, content_data, language="en")
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        enabled: Optional[bool] = None,
+        ttl_days: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            session: Database session
+            enabled: Override for summarization.cache.enabled
+            ttl_days: Override for summarization.cache.ttl_days (0 = no expiry)
+            max_entries: Override for summarization.cache.max_entries (0 = unlimited)
+        """
+        self.session = session
+        if enabled is None or ttl_days is None or max_entries is None:
+            from reconly_core.services.settings_service import SettingsService
+
+            settings = SettingsService(session)
+            if enabled is None:
+                enabled = settings.get("summarization.cache.enabled")
+            if ttl_days is None:
+                ttl_days = settings.get("summarization.cache.ttl_days")
+            if max_entries is None:
+                max_entries = settings.get("summarization.cache.max_entries")
+        self.enabled = bool(enabled)
+        self.ttl = timedelta(days=ttl_days) if ttl_days and ttl_days > 0 else None
+        self.max_entries = max(0, max_entries or 0)
+
+    def make_key(
+        self,
+        summarizer: BaseProvider,
+        content_data: Dict[str, Any],
+        language: str,
+        system_prompt: Optional[str] = None,
+        user_prompt: Optional[str] = None,
+    ) -> Optional[str]:
+        """Build the cache key for a request, or None when caching is disabled."""
+        if not self.enabled:
+            return None
+        model_info = summarizer.get_model_info()
+        return compute_cache_key(
+            content=content_data.get("content", ""),
+            provider=model_info.get("provider", ""),
+            model=model_info.get("model_key") or model_info.get("model", ""),
+            language=language,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+        )
+
+    def get(self, key: Optional[str], content_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached summary and rebuild the result for ``content_data``.
+
+        Args:
+            key: Cache key from make_key() (None = caching disabled)
+            content_data: Item being summarized
+
+        Returns:
+            Summarizer-style result dict on a hit, None on a miss
+        """
+        if key is None:
+            return None
+
+        entry = self.session.query(SummaryCacheEntry).filter(
+            SummaryCacheEntry.cache_key == key
+        ).first()
+        if entry is None or self._is_expired(entry):
+            _count("misses")
+            return None
+
+        entry.hit_count = (entry.hit_count or 0) + 1
+        entry.last_hit_at = datetime.utcnow()
+        _count("hits")
+
+        result = dict(content_data)
+        result["summary"] = entry.summary
+        result["summary_language"] = entry.language
+        if entry.title:
+            result["title"] = entry.title
+        result["model_info"] = {
+            "provider": entry.provider,
+            "model": entry.model,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cached": True,
+        }
+        result["estimated_cost"] = 0.0
+        return result
+
+    def put(
+        self,
+        key: Optional[str],
+        result: Dict[str, Any],
+        content_data: Dict[str, Any],
+    ) -> None:
+        """
+        Store a fresh summarizer result.
+
+        Results served by a fallback provider are not stored, because the key
+        names the primary provider's model. Concurrent writers racing on the
+        same key are resolved by keeping the first entry.
+
+        Args:
+            key: Cache key from make_key() (None = caching disabled)
+            result: Summarizer result
+            content_data: Item that was summarized
+        """
+        if key is None or not result.get("summary"):
+            return
+        model_info = result.get("model_info", {})
+        if model_info.get("cached") or result.get("fallback_used"):
+            return
+
+        title = result.get("title")
+        now = datetime.utcnow()
+        entry = SummaryCacheEntry(
+            cache_key=key,
+            content_hash=_sha256(content_data.get("content", "")),
+            provider=model_info.get("provider", "unknown"),
+            model=model_info.get("model_key") or model_info.get("model", "unknown"),
+            language=result.get("summary_language"),
+            summary=result["summary"],
+            # Only keep titles the LLM produced (e.g. translated titles)
+            title=title if title and title != content_data.get("title") else None,
+            hit_count=0,
+            created_at=now,
+            last_hit_at=now,
+        )
+        try:
+            with self.session.begin_nested():
+                self.session.add(entry)
+        except IntegrityError:
+            return
+        _count("stores")
+
+    def summarize(
+        self,
+        summarizer: BaseProvider,
+        content_data: Dict[str, Any],
+        language: str,
+        system_prompt: Optional[str] = None,
+        user_prompt: Optional[str] = None,
+        store: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Summarize through the cache.
+
+        Args:
+            summarizer: Summarizer used on a miss
+            content_data: Item to summarize
+            language: Target language
+            system_prompt: Rendered system prompt
+            user_prompt: Rendered user prompt
+            store: Store fresh results (False for dry runs)
+
+        Returns:
+            Summarizer result dict
+        """
+        key = self.make_key(summarizer, content_data, language, system_prompt, user_prompt)
+        cached = self.get(key, content_data)
+        if cached is not None:
+            return cached
+
+        result = summarizer.summarize(
+            content_data,
+            language=language,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+        )
+        if store:
+            self.put(key, result, content_data)
+        return result
+
+    def prune(self) -> int:
+        """
+        Remove expired entries and enforce the max entry count (LRU).
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.enabled:
+            return 0
+
+        removed = 0
+        if self.ttl is not None:
+            cutoff = datetime.utcnow() - self.ttl
+            removed += self.session.query(SummaryCacheEntry).filter(
+                SummaryCacheEntry.created_at < cutoff
+            ).delete(synchronize_session=False)
+
+        if self.max_entries:
+            keep_ids = self.session.query(SummaryCacheEntry.id).order_by(
+                SummaryCacheEntry.last_hit_at.desc(),
+                SummaryCacheEntry.id.desc(),
+            ).limit(self.max_entries).subquery()
+            removed += self.session.query(SummaryCacheEntry).filter(
+                SummaryCacheEntry.id.notin_(keep_ids.select())
+            ).delete(synchronize_session=False)
+
+        if removed:
+            _count("evictions", removed)
+            logger.debug("Summary cache pruned", removed=removed)
+        return removed
+
+    def _is_expired(self, entry: SummaryCacheEntry) -> bool:
+        return self.ttl is not None and entry.created_at < datetime.utcnow() - self.ttl
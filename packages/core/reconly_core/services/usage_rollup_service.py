@@ -0,0 +1,210 @@
+"""Daily LLM usage rollups for dashboard and analytics.
+
+llm_usage_logs grows by one row per LLM call, and the dashboard and
+analytics pages used to aggregate it on every page load. The rollup table
+(LLMUsageRollup) keeps one row per UTC day, feed, provider and model.
+
+Rows are recomputed rather than incremented: when a feed run finishes
+(including runs that fail part-way), refresh_feed_run() recomputes that
+feed's rows for the days the run logged usage on and upserts them on the
+(day, feed, provider, model) key. Re-running a refresh, or two runs of the
+same feed refreshing at once, therefore never double-counts. rebuild()
+recomputes every row from the usage log (``reconly --rebuild-usage-rollups``).
+
+Example:
+    >>> service = UsageRollupService(db)
+    >>> service.refresh_feed_run(feed_run.id)
+    >>> service.totals(since=date(2026, 2, 1))
+    {'requests': 42, 'tokens_in': 120000, 'tokens_out': 8000, 'cost': 0.31}
+"""
+from datetime import date
+from typing import Any, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from reconly_core.database.models import FeedRun, LLMUsageLog, LLMUsageRollup
+from reconly_core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class UsageRollupService:
+    """Service for maintaining and reading daily LLM usage rollups."""
+
+    def __init__(self, db: Session):
+        """Initialize the usage rollup service.
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    def refresh_feed_run(self, feed_run_id: int) -> int:
+        """Recompute the rollup rows touched by a feed run.
+
+        Recomputes the run's feed rows for every day the run logged usage on
+        (a run can cross midnight) and upserts them. Does not commit.
+
+        Args:
+            feed_run_id: ID of the finished feed run
+
+        Returns:
+            Number of rollup rows written
+        """
+        feed_id = self.db.query(FeedRun.feed_id).filter(FeedRun.id == feed_run_id).scalar()
+        if feed_id is None:
+            return 0
+
+        usage_day = func.date(LLMUsageLog.timestamp)
+        days = [
+            day for (day,) in
+            self.db.query(usage_day).filter(LLMUsageLog.feed_run_id == feed_run_id).distinct().all()
+        ]
+        if not days:
+            return 0
+
+        rows = self._upsert_from_logs(
+            FeedRun.feed_id == feed_id,
+            usage_day.in_(days),
+        )
+        logger.debug("Refreshed usage rollups", feed_run_id=feed_run_id, feed_id=feed_id, rows=rows)
+        return rows
+
+    def rebuild(self) -> int:
+        """Recompute all rollup rows from llm_usage_logs. Does not commit.
+
+        Returns:
+            Number of rollup rows written
+        """
+        self.db.query(LLMUsageRollup).delete(synchronize_session=False)
+        return self._upsert_from_logs()
+
+    def _upsert_from_logs(self, *criteria) -> int:
+        """Aggregate usage logs matching criteria and upsert them as rollup rows."""
+        usage_day = func.date(LLMUsageLog.timestamp)
+        aggregate = (
+            select(
+                usage_day,
+                FeedRun.feed_id,
+                LLMUsageLog.provider,
+                LLMUsageLog.model,
+                func.count(LLMUsageLog.id),
+                func.coalesce(func.sum(LLMUsageLog.tokens_in), 0),
+                func.coalesce(func.sum(LLMUsageLog.tokens_out), 0),
+                func.coalesce(func.sum(LLMUsageLog.cost), 0.0),
+            )
+            .select_from(LLMUsageLog)
+            .outerjoin(FeedRun, FeedRun.id == LLMUsageLog.feed_run_id)
+            .where(*criteria)
+            .group_by(usage_day, FeedRun.feed_id, LLMUsageLog.provider, LLMUsageLog.model)
+        )
+        statement = insert(LLMUsageRollup).from_select(
+            ['day', 'feed_id', 'provider', 'model', 'requests', 'tokens_in', 'tokens_out', 'cost'],
+            aggregate,
+        )
+        # Totals are absolute, so a conflicting row is overwritten, not added to
+        statement = statement.on_conflict_do_update(
+            index_elements=[
+                LLMUsageRollup.day,
+                func.coalesce(LLMUsageRollup.feed_id, 0),
+                LLMUsageRollup.provider,
+                LLMUsageRollup.model,
+            ],
+            set_={
+                'requests': statement.excluded.requests,
+                'tokens_in': statement.excluded.tokens_in,
+                'tokens_out': statement.excluded.tokens_out,
+                'cost': statement.excluded.cost,
+            },
+        )
+        result = self.db.execute(statement)
+        return result.rowcount or 0
+
+    def totals(self, since: Optional[date] = None) -> dict[str, Any]:
+        """Sum requests, tokens and cost from a day onwards.
+
+        Args:
+            since: First UTC day to include (None = all time)
+
+        Returns:
+            Dict with requests, tokens_in, tokens_out and cost
+        """
+        row = self.db.query(
+            func.coalesce(func.sum(LLMUsageRollup.requests), 0).label('requests'),
+            func.coalesce(func.sum(LLMUsageRollup.tokens_in), 0).label('tokens_in'),
+            func.coalesce(func.sum(LLMUsageRollup.tokens_out), 0).label('tokens_out'),
+            func.coalesce(func.sum(LLMUsageRollup.cost), 0.0).label('cost'),
+        ).filter(*self._since(since)).one()
+
+        return {
+            'requests': int(row.requests),
+            'tokens_in': int(row.tokens_in),
+            'tokens_out': int(row.tokens_out),
+            'cost': float(row.cost),
+        }
+
+    def tokens_by_model(self, since: Optional[date] = None) -> list[dict[str, Any]]:
+        """Sum tokens per provider and model from a day onwards.
+
+        Args:
+            since: First UTC day to include (None = all time)
+
+        Returns:
+            List of dicts with provider, model, tokens_in and tokens_out
+        """
+        rows = self.db.query(
+            LLMUsageRollup.provider,
+            LLMUsageRollup.model,
+            func.sum(LLMUsageRollup.tokens_in).label('tokens_in'),
+            func.sum(LLMUsageRollup.tokens_out).label('tokens_out'),
+        ).filter(
+            *self._since(since)
+        ).group_by(
+            LLMUsageRollup.provider, LLMUsageRollup.model
+        ).all()
+
+        return [
+            {
+                'provider': r.provider,
+                'model': r.model,
+                'tokens_in': int(r.tokens_in or 0),
+                'tokens_out': int(r.tokens_out or 0),
+            }
+            for r in rows
+        ]
+
+    def tokens_by_day(self, since: Optional[date] = None) -> list[dict[str, Any]]:
+        """Sum tokens per day from a day onwards, oldest first.
+
+        Args:
+            since: First UTC day to include (None = all time)
+
+        Returns:
+            List of dicts with day, tokens_in and tokens_out
+        """
+        rows = self.db.query(
+            LLMUsageRollup.day,
+            func.sum(LLMUsageRollup.tokens_in).label('tokens_in'),
+            func.sum(LLMUsageRollup.tokens_out).label('tokens_out'),
+        ).filter(
+            *self._since(since)
+        ).group_by(
+            LLMUsageRollup.day
+        ).order_by(
+            LLMUsageRollup.day
+        ).all()
+
+        return [
+            {
+                'day': r.day,
+                'tokens_in': int(r.tokens_in or 0),
+                'tokens_out': int(r.tokens_out or 0),
+            }
+            for r in rows
+        ]
+
+    @staticmethod
+    def _since(since: Optional[date]) -> list:
+        return [LLMUsageRollup.day >= since] if since is not None else []
@@ -1,9 +1,26 @@
-"""Feed tracking system to avoid processing duplicate articles."""
+"""Feed tracking system to avoid processing duplicate articles.
+
+Two backends share the same interface:
+
+- FeedTracker: JSON file (``data/processed_feeds.json``), used by the
+  single-shot CLI paths.
+- DBFeedTracker: one ``feed_tracking_state`` row per feed URL, used by
+  FeedService. Writes are per-URL upserts committed immediately, so
+  concurrent feed runs (scheduler jobs, API-triggered runs) never
+  overwrite each other's state. Also stores HTTP validators (ETag /
+  Last-Modified) for conditional requests.
+"""
 import json
+import threading
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Any, Optional, Dict
 from pathlib import Path
 
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from reconly_core.database.models import FeedTrackingState
+
 
 class FeedTracker:
     """Tracks processed feeds to avoid duplicate processing."""
@@ -22,6 +39,7 @@ class FeedTracker:
             tracking_file = project_root / 'data' / 'processed_feeds.json'
 
         self.tracking_file = Path(tracking_file)
+        self._lock = threading.Lock()  # Sources may be processed on worker threads
         self._ensure_data_dir()
         self.data = self._load_tracking_data()
 
@@ -83,13 +101,14 @@ class FeedTracker:
         if timestamp is None:
             timestamp = datetime.now()
 
-        if feed_url not in self.data:
-            self.data[feed_url] = {}
+        with self._lock:
+            if feed_url not in self.data:
+                self.data[feed_url] = {}
 
-        self.data[feed_url]['last_read'] = timestamp.isoformat()
-        self.data[feed_url]['updated_at'] = datetime.now().isoformat()
+            self.data[feed_url]['last_read'] = timestamp.isoformat()
+            self.data[feed_url]['updated_at'] = datetime.now().isoformat()
 
-        self._save_tracking_data()
+            self._save_tracking_data()
 
     def get_feed_info(self, feed_url: str) -> Dict:
         """
@@ -127,3 +146,170 @@ class FeedTracker:
         """Reset tracking for all feeds."""
         self.data = {}
         self._save_tracking_data()
+
+
+class DBFeedTracker:
+    """Database-backed feed tracker with per-URL atomic updates.
+
+    Each call opens a short-lived session from ``bind``, so one tracker can
+    be shared by worker threads. While a URL has no last-read time in the
+    database, the legacy JSON tracking file is consulted so upgrades keep
+    their incremental state.
+
+    Example:
+        >>> tracker = DBFeedTracker(engine)
+        >>> since = tracker.get_last_read(feed_url)
+        >>> tracker.update_last_read(feed_url, newest_published)
+    """
+
+    def __init__(self, bind, legacy_tracker: Optional[FeedTracker] = None):
+        """
+        Initialize the tracker.
+
+        Args:
+            bind: SQLAlchemy engine (or connection) to open sessions on
+            legacy_tracker: JSON tracker to fall back to for URLs without a
+                            last-read time (default: the default tracking file, if it exists)
+        """
+        self._session_factory = sessionmaker(bind=bind)
+        if legacy_tracker is None:
+            default_file = Path(__file__).parent.parent / 'data' / 'processed_feeds.json'
+            if default_file.exists():
+                legacy_tracker = FeedTracker(str(default_file))
+        self._legacy = legacy_tracker
+
+    def _get_state(self, feed_url: str) -> Optional[FeedTrackingState]:
+        with self._session_factory() as session:
+            state = session.query(FeedTrackingState).filter(
+                FeedTrackingState.feed_url == feed_url
+            ).first()
+            if state is not None:
+                session.expunge(state)
+            return state
+
+    def _upsert(self, feed_url: str, values: Dict[str, Any]) -> None:
+        """Update the row for a URL, inserting it if missing (race-safe)."""
+        values = {**values, 'updated_at': datetime.utcnow()}
+        with self._session_factory() as session:
+            query = session.query(FeedTrackingState).filter(
+                FeedTrackingState.feed_url == feed_url
+            )
+            if not query.update(values, synchronize_session=False):
+                try:
+                    with session.begin_nested():
+                        session.add(FeedTrackingState(feed_url=feed_url, **values))
+                except IntegrityError:
+                    # Another writer inserted the row first
+                    query.update(values, synchronize_session=False)
+            session.commit()
+
+    def get_last_read(self, feed_url: str) -> Optional[datetime]:
+        """
+        Get the last read timestamp for a feed.
+
+        Args:
+            feed_url: URL of the feed
+
+        Returns:
+            datetime of last read, or None if feed hasn't been read before
+        """
+        state = self._get_state(feed_url)
+        if state is not None and state.last_read is not None:
+            return state.last_read
+        # No row, or a row holding only validators (stored before the first
+        # successful read): fall back to the legacy tracking file
+        if self._legacy is not None:
+            return self._legacy.get_last_read(feed_url)
+        return None
+
+    def update_last_read(self, feed_url: str, timestamp: datetime = None):
+        """
+        Update the last read timestamp for a feed.
+
+        Args:
+            feed_url: URL of the feed
+            timestamp: Timestamp to set (default: now)
+        """
+        if timestamp is None:
+            timestamp = datetime.now()
+        self._upsert(feed_url, {'last_read': timestamp})
+
+    def get_validators(self, feed_url: str) -> Dict[str, Optional[str]]:
+        """
+        Get stored HTTP validators for a feed.
+
+        Args:
+            feed_url: URL of the feed
+
+        Returns:
+            Dictionary with 'etag' and 'last_modified' (values may be None)
+        """
+        state = self._get_state(feed_url)
+        if state is None:
+            return {'etag': None, 'last_modified': None}
+        return {'etag': state.etag, 'last_modified': state.last_modified}
+
+    def update_validators(
+        self,
+        feed_url: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """
+        Store HTTP validators from the latest response for a feed.
+
+        Args:
+            feed_url: URL of the feed
+            etag: ETag response header
+            last_modified: Last-Modified response header
+        """
+        self._upsert(feed_url, {'etag': etag, 'last_modified': last_modified})
+
+    def get_feed_info(self, feed_url: str) -> Dict:
+        """
+        Get all tracking information for a feed.
+
+        Args:
+            feed_url: URL of the feed
+
+        Returns:
+            Dictionary with tracking info (empty dict if not tracked)
+        """
+        state = self._get_state(feed_url)
+        return state.to_dict() if state is not None else {}
+
+    def get_all_feeds(self) -> Dict:
+        """
+        Get tracking data for all feeds.
+
+        Returns:
+            Dictionary mapping feed URLs to their tracking data
+        """
+        with self._session_factory() as session:
+            return {
+                state.feed_url: state.to_dict()
+                for state in session.query(FeedTrackingState).all()
+            }
+
+    def reset_feed(self, feed_url: str):
+        """
+        Reset tracking for a specific feed.
+
+        Args:
+            feed_url: URL of the feed to reset
+        """
+        with self._session_factory() as session:
+            session.query(FeedTrackingState).filter(
+                FeedTrackingState.feed_url == feed_url
+            ).delete(synchronize_session=False)
+            session.commit()
+        if self._legacy is not None:
+            self._legacy.reset_feed(feed_url)
+
+    def reset_all(self):
+        """Reset tracking for all feeds."""
+        with self._session_factory() as session:
+            session.query(FeedTrackingState).delete(synchronize_session=False)
+            session.commit()
+        if self._legacy is not None:
+            self._legacy.reset_all()
@@ -1,5 +1,11 @@
 """Utility modules for reconly-core."""
 
+from reconly_core.utils.http_client import (
+    HTTPClient,
+    HTTPClientConfig,
+    close_http_client,
+    get_http_client,
+)
 from reconly_core.utils.images import (
     extract_og_image,
     extract_content_image,
@@ -9,6 +15,10 @@ from reconly_core.utils.images import (
 )
 
 __all__ = [
+    "HTTPClient",
+    "HTTPClientConfig",
+    "close_http_client",
+    "get_http_client",
     "extract_og_image",
     "extract_content_image",
     "extract_preview_image",
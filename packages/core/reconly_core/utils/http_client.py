@@ -0,0 +1,683 @@
+"""Shared HTTP client for fetchers and content lookups.
+
+All outbound page, image and API lookups made while fetching content go
+through one process-wide client, so connections are reused across sources,
+articles and worker threads instead of opening a fresh TCP+TLS connection
+per request.
+
+Features:
+- Keep-alive connection pooling (HTTP/2 when the ``h2`` package is installed)
+- A cap on concurrent requests per host
+- An in-process DNS cache with a TTL (skipped when ``HTTP_PROXY``/``HTTPS_PROXY``
+  is set, so the environment's proxy and ``NO_PROXY`` settings still apply)
+- Uniform timeouts, and retries with backoff on transient failures
+  (timeouts, connection errors, 429 and 5xx responses) via
+  ``reconly_core.resilience.retry``
+
+Synchronous callers use ``get()``/``head()``/``request()``. Async callers use
+``aget()``/``arequest()``, which run on one ``httpx.AsyncClient`` driven by a
+long-lived event loop in a background thread, whatever loop the caller is on,
+so async connections are pooled across callers and closed by ``close()``.
+
+Libraries that require a ``requests.Session`` (e.g. youtube-transcript-api)
+get a pooled per-thread session from ``get_requests_session()``.
+
+Example:
+    >>> from reconly_core.utils.http_client import get_http_client
+    >>> response = get_http_client().get("https://example.com", timeout=10)
+    >>> response.status_code
+    200
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import ipaddress
+import os
+import socket
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import anyio
+import httpcore
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from reconly_core.logging import get_logger
+from reconly_core.resilience.config import RetryConfig
+from reconly_core.resilience.retry import with_retry
+
+logger = get_logger(__name__)
+
+# Browser-like User-Agent; many sites reject default library agents
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Responses retried like transient errors (the last response is returned)
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Only safe methods are retried
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+
+
+@dataclass
+class HTTPClientConfig:
+    """Configuration for the shared HTTP client.
+
+    Attributes:
+        timeout: Default request timeout in seconds (default: 15.0)
+        connect_timeout: Connect timeout in seconds (default: 5.0)
+        max_connections: Pooled connections across all hosts (default: 50)
+        max_keepalive: Idle connections kept open for reuse (default: 20)
+        keepalive_expiry: Seconds an idle connection is kept (default: 30.0)
+        max_per_host: Concurrent requests per host, 0 = unlimited (default: 6)
+        retry_attempts: Attempts per request including the first (default: 2)
+        dns_cache_ttl: Seconds to cache DNS lookups, 0 = disabled (default: 300.0)
+        http2: Negotiate HTTP/2 when the ``h2`` package is installed (default: True)
+    """
+    timeout: float = 15.0
+    connect_timeout: float = 5.0
+    max_connections: int = 50
+    max_keepalive: int = 20
+    keepalive_expiry: float = 30.0
+    max_per_host: int = 6
+    retry_attempts: int = 2
+    dns_cache_ttl: float = 300.0
+    http2: bool = True
+
+    @classmethod
+    def from_env(cls) -> "HTTPClientConfig":
+        """Create HTTPClientConfig from environment variables.
+
+        Environment variables:
+            HTTP_TIMEOUT: Default request timeout in seconds (default: 15)
+            HTTP_CONNECT_TIMEOUT: Connect timeout in seconds (default: 5)
+            HTTP_MAX_CONNECTIONS: Pooled connections across all hosts (default: 50)
+            HTTP_MAX_PER_HOST: Concurrent requests per host (default: 6)
+            HTTP_RETRY_ATTEMPTS: Attempts per request (default: 2)
+            HTTP_DNS_CACHE_TTL: DNS cache TTL in seconds (default: 300)
+            HTTP_HTTP2: Enable HTTP/2 when available (default: true)
+
+        Returns:
+            HTTPClientConfig instance with values from environment or defaults
+        """
+        return cls(
+            timeout=float(os.getenv("HTTP_TIMEOUT", "15")),
+            connect_timeout=float(os.getenv("HTTP_CONNECT_TIMEOUT", "5")),
+            max_connections=int(os.getenv("HTTP_MAX_CONNECTIONS", "50")),
+            max_per_host=int(os.getenv("HTTP_MAX_PER_HOST", "6")),
+            retry_attempts=int(os.getenv("HTTP_RETRY_ATTEMPTS", "2")),
+            dns_cache_ttl=float(os.getenv("HTTP_DNS_CACHE_TTL", "300")),
+            http2=os.getenv("HTTP_HTTP2", "true").lower() in ("true", "1", "yes"),
+        )
+
+
+def _is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return True
+
+
+def _get_host(url: Any) -> Optional[str]:
+    try:
+        host = httpx.URL(str(url)).host
+    except (httpx.InvalidURL, TypeError, ValueError):
+        return None
+    return host.lower() or None
+
+
+def _unique_addresses(infos: List[Tuple]) -> List[str]:
+    addresses: List[str] = []
+    for info in infos:
+        address = info[4][0]
+        if address not in addresses:
+            addresses.append(address)
+    return addresses
+
+
+class DNSCache:
+    """Thread-safe TTL cache for resolved host addresses."""
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, host: str, port: int) -> Optional[List[str]]:
+        """Return cached addresses for a host, or None when missing or expired."""
+        with self._lock:
+            entry = self._entries.get((host, port))
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def store(self, host: str, port: int, addresses: List[str]) -> List[str]:
+        """Cache the addresses for a host and return them."""
+        if self.ttl > 0 and addresses:
+            with self._lock:
+                self._entries[(host, port)] = (time.monotonic() + self.ttl, addresses)
+        return addresses
+
+    def resolve(self, host: str, port: int) -> List[str]:
+        """Resolve a host, using the cache when possible.
+
+        Raises:
+            OSError: If the host cannot be resolved
+        """
+        cached = self.lookup(host, port)
+        if cached is not None:
+            return cached
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        return self.store(host, port, _unique_addresses(infos))
+
+    async def aresolve(self, host: str, port: int) -> List[str]:
+        """Async variant of resolve()."""
+        cached = self.lookup(host, port)
+        if cached is not None:
+            return cached
+        infos = await anyio.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        return self.store(host, port, _unique_addresses(infos))
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class _CachingSyncBackend(httpcore.SyncBackend):
+    """httpcore network backend that resolves hosts through a DNSCache.
+
+    TLS still uses the original hostname for SNI and certificate checks,
+    since httpcore takes it from the request origin, not the socket address.
+    """
+
+    def __init__(self, dns_cache: DNSCache):
+        super().__init__()
+        self._dns_cache = dns_cache
+
+    def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        if _is_ip_address(host):
+            return super().connect_tcp(host, port, timeout, local_address, socket_options)
+        try:
+            addresses = self._dns_cache.resolve(host, port)
+        except OSError as e:
+            raise httpcore.ConnectError(str(e)) from e
+
+        error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return super().connect_tcp(address, port, timeout, local_address, socket_options)
+            except httpcore.ConnectError as e:
+                error = e
+        raise error
+
+
+class _CachingAsyncBackend(httpcore.AnyIOBackend):
+    """Async counterpart of _CachingSyncBackend."""
+
+    def __init__(self, dns_cache: DNSCache):
+        super().__init__()
+        self._dns_cache = dns_cache
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        if _is_ip_address(host):
+            return await super().connect_tcp(host, port, timeout, local_address, socket_options)
+        try:
+            addresses = await self._dns_cache.aresolve(host, port)
+        except OSError as e:
+            raise httpcore.ConnectError(str(e)) from e
+
+        error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return await super().connect_tcp(address, port, timeout, local_address, socket_options)
+            except httpcore.ConnectError as e:
+                error = e
+        raise error
+
+
+def _to_httpx_error(error: Exception) -> httpx.TransportError:
+    """Map an httpcore exception to the httpx exception of the same name."""
+    for cls in type(error).__mro__:
+        mapped = getattr(httpx, cls.__name__, None)
+        if isinstance(mapped, type) and issubclass(mapped, httpx.TransportError):
+            return mapped(str(error))
+    return httpx.TransportError(str(error))
+
+
+# Base classes of the httpcore exceptions raised to callers
+_HTTPCORE_ERRORS = (
+    httpcore.TimeoutException,
+    httpcore.NetworkError,
+    httpcore.ProtocolError,
+    httpcore.ProxyError,
+    httpcore.UnsupportedProtocol,
+)
+
+
+@contextmanager
+def _httpx_errors() -> Iterator[None]:
+    try:
+        yield
+    except _HTTPCORE_ERRORS as e:
+        raise _to_httpx_error(e) from e
+
+
+def _to_httpcore_request(request: httpx.Request) -> httpcore.Request:
+    return httpcore.Request(
+        method=request.method,
+        url=httpcore.URL(
+            scheme=request.url.raw_scheme,
+            host=request.url.raw_host,
+            port=request.url.port,
+            target=request.url.raw_path,
+        ),
+        headers=request.headers.raw,
+        content=request.stream,
+        extensions=request.extensions,
+    )
+
+
+class _ResponseStream(httpx.SyncByteStream):
+    def __init__(self, stream):
+        self._stream = stream
+
+    def __iter__(self) -> Iterator[bytes]:
+        with _httpx_errors():
+            for chunk in self._stream:
+                yield chunk
+
+    def close(self) -> None:
+        if hasattr(self._stream, 'close'):
+            self._stream.close()
+
+
+class _AsyncResponseStream(httpx.AsyncByteStream):
+    def __init__(self, stream):
+        self._stream = stream
+
+    async def __aiter__(self):
+        with _httpx_errors():
+            async for chunk in self._stream:
+                yield chunk
+
+    async def aclose(self) -> None:
+        if hasattr(self._stream, 'aclose'):
+            await self._stream.aclose()
+
+
+class _PoolTransport(httpx.BaseTransport):
+    """httpx transport over an httpcore pool that resolves hosts via a DNSCache.
+
+    httpx.HTTPTransport has no option for httpcore's network backend, so the
+    pool is built with httpcore's public ``network_backend`` argument and
+    requests are handed to it the way HTTPTransport does.
+    """
+
+    def __init__(self, pool: httpcore.ConnectionPool):
+        self._pool = pool
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with _httpx_errors():
+            response = self._pool.handle_request(_to_httpcore_request(request))
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream),
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        self._pool.close()
+
+
+class _AsyncPoolTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of _PoolTransport."""
+
+    def __init__(self, pool: httpcore.AsyncConnectionPool):
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        with _httpx_errors():
+            response = await self._pool.handle_async_request(_to_httpcore_request(request))
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_AsyncResponseStream(response.stream),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+class _AsyncState:
+    """Async client and per-host semaphores, used only on the client's I/O loop."""
+
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+        self.host_slots: Dict[str, asyncio.Semaphore] = {}
+
+
+class HTTPClient:
+    """Pooled HTTP client shared by fetchers and content lookups.
+
+    Thread-safe; a single instance is shared process-wide through
+    get_http_client().
+
+    Example:
+        >>> client = HTTPClient()
+        >>> response = client.get("https://example.com/feed", timeout=10)
+        >>> response = await client.aget("https://example.com/page")
+    """
+
+    def __init__(
+        self,
+        config: Optional[HTTPClientConfig] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        """
+        Initialize the client.
+
+        Connections are opened lazily on the first request.
+
+        Args:
+            config: Client configuration (default: from environment)
+            transport: Custom httpx transport used for both sync and async
+                requests instead of the pooled one (e.g. httpx.MockTransport)
+        """
+        self.config = config or HTTPClientConfig.from_env()
+        self.dns_cache = DNSCache(self.config.dns_cache_ttl)
+        self.http2 = self.config.http2 and importlib.util.find_spec("h2") is not None
+        self.retry_config = RetryConfig(
+            max_attempts=max(1, self.config.retry_attempts),
+            base_delay=0.5,
+            max_delay=5.0,
+            rate_limit_delay=5.0,
+        )
+        self._transport = transport
+        self._client: Optional[httpx.Client] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._async: Optional[_AsyncState] = None
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _client_options(self) -> Dict[str, Any]:
+        return {
+            "headers": {"User-Agent": DEFAULT_USER_AGENT},
+            "timeout": httpx.Timeout(self.config.timeout, connect=self.config.connect_timeout),
+            "follow_redirects": True,
+        }
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.config.max_connections,
+            max_keepalive_connections=self.config.max_keepalive,
+            keepalive_expiry=self.config.keepalive_expiry,
+        )
+
+    def _pool_options(self) -> Dict[str, Any]:
+        return {
+            "ssl_context": httpx.create_ssl_context(),
+            "max_connections": self.config.max_connections,
+            "max_keepalive_connections": self.config.max_keepalive,
+            "keepalive_expiry": self.config.keepalive_expiry,
+            "http2": self.http2,
+        }
+
+    def _uses_default_transport(self) -> bool:
+        # httpx only applies HTTP(S)_PROXY / ALL_PROXY / NO_PROXY when it builds
+        # its own transport, and a proxied request is resolved by the proxy, so
+        # the DNS-caching pool is skipped whenever the environment sets a proxy.
+        if self.config.dns_cache_ttl <= 0:
+            return True
+        proxies = urllib.request.getproxies()
+        return any(proxies.get(scheme) for scheme in ("http", "https", "all"))
+
+    def _transport_options(self, transport: Any) -> Dict[str, Any]:
+        if transport is None:
+            return {"http2": self.http2, "limits": self._limits()}
+        return {"transport": transport}
+
+    def _build_transport(self) -> Optional[httpx.BaseTransport]:
+        """The DNS-caching transport, or None to let httpx build its own."""
+        if self._uses_default_transport():
+            return None
+        return _PoolTransport(httpcore.ConnectionPool(
+            network_backend=_CachingSyncBackend(self.dns_cache),
+            **self._pool_options(),
+        ))
+
+    def _build_async_transport(self) -> Optional[httpx.AsyncBaseTransport]:
+        """The DNS-caching async transport, or None to let httpx build its own."""
+        if self._uses_default_transport():
+            return None
+        return _AsyncPoolTransport(httpcore.AsyncConnectionPool(
+            network_backend=_CachingAsyncBackend(self.dns_cache),
+            **self._pool_options(),
+        ))
+
+    @property
+    def client(self) -> httpx.Client:
+        """The underlying synchronous httpx client."""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        **self._transport_options(self._transport or self._build_transport()),
+                        **self._client_options(),
+                    )
+        return self._client
+
+    def _io_loop(self) -> asyncio.AbstractEventLoop:
+        """The background event loop that runs all async requests."""
+        if self._loop is None:
+            with self._lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    self._loop_thread = threading.Thread(
+                        target=loop.run_forever, name="http-client-io", daemon=True,
+                    )
+                    self._loop_thread.start()
+                    self._loop = loop
+        return self._loop
+
+    def _async_state(self) -> _AsyncState:
+        # Only called on the I/O loop, so no locking is needed
+        if self._async is None:
+            self._async = _AsyncState(httpx.AsyncClient(
+                **self._transport_options(self._transport or self._build_async_transport()),
+                **self._client_options(),
+            ))
+        return self._async
+
+    async def _aclose_async_client(self) -> None:
+        state, self._async = self._async, None
+        if state is not None:
+            await state.client.aclose()
+
+    @contextmanager
+    def _host_slot(self, host: Optional[str]) -> Iterator[None]:
+        if not host or self.config.max_per_host <= 0:
+            yield
+            return
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.config.max_per_host)
+        with slot:
+            yield
+
+    def request(self, method: str, url: str, *, retry: bool = True, **kwargs: Any) -> httpx.Response:
+        """
+        Send a request through the shared pool.
+
+        Transient failures are retried for idempotent methods. When every
+        attempt answers with a retryable status (429/5xx), the last response
+        is returned rather than raised, like any other HTTP status.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            retry: Retry transient failures (False for quick validation checks)
+            **kwargs: Passed to httpx (headers, params, timeout, ...)
+
+        Returns:
+            httpx.Response
+
+        Raises:
+            httpx.HTTPError: On timeouts and connection failures
+        """
+        retry = retry and method.upper() in IDEMPOTENT_METHODS
+        host = _get_host(url)
+
+        def http_request() -> httpx.Response:
+            with self._host_slot(host):
+                response = self.client.request(method, url, **kwargs)
+            if retry and response.status_code in RETRY_STATUS_CODES:
+                response.close()
+                raise httpx.HTTPStatusError(
+                    f"Retryable status {response.status_code}",
+                    request=response.request,
+                    response=response,
+                )
+            return response
+
+        if not retry:
+            return http_request()
+        try:
+            return with_retry(self.retry_config)(http_request)()
+        except httpx.HTTPStatusError as e:
+            return e.response
+
+    def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a GET request. See request()."""
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a HEAD request. See request()."""
+        return self.request("HEAD", url, **kwargs)
+
+    async def arequest(self, method: str, url: str, *, retry: bool = True, **kwargs: Any) -> httpx.Response:
+        """Async variant of request().
+
+        The request runs on the client's I/O loop; the caller's loop only
+        awaits the result, so it may be short-lived (e.g. ``asyncio.run``).
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self._arequest(method, url, retry=retry, **kwargs), self._io_loop(),
+        )
+        return await asyncio.wrap_future(future)
+
+    async def _arequest(self, method: str, url: str, *, retry: bool, **kwargs: Any) -> httpx.Response:
+        state = self._async_state()
+        retry = retry and method.upper() in IDEMPOTENT_METHODS
+        host = _get_host(url)
+
+        async def http_request() -> httpx.Response:
+            if host and self.config.max_per_host > 0:
+                slot = state.host_slots.setdefault(host, asyncio.Semaphore(self.config.max_per_host))
+            else:
+                slot = nullcontext()
+            async with slot:
+                response = await state.client.request(method, url, **kwargs)
+            if retry and response.status_code in RETRY_STATUS_CODES:
+                await response.aclose()
+                raise httpx.HTTPStatusError(
+                    f"Retryable status {response.status_code}",
+                    request=response.request,
+                    response=response,
+                )
+            return response
+
+        if not retry:
+            return await http_request()
+        try:
+            return await with_retry(self.retry_config)(http_request)()
+        except httpx.HTTPStatusError as e:
+            return e.response
+
+    async def aget(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send an async GET request. See request()."""
+        return await self.arequest("GET", url, **kwargs)
+
+    def close(self) -> None:
+        """Close pooled connections and stop the async I/O loop.
+
+        The client stays usable; connections and the loop are recreated on
+        the next request.
+        """
+        with self._lock:
+            client, self._client = self._client, None
+            loop, self._loop = self._loop, None
+            thread, self._loop_thread = self._loop_thread, None
+            self._host_slots.clear()
+        if client is not None:
+            client.close()
+        if loop is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._aclose_async_client(), loop).result(timeout=10)
+            finally:
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join(timeout=10)
+                if not thread.is_alive():
+                    loop.close()
+        self.dns_cache.clear()
+
+
+_http_client: Optional[HTTPClient] = None
+_http_client_lock = threading.Lock()
+_thread_local = threading.local()
+
+
+def get_http_client() -> HTTPClient:
+    """Get the process-wide shared HTTP client (created on first use)."""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = HTTPClient()
+                logger.debug(
+                    "http_client_created",
+                    http2=_http_client.http2,
+                    max_per_host=_http_client.config.max_per_host,
+                )
+    return _http_client
+
+
+def close_http_client() -> None:
+    """Close and discard the process-wide HTTP client."""
+    global _http_client
+    with _http_client_lock:
+        client, _http_client = _http_client, None
+    if client is not None:
+        client.close()
+
+
+def get_requests_session() -> requests.Session:
+    """Get a pooled ``requests.Session`` for the current thread.
+
+    For third-party libraries that only accept a requests session.
+    Sessions are kept per thread because such libraries may mutate
+    session state (headers, cookies).
+    """
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        config = get_http_client().config
+        adapter = HTTPAdapter(
+            pool_connections=config.max_keepalive,
+            pool_maxsize=max(1, config.max_per_host),
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"User-Agent": DEFAULT_USER_AGENT})
+        _thread_local.session = session
+    return session
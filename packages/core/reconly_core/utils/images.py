@@ -12,9 +12,10 @@ import re
 from typing import Optional
 from urllib.parse import urljoin, urlparse
 
-import requests
 from bs4 import BeautifulSoup
 
+from reconly_core.utils.http_client import DEFAULT_USER_AGENT, get_http_client
+
 logger = logging.getLogger(__name__)
 
 # URL patterns for badge/shield services that should be filtered out
@@ -40,7 +41,7 @@ BADGE_URL_PATTERNS = [
 
 # Default headers for fetching URLs
 DEFAULT_HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    'User-Agent': DEFAULT_USER_AGENT
 }
 
 
@@ -181,7 +182,7 @@ def fetch_og_image(url: str, timeout: int = 5) -> Optional[str]:
         if parsed.scheme not in ('http', 'https'):
             return None
 
-        response = requests.get(url, headers=DEFAULT_HEADERS, timeout=timeout)
+        response = get_http_client().get(url, headers=DEFAULT_HEADERS, timeout=timeout)
         if response.status_code != 200:
             return None
 
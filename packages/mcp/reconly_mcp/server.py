@@ -68,22 +68,21 @@ def create_database_session():
     Raises:
         DatabaseConnectionError: If connection fails
     """
-    from sqlalchemy import create_engine, text
-    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy import text
+    from reconly_core.database.engine import get_session_factory, get_shared_engine
 
     database_url = get_database_url()
     logger.info(f"Connecting to database: {database_url}")
 
     try:
-        engine = create_engine(
+        # Process-wide engine, shared with the services the tools call
+        get_shared_engine(
             database_url,
             pool_size=5,
             max_overflow=10,
             pool_pre_ping=True,
         )
-
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-        session = SessionLocal()
+        session = get_session_factory(database_url)()
 
         # Test connection (use text() for SQLAlchemy 2.0 compatibility)
         session.execute(text("SELECT 1"))
@@ -35,6 +35,10 @@ def client(test_connection, test_db):
     """
     from reconly_api import dependencies
     from reconly_api.main import app
+    from reconly_core.services.stats_cache import get_stats_cache
+
+    # Cached aggregates would outlive the previous test's rolled-back data
+    get_stats_cache().invalidate()
 
     # Store original values for cleanup
     original_engine = dependencies.engine
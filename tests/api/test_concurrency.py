@@ -0,0 +1,70 @@
+"""Tests for keeping blocking route work off the event loop."""
+import asyncio
+import inspect
+import threading
+
+import anyio
+from anyio.to_thread import current_default_thread_limiter
+from fastapi.routing import APIRoute
+
+from reconly_api.concurrency import configure_threadpool, run_async
+from reconly_api.main import app
+
+# Async on purpose: streams from the event loop
+ASYNC_ENDPOINTS = {"chat_stream"}
+
+
+def test_api_routes_run_in_threadpool():
+    """Route handlers are sync so FastAPI runs them in worker threads."""
+    async_endpoints = {
+        route.endpoint.__name__
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and route.path.startswith("/api/")
+        and inspect.iscoroutinefunction(route.endpoint)
+    }
+    assert async_endpoints <= ASYNC_ENDPOINTS
+
+
+def test_run_async_from_worker_thread():
+    """run_async drives a coroutine on the calling thread's own loop."""
+    async def answer():
+        await asyncio.sleep(0)
+        return threading.get_ident()
+
+    result = {}
+    worker = threading.Thread(target=lambda: result.update(thread=run_async(answer())))
+    worker.start()
+    worker.join()
+
+    assert result["thread"] == worker.ident
+
+
+def test_run_async_reuses_thread_loop():
+    """Calls from one worker thread share a loop; other threads get their own."""
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    loops = []
+
+    def work():
+        loops.append(run_async(current_loop()))
+        loops.append(run_async(current_loop()))
+
+    for _ in range(2):
+        worker = threading.Thread(target=work)
+        worker.start()
+        worker.join()
+
+    assert loops[0] is loops[1]
+    assert loops[2] is loops[3]
+    assert loops[0] is not loops[2]
+
+
+def test_configure_threadpool():
+    """configure_threadpool sizes the default worker thread limiter."""
+    async def configure():
+        configure_threadpool(7)
+        return current_default_thread_limiter().total_tokens
+
+    assert anyio.run(configure) == 7
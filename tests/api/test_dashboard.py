@@ -2,7 +2,8 @@
 from datetime import datetime, timedelta
 
 import pytest
-from reconly_core.database.models import Digest, Feed, FeedRun, Source
+from reconly_core.database.models import Digest, Feed, FeedRun, LLMUsageLog, Source
+from reconly_core.services.usage_rollup_service import UsageRollupService
 
 
 @pytest.fixture
@@ -93,6 +94,26 @@ class TestDashboardStats:
         assert data["feeds_count"] == 1
         assert data["digests_count"] == 1
 
+    def test_get_dashboard_stats_tokens_from_rollups(self, client, test_db, sample_feed_run):
+        """Token usage comes from the daily rollups refreshed after a run."""
+        test_db.add(LLMUsageLog(
+            feed_run_id=sample_feed_run.id,
+            provider="ollama",
+            model="llama3.2",
+            tokens_in=120,
+            tokens_out=30,
+        ))
+        test_db.flush()
+        UsageRollupService(test_db).refresh_feed_run(sample_feed_run.id)
+        test_db.commit()
+
+        response = client.get("/api/v1/dashboard/stats")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["tokens_today"] == 150
+        assert data["tokens_week"] == 150
+        assert data["success_rate"] == 100.0
+
 
 @pytest.mark.api
 class TestDashboardInsights:
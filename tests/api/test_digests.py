@@ -133,3 +133,147 @@ class TestDigestsResponseFormat:
         ]
         for field in expected_fields:
             assert field in data, f"Missing field: {field}"
+
+
+@pytest.mark.api
+class TestDigestsListProjection:
+    """Test the digest list projection, views and keyset pagination."""
+
+    @pytest.fixture
+    def many_digests(self, test_db):
+        """Create digests with distinct creation times."""
+        from datetime import datetime, timedelta
+
+        now = datetime.utcnow()
+        digests = []
+        for i in range(5):
+            digest = Digest(
+                url=f"https://example.com/page-{i}",
+                title=f"Page {i}",
+                content="x" * 2000,
+                summary=f"Summary {i}",
+                source_type="rss",
+                created_at=now - timedelta(minutes=i),
+            )
+            test_db.add(digest)
+            digests.append(digest)
+        test_db.commit()
+        return digests
+
+    def test_list_includes_tags_and_tokens(self, client, test_db, sample_digest):
+        """Test tags and token usage are aggregated into list rows."""
+        from reconly_core.database.models import DigestTag, LLMUsageLog, Tag
+
+        for name in ("beta", "alpha"):
+            tag = Tag(name=name)
+            test_db.add(tag)
+            test_db.flush()
+            test_db.add(DigestTag(digest_id=sample_digest.id, tag_id=tag.id))
+        for tokens_in, tokens_out in ((100, 20), (50, 5)):
+            test_db.add(LLMUsageLog(
+                digest_id=sample_digest.id, provider="ollama", model="test",
+                tokens_in=tokens_in, tokens_out=tokens_out,
+            ))
+        test_db.commit()
+
+        data = client.get("/api/v1/digests").json()
+
+        digest = data["digests"][0]
+        assert digest["tags"] == ["alpha", "beta"]
+        assert digest["tokens_in"] == 150
+        assert digest["tokens_out"] == 25
+
+    def test_list_tag_filter_counts_each_digest_once(self, client, test_db, sample_digest):
+        """Test a digest matching several filter tags is listed once."""
+        from reconly_core.database.models import DigestTag, Tag
+
+        for name in ("alpha", "beta"):
+            tag = Tag(name=name)
+            test_db.add(tag)
+            test_db.flush()
+            test_db.add(DigestTag(digest_id=sample_digest.id, tag_id=tag.id))
+        test_db.commit()
+
+        data = client.get("/api/v1/digests?tags=alpha,beta").json()
+
+        assert data["total"] == 1
+        assert len(data["digests"]) == 1
+
+    def test_summary_view_truncates_content(self, client, many_digests):
+        """Test the summary view returns a content preview."""
+        from reconly_core.services.digest_list_service import SUMMARY_CONTENT_CHARS
+
+        full = client.get("/api/v1/digests?limit=1").json()
+        summary = client.get("/api/v1/digests?limit=1&view=summary").json()
+
+        assert len(full["digests"][0]["content"]) == 2000
+        assert len(summary["digests"][0]["content"]) == SUMMARY_CONTENT_CHARS
+        assert summary["total"] == 5
+
+    def test_cursor_pagination(self, client, many_digests):
+        """Test keyset pages cover all digests in order without repeats."""
+        first = client.get("/api/v1/digests?limit=2").json()
+        assert first["total"] == 5
+        assert first["next_cursor"]
+
+        titles = [d["title"] for d in first["digests"]]
+        cursor = first["next_cursor"]
+        while cursor:
+            page = client.get(f"/api/v1/digests?limit=2&cursor={cursor}").json()
+            assert page["total"] is None
+            titles.extend(d["title"] for d in page["digests"])
+            cursor = page["next_cursor"]
+
+        assert titles == [f"Page {i}" for i in range(5)]
+
+    def test_offset_past_end_keeps_total(self, client, many_digests):
+        """Test an empty offset page still reports the total."""
+        data = client.get("/api/v1/digests?offset=10").json()
+        assert data["total"] == 5
+        assert data["digests"] == []
+
+    def test_invalid_cursor(self, client):
+        """Test a malformed cursor is rejected."""
+        response = client.get("/api/v1/digests?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+
+@pytest.mark.api
+class TestDigestsStreamingExport:
+    """Test streamed digest exports."""
+
+    def test_export_streams_all_digests(self, client, test_db):
+        """Test the export download contains every matching digest."""
+        import json
+
+        for i in range(3):
+            test_db.add(Digest(url=f"https://example.com/export-{i}", title=f"Export {i}"))
+        test_db.commit()
+
+        response = client.get("/api/v1/digests/export?format=ndjson")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert "digests.ndjson" in response.headers["content-disposition"]
+        titles = {json.loads(line)["title"] for line in response.text.splitlines()}
+        assert titles == {"Export 0", "Export 1", "Export 2"}
+
+    def test_stream_digests_outlives_request_session(self, test_db):
+        """Test streaming still works once the session that built the query is closed."""
+        from sqlalchemy.orm import Session
+
+        from reconly_api.routes.digests import _stream_digests
+
+        test_db.add(Digest(url="https://example.com/late", title="Late"))
+        test_db.commit()
+
+        request_session = Session(bind=test_db.get_bind())
+        digests = _stream_digests(request_session.query(Digest).filter(Digest.title == "Late"))
+        request_session.close()
+
+        assert [digest.title for digest in digests] == ["Late"]
+
+    def test_export_by_ids_not_found(self, client):
+        """Test exporting unknown IDs returns 404 before streaming."""
+        response = client.post("/api/v1/digests/export", json={"ids": [99999], "format": "json"})
+        assert response.status_code == 404
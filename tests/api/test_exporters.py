@@ -152,6 +152,7 @@ class TestExportersAPI:
 
         valid_content_types = [
             "application/json",
+            "application/x-ndjson",
             "text/csv",
             "text/markdown",
             "text/plain",
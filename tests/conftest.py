@@ -409,3 +409,27 @@ def sample_digests(db_session) -> list[Digest]:
     for digest in digests:
         db_session.refresh(digest)
     return digests
+
+
+@pytest.fixture
+def feed_requests(monkeypatch):
+    """Answer parse_feed() downloads with an empty 200 unless a test says otherwise.
+
+    Tests append the response for the next feed request; every request is
+    recorded as well.
+    """
+    import httpx
+
+    from reconly_core.utils.http_client import HTTPClient, HTTPClientConfig
+
+    responses = []
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return responses.pop(0) if responses else httpx.Response(200, content=b"")
+
+    client = HTTPClient(HTTPClientConfig(retry_attempts=1), transport=httpx.MockTransport(handler))
+    monkeypatch.setattr('reconly_core.fetchers.base.get_http_client', lambda: client)
+    yield responses, requests
+    client.close()
@@ -23,6 +23,7 @@ from reconly_core.agents.fetch import (
     DEFAULT_MAX_CONTENT_LENGTH,
     _extract_content,
 )
+from reconly_core.utils.http_client import HTTPClient, HTTPClientConfig
 
 
 # =============================================================================
@@ -205,11 +206,9 @@ class TestWebFetchSuccess:
         mock_response.content = simple_html
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
+        with patch("reconly_core.agents.fetch.get_http_client") as mock_client:
+            mock_instance = MagicMock()
+            mock_instance.aget = AsyncMock(return_value=mock_response)
             mock_client.return_value = mock_instance
 
             result = await web_fetch("https://example.com/page")
@@ -228,40 +227,25 @@ class TestWebFetchSuccess:
         mock_response.content = simple_html
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
+        with patch("reconly_core.agents.fetch.get_http_client") as mock_client:
+            mock_instance = MagicMock()
+            mock_instance.aget = AsyncMock(return_value=mock_response)
             mock_client.return_value = mock_instance
 
             await web_fetch("https://example.com/page")
 
-            call_args = mock_instance.get.call_args
+            call_args = mock_instance.aget.call_args
             headers = call_args.kwargs["headers"]
 
             assert "User-Agent" in headers
             assert "text/html" in headers["Accept"]
 
-    @pytest.mark.asyncio
-    async def test_fetch_follows_redirects(self, simple_html):
-        """Fetch is configured to follow redirects."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.content = simple_html
-        mock_response.raise_for_status = MagicMock()
+    def test_fetch_follows_redirects(self):
+        """The shared HTTP client used by fetch follows redirects."""
+        client = HTTPClient(HTTPClientConfig())
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
-            mock_client.return_value = mock_instance
-
-            await web_fetch("https://example.com/page")
-
-            call_args = mock_instance.get.call_args
-            assert call_args.kwargs["follow_redirects"] is True
+        assert client.client.follow_redirects is True
+        client.close()
 
     @pytest.mark.asyncio
     async def test_fetch_uses_custom_timeout(self, simple_html):
@@ -271,16 +255,14 @@ class TestWebFetchSuccess:
         mock_response.content = simple_html
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
+        with patch("reconly_core.agents.fetch.get_http_client") as mock_client:
+            mock_instance = MagicMock()
+            mock_instance.aget = AsyncMock(return_value=mock_response)
             mock_client.return_value = mock_instance
 
             await web_fetch("https://example.com/page", timeout=60.0)
 
-            call_args = mock_instance.get.call_args
+            call_args = mock_instance.aget.call_args
             assert call_args.kwargs["timeout"] == 60.0
 
 
@@ -300,11 +282,9 @@ class TestContentTruncation:
         mock_response.content = long_content_html
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
+        with patch("reconly_core.agents.fetch.get_http_client") as mock_client:
+            mock_instance = MagicMock()
+            mock_instance.aget = AsyncMock(return_value=mock_response)
             mock_client.return_value = mock_instance
 
             result = await web_fetch("https://example.com/long")
@@ -320,11 +300,9 @@ class TestContentTruncation:
         mock_response.content = long_content_html
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
+        with patch("reconly_core.agents.fetch.get_http_client") as mock_client:
+            mock_instance = MagicMock()
+            mock_instance.aget = AsyncMock(return_value=mock_response)
             mock_client.return_value = mock_instance
 
             result = await web_fetch(
@@ -343,11 +321,9 @@ class TestContentTruncation:
         mock_response.content = simple_html
         mock_response.raise_for_status = MagicMock()
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
+        with patch("reconly_core.agents.fetch.get_http_client") as mock_client:
+            mock_instance = MagicMock()
+            mock_instance.aget = AsyncMock(return_value=mock_response)
             mock_client.return_value = mock_instance
 
             result = await web_fetch("https://example.com/short")
@@ -369,11 +345,9 @@ class TestWebFetchHTTPErrors:
         mock_response = MagicMock()
         mock_response.status_code = 404
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
+        with patch("reconly_core.agents.fetch.get_http_client") as mock_client:
+            mock_instance = MagicMock()
+            mock_instance.aget = AsyncMock(return_value=mock_response)
             mock_client.return_value = mock_instance
 
             with pytest.raises(WebFetchHTTPError) as exc_info:
@@ -388,11 +362,9 @@ class TestWebFetchHTTPErrors:
         mock_response = MagicMock()
         mock_response.status_code = 403
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
+        with patch("reconly_core.agents.fetch.get_http_client") as mock_client:
+            mock_instance = MagicMock()
+            mock_instance.aget = AsyncMock(return_value=mock_response)
             mock_client.return_value = mock_instance
 
             with pytest.raises(WebFetchHTTPError) as exc_info:
@@ -407,11 +379,9 @@ class TestWebFetchHTTPErrors:
         mock_response = MagicMock()
         mock_response.status_code = 401
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
+        with patch("reconly_core.agents.fetch.get_http_client") as mock_client:
+            mock_instance = MagicMock()
+            mock_instance.aget = AsyncMock(return_value=mock_response)
             mock_client.return_value = mock_instance
 
             with pytest.raises(WebFetchHTTPError) as exc_info:
@@ -426,11 +396,9 @@ class TestWebFetchHTTPErrors:
         mock_response = MagicMock()
         mock_response.status_code = 429
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
+        with patch("reconly_core.agents.fetch.get_http_client") as mock_client:
+            mock_instance = MagicMock()
+            mock_instance.aget = AsyncMock(return_value=mock_response)
             mock_client.return_value = mock_instance
 
             with pytest.raises(WebFetchHTTPError) as exc_info:
@@ -445,11 +413,9 @@ class TestWebFetchHTTPErrors:
         mock_response = MagicMock()
         mock_response.status_code = 500
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
+        with patch("reconly_core.agents.fetch.get_http_client") as mock_client:
+            mock_instance = MagicMock()
+            mock_instance.aget = AsyncMock(return_value=mock_response)
             mock_client.return_value = mock_instance
 
             with pytest.raises(WebFetchHTTPError) as exc_info:
@@ -464,11 +430,9 @@ class TestWebFetchHTTPErrors:
         mock_response = MagicMock()
         mock_response.status_code = 503
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get.return_value = mock_response
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
+        with patch("reconly_core.agents.fetch.get_http_client") as mock_client:
+            mock_instance = MagicMock()
+            mock_instance.aget = AsyncMock(return_value=mock_response)
             mock_client.return_value = mock_instance
 
             with pytest.raises(WebFetchHTTPError) as exc_info:
@@ -488,11 +452,9 @@ class TestWebFetchTimeout:
     @pytest.mark.asyncio
     async def test_timeout_raises_timeout_error(self):
         """Request timeout raises WebFetchTimeoutError."""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get.side_effect = httpx.TimeoutException("Connection timed out")
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
+        with patch("reconly_core.agents.fetch.get_http_client") as mock_client:
+            mock_instance = MagicMock()
+            mock_instance.aget = AsyncMock(side_effect=httpx.TimeoutException("Connection timed out"))
             mock_client.return_value = mock_instance
 
             with pytest.raises(WebFetchTimeoutError) as exc_info:
@@ -503,11 +465,9 @@ class TestWebFetchTimeout:
     @pytest.mark.asyncio
     async def test_timeout_includes_duration(self):
         """Timeout error message includes timeout duration."""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get.side_effect = httpx.TimeoutException("Timeout")
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
+        with patch("reconly_core.agents.fetch.get_http_client") as mock_client:
+            mock_instance = MagicMock()
+            mock_instance.aget = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
             mock_client.return_value = mock_instance
 
             with pytest.raises(WebFetchTimeoutError) as exc_info:
@@ -527,11 +487,9 @@ class TestWebFetchConnectionErrors:
     @pytest.mark.asyncio
     async def test_connection_error_raises_fetch_error(self):
         """Connection error raises WebFetchError."""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get.side_effect = httpx.ConnectError("Connection refused")
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
+        with patch("reconly_core.agents.fetch.get_http_client") as mock_client:
+            mock_instance = MagicMock()
+            mock_instance.aget = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
             mock_client.return_value = mock_instance
 
             with pytest.raises(WebFetchError) as exc_info:
@@ -542,14 +500,12 @@ class TestWebFetchConnectionErrors:
     @pytest.mark.asyncio
     async def test_dns_error_raises_fetch_error(self):
         """DNS resolution error raises WebFetchError."""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_instance = AsyncMock()
-            mock_instance.get.side_effect = httpx.RequestError(
+        with patch("reconly_core.agents.fetch.get_http_client") as mock_client:
+            mock_instance = MagicMock()
+            mock_instance.aget = AsyncMock(side_effect=httpx.RequestError(
                 "DNS resolution failed",
                 request=MagicMock(),
-            )
-            mock_instance.__aenter__.return_value = mock_instance
-            mock_instance.__aexit__.return_value = None
+            ))
             mock_client.return_value = mock_instance
 
             with pytest.raises(WebFetchError):
@@ -191,6 +191,76 @@ class TestCSVExporter:
         assert exporter.get_file_extension() == 'csv'
 
 
+class TestNDJSONExporter:
+    """Tests for NDJSONExporter."""
+
+    def test_registered(self):
+        """Test that NDJSON exporter is registered."""
+        assert 'ndjson' in list_exporters()
+
+    def test_export_empty_list(self):
+        """Test exporting empty digest list."""
+        result = get_exporter('ndjson').export([])
+
+        assert result.content == ''
+        assert result.filename == 'digests.ndjson'
+        assert result.content_type == 'application/x-ndjson'
+
+    def test_export_one_object_per_line(self):
+        """Test each digest is a compact JSON object on its own line."""
+        digests = [create_mock_digest(id=i, title=f"Article {i}") for i in range(3)]
+        result = get_exporter('ndjson').export(digests, {'include_content': False})
+
+        lines = result.content.splitlines()
+        assert len(lines) == 3
+        assert [json.loads(line)['id'] for line in lines] == [0, 1, 2]
+        assert 'content' not in json.loads(lines[0])
+
+
+class TestExportStream:
+    """Tests for incremental export_stream() output."""
+
+    @pytest.mark.parametrize("format", ['json', 'csv', 'obsidian', 'markdown', 'ndjson'])
+    def test_stream_matches_export(self, format):
+        """Test streamed parts join to the export() content."""
+        exporter = get_exporter(format)
+        digests = [create_mock_digest(id=i, title=f"Article {i}") for i in range(3)]
+
+        parts = list(exporter.export_stream(iter(digests)))
+
+        assert len(parts) > 1
+        assert ''.join(parts) == exporter.export(digests).content
+
+    def test_json_stream_of_empty_iterable(self):
+        """Test streaming no digests yields an empty JSON array."""
+        assert ''.join(get_exporter('json').export_stream(iter([]))) == '[]'
+
+    def test_csv_stream_yields_one_part_per_row(self):
+        """Test CSV streams the header with the first row, then one row per part."""
+        digests = [create_mock_digest(id=i) for i in range(3)]
+        parts = list(get_exporter('csv').export_stream(digests))
+
+        assert len(parts) == 3
+        assert parts[0].startswith('id,')
+        assert all(part.count('\n') == 1 for part in parts[1:])
+
+    def test_export_to_path_writes_more_than_one_batch(self):
+        """Test one-file-per-digest exports write every batch of files."""
+        from reconly_core.exporters.base import EXPORT_WRITE_BATCH_SIZE
+
+        count = EXPORT_WRITE_BATCH_SIZE + 5
+        digests = (create_mock_digest(id=i, title=f"Article {i}") for i in range(count))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = get_exporter('json').export_to_path(
+                digests, tmpdir, {"one_file_per_digest": True}
+            )
+
+            assert result.success is True
+            assert result.files_written == count
+            assert len(list(Path(tmpdir).glob("*.json"))) == count
+
+
 class TestMarkdownExporter:
     """Tests for MarkdownExporter (Obsidian format)."""
 
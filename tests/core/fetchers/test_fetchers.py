@@ -1,6 +1,32 @@
 """Tests for fetcher factory and built-in fetchers."""
+import httpx
 import pytest
 from reconly_core.fetchers import get_fetcher, list_fetchers, is_fetcher_registered
+from reconly_core.fetchers.base import HTTPValidators, parse_feed
+from reconly_core.utils.http_client import HTTPClient, HTTPClientConfig
+
+RSS_BODY = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Example</title>
+<item><title>First</title><link>/posts/1</link></item>
+</channel></rss>"""
+
+
+@pytest.fixture
+def feed_server(monkeypatch):
+    """Route parse_feed() downloads to a handler set by the test."""
+    state = {}
+
+    def handler(request):
+        state['request'] = request
+        route = state['route']
+        if isinstance(route, Exception):
+            raise route
+        return route
+
+    client = HTTPClient(HTTPClientConfig(retry_attempts=1), transport=httpx.MockTransport(handler))
+    monkeypatch.setattr('reconly_core.fetchers.base.get_http_client', lambda: client)
+    yield state
+    client.close()
 
 
 class TestBuiltInFetchersRegistered:
@@ -178,3 +204,46 @@ class TestListFetchers:
         """Test that there are at least 3 built-in fetchers."""
         fetchers = list_fetchers()
         assert len(fetchers) >= 3
+
+
+class TestParseFeed:
+    """Test feed downloads through the shared HTTP client."""
+
+    def test_parses_body_and_resolves_relative_links(self, feed_server):
+        feed_server['route'] = httpx.Response(200, content=RSS_BODY)
+
+        feed = parse_feed("https://example.com/feed.xml")
+
+        assert feed.feed.title == "Example"
+        assert feed.entries[0].link == "https://example.com/posts/1"
+
+    def test_sends_and_refreshes_validators(self, feed_server):
+        feed_server['route'] = httpx.Response(
+            200, content=RSS_BODY, headers={'ETag': '"v2"', 'Last-Modified': 'Wed, 31 Dec 2025 10:00:00 GMT'},
+        )
+        validators = HTTPValidators(etag='"v1"')
+
+        feed = parse_feed("https://example.com/feed.xml", validators)
+
+        assert feed_server['request'].headers['If-None-Match'] == '"v1"'
+        assert len(feed.entries) == 1
+        assert validators == HTTPValidators(etag='"v2"', last_modified='Wed, 31 Dec 2025 10:00:00 GMT')
+
+    def test_not_modified(self, feed_server):
+        feed_server['route'] = httpx.Response(304)
+        validators = HTTPValidators(etag='"v1"')
+
+        feed = parse_feed("https://example.com/feed.xml", validators)
+
+        assert feed.entries == []
+        assert validators.not_modified is True
+        assert validators.etag == '"v1"'
+
+    def test_network_error_reported_as_bozo(self, feed_server):
+        feed_server['route'] = httpx.ConnectError("connection refused")
+
+        feed = parse_feed("https://example.com/feed.xml")
+
+        assert feed.bozo
+        assert isinstance(feed.bozo_exception, httpx.ConnectError)
+        assert feed.entries == []
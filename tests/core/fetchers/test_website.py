@@ -1,8 +1,32 @@
 """Tests for website content fetching."""
+import httpx
 import pytest
-import responses
-import requests
+
 from reconly_core.fetchers.website import WebsiteFetcher
+from reconly_core.utils.http_client import HTTPClient, HTTPClientConfig
+
+
+@pytest.fixture
+def routes(monkeypatch):
+    """Route WebsiteFetcher requests to canned responses keyed by URL.
+
+    Values are an httpx.Response, an exception to raise, or a callable
+    taking the request and returning a response.
+    """
+    table = {}
+
+    def handler(request):
+        route = table[str(request.url)]
+        if isinstance(route, Exception):
+            raise route
+        if callable(route):
+            return route(request)
+        return route
+
+    client = HTTPClient(HTTPClientConfig(retry_attempts=1), transport=httpx.MockTransport(handler))
+    monkeypatch.setattr('reconly_core.fetchers.website.get_http_client', lambda: client)
+    yield table
+    client.close()
 
 
 class TestWebsiteFetcher:
@@ -13,8 +37,7 @@ class TestWebsiteFetcher:
         """Create WebsiteFetcher instance for testing."""
         return WebsiteFetcher(timeout=5)
 
-    @responses.activate
-    def test_fetch_success_with_main_tag(self, website_fetcher):
+    def test_fetch_success_with_main_tag(self, website_fetcher, routes):
         """WHEN valid HTML with <main> tag is fetched
         THEN content is extracted from main element."""
         html = """
@@ -31,12 +54,7 @@ class TestWebsiteFetcher:
         </html>
         """
 
-        responses.add(
-            responses.GET,
-            'https://example.com/article',
-            body=html,
-            status=200
-        )
+        routes['https://example.com/article'] = httpx.Response(200, text=html)
 
         result = website_fetcher.fetch('https://example.com/article')
         # fetch() now returns a list with a single item
@@ -50,8 +68,7 @@ class TestWebsiteFetcher:
         assert 'Footer content' not in item['content']
         assert item['source_type'] == 'website'
 
-    @responses.activate
-    def test_fetch_success_with_article_tag(self, website_fetcher):
+    def test_fetch_success_with_article_tag(self, website_fetcher, routes):
         """WHEN HTML uses <article> tag and no <main>
         THEN content is extracted from article element."""
         html = """
@@ -66,12 +83,7 @@ class TestWebsiteFetcher:
         </html>
         """
 
-        responses.add(
-            responses.GET,
-            'https://example.com/blog',
-            body=html,
-            status=200
-        )
+        routes['https://example.com/blog'] = httpx.Response(200, text=html)
 
         result = website_fetcher.fetch('https://example.com/blog')
         item = result[0]
@@ -80,8 +92,7 @@ class TestWebsiteFetcher:
         assert 'Article Title' in item['content']
         assert 'Article body text.' in item['content']
 
-    @responses.activate
-    def test_fetch_removes_scripts_and_styles(self, website_fetcher):
+    def test_fetch_removes_scripts_and_styles(self, website_fetcher, routes):
         """WHEN HTML contains <script> and <style> tags
         THEN they are removed from content."""
         html = """
@@ -99,12 +110,7 @@ class TestWebsiteFetcher:
         </html>
         """
 
-        responses.add(
-            responses.GET,
-            'https://example.com/page',
-            body=html,
-            status=200
-        )
+        routes['https://example.com/page'] = httpx.Response(200, text=html)
 
         result = website_fetcher.fetch('https://example.com/page')
         item = result[0]
@@ -113,53 +119,37 @@ class TestWebsiteFetcher:
         assert 'console.log' not in item['content']
         assert 'color: red' not in item['content']
 
-    @responses.activate
-    def test_fetch_404_error(self, website_fetcher):
+    def test_fetch_404_error(self, website_fetcher, routes):
         """WHEN URL returns 404 status
         THEN exception is raised."""
-        responses.add(
-            responses.GET,
-            'https://example.com/notfound',
-            status=404
-        )
+        routes['https://example.com/notfound'] = httpx.Response(404)
 
         with pytest.raises(Exception) as exc_info:
             website_fetcher.fetch('https://example.com/notfound')
 
         assert "Failed to fetch website" in str(exc_info.value)
 
-    @responses.activate
-    def test_fetch_timeout(self, website_fetcher):
+    def test_fetch_timeout(self, website_fetcher, routes):
         """WHEN request times out
         THEN exception is raised."""
-        responses.add(
-            responses.GET,
-            'https://example.com/slow',
-            body=requests.exceptions.Timeout("Timeout")
-        )
+        routes['https://example.com/slow'] = httpx.ReadTimeout("Timeout")
 
         with pytest.raises(Exception) as exc_info:
             website_fetcher.fetch('https://example.com/slow')
 
         assert "Failed to fetch website" in str(exc_info.value)
 
-    @responses.activate
-    def test_fetch_connection_error(self, website_fetcher):
+    def test_fetch_connection_error(self, website_fetcher, routes):
         """WHEN connection cannot be established
         THEN exception is raised."""
-        responses.add(
-            responses.GET,
-            'https://example.com/unreachable',
-            body=requests.exceptions.ConnectionError("Connection failed")
-        )
+        routes['https://example.com/unreachable'] = httpx.ConnectError("Connection failed")
 
         with pytest.raises(Exception) as exc_info:
             website_fetcher.fetch('https://example.com/unreachable')
 
         assert "Failed to fetch website" in str(exc_info.value)
 
-    @responses.activate
-    def test_fetch_missing_title(self, website_fetcher):
+    def test_fetch_missing_title(self, website_fetcher, routes):
         """WHEN HTML has no <title> tag
         THEN default title is used."""
         html = """
@@ -172,12 +162,7 @@ class TestWebsiteFetcher:
         </html>
         """
 
-        responses.add(
-            responses.GET,
-            'https://example.com/notitle',
-            body=html,
-            status=200
-        )
+        routes['https://example.com/notitle'] = httpx.Response(200, text=html)
 
         result = website_fetcher.fetch('https://example.com/notitle')
         item = result[0]
@@ -185,8 +170,7 @@ class TestWebsiteFetcher:
         assert item['title'] == 'No title'
         assert 'Content without title' in item['content']
 
-    @responses.activate
-    def test_fetch_with_content_div(self, website_fetcher):
+    def test_fetch_with_content_div(self, website_fetcher, routes):
         """WHEN HTML uses <div class="content"> and no main/article
         THEN content is extracted from div (if it meets minimum length threshold)."""
         # Content must exceed 100 char threshold used by the best-element selection logic
@@ -203,12 +187,7 @@ class TestWebsiteFetcher:
         </html>
         """
 
-        responses.add(
-            responses.GET,
-            'https://example.com/div',
-            body=html,
-            status=200
-        )
+        routes['https://example.com/div'] = httpx.Response(200, text=html)
 
         result = website_fetcher.fetch('https://example.com/div')
         item = result[0]
@@ -216,8 +195,7 @@ class TestWebsiteFetcher:
         assert 'main content in a div element' in item['content']
         assert 'Sidebar' not in item['content']
 
-    @responses.activate
-    def test_fetch_fallback_to_body(self, website_fetcher):
+    def test_fetch_fallback_to_body(self, website_fetcher, routes):
         """WHEN no semantic content tags are found
         THEN entire body content is extracted."""
         html = """
@@ -229,20 +207,14 @@ class TestWebsiteFetcher:
         </html>
         """
 
-        responses.add(
-            responses.GET,
-            'https://example.com/simple',
-            body=html,
-            status=200
-        )
+        routes['https://example.com/simple'] = httpx.Response(200, text=html)
 
         result = website_fetcher.fetch('https://example.com/simple')
         item = result[0]
 
         assert 'Just some text in body' in item['content']
 
-    @responses.activate
-    def test_fetch_cleans_excessive_whitespace(self, website_fetcher):
+    def test_fetch_cleans_excessive_whitespace(self, website_fetcher, routes):
         """WHEN HTML has excessive whitespace and newlines
         THEN content is cleaned up."""
         html = """
@@ -259,12 +231,7 @@ class TestWebsiteFetcher:
         </html>
         """
 
-        responses.add(
-            responses.GET,
-            'https://example.com/whitespace',
-            body=html,
-            status=200
-        )
+        routes['https://example.com/whitespace'] = httpx.Response(200, text=html)
 
         result = website_fetcher.fetch('https://example.com/whitespace')
         item = result[0]
@@ -275,8 +242,7 @@ class TestWebsiteFetcher:
         # No more than 2 consecutive newlines
         assert '\n\n\n' not in item['content']
 
-    @responses.activate
-    def test_fetch_malformed_html(self, website_fetcher):
+    def test_fetch_malformed_html(self, website_fetcher, routes):
         """WHEN HTML is malformed but parseable
         THEN content is still extracted (BeautifulSoup is lenient)."""
         html = """
@@ -289,12 +255,7 @@ class TestWebsiteFetcher:
         </html>
         """
 
-        responses.add(
-            responses.GET,
-            'https://example.com/malformed',
-            body=html,
-            status=200
-        )
+        routes['https://example.com/malformed'] = httpx.Response(200, text=html)
 
         result = website_fetcher.fetch('https://example.com/malformed')
         item = result[0]
@@ -302,8 +263,7 @@ class TestWebsiteFetcher:
         assert item['title'] == 'Malformed'
         assert 'Content here' in item['content']
 
-    @responses.activate
-    def test_fetch_empty_body(self, website_fetcher):
+    def test_fetch_empty_body(self, website_fetcher, routes):
         """WHEN HTML body is empty
         THEN result contains empty content."""
         html = """
@@ -313,12 +273,7 @@ class TestWebsiteFetcher:
         </html>
         """
 
-        responses.add(
-            responses.GET,
-            'https://example.com/empty',
-            body=html,
-            status=200
-        )
+        routes['https://example.com/empty'] = httpx.Response(200, text=html)
 
         result = website_fetcher.fetch('https://example.com/empty')
         item = result[0]
@@ -326,8 +281,7 @@ class TestWebsiteFetcher:
         assert item['title'] == 'Empty'
         assert item['content'] == ''
 
-    @responses.activate
-    def test_fetch_sets_user_agent(self, website_fetcher):
+    def test_fetch_sets_user_agent(self, website_fetcher, routes):
         """WHEN request is made
         THEN User-Agent header is set."""
         html = '<html><body><p>Test</p></body></html>'
@@ -335,18 +289,13 @@ class TestWebsiteFetcher:
         def check_headers(request):
             assert 'User-Agent' in request.headers
             assert 'Mozilla' in request.headers['User-Agent']
-            return (200, {}, html)
+            return httpx.Response(200, text=html)
 
-        responses.add_callback(
-            responses.GET,
-            'https://example.com/ua',
-            callback=check_headers
-        )
+        routes['https://example.com/ua'] = check_headers
 
         website_fetcher.fetch('https://example.com/ua')
 
-    @responses.activate
-    def test_fetch_with_id_content(self, website_fetcher):
+    def test_fetch_with_id_content(self, website_fetcher, routes):
         """WHEN HTML uses <div id="content">
         THEN content is extracted from that div (if it meets minimum length threshold)."""
         # Content must exceed 100 char threshold used by the best-element selection logic
@@ -363,15 +312,29 @@ class TestWebsiteFetcher:
         </html>
         """
 
-        responses.add(
-            responses.GET,
-            'https://example.com/idcontent',
-            body=html,
-            status=200
-        )
+        routes['https://example.com/idcontent'] = httpx.Response(200, text=html)
 
         result = website_fetcher.fetch('https://example.com/idcontent')
         item = result[0]
 
         assert 'Main content with ID selector' in item['content']
         assert 'Header' not in item['content']
+
+    def test_fetch_extracts_preview_image(self, website_fetcher, routes):
+        """WHEN page has an og:image meta tag
+        THEN image_url is returned from the same response."""
+        html = """
+        <html>
+            <head>
+                <title>Story</title>
+                <meta property="og:image" content="/images/story.jpg">
+            </head>
+            <body><article><p>Story body.</p></article></body>
+        </html>
+        """
+
+        routes['https://example.com/story'] = httpx.Response(200, text=html)
+
+        item = website_fetcher.fetch('https://example.com/story')[0]
+
+        assert item['image_url'] == 'https://example.com/images/story.jpg'
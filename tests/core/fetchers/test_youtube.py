@@ -1,10 +1,16 @@
 """Tests for YouTube transcript fetching."""
+import httpx
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
+from reconly_core.fetchers.base import HTTPValidators
 from reconly_core.fetchers.youtube import YouTubeFetcher
 
 
+# Channel feed downloads are answered by a mock transport
+pytestmark = pytest.mark.usefixtures("feed_requests")
+
+
 class TestYouTubeFetcher:
     """Test suite for YouTubeFetcher class."""
 
@@ -92,7 +98,8 @@ class TestYouTubeFetcher:
         mock_response.text = '{"channelId":"UCBJycsmduvYEL83R_U4JriQ"}'
         mock_response.raise_for_status = Mock()
 
-        with patch('reconly_core.fetchers.youtube.requests.get', return_value=mock_response):
+        with patch('reconly_core.fetchers.youtube.get_http_client') as get_client:
+            get_client.return_value.get.return_value = mock_response
             channel_id = youtube_fetcher.extract_channel_id(url)
             assert channel_id == "UCBJycsmduvYEL83R_U4JriQ"
 
@@ -105,7 +112,8 @@ class TestYouTubeFetcher:
         mock_response.text = '"externalId":"UC_x5XG1OV2P6uZZ5FSM9Ttw"'
         mock_response.raise_for_status = Mock()
 
-        with patch('reconly_core.fetchers.youtube.requests.get', return_value=mock_response):
+        with patch('reconly_core.fetchers.youtube.get_http_client') as get_client:
+            get_client.return_value.get.return_value = mock_response
             channel_id = youtube_fetcher.extract_channel_id(url)
             assert channel_id == "UC_x5XG1OV2P6uZZ5FSM9Ttw"
 
@@ -274,7 +282,7 @@ class TestYouTubeFetcher:
 
         mock_feed.entries = [mock_entry]
 
-        with patch('reconly_core.fetchers.youtube.feedparser.parse', return_value=mock_feed):
+        with patch('reconly_core.fetchers.base.feedparser.parse', return_value=mock_feed):
             videos = youtube_fetcher._fetch_channel_rss('UCtest123')
 
             assert len(videos) == 1
@@ -306,13 +314,33 @@ class TestYouTubeFetcher:
 
         mock_feed.entries = [old_entry, new_entry]
 
-        with patch('reconly_core.fetchers.youtube.feedparser.parse', return_value=mock_feed):
+        with patch('reconly_core.fetchers.base.feedparser.parse', return_value=mock_feed):
             since = datetime(2024, 1, 10)
             videos = youtube_fetcher._fetch_channel_rss('UCtest123', since=since)
 
             assert len(videos) == 1
             assert videos[0]['video_id'] == 'new'
 
+    def test_fetch_channel_not_modified(self, youtube_fetcher, feed_requests):
+        """WHEN the channel feed answers 304 Not Modified
+        THEN no transcripts are fetched and validators are flagged."""
+        validators = HTTPValidators(etag='"v1"')
+        responses, requests = feed_requests
+        responses.append(httpx.Response(304))
+
+        with patch('reconly_core.fetchers.base.feedparser.parse') as parse:
+            with patch.object(youtube_fetcher, 'extract_channel_id', return_value='UCtest123'):
+                with patch.object(youtube_fetcher, '_fetch_video_transcript') as transcript:
+                    results = youtube_fetcher.fetch(
+                        'https://www.youtube.com/channel/UCtest123', validators=validators,
+                    )
+
+        assert results == []
+        assert validators.not_modified is True
+        assert requests[0].headers['If-None-Match'] == '"v1"'
+        parse.assert_not_called()
+        transcript.assert_not_called()
+
     def test_fetch_channel_returns_empty_when_no_rss(self, youtube_fetcher):
         """WHEN channel RSS returns empty feed
         THEN empty list is returned."""
@@ -321,7 +349,7 @@ class TestYouTubeFetcher:
         mock_feed.entries = []
         mock_feed.feed.get.return_value = "Empty Channel"
 
-        with patch('reconly_core.fetchers.youtube.feedparser.parse', return_value=mock_feed):
+        with patch('reconly_core.fetchers.base.feedparser.parse', return_value=mock_feed):
             with patch.object(youtube_fetcher, 'extract_channel_id', return_value='UCtest123'):
                 results = youtube_fetcher.fetch('https://www.youtube.com/channel/UCtest123')
 
@@ -359,7 +387,7 @@ class TestYouTubeFetcher:
                 return mock_transcript
             raise Exception("No transcript")
 
-        with patch('reconly_core.fetchers.youtube.feedparser.parse', return_value=mock_feed):
+        with patch('reconly_core.fetchers.base.feedparser.parse', return_value=mock_feed):
             with patch('reconly_core.fetchers.youtube.YouTubeTranscriptApi') as mock_api_class:
                 mock_api = Mock()
                 mock_api.fetch.side_effect = mock_fetch_video
@@ -392,7 +420,7 @@ class TestYouTubeFetcher:
         mock_transcript.snippets = [Mock(text="Transcript content")]
         mock_transcript.language = "en"
 
-        with patch('reconly_core.fetchers.youtube.feedparser.parse', return_value=mock_feed):
+        with patch('reconly_core.fetchers.base.feedparser.parse', return_value=mock_feed):
             with patch('reconly_core.fetchers.youtube.YouTubeTranscriptApi') as mock_api_class:
                 mock_api = Mock()
                 mock_api.fetch.return_value = mock_transcript
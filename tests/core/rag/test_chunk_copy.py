@@ -0,0 +1,94 @@
+"""Tests for the binary COPY chunk writer (no database needed)."""
+import struct
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from reconly_core.database.models import DigestChunk
+from reconly_core.rag.chunk_copy import copy_rows, encode_copy_rows
+
+
+def _fields(payload, column_count):
+    """Decode a binary COPY payload into rows of raw field bytes."""
+    assert payload.startswith(b'PGCOPY\n\xff\r\n\x00')
+    offset = 19
+    rows = []
+    while True:
+        (count,) = struct.unpack_from('>h', payload, offset)
+        offset += 2
+        if count == -1:
+            break
+        assert count == column_count
+        row = []
+        for _ in range(count):
+            (length,) = struct.unpack_from('>i', payload, offset)
+            offset += 4
+            if length == -1:
+                row.append(None)
+                continue
+            row.append(payload[offset:offset + length])
+            offset += length
+        rows.append(row)
+    assert offset == len(payload)
+    return rows
+
+
+class TestEncodeCopyRows:
+    """Binary COPY encoding."""
+
+    def test_encodes_chunk_columns(self):
+        columns = ['digest_id', 'text', 'embedding', 'extra_data', 'created_at']
+        row = {
+            'digest_id': 42,
+            'text': 'Grüße',
+            'embedding': [0.5, -1.0, 2.0],
+            'extra_data': {'heading': 'Intro'},
+            'created_at': datetime(2000, 1, 2, 0, 0, 1, 5),
+        }
+
+        [fields] = _fields(encode_copy_rows(DigestChunk.__table__, columns, [row]), len(columns))
+
+        assert struct.unpack('>i', fields[0]) == (42,)
+        assert fields[1].decode('utf-8') == 'Grüße'
+        assert struct.unpack_from('>HH', fields[2]) == (3, 0)
+        assert np.frombuffer(fields[2][4:], dtype='>f4').tolist() == [0.5, -1.0, 2.0]
+        assert fields[3] == b'{"heading": "Intro"}'
+        assert struct.unpack('>q', fields[4]) == (86_400_000_000 + 1_000_005,)
+
+    def test_missing_and_none_values_are_null(self):
+        columns = ['digest_id', 'feed_id', 'extra_data']
+
+        rows = _fields(
+            encode_copy_rows(DigestChunk.__table__, columns, [{'digest_id': 1, 'extra_data': None}]),
+            len(columns),
+        )
+
+        assert rows == [[struct.pack('>i', 1), None, None]]
+
+    def test_unsupported_type(self):
+        with pytest.raises(TypeError):
+            encode_copy_rows(DigestChunk.__table__, ['search_vector'], [{'search_vector': 'x'}])
+
+
+class TestCopyRows:
+    """Driver detection."""
+
+    def test_falls_back_without_postgres(self):
+        db = MagicMock()
+        db.connection.return_value.dialect.name = 'sqlite'
+
+        assert copy_rows(db, DigestChunk.__table__, [{'digest_id': 1}]) is False
+
+    def test_copies_with_column_list(self):
+        db = MagicMock()
+        connection = db.connection.return_value
+        connection.dialect.name = 'postgresql'
+        connection.dialect.identifier_preparer.quote = lambda name: name
+        cursor = connection.connection.dbapi_connection.cursor.return_value.__enter__.return_value
+
+        assert copy_rows(db, DigestChunk.__table__, [{'text': 'a', 'digest_id': 1}]) is True
+
+        sql = cursor.copy_expert.call_args[0][0]
+        assert sql == "COPY digest_chunks (digest_id, text) FROM STDIN WITH (FORMAT BINARY)"
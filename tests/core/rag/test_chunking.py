@@ -49,6 +49,25 @@ class TestChunkingService:
         """Test token counting for empty string."""
         assert chunker.count_tokens("") == 0
 
+    def test_count_tokens_batch(self, chunker):
+        """Test batch token counting matches per-text counting."""
+        texts = ["Hello, world!", "", "A somewhat longer sentence with more tokens."]
+        assert chunker.count_tokens_batch(texts) == [chunker.count_tokens(t) for t in texts]
+        assert chunker.count_tokens_batch([]) == []
+
+    def test_chunk_token_counts_come_from_single_pass(self, chunker, monkeypatch):
+        """Test chunking tokenizes sections once instead of per chunk and overlap."""
+        text = "\n\n".join(
+            f"Paragraph {i} talks about topic {i} in some detail. " * 5 for i in range(20)
+        )
+        calls = []
+        monkeypatch.setattr(chunker, "count_tokens", lambda t: calls.append(t) or 0)
+
+        chunks = chunker.chunk_text(text)
+
+        assert len(chunks) > 1
+        assert calls == []
+
     def test_chunk_text_empty_string(self, chunker):
         """Test chunking empty string returns empty list."""
         chunks = chunker.chunk_text("")
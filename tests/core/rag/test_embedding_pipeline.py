@@ -2,15 +2,20 @@
 
 Tests the complete flow from chunking through embedding to storage.
 """
+import asyncio
+
 import pytest
 from unittest.mock import Mock, AsyncMock
 
 from reconly_core.rag.embedding_service import (
     EmbeddingService,
     EMBEDDING_STATUS_COMPLETED,
+    EMBEDDING_STATUS_FAILED,
+    chunk_text_hash,
+    refresh_digest_centroids,
 )
 from reconly_core.rag.chunking import ChunkingService
-from reconly_core.database.models import Digest, DigestChunk, Source
+from reconly_core.database.models import Digest, DigestChunk, Feed, FeedRun, Source
 
 
 class TestEmbeddingPipeline:
@@ -107,6 +112,48 @@ education, transportation, and many other fields.
         db_session.refresh(sample_digest)
         assert sample_digest.embedding_status == EMBEDDING_STATUS_COMPLETED
 
+    @pytest.mark.asyncio
+    async def test_chunks_written_in_bulk(self, embedding_service, sample_digest, db_session):
+        """Returned chunks carry their row IDs without being tracked by the session."""
+        await embedding_service.embed_digest(sample_digest)
+
+        chunks = await embedding_service.embed_digest(sample_digest, replace_existing=True)
+
+        assert all(chunk not in db_session for chunk in chunks)
+        db_chunks = db_session.query(DigestChunk).filter(
+            DigestChunk.digest_id == sample_digest.id
+        ).order_by(DigestChunk.chunk_index).all()
+        assert [c.id for c in db_chunks] == [c.id for c in chunks]
+        assert [c.text for c in db_chunks] == [c.text for c in chunks]
+
+    @pytest.mark.asyncio
+    async def test_reembed_unchanged_digest_reuses_vectors(self, embedding_service, sample_digest, db_session):
+        """Re-embedding identical text makes no provider calls."""
+        first = await embedding_service.embed_digest(sample_digest)
+        embedding_service.provider.embed.reset_mock()
+
+        second = await embedding_service.embed_digest(sample_digest)
+
+        embedding_service.provider.embed.assert_not_awaited()
+        assert [c.text_hash for c in second] == [c.text_hash for c in first]
+        assert [list(c.embedding) for c in second] == [list(c.embedding) for c in first]
+        assert all(c.embedding_model == 'test-provider:unknown' for c in second)
+
+    @pytest.mark.asyncio
+    async def test_reembed_changed_digest_embeds_new_text_only(self, embedding_service, sample_digest):
+        """Only chunks whose text changed are sent to the provider."""
+        first = await embedding_service.embed_digest(sample_digest)
+        sample_digest.summary = "A revised summary of the article."
+        embedding_service.provider.embed.reset_mock()
+
+        second = await embedding_service.embed_digest(sample_digest)
+
+        sent = [text for call in embedding_service.provider.embed.await_args_list for text in call.args[0]]
+        old_texts = {c.text for c in first}
+        assert sent
+        assert len(sent) < len(second)
+        assert not old_texts.intersection(sent)
+
     @pytest.mark.asyncio
     async def test_embedding_with_summary(self, embedding_service, sample_digest):
         """Test that summary is included as a chunk."""
@@ -317,6 +364,252 @@ education, transportation, and many other fields.
             assert len(digest_chunks) > 0
 
 
+class TestBackfill:
+    """Tests for bulk backfills."""
+
+    @pytest.fixture
+    def embedding_service(self, db_session):
+        """Return an embedding service whose provider records batch sizes."""
+        provider = Mock()
+        provider.batch_sizes = []
+
+        async def embed_multi(texts):
+            provider.batch_sizes.append(len(texts))
+            return [[0.1] * 1024 for _ in texts]
+
+        provider.embed = AsyncMock(side_effect=embed_multi)
+        return EmbeddingService(
+            db=db_session,
+            embedding_provider=provider,
+            chunking_service=ChunkingService(db=db_session),
+            batch_size=4,
+        )
+
+    def create_digests(self, db_session, count):
+        source = Source(name="Test", type="manual", url="https://test.example.com", config={})
+        db_session.add(source)
+        db_session.flush()
+
+        digests = []
+        for i in range(count):
+            digest = Digest(
+                title=f"Article {i}",
+                url=f"https://test.example.com/backfill-{i}",
+                content=f"This is article {i} about topic {i}.",
+                source_id=source.id,
+            )
+            db_session.add(digest)
+            digests.append(digest)
+        db_session.commit()
+        return digests
+
+    @pytest.mark.asyncio
+    async def test_backfill_packs_chunks_across_digests(self, embedding_service, db_session):
+        """Chunks from several digests share full batches."""
+        digests = self.create_digests(db_session, 5)
+
+        results = await embedding_service.backfill_digests(commit_every=10)
+
+        assert set(results) == {d.id for d in digests}
+        total_chunks = sum(results.values())
+        assert db_session.query(DigestChunk).count() == total_chunks
+        # Every batch except the last is full
+        assert all(size == 4 for size in embedding_service.provider.batch_sizes[:-1])
+        for digest in digests:
+            db_session.refresh(digest)
+            assert digest.embedding_status == EMBEDDING_STATUS_COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_backfill_copies_filter_columns(self, embedding_service, db_session):
+        """Chunk rows carry the digest's feed, source and creation date."""
+        feed = Feed(name="Backfill Feed")
+        db_session.add(feed)
+        db_session.flush()
+        feed_run = FeedRun(feed_id=feed.id, triggered_by="manual", status="completed")
+        db_session.add(feed_run)
+        db_session.flush()
+        digest = self.create_digests(db_session, 1)[0]
+        digest.feed_run_id = feed_run.id
+        db_session.commit()
+
+        await embedding_service.backfill_digests()
+
+        chunk = db_session.query(DigestChunk).filter(DigestChunk.digest_id == digest.id).first()
+        assert chunk.feed_id == feed.id
+        assert chunk.source_id == digest.source_id
+        assert chunk.digest_created_at == digest.created_at
+
+    @pytest.mark.asyncio
+    async def test_backfill_sets_centroid(self, embedding_service, db_session):
+        """Backfilled digests get the mean of their chunk embeddings."""
+        digest = self.create_digests(db_session, 1)[0]
+
+        await embedding_service.backfill_digests()
+
+        centroid = db_session.query(Digest.centroid_embedding).filter(Digest.id == digest.id).scalar()
+        assert list(centroid) == pytest.approx([0.1] * 1024)
+
+    def test_refresh_digest_centroids_averages_chunks(self, db_session):
+        digest = self.create_digests(db_session, 1)[0]
+        for i, embedding in enumerate([[1.0, 0.0], [0.0, 1.0]]):
+            db_session.add(DigestChunk(
+                digest_id=digest.id, chunk_index=i, text=f"Chunk {i}", token_count=2,
+                start_char=0, end_char=7, embedding=embedding + [0.0] * 1022,
+            ))
+        db_session.flush()
+
+        refresh_digest_centroids(db_session, [digest.id], 'digest')
+
+        centroid = db_session.query(Digest.centroid_embedding).filter(Digest.id == digest.id).scalar()
+        assert list(centroid[:3]) == pytest.approx([0.5, 0.5, 0.0])
+
+        db_session.query(DigestChunk).delete()
+        refresh_digest_centroids(db_session, [digest.id], 'digest')
+
+        assert db_session.query(Digest.centroid_embedding).filter(Digest.id == digest.id).scalar() is None
+
+    @pytest.mark.asyncio
+    async def test_delete_digest_chunks_clears_centroid(self, embedding_service, db_session):
+        """Deleting a digest's chunks also clears its centroid."""
+        digest = self.create_digests(db_session, 1)[0]
+        await embedding_service.backfill_digests()
+
+        assert embedding_service.delete_digest_chunks(digest.id) > 0
+
+        assert db_session.query(Digest.centroid_embedding).filter(Digest.id == digest.id).scalar() is None
+
+    @pytest.mark.asyncio
+    async def test_backfill_marks_failed_batch(self, embedding_service, db_session):
+        """Digests in a failed batch are marked failed and get no chunks."""
+        digests = self.create_digests(db_session, 2)
+        embedding_service.provider.embed = AsyncMock(side_effect=RuntimeError("server down"))
+
+        results = await embedding_service.backfill_digests()
+
+        assert results == {d.id: 0 for d in digests}
+        assert db_session.query(DigestChunk).count() == 0
+        for digest in digests:
+            db_session.refresh(digest)
+            assert digest.embedding_status == EMBEDDING_STATUS_FAILED
+            assert 'server down' in digest.embedding_error
+
+    @pytest.mark.asyncio
+    async def test_backfill_reembed_all_replaces_chunks(self, embedding_service, db_session):
+        """reembed_all re-embeds completed digests without duplicating chunks."""
+        self.create_digests(db_session, 3)
+        first = await embedding_service.backfill_digests(commit_every=2)
+
+        second = await embedding_service.backfill_digests(reembed_all=True, commit_every=2)
+
+        assert second == first
+        assert db_session.query(DigestChunk).count() == sum(first.values())
+
+    @pytest.mark.asyncio
+    async def test_backfill_reembeds_outdated_model(self, embedding_service, db_session):
+        """After a model switch, backfills re-embed digests embedded with the old model."""
+        digests = self.create_digests(db_session, 2)
+        await embedding_service.backfill_digests()
+        assert await embedding_service.backfill_digests() == {}
+
+        embedding_service.provider.get_model_info = Mock(
+            return_value={'provider': 'test', 'model': 'other'}
+        )
+        stats = embedding_service.get_chunk_statistics()
+        assert stats['embedding_status']['outdated_model'] == 2
+
+        results = await embedding_service.backfill_digests()
+
+        assert set(results) == {d.id for d in digests}
+        models = {row[0] for row in db_session.query(DigestChunk.embedding_model).all()}
+        assert models == {'test:other'}
+        assert embedding_service.get_chunk_statistics()['embedding_status']['outdated_model'] == 0
+
+    @pytest.mark.asyncio
+    async def test_backfill_progress_callback(self, embedding_service, db_session):
+        """Progress is reported per digest across commit windows."""
+        self.create_digests(db_session, 3)
+        calls = []
+
+        await embedding_service.backfill_digests(
+            commit_every=2,
+            progress_callback=lambda current, total, digest: calls.append((current, total)),
+        )
+
+        assert calls == [(1, 3), (2, 3), (3, 3)]
+
+
+class TestEmbedConcurrently:
+    """Tests for concurrent batch embedding (no database needed)."""
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency_and_order(self):
+        """At most `concurrency` batches run at once and results keep input order."""
+        state = {'active': 0, 'peak': 0}
+
+        async def embed_multi(texts):
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+            await asyncio.sleep(0.01)
+            state['active'] -= 1
+            return [[float(text)] for text in texts]
+
+        provider = Mock()
+        provider.embed = AsyncMock(side_effect=embed_multi)
+        service = EmbeddingService(db=Mock(), embedding_provider=provider, chunking_service=Mock(), batch_size=3)
+
+        texts = [str(i) for i in range(20)]
+        embeddings, errors = await service._embed_concurrently(texts, concurrency=2)
+
+        assert state['peak'] == 2
+        assert provider.embed.call_count == 7
+        assert embeddings == [[float(i)] for i in range(20)]
+        assert errors == [None] * 20
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_isolated(self):
+        """A failing batch only affects its own texts."""
+        async def embed_multi(texts):
+            if '3' in texts:
+                raise RuntimeError("boom")
+            return [[1.0] for _ in texts]
+
+        provider = Mock()
+        provider.embed = AsyncMock(side_effect=embed_multi)
+        service = EmbeddingService(db=Mock(), embedding_provider=provider, chunking_service=Mock(), batch_size=2)
+
+        embeddings, errors = await service._embed_concurrently(['0', '1', '2', '3', '4'], concurrency=4)
+
+        assert embeddings == [[1.0], [1.0], [], [], [1.0]]
+        assert [bool(error) for error in errors] == [False, False, True, True, False]
+
+
+class TestChunkReuse:
+    """Tests for reusing stored chunk vectors (no database needed)."""
+
+    @pytest.mark.asyncio
+    async def test_only_missing_texts_are_embedded(self):
+        """Texts with a reusable vector are skipped and duplicates embedded once."""
+        provider = Mock()
+        provider.embed = AsyncMock(side_effect=lambda texts: [[float(len(t))] for t in texts])
+        service = EmbeddingService(db=Mock(), embedding_provider=provider, chunking_service=Mock())
+
+        texts = ['kept', 'new', 'new']
+        hashes = [chunk_text_hash(text) for text in texts]
+        reusable = {chunk_text_hash('kept'): [9.0]}
+
+        embeddings = await service._embed_missing(texts, hashes, reusable)
+
+        provider.embed.assert_awaited_once_with(['new'])
+        assert embeddings == [[9.0], [3.0], [3.0]]
+
+    def test_model_identity(self):
+        provider = Mock()
+        provider.get_model_info = Mock(return_value={'provider': 'ollama', 'model': 'bge-m3'})
+        service = EmbeddingService(db=Mock(), embedding_provider=provider, chunking_service=Mock())
+
+        assert service.model_identity == 'ollama:bge-m3'
+
+
 class TestChunkingIntegration:
     """Test chunking integration with the pipeline."""
 
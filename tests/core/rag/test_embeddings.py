@@ -1,6 +1,9 @@
 """Tests for embedding providers."""
+import threading
+import time
+
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import requests
 
 from reconly_core.rag.embeddings import (
@@ -219,7 +222,7 @@ class TestOllamaEmbedding:
             # Mock embedding response
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = {
-                'embedding': [0.1] * 1024  # Mock 1024-dim embedding
+                'embeddings': [[0.1] * 1024]  # Mock 1024-dim embedding
             }
 
             provider = OllamaEmbedding(model='bge-m3')
@@ -239,7 +242,7 @@ class TestOllamaEmbedding:
             # Mock embedding response
             mock_post.return_value.status_code = 200
             mock_post.return_value.json.return_value = {
-                'embedding': [0.1] * 1024
+                'embeddings': [[0.1] * 1024] * 3
             }
 
             provider = OllamaEmbedding(model='bge-m3')
@@ -250,6 +253,100 @@ class TestOllamaEmbedding:
             for emb in embeddings:
                 assert len(emb) == 1024
 
+            # All texts go out in a single /api/embed request
+            mock_post.assert_called_once()
+            assert mock_post.call_args[0][0].endswith('/api/embed')
+            assert mock_post.call_args[1]['json']['input'] == ["Text 1", "Text 2", "Text 3"]
+
+    @pytest.mark.asyncio
+    async def test_embed_splits_into_batches(self):
+        """Test that large inputs are split into batches and keep their order."""
+        def embed_response(url, json, timeout):
+            response = MagicMock(status_code=200)
+            response.json.return_value = {
+                'embeddings': [[float(text.split()[1])] for text in json['input']]
+            }
+            return response
+
+        with patch('requests.get'), \
+             patch('requests.post', side_effect=embed_response) as mock_post:
+            provider = OllamaEmbedding(model='bge-m3', max_concurrency=2)
+            embeddings = await provider.embed([f"Text {i}" for i in range(70)])
+
+        assert mock_post.call_count == 3
+        assert [len(call[1]['json']['input']) for call in mock_post.call_args_list] == [32, 32, 6]
+        assert embeddings == [[float(i)] for i in range(70)]
+
+    @pytest.mark.asyncio
+    async def test_embed_bounded_concurrency(self):
+        """Test that at most max_concurrency batch requests are in flight."""
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def embed_response(url, json, timeout):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.05)
+            with lock:
+                state['active'] -= 1
+            response = MagicMock(status_code=200)
+            response.json.return_value = {'embeddings': [[0.1]] * len(json['input'])}
+            return response
+
+        with patch('requests.get'), \
+             patch('requests.post', side_effect=embed_response):
+            provider = OllamaEmbedding(model='bge-m3', max_concurrency=2)
+            await provider.embed(["Text"] * 32 * 6)
+
+        assert state['peak'] == 2
+
+    @pytest.mark.asyncio
+    async def test_embed_falls_back_to_legacy_endpoint(self):
+        """Test fallback to /api/embeddings on servers without /api/embed."""
+        def embed_response(url, json, timeout):
+            response = MagicMock()
+            if url.endswith('/api/embed'):
+                response.status_code = 404
+                response.text = '404 page not found'
+                response.json.side_effect = ValueError('not json')
+            else:
+                response.status_code = 200
+                response.json.return_value = {'embedding': [0.1] * 1024}
+            return response
+
+        with patch('requests.get'), \
+             patch('requests.post', side_effect=embed_response) as mock_post:
+            provider = OllamaEmbedding(model='bge-m3')
+            embeddings = await provider.embed(["Text 1", "Text 2"])
+            assert len(embeddings) == 2
+            assert provider._legacy_api is True
+
+            # Later calls go straight to the legacy endpoint
+            await provider.embed(["Text 3"])
+
+        urls = [call[0][0] for call in mock_post.call_args_list]
+        assert urls[0].endswith('/api/embed')
+        assert all(url.endswith('/api/embeddings') for url in urls[1:])
+        assert len(urls) == 4
+
+    @pytest.mark.asyncio
+    async def test_embed_model_not_found_does_not_fall_back(self):
+        """Test that a 404 for a missing model is reported, not retried on the legacy API."""
+        with patch('requests.get'), \
+             patch('requests.post') as mock_post:
+            mock_post.return_value.status_code = 404
+            mock_post.return_value.text = '{"error":"model \\"bge-m3\\" not found"}'
+            mock_post.return_value.json.return_value = {'error': 'model "bge-m3" not found'}
+
+            provider = OllamaEmbedding(model='bge-m3')
+
+            with pytest.raises(RuntimeError, match='404'):
+                await provider.embed(["Test"])
+
+        assert provider._legacy_api is False
+        mock_post.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_embed_empty_list_raises(self):
         """Test that embedding empty list raises error."""
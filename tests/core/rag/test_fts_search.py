@@ -0,0 +1,119 @@
+"""Tests for full-text search over the stored search vectors."""
+from unittest.mock import MagicMock
+
+from reconly_core.database.models import Digest, DigestChunk, Source
+from reconly_core.rag.search.fts import FTSService
+
+
+def _executed_sql(ts_config='english', **kwargs):
+    db = MagicMock()
+    FTSService(db, ts_config=ts_config).search("machine learning", **kwargs)
+    return str(db.execute.call_args[0][0])
+
+
+class TestFTSQueryBuilding:
+    """SQL generated by FTSService.search (no database needed)."""
+
+    def test_uses_stored_search_vector(self):
+        sql = _executed_sql()
+
+        assert "WHERE search_vector @@ tsq" in sql
+        assert "to_tsvector" not in sql
+        assert "ILIKE" not in sql
+
+    def test_field_subset_filters_by_weight(self):
+        sql = _executed_sql(search_fields=['title', 'content'])
+
+        assert "search_vector @@ tsq AND ts_filter(search_vector, '{a,c}') @@ tsq" in sql
+        assert "WHEN ts_filter(search_vector, '{a}') @@ tsq THEN 'title'" in sql
+
+    def test_headline_only_for_top_k(self):
+        sql = _executed_sql()
+        ranked, final = sql.split("d.id,", 1)
+
+        assert "LIMIT :limit" in ranked
+        assert "ts_headline" not in ranked
+        assert "ts_headline" in final
+
+    def test_other_language_computes_vector(self):
+        sql = _executed_sql(ts_config='german')
+
+        assert "search_vector" not in sql
+        assert "to_tsvector('german', COALESCE(title, ''))" in sql
+
+    def test_empty_query(self):
+        db = MagicMock()
+
+        assert FTSService(db).search("   ") == []
+        assert FTSService(db).search("ai", search_fields=['unknown']) == []
+        db.execute.assert_not_called()
+
+
+class TestFTSSearch:
+    """Full-text search against the database."""
+
+    def _create_digests(self, db_session):
+        source = Source(name="Test", type="manual", url="https://fts.example.com", config={})
+        db_session.add(source)
+        db_session.flush()
+
+        title_match = Digest(
+            title="Machine learning in production",
+            url="https://fts.example.com/1",
+            summary="Deployment notes",
+            content="Operational details",
+            source_id=source.id,
+        )
+        content_match = Digest(
+            title="Weekly notes",
+            url="https://fts.example.com/2",
+            summary="Assorted links",
+            content="A short aside about machine learning",
+            source_id=source.id,
+        )
+        db_session.add_all([title_match, content_match])
+        db_session.flush()
+        return title_match, content_match
+
+    def test_title_matches_rank_first(self, db_session):
+        title_match, content_match = self._create_digests(db_session)
+
+        results = FTSService(db_session).search("machine learning")
+
+        assert [r.digest_id for r in results] == [title_match.id, content_match.id]
+        assert results[0].matched_field == 'title'
+        assert results[1].matched_field == 'content'
+
+    def test_search_fields_restricts_matches(self, db_session):
+        title_match, _ = self._create_digests(db_session)
+
+        results = FTSService(db_session).search("machine learning", search_fields=['title'])
+
+        assert [r.digest_id for r in results] == [title_match.id]
+
+    def test_search_vector_follows_updates(self, db_session):
+        _, content_match = self._create_digests(db_session)
+        content_match.content = "Nothing relevant"
+        db_session.flush()
+
+        results = FTSService(db_session).search("machine learning")
+
+        assert content_match.id not in [r.digest_id for r in results]
+
+    def test_search_chunks_ranked(self, db_session):
+        title_match, content_match = self._create_digests(db_session)
+        db_session.add_all([
+            DigestChunk(digest_id=content_match.id, chunk_index=0, text="machine learning once",
+                        token_count=3, start_char=0, end_char=21),
+            DigestChunk(digest_id=title_match.id, chunk_index=0,
+                        text="machine learning and more machine learning",
+                        token_count=6, start_char=0, end_char=42),
+            DigestChunk(digest_id=title_match.id, chunk_index=1, text="unrelated",
+                        token_count=1, start_char=42, end_char=51),
+        ])
+        db_session.flush()
+
+        results = FTSService(db_session).search_chunks("machine learning")
+
+        assert [r['digest_id'] for r in results] == [title_match.id, content_match.id]
+        assert results[0]['score'] > results[1]['score']
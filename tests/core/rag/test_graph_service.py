@@ -1,7 +1,7 @@
 """Tests for GraphService."""
 import pytest
 import numpy as np
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
 
 from reconly_core.rag.graph_service import (
@@ -9,7 +9,9 @@ from reconly_core.rag.graph_service import (
     GraphNode,
     GraphEdge,
     GraphData,
+    _GraphCache,
 )
+from reconly_core.rag.embedding_service import refresh_digest_centroids
 from reconly_core.database.models import (
     Digest,
     DigestChunk,
@@ -440,6 +442,249 @@ class TestGraphService:
         assert count == 0
 
 
+class TestGraphServiceBatch:
+    """Tests for compute_relationships_batch."""
+
+    @pytest.fixture
+    def sample_digests(self, db_session):
+        source = Source(name="Batch Source", type="manual", url="https://batch.example.com", config={})
+        tag = Tag(name="batch-ai")
+        db_session.add_all([source, tag])
+        db_session.flush()
+
+        digests = []
+        for i in range(4):
+            digest = Digest(
+                title=f"Batch digest {i}",
+                url=f"https://batch.example.com/{i}",
+                content=f"Content {i}",
+                source_id=source.id,
+            )
+            db_session.add(digest)
+            db_session.flush()
+            db_session.add(DigestTag(digest_id=digest.id, tag_id=tag.id))
+            db_session.add(DigestChunk(
+                digest_id=digest.id,
+                chunk_index=0,
+                text=f"Chunk {i}",
+                token_count=10,
+                start_char=0,
+                end_char=10,
+                embedding=[1.0, float(i) / 10] + [0.0] * 1022,
+            ))
+            digests.append(digest)
+        db_session.commit()
+        return digests
+
+    @pytest.mark.asyncio
+    async def test_batch_creates_all_relationship_types(self, db_session, sample_digests):
+        service = GraphService(db=db_session, embedding_provider=Mock(), default_chunk_source='digest')
+
+        created = await service.compute_relationships_batch([d.id for d in sample_digests])
+        db_session.commit()
+
+        by_type = service.get_statistics()['by_type']
+        assert created == sum(by_type.values())
+        # Every ordered pair of the 4 digests is related by each type
+        assert by_type == {'semantic': 12, 'tag': 12, 'source': 12}
+
+    @pytest.mark.asyncio
+    async def test_batch_is_idempotent(self, db_session, sample_digests):
+        service = GraphService(db=db_session, embedding_provider=Mock(), default_chunk_source='digest')
+        ids = [d.id for d in sample_digests]
+
+        await service.compute_relationships_batch(ids, batch_size=2)
+        db_session.commit()
+
+        assert await service.compute_relationships_batch(ids) == 0
+
+    @pytest.mark.asyncio
+    async def test_single_digest_uses_centroids(self, db_session, sample_digests):
+        service = GraphService(db=db_session, embedding_provider=Mock(), default_chunk_source='digest')
+        refresh_digest_centroids(db_session, [d.id for d in sample_digests], 'digest')
+
+        similar = service._find_similar_digests(sample_digests[0].id, chunk_source='digest', limit=2)
+
+        # Centroids lie along the same direction with increasing angle
+        assert [digest_id for digest_id, _ in similar] == [sample_digests[1].id, sample_digests[2].id]
+        assert similar[0][1] > similar[1][1]
+
+
+class TestSemanticEdgeCollection:
+    """Semantic edge selection from kNN rows (no database needed)."""
+
+    def test_edges_are_bidirectional_thresholded_and_capped(self):
+        db = Mock()
+        db.execute.return_value.all.return_value = [
+            (1, 2, 0.1),   # similarity 0.9
+            (1, 3, 0.2),   # similarity 0.8
+            (1, 4, 0.3),   # similarity 0.7 (over the cap)
+            (5, 6, 0.9),   # similarity 0.1 (below threshold)
+        ]
+        service = GraphService(db=db, embedding_provider=Mock(), max_edges_per_digest=2)
+        edges = {}
+
+        service._collect_semantic_edges([1, 5], 'digest', edges)
+
+        assert set(edges) == {
+            (1, 2, 'semantic'), (2, 1, 'semantic'),
+            (1, 3, 'semantic'), (3, 1, 'semantic'),
+        }
+        assert edges[(2, 1, 'semantic')][0] == pytest.approx(0.9)
+
+    def test_add_edge_keeps_higher_score(self):
+        edges = {}
+        GraphService._add_edge(edges, 1, 2, 'semantic', 0.6, {})
+        GraphService._add_edge(edges, 1, 2, 'semantic', 0.8, {})
+        GraphService._add_edge(edges, 1, 2, 'semantic', 0.7, {})
+
+        assert edges[(1, 2, 'semantic')][0] == 0.8
+
+
+class TestGraphAssembly:
+    """Bulk graph assembly and the traversal strategies."""
+
+    @pytest.fixture
+    def chain(self, db_session):
+        """Digests 0 -> 1 -> 2 -> 3 plus 0 -> 2, all tagged."""
+        source = Source(name="Chain Source", type="manual", url="https://chain.example.com", config={})
+        tag = Tag(name="chain-tag")
+        db_session.add_all([source, tag])
+        db_session.flush()
+
+        digests = []
+        for i in range(4):
+            digest = Digest(
+                title=f"Chain {i}",
+                url=f"https://chain.example.com/{i}",
+                content=f"Content {i}",
+                source_id=source.id,
+            )
+            db_session.add(digest)
+            db_session.flush()
+            db_session.add(DigestTag(digest_id=digest.id, tag_id=tag.id))
+            digests.append(digest)
+
+        for source_index, target_index, score in [(0, 1, 0.9), (1, 2, 0.8), (2, 3, 0.7), (0, 2, 0.6)]:
+            db_session.add(DigestRelationship(
+                source_digest_id=digests[source_index].id,
+                target_digest_id=digests[target_index].id,
+                relationship_type="semantic",
+                score=score,
+            ))
+        db_session.commit()
+        return digests
+
+    @staticmethod
+    def _digest_ids(data):
+        return [n.data['digest_id'] for n in data.nodes if n.type == "digest"]
+
+    def test_frontier_respects_depth(self, db_session, chain):
+        service = GraphService(db=db_session)
+
+        data = service.get_graph_data(center_digest_id=chain[0].id, depth=1, use_cache=False)
+
+        assert self._digest_ids(data) == [chain[0].id, chain[1].id, chain[2].id]
+        semantic = [(e.source, e.target) for e in data.edges if e.type == "semantic"]
+        assert semantic == [(f"d_{chain[0].id}", f"d_{chain[1].id}"), (f"d_{chain[0].id}", f"d_{chain[2].id}")]
+
+    def test_tag_counts_from_aggregate(self, db_session, chain):
+        service = GraphService(db=db_session)
+
+        data = service.get_graph_data(center_digest_id=chain[0].id, depth=0, use_cache=False)
+
+        tag_node = next(n for n in data.nodes if n.type == "tag")
+        assert tag_node.data['count'] == 4
+
+    def test_recursive_matches_frontier(self, db_session, chain):
+        service = GraphService(db=db_session)
+
+        for depth in (1, 2, 3):
+            frontier = service.get_graph_data(
+                center_digest_id=chain[0].id, depth=depth, use_cache=False
+            )
+            recursive = service.get_graph_data(
+                center_digest_id=chain[0].id, depth=depth, traversal='recursive', use_cache=False
+            )
+
+            assert set(self._digest_ids(recursive)) == set(self._digest_ids(frontier))
+            assert {(e.source, e.target, e.type) for e in recursive.edges} == {
+                (e.source, e.target, e.type) for e in frontier.edges
+            }
+
+    def test_cache_invalidated_by_new_relationship(self, db_session, chain):
+        service = GraphService(db=db_session)
+        center = chain[3].id
+
+        before = service.get_graph_data(center_digest_id=center, depth=1)
+        assert self._digest_ids(before) == [center]
+
+        db_session.add(DigestRelationship(
+            source_digest_id=center,
+            target_digest_id=chain[0].id,
+            relationship_type="semantic",
+            score=0.95,
+        ))
+        db_session.commit()
+
+        after = service.get_graph_data(center_digest_id=center, depth=1)
+        assert self._digest_ids(after) == [center, chain[0].id]
+
+
+    def test_cache_invalidated_by_renamed_tag(self, db_session, chain):
+        service = GraphService(db=db_session)
+
+        before = service.get_graph_data(center_digest_id=chain[0].id, depth=0)
+        tag_node = next(n for n in before.nodes if n.type == "tag")
+
+        tag = db_session.query(Tag).filter(Tag.name == tag_node.label).one()
+        tag.name = "renamed"
+        db_session.commit()
+
+        after = service.get_graph_data(center_digest_id=chain[0].id, depth=0)
+        assert [n.label for n in after.nodes if n.type == "tag"] == ["renamed"]
+
+
+class TestGraphCache:
+    """Graph cache behaviour (no database needed)."""
+
+    def test_get_graph_data_served_from_cache(self):
+        service = GraphService(db=Mock())
+        calls = []
+
+        def assemble(assembly, min_sim, limit, filtered_ids):
+            calls.append(limit)
+            assembly.nodes["d_1"] = GraphNode("d_1", "digest", "Digest 1")
+
+        with patch.object(service, '_graph_version', return_value=(1, 1, 1, 1)), \
+                patch.object(service, '_assemble_overview', side_effect=assemble):
+            first = service.get_graph_data(limit=7)
+            first.nodes.clear()
+            second = service.get_graph_data(limit=7)
+            service.get_graph_data(limit=8)
+
+        assert calls == [7, 8]
+        assert [n.id for n in second.nodes] == ["d_1"]
+
+    def test_stale_entries_dropped(self):
+        cache = _GraphCache()
+        cache.put(("key",), (1,), GraphData(nodes=[GraphNode("d_1", "digest", "Digest 1")]))
+
+        assert cache.get(("key",), (1,)) is not None
+        assert cache.get(("key",), (2,)) is None
+        assert cache.get(("key",), (1,)) is None
+
+    def test_least_recently_used_evicted(self):
+        cache = _GraphCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.put((key,), (1,), GraphData())
+        cache.get(("a",), (1,))
+        cache.put(("c",), (1,), GraphData())
+
+        assert cache.get(("a",), (1,)) is not None
+        assert cache.get(("b",), (1,)) is None
+
+
 class TestGraphNode:
     """Test GraphNode dataclass."""
 
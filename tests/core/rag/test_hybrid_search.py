@@ -1,4 +1,6 @@
 """Tests for HybridSearchService."""
+import asyncio
+import threading
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 import time
@@ -409,6 +411,56 @@ class TestHybridSearchService:
         assert stats['cache_enabled'] is True
 
 
+class TestHybridSearchConcurrency:
+    """Retrieval legs and title hydration (no database needed)."""
+
+    @pytest.fixture
+    def service(self, mock_embedding_provider):
+        db = Mock()
+        db.query.return_value.filter.return_value.all.return_value = [
+            Mock(id=1, title="Vector title"),
+        ]
+        return HybridSearchService(db=db, embedding_provider=mock_embedding_provider, enable_cache=False)
+
+    @pytest.mark.asyncio
+    async def test_fts_overlaps_query_embedding(self, service, mock_embedding_provider):
+        fts_started = threading.Event()
+
+        def fts_search(*args, **kwargs):
+            fts_started.set()
+            return [FTSSearchResult(2, "FTS title", None, 0.5, 'title')]
+
+        async def embed_single(query):
+            # Only completes if FTS is already running in another thread
+            assert await asyncio.to_thread(fts_started.wait, 2)
+            return [0.1] * 1024
+
+        mock_embedding_provider.embed_single = AsyncMock(side_effect=embed_single)
+
+        with patch.object(service.vector_service, 'search_sync',
+                          return_value=[VectorSearchResult(1, 1, 0, "chunk", 0.9, 0.1)]), \
+             patch.object(service.fts_service, 'search', side_effect=fts_search):
+            response = await service.search("query", mode='hybrid')
+
+        assert {r.digest_id for r in response.results} == {1, 2}
+
+    def test_titles_hydrated_in_one_query(self, service):
+        vector_results = [
+            VectorSearchResult(1, 1, 0, "chunk1", 0.9, 0.1),
+            VectorSearchResult(2, 3, 0, "chunk2", 0.8, 0.2),
+        ]
+        fts_results = [FTSSearchResult(2, "FTS title", None, 0.5, 'title')]
+
+        merged = service._merge_with_rrf(vector_results, fts_results, limit=10)
+
+        assert service.db.query.call_count == 1
+        titles = {r.digest_id: r.title for r in merged}
+        assert titles == {1: "Vector title", 2: "FTS title", 3: None}
+
+    def test_shared_session_not_isolated(self, service):
+        assert service._isolated_sessions() is False
+
+
 class TestChunkMatch:
     """Test ChunkMatch dataclass."""
 
@@ -0,0 +1,198 @@
+"""Tests for the background RAG indexing queue."""
+import threading
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from reconly_core.database.models import Digest, RAGIndexJob, Source
+from reconly_core.rag import index_queue
+from reconly_core.rag.index_queue import (
+    JOB_STATUS_FAILED,
+    JOB_STATUS_PENDING,
+    JOB_STATUS_RUNNING,
+    RAGIndexQueue,
+    RAGIndexWorker,
+    process_index_jobs,
+)
+
+
+def create_digests(db_session, count):
+    source = Source(name="Test", type="manual", url="https://test.example.com", config={})
+    db_session.add(source)
+    db_session.flush()
+
+    digests = []
+    for i in range(count):
+        digest = Digest(
+            title=f"Article {i}",
+            url=f"https://test.example.com/queued-{i}",
+            content=f"Content {i}",
+            source_id=source.id,
+        )
+        db_session.add(digest)
+        digests.append(digest)
+    db_session.flush()
+    return digests
+
+
+class TestRAGIndexQueue:
+    """Queue operations against the database."""
+
+    def test_enqueue_coalesces(self, db_session):
+        digests = create_digests(db_session, 2)
+        queue = RAGIndexQueue(db_session)
+
+        queue.enqueue([digests[0].id, digests[1].id, digests[0].id])
+        queue.enqueue([digests[0].id])
+        db_session.commit()
+
+        assert db_session.query(RAGIndexJob).count() == 2
+        assert queue.get_statistics() == {'pending': 2, 'running': 0, 'failed': 0}
+
+    def test_enqueue_resets_failed_job(self, db_session):
+        digest = create_digests(db_session, 1)[0]
+        db_session.add(RAGIndexJob(digest_id=digest.id, status=JOB_STATUS_FAILED, attempts=5, last_error="x"))
+        db_session.commit()
+
+        RAGIndexQueue(db_session).enqueue([digest.id])
+        db_session.commit()
+
+        job = db_session.query(RAGIndexJob).one()
+        db_session.refresh(job)
+        assert job.status == JOB_STATUS_PENDING
+        assert job.attempts == 0
+        assert job.last_error is None
+
+    def test_claim_skips_jobs_not_due(self, db_session):
+        digests = create_digests(db_session, 2)
+        db_session.add(RAGIndexJob(digest_id=digests[0].id))
+        db_session.add(RAGIndexJob(
+            digest_id=digests[1].id,
+            available_at=datetime.utcnow() + timedelta(minutes=5),
+        ))
+        db_session.commit()
+
+        jobs = RAGIndexQueue(db_session).claim(limit=10)
+
+        assert [job.digest_id for job in jobs] == [digests[0].id]
+        assert jobs[0].status == JOB_STATUS_RUNNING
+        assert jobs[0].attempts == 1
+
+    def test_release_stale(self, db_session):
+        digest = create_digests(db_session, 1)[0]
+        db_session.add(RAGIndexJob(
+            digest_id=digest.id,
+            status=JOB_STATUS_RUNNING,
+            locked_at=datetime.utcnow() - timedelta(hours=2),
+        ))
+        db_session.commit()
+
+        assert RAGIndexQueue(db_session).release_stale() == 1
+
+    def test_claim_releases_stale_jobs(self, db_session):
+        digests = create_digests(db_session, 2)
+        db_session.add(RAGIndexJob(
+            digest_id=digests[0].id,
+            status=JOB_STATUS_RUNNING,
+            locked_at=datetime.utcnow() - timedelta(hours=2),
+        ))
+        db_session.add(RAGIndexJob(
+            digest_id=digests[1].id,
+            status=JOB_STATUS_RUNNING,
+            locked_at=datetime.utcnow(),
+        ))
+        db_session.commit()
+
+        jobs = RAGIndexQueue(db_session).claim(limit=10)
+
+        assert [job.digest_id for job in jobs] == [digests[0].id]
+
+    def test_process_completes_and_retries(self, db_session):
+        digests = create_digests(db_session, 2)
+        RAGIndexQueue(db_session).enqueue([d.id for d in digests])
+        db_session.commit()
+
+        async def index(db, digest_ids):
+            return {digest_ids[0]: None, digest_ids[1]: "provider down"}
+
+        with patch.object(index_queue, 'index_digests', side_effect=index):
+            processed = process_index_jobs(db_session, limit=10, max_attempts=3)
+
+        assert processed == 2
+        job = db_session.query(RAGIndexJob).one()
+        assert job.digest_id == digests[1].id
+        assert job.status == JOB_STATUS_PENDING
+        assert job.available_at > datetime.utcnow()
+        assert job.last_error == "provider down"
+
+
+class TestRetryBackoff:
+    """fail() bookkeeping (no database needed)."""
+
+    def test_backoff_doubles_per_attempt(self):
+        queue = RAGIndexQueue(MagicMock(), max_attempts=5)
+        delays = []
+        for attempts in (1, 2, 3):
+            job = RAGIndexJob(digest_id=1, attempts=attempts, status=JOB_STATUS_RUNNING)
+            before = datetime.utcnow()
+            queue.fail(job, "error")
+            delays.append(round((job.available_at - before).total_seconds()))
+            assert job.status == JOB_STATUS_PENDING
+
+        assert delays == [60, 120, 240]
+
+    def test_marked_failed_after_max_attempts(self):
+        queue = RAGIndexQueue(MagicMock(), max_attempts=2)
+        job = RAGIndexJob(digest_id=1, attempts=2, status=JOB_STATUS_RUNNING)
+
+        queue.fail(job, "error" * 500)
+
+        assert job.status == JOB_STATUS_FAILED
+        assert len(job.last_error) == 1000
+
+
+class TestRAGIndexWorker:
+    """Worker thread lifecycle (no database needed)."""
+
+    def test_worker_processes_until_stopped(self):
+        batches = []
+        processed = threading.Event()
+
+        def fake_process(db, loop=None):
+            batches.append(loop)
+            if len(batches) >= 3:
+                processed.set()
+                return 0
+            return 1
+
+        with patch.object(index_queue, 'process_index_jobs', side_effect=fake_process):
+            worker = RAGIndexWorker(MagicMock(), poll_interval=0.01)
+            worker.start()
+            assert processed.wait(2)
+            worker.stop(timeout=2)
+
+        assert not worker.is_alive()
+        # One event loop per worker, reused across batches
+        assert len({id(loop) for loop in batches}) == 1
+
+    def test_worker_survives_errors(self):
+        calls = []
+        done = threading.Event()
+
+        def fake_process(db, loop=None):
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("database unavailable")
+            done.set()
+            return 0
+
+        with patch.object(index_queue, 'process_index_jobs', side_effect=fake_process):
+            worker = RAGIndexWorker(MagicMock(), poll_interval=0.01)
+            worker.start()
+            assert done.wait(2)
+            worker.stop(timeout=2)
+
+        assert len(calls) >= 2
+
+    def test_start_with_zero_workers(self):
+        assert index_queue.start_index_workers(MagicMock(), workers=0) == 0
+        assert not index_queue.index_workers_running()
@@ -1,7 +1,7 @@
 """Tests for VectorSearchService."""
 import pytest
 import numpy as np
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock, AsyncMock, patch
 
 from reconly_core.rag.search.vector import VectorSearchService, VectorSearchResult
 from reconly_core.database.models import Digest, DigestChunk, FeedRun, Source
@@ -65,6 +65,8 @@ class TestVectorSearchService:
                 start_char=idx * 100,
                 end_char=(idx + 1) * 100,
                 embedding=emb,
+                source_id=digest.source_id,
+                digest_created_at=digest.created_at,
             )
             db_session.add(chunk)
 
@@ -137,8 +139,10 @@ class TestVectorSearchService:
         db_session.add(feed_run)
         db_session.flush()
 
-        # Update digest with feed_run_id
+        # Update digest with feed_run_id (and the chunks' denormalized feed_id)
         sample_digest_with_chunks.feed_run_id = feed_run.id
+        for chunk in sample_digest_with_chunks.chunks:
+            chunk.feed_id = feed.id
         db_session.commit()
 
         results = await vector_service.search("test", feed_id=feed.id, chunk_source='digest')
@@ -189,6 +193,56 @@ class TestVectorSearchService:
             assert result.source_type == 'digest'
 
 
+class TestFilteredScanPlanning:
+    """Exact vs HNSW scan selection (no database needed)."""
+
+    @pytest.fixture
+    def service(self):
+        service = VectorSearchService(Mock(), Mock())
+        service._scan_settings = (100, 2000)
+        return service
+
+    def _executed_sql(self, service):
+        return [str(call.args[0]) for call in service.db.execute.call_args_list]
+
+    def test_small_filtered_set_uses_exact_scan(self, service):
+        service.db.execute.return_value.scalar.return_value = 50
+        distance = DigestChunk.embedding.cosine_distance([0.1] * 3)
+
+        order_by = service._plan_scan(DigestChunk, [DigestChunk.feed_id == 1], distance, limit=10)
+
+        assert "+" in str(order_by)
+        assert not any("set_config" in sql for sql in self._executed_sql(service))
+
+    def test_large_filtered_set_uses_iterative_index_scan(self, service):
+        service.db.execute.return_value.scalar.return_value = 2001
+        distance = DigestChunk.embedding.cosine_distance([0.1] * 3)
+
+        with patch.object(service, '_supports_iterative_scan', return_value=True):
+            order_by = service._plan_scan(DigestChunk, [DigestChunk.feed_id == 1], distance, limit=10)
+
+        assert order_by is distance
+        executed = self._executed_sql(service)
+        assert any("hnsw.ef_search" in sql for sql in executed)
+        assert any("hnsw.iterative_scan" in sql for sql in executed)
+
+    def test_unfiltered_search_raises_ef_search_to_limit(self, service):
+        distance = DigestChunk.embedding.cosine_distance([0.1] * 3)
+
+        with patch.object(service, '_supports_iterative_scan', return_value=True):
+            service._plan_scan(DigestChunk, [], distance, limit=500)
+
+        assert service.db.execute.call_count == 1
+        assert service.db.execute.call_args.args[1] == {'value': '500'}
+
+    def test_filter_conditions_use_chunk_columns(self, service):
+        conditions = service._filter_conditions(DigestChunk, feed_id=1, source_id=2, days=7)
+
+        assert [condition.left.name for condition in conditions] == [
+            'feed_id', 'source_id', 'digest_created_at',
+        ]
+
+
 class TestVectorSearchResult:
     """Test the VectorSearchResult dataclass."""
 
@@ -0,0 +1,146 @@
+"""Tests for parallel source processing primitives."""
+import threading
+import time
+
+import pytest
+
+from reconly_core.services.concurrency import (
+    GlobalWorkerPool,
+    HostThrottle,
+    get_global_worker_pool,
+    get_host,
+)
+from reconly_core.services.feed_service import _RunMetrics
+
+
+class TestGetHost:
+    """Tests for host extraction."""
+
+    def test_extracts_lowercase_host(self):
+        assert get_host("https://Example.COM/feed.xml") == "example.com"
+
+    def test_returns_none_for_prompt_text(self):
+        assert get_host("Research the latest AI news") is None
+
+    def test_returns_none_for_empty(self):
+        assert get_host(None) is None
+        assert get_host("") is None
+
+
+class TestGlobalWorkerPool:
+    """Tests for the process-wide worker cap."""
+
+    def test_limits_concurrent_slots(self):
+        pool = GlobalWorkerPool(limit=2)
+        peak = 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal peak
+            with pool.slot():
+                with lock:
+                    peak = max(peak, pool.active)
+                time.sleep(0.02)
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert peak == 2
+        assert pool.active == 0
+
+    def test_limit_is_at_least_one(self):
+        pool = GlobalWorkerPool(limit=0)
+        assert pool.limit == 1
+
+    def test_get_global_worker_pool_updates_limit(self):
+        pool = get_global_worker_pool()
+        original = pool.limit
+        try:
+            assert get_global_worker_pool(original + 3).limit == original + 3
+            assert get_global_worker_pool() is pool
+        finally:
+            pool.set_limit(original)
+
+
+class TestHostThrottle:
+    """Tests for per-host politeness limits."""
+
+    def test_limits_concurrency_per_host(self):
+        throttle = HostThrottle(max_per_host=1)
+        active = {"a.com": 0, "b.com": 0}
+        peak = {"a.com": 0, "b.com": 0}
+        lock = threading.Lock()
+
+        def work(host):
+            with throttle.acquire(f"https://{host}/feed"):
+                with lock:
+                    active[host] += 1
+                    peak[host] = max(peak[host], active[host])
+                time.sleep(0.02)
+                with lock:
+                    active[host] -= 1
+
+        threads = [threading.Thread(target=work, args=(h,)) for h in ["a.com", "b.com"] * 3]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert peak == {"a.com": 1, "b.com": 1}
+
+    def test_delay_applies_per_host(self):
+        throttle = HostThrottle(max_per_host=4, delay_between=0.1)
+
+        start = time.monotonic()
+        with throttle.acquire("https://a.com/1"):
+            pass
+        with throttle.acquire("https://b.com/1"):
+            pass
+        # Different hosts do not wait on each other
+        assert time.monotonic() - start < 0.05
+
+        with throttle.acquire("https://a.com/2"):
+            pass
+        # Second request to the same host is spaced by delay_between
+        assert time.monotonic() - start >= 0.09
+
+    def test_urls_without_host_pass_through(self):
+        throttle = HostThrottle(max_per_host=1, delay_between=10)
+        start = time.monotonic()
+        with throttle.acquire("agent research prompt"):
+            with throttle.acquire("agent research prompt"):
+                pass
+        assert time.monotonic() - start < 0.05
+
+
+class TestRunMetricsMerge:
+    """Tests for merging per-worker metrics."""
+
+    def test_merge_accumulates_counts_and_errors(self):
+        total = _RunMetrics(sources_processed=1, items_processed=3, total_cost=0.5)
+        worker = _RunMetrics(
+            sources_processed=1,
+            sources_failed=1,
+            sources_not_modified=1,
+            items_processed=2,
+            total_tokens_in=100,
+            total_tokens_out=50,
+            total_cost=0.25,
+            errors=["Source: boom"],
+            structured_errors=[{"source_id": 2}],
+        )
+
+        total.merge(worker)
+
+        assert total.sources_processed == 2
+        assert total.sources_failed == 1
+        assert total.sources_not_modified == 1
+        assert total.items_processed == 5
+        assert total.total_tokens_in == 100
+        assert total.total_tokens_out == 50
+        assert total.total_cost == pytest.approx(0.75)
+        assert total.errors == ["Source: boom"]
+        assert total.structured_errors == [{"source_id": 2}]
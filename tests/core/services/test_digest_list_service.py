@@ -0,0 +1,21 @@
+"""Tests for digest list cursors."""
+from datetime import datetime
+
+import pytest
+
+from reconly_core.services.digest_list_service import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 2, 9, 12, 30, 15, 123456)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "!!!", encode_cursor(datetime(2026, 1, 1), 1)[:-3]])
+def test_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
@@ -0,0 +1,95 @@
+"""Tests for conditional feed fetching in FeedService."""
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from reconly_core.fetchers.base import HTTPValidators
+from reconly_core.services.feed_service import FeedRunOptions, FeedService
+
+
+def _source(url="https://example.com/feed"):
+    source = MagicMock()
+    source.id = 1
+    source.name = "Example"
+    source.url = url
+    source.config = {}
+    source.include_keywords = None
+    source.exclude_keywords = None
+    return source
+
+
+@pytest.fixture
+def service():
+    service = FeedService()
+    service._tracker = MagicMock()
+    service._tracker.get_last_read.return_value = None
+    service._tracker.get_validators.return_value = {"etag": '"v1"', "last_modified": None}
+    return service
+
+
+@pytest.fixture(autouse=True)
+def _settings():
+    with patch("reconly_core.services.settings_service.SettingsService.get", return_value=False):
+        yield
+
+
+class TestConditionalRSSFetch:
+    """Tests for validators handling in FeedService._process_rss_source()."""
+
+    def _process(self, service, fetcher, options=None):
+        return service._process_rss_source(
+            source=_source(),
+            feed=MagicMock(),
+            feed_run=MagicMock(),
+            summarizer=MagicMock(),
+            language="en",
+            options=options or FeedRunOptions(),
+            session=MagicMock(),
+            fetcher=fetcher,
+        )
+
+    def test_not_modified_skips_processing(self, service):
+        fetcher = MagicMock()
+
+        def fetch(url, validators=None, **kwargs):
+            assert validators == HTTPValidators(etag='"v1"')
+            validators.not_modified = True
+            return []
+
+        fetcher.fetch.side_effect = fetch
+
+        result = self._process(service, fetcher)
+
+        assert result == {"success": True, "items_count": 0, "not_modified": True}
+        service._tracker.update_validators.assert_not_called()
+        service._tracker.update_last_read.assert_not_called()
+
+    def test_new_validators_stored_when_nothing_new(self, service):
+        fetcher = MagicMock()
+
+        def fetch(url, validators=None, **kwargs):
+            validators.etag = '"v2"'
+            validators.last_modified = "Wed, 31 Dec 2025 10:00:00 GMT"
+            return []
+
+        fetcher.fetch.side_effect = fetch
+
+        result = self._process(service, fetcher)
+
+        assert result == {"success": True, "items_count": 0}
+        service._tracker.update_validators.assert_called_once_with(
+            "https://example.com/feed", '"v2"', "Wed, 31 Dec 2025 10:00:00 GMT",
+        )
+
+    def test_dry_run_does_not_store_validators(self, service):
+        fetcher = MagicMock()
+
+        def fetch(url, validators=None, **kwargs):
+            validators.etag = '"v2"'
+            return []
+
+        fetcher.fetch.side_effect = fetch
+
+        self._process(service, fetcher, FeedRunOptions(dry_run=True))
+
+        service._tracker.update_validators.assert_not_called()
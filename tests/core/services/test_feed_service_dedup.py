@@ -0,0 +1,45 @@
+"""Tests for FeedService batch URL dedup (_existing_digest_urls)."""
+from unittest.mock import patch
+
+from reconly_core.services import feed_service as feed_service_module
+from reconly_core.services.feed_service import FeedService
+
+
+class TestExistingDigestUrls:
+    """Tests for FeedService._existing_digest_urls()."""
+
+    def test_returns_only_urls_with_digests(self, db_session, digest_factory):
+        digest_factory(url="https://example.com/known-1")
+        digest_factory(url="https://example.com/known-2")
+        service = FeedService()
+
+        existing = service._existing_digest_urls(
+            [
+                "https://example.com/known-1",
+                "https://example.com/new",
+                "https://example.com/known-2",
+                None,
+                "",
+            ],
+            db_session,
+        )
+
+        assert existing == {"https://example.com/known-1", "https://example.com/known-2"}
+
+    def test_empty_input_skips_query(self, db_session):
+        service = FeedService()
+
+        with patch.object(db_session, "query") as query:
+            assert service._existing_digest_urls([None, ""], db_session) == set()
+        query.assert_not_called()
+
+    def test_large_batches_are_chunked(self, db_session, digest_factory):
+        digest_factory(url="https://example.com/item-0")
+        digest_factory(url="https://example.com/item-6")
+        service = FeedService()
+        urls = [f"https://example.com/item-{i}" for i in range(7)]
+
+        with patch.object(feed_service_module, "DIGEST_URL_LOOKUP_CHUNK", 3):
+            existing = service._existing_digest_urls(urls, db_session)
+
+        assert existing == {"https://example.com/item-0", "https://example.com/item-6"}
@@ -103,7 +103,7 @@ def create_source_content(db_session, digest, source, content="Original article
 def query_unembedded_source_content(db_session, digest_ids):
     """Query for source content that needs embedding.
 
-    This mirrors the query used in _process_rag_for_feed_run().
+    This mirrors the query used in rag.index_queue.index_digests().
     """
     return db_session.query(SourceContent).join(
         DigestSourceItem,
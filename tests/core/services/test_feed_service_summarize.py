@@ -0,0 +1,43 @@
+"""Tests for FeedService._summarize_items() digest writes."""
+from unittest.mock import MagicMock, patch
+
+from reconly_core.database.models import Digest
+from reconly_core.services import feed_service as feed_service_module
+from reconly_core.services.feed_service import FeedRunOptions, FeedService
+
+
+def _save_digest(result, source, feed, feed_run, session):
+    digest = Digest(url=result["url"], title=result["title"])
+    session.add(digest)
+    session.flush()
+    return digest
+
+
+class TestSummarizeItemsPersist:
+    """A failed digest write must not break the rest of its batch."""
+
+    def test_failed_write_is_rolled_back_per_item(self, db_session, digest_factory):
+        digest_factory(url="https://example.com/taken")
+        items = [
+            {"url": f"https://example.com/{name}", "title": name}
+            for name in ("first", "taken", "last")
+        ]
+        summarizer = MagicMock()
+        summarizer.summarize.side_effect = lambda item, **kwargs: dict(item)
+        errors = []
+        service = FeedService()
+
+        with patch.object(feed_service_module, "SummaryCache") as cache_cls, \
+                patch.object(service, "_save_digest", side_effect=_save_digest), \
+                patch.object(service, "_log_llm_usage"):
+            cache_cls.return_value.get.return_value = None
+            totals = service._summarize_items(
+                items, MagicMock(id=1), MagicMock(), MagicMock(), summarizer,
+                "en", None, FeedRunOptions(), db_session,
+                on_error=lambda item, error: errors.append(item["url"]),
+            )
+
+        assert totals["items_count"] == 2
+        assert errors == ["https://example.com/taken"]
+        saved = {url for (url,) in db_session.query(Digest.url).filter(Digest.title.in_(["first", "last"]))}
+        assert saved == {"https://example.com/first", "https://example.com/last"}
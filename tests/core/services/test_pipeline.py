@@ -0,0 +1,145 @@
+"""Tests for the staged summarize → persist pipeline."""
+import threading
+import time
+
+from reconly_core.logging import generate_trace_id, get_trace_id, clear_trace_id
+from reconly_core.services.pipeline import SummarizePipeline
+
+
+def _items(n):
+    return [{"title": f"Item {i}", "url": f"https://example.com/{i}"} for i in range(n)]
+
+
+class TestSummarizePipeline:
+    """Tests for SummarizePipeline."""
+
+    def test_inline_mode_persists_in_batches(self):
+        batches = []
+        pipeline = SummarizePipeline(
+            summarize=lambda item: {"summary": item["title"]},
+            persist=batches.append,
+            workers=1,
+            batch_size=2,
+        )
+
+        stats = pipeline.run(_items(5))
+
+        assert stats.submitted == 5
+        assert stats.summarized == 5
+        assert stats.failed == 0
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert stats.batches_written == 3
+
+    def test_concurrent_mode_persists_all_items(self):
+        persisted = []
+        pipeline = SummarizePipeline(
+            summarize=lambda item: {"summary": item["title"]},
+            persist=lambda batch: persisted.extend(batch),
+            workers=4,
+            batch_size=3,
+        )
+
+        stats = pipeline.run(_items(10))
+
+        assert stats.summarized == 10
+        assert sorted(item["url"] for item, _ in persisted) == sorted(i["url"] for i in _items(10))
+
+    def test_summarize_runs_concurrently(self):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def summarize(item):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return {}
+
+        SummarizePipeline(summarize=summarize, persist=lambda b: None, workers=3).run(_items(9))
+
+        assert peak == 3
+
+    def test_persist_runs_on_calling_thread(self):
+        caller = threading.get_ident()
+        persist_threads = set()
+
+        pipeline = SummarizePipeline(
+            summarize=lambda item: {},
+            persist=lambda batch: persist_threads.add(threading.get_ident()),
+            workers=4,
+            batch_size=1,
+        )
+        pipeline.run(_items(6))
+
+        assert persist_threads == {caller}
+
+    def test_intake_is_bounded(self):
+        """Intake pauses while max_pending items are in flight."""
+        in_flight = 0
+        peak_in_flight = 0
+        lock = threading.Lock()
+
+        def source():
+            nonlocal in_flight, peak_in_flight
+            for item in _items(20):
+                with lock:
+                    in_flight += 1
+                    peak_in_flight = max(peak_in_flight, in_flight)
+                yield item
+
+        def persist(batch):
+            nonlocal in_flight
+            with lock:
+                in_flight -= len(batch)
+
+        def summarize(item):
+            time.sleep(0.005)
+            return {}
+
+        SummarizePipeline(
+            summarize=summarize, persist=persist, workers=2, batch_size=1, max_pending=4,
+        ).run(source())
+
+        assert peak_in_flight <= 5
+
+    def test_errors_are_reported_and_skipped(self):
+        errors = []
+        persisted = []
+
+        def summarize(item):
+            if item["title"] == "Item 1":
+                raise RuntimeError("LLM unavailable")
+            return {}
+
+        for workers in (1, 3):
+            errors.clear()
+            persisted.clear()
+            stats = SummarizePipeline(
+                summarize=summarize,
+                persist=persisted.extend,
+                workers=workers,
+                on_error=lambda item, e: errors.append((item["title"], str(e))),
+            ).run(_items(3))
+
+            assert stats.failed == 1
+            assert stats.summarized == 2
+            assert errors == [("Item 1", "LLM unavailable")]
+            assert len(persisted) == 2
+
+    def test_trace_id_propagates_to_workers(self):
+        trace_id = generate_trace_id()
+        seen = set()
+        try:
+            SummarizePipeline(
+                summarize=lambda item: seen.add(get_trace_id()) or {},
+                persist=lambda b: None,
+                workers=2,
+            ).run(_items(4))
+        finally:
+            clear_trace_id()
+
+        assert seen == {trace_id}
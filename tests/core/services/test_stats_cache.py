@@ -0,0 +1,82 @@
+"""Tests for the dashboard/analytics stats cache."""
+from reconly_core.database.models import Source, Tag
+from reconly_core.services.stats_cache import StatsCache, get_stats_cache
+
+
+class TestStatsCache:
+
+    def test_caches_computed_value(self):
+        cache = StatsCache(ttl_seconds=60)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"count": len(calls)}
+
+        assert cache.get_or_compute("key", compute) == {"count": 1}
+        assert cache.get_or_compute("key", compute) == {"count": 1}
+        assert len(calls) == 1
+
+    def test_expired_value_is_recomputed(self):
+        cache = StatsCache(ttl_seconds=0)
+        values = iter([1, 2])
+
+        assert cache.get_or_compute("key", lambda: next(values)) == 1
+        assert cache.get_or_compute("key", lambda: next(values)) == 2
+
+    def test_invalidate(self):
+        cache = StatsCache(ttl_seconds=60)
+        cache.get_or_compute("key", lambda: 1)
+        cache.invalidate()
+        assert cache.get_or_compute("key", lambda: 2) == 2
+
+
+class TestWriteInvalidation:
+
+    def test_commit_of_tracked_table_invalidates(self, db_session):
+        cache = get_stats_cache()
+        cache.invalidate()
+        cache.get_or_compute("sources", lambda: 0)
+
+        db_session.add(Source(name="New", type="rss", url="https://example.com/feed.xml"))
+        db_session.commit()
+
+        assert cache.get_or_compute("sources", lambda: 1) == 1
+
+    def test_commit_of_untracked_table_keeps_cache(self, db_session):
+        cache = get_stats_cache()
+        cache.invalidate()
+        cache.get_or_compute("sources", lambda: 0)
+
+        db_session.add(Tag(name="untracked"))
+        db_session.commit()
+
+        assert cache.get_or_compute("sources", lambda: 1) == 0
+
+    def test_released_savepoint_waits_for_outer_commit(self, db_session):
+        cache = get_stats_cache()
+        cache.invalidate()
+        cache.get_or_compute("sources", lambda: 0)
+
+        with db_session.begin_nested():
+            db_session.add(Source(name="Nested", type="rss", url="https://example.com/nested.xml"))
+
+        assert cache.get_or_compute("sources", lambda: 1) == 0
+        db_session.commit()
+        assert cache.get_or_compute("sources", lambda: 2) == 2
+
+    def test_rolled_back_savepoint_keeps_outer_write(self, db_session):
+        cache = get_stats_cache()
+        cache.invalidate()
+        cache.get_or_compute("sources", lambda: 0)
+
+        db_session.add(Source(name="Outer", type="rss", url="https://example.com/outer.xml"))
+        db_session.flush()
+        savepoint = db_session.begin_nested()
+        db_session.add(Tag(name="discarded"))
+        db_session.flush()
+        savepoint.rollback()
+        db_session.commit()
+
+        assert cache.get_or_compute("sources", lambda: 1) == 1
+
@@ -0,0 +1,177 @@
+"""Tests for the content-addressed summary cache."""
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from reconly_core.database.models import SummaryCacheEntry
+from reconly_core.services.summary_cache import (
+    SummaryCache,
+    compute_cache_key,
+    get_summary_cache_stats,
+    reset_summary_cache_stats,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    reset_summary_cache_stats()
+    yield
+    reset_summary_cache_stats()
+
+
+def _summarizer(summary="A summary"):
+    summarizer = MagicMock()
+    summarizer.get_model_info.return_value = {"provider": "ollama", "model": "llama3.2"}
+
+    def summarize(content_data, language="en", system_prompt=None, user_prompt=None):
+        result = dict(content_data)
+        result["summary"] = summary
+        result["summary_language"] = language
+        result["model_info"] = {
+            "provider": "ollama",
+            "model": "llama3.2",
+            "input_tokens": 100,
+            "output_tokens": 20,
+        }
+        result["estimated_cost"] = 0.01
+        return result
+
+    summarizer.summarize.side_effect = summarize
+    return summarizer
+
+
+def _item(url="https://example.com/a", content="Same article body"):
+    return {"url": url, "title": "Article", "content": content, "source_type": "rss"}
+
+
+class TestComputeCacheKey:
+    """Tests for compute_cache_key()."""
+
+    def test_key_is_stable(self):
+        args = ("content", "ollama", "llama3.2", "en", "system", "user")
+        assert compute_cache_key(*args) == compute_cache_key(*args)
+        assert len(compute_cache_key(*args)) == 64
+
+    @pytest.mark.parametrize("index,value", [
+        (0, "other content"),
+        (1, "openai"),
+        (2, "gpt-4o"),
+        (3, "de"),
+        (4, "other system"),
+        (5, "other user"),
+    ])
+    def test_each_component_changes_key(self, index, value):
+        args = ["content", "ollama", "llama3.2", "en", "system", "user"]
+        changed = list(args)
+        changed[index] = value
+        assert compute_cache_key(*args) != compute_cache_key(*changed)
+
+    def test_system_and_user_prompts_not_interchangeable(self):
+        assert compute_cache_key("a", "p", "m", "en", None, "x") != compute_cache_key("a", "p", "m", "en", "x", None)
+
+
+class TestSummaryCacheDisabled:
+    """Disabled cache passes straight through without touching the session."""
+
+    def test_summarize_calls_provider(self):
+        session = MagicMock()
+        cache = SummaryCache(session, enabled=False, ttl_days=30, max_entries=100)
+        summarizer = _summarizer()
+
+        result = cache.summarize(summarizer, _item(), language="en")
+
+        assert result["summary"] == "A summary"
+        assert summarizer.summarize.call_count == 1
+        session.query.assert_not_called()
+        session.add.assert_not_called()
+        assert cache.prune() == 0
+
+
+class TestSummaryCache:
+    """Database-backed cache behaviour."""
+
+    @pytest.fixture
+    def cache(self, db_session):
+        return SummaryCache(db_session, enabled=True, ttl_days=30, max_entries=100)
+
+    def test_hit_reuses_summary_for_new_url(self, cache, db_session):
+        summarizer = _summarizer()
+
+        first = cache.summarize(summarizer, _item("https://a.example.com/x"), language="en")
+        second = cache.summarize(summarizer, _item("https://b.example.com/y?utm=1"), language="en")
+
+        assert summarizer.summarize.call_count == 1
+        assert second["summary"] == first["summary"]
+        assert second["url"] == "https://b.example.com/y?utm=1"
+        assert second["model_info"]["cached"] is True
+        assert second["model_info"]["input_tokens"] == 0
+        assert second["estimated_cost"] == 0.0
+
+        stats = get_summary_cache_stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.stores == 1
+
+        entry = db_session.query(SummaryCacheEntry).one()
+        assert entry.hit_count == 1
+
+    def test_different_prompt_misses(self, cache):
+        summarizer = _summarizer()
+
+        cache.summarize(summarizer, _item(), language="en", system_prompt="Be brief")
+        cache.summarize(summarizer, _item(), language="en", system_prompt="Be detailed")
+
+        assert summarizer.summarize.call_count == 2
+
+    def test_store_false_skips_write(self, cache, db_session):
+        cache.summarize(_summarizer(), _item(), language="en", store=False)
+
+        assert db_session.query(SummaryCacheEntry).count() == 0
+
+    def test_fallback_results_not_stored(self, cache, db_session):
+        key = cache.make_key(_summarizer(), _item(), "en")
+        cache.put(key, {"summary": "x", "fallback_used": True, "model_info": {}}, _item())
+
+        assert db_session.query(SummaryCacheEntry).count() == 0
+
+    def test_duplicate_put_keeps_first_entry(self, cache, db_session):
+        summarizer = _summarizer()
+        key = cache.make_key(summarizer, _item(), "en")
+        result = summarizer.summarize(_item(), language="en")
+
+        cache.put(key, result, _item())
+        cache.put(key, dict(result, summary="second"), _item())
+
+        assert db_session.query(SummaryCacheEntry).one().summary == "A summary"
+
+    def test_expired_entry_is_a_miss(self, cache, db_session):
+        summarizer = _summarizer()
+        cache.summarize(summarizer, _item(), language="en")
+        entry = db_session.query(SummaryCacheEntry).one()
+        entry.created_at = datetime.utcnow() - timedelta(days=31)
+        db_session.flush()
+
+        cache.summarize(summarizer, _item(), language="en")
+
+        assert summarizer.summarize.call_count == 2
+
+    def test_prune_evicts_expired_and_least_recently_used(self, db_session):
+        cache = SummaryCache(db_session, enabled=True, ttl_days=30, max_entries=2)
+        summarizer = _summarizer()
+        for i in range(4):
+            cache.summarize(summarizer, _item(content=f"body {i}"), language="en")
+
+        entries = db_session.query(SummaryCacheEntry).order_by(SummaryCacheEntry.id).all()
+        now = datetime.utcnow()
+        entries[0].created_at = now - timedelta(days=60)  # expired
+        for offset, entry in enumerate(entries[1:]):
+            entry.last_hit_at = now - timedelta(minutes=10 - offset)
+        db_session.flush()
+
+        removed = cache.prune()
+
+        assert removed == 2
+        remaining = {e.content_hash for e in db_session.query(SummaryCacheEntry).all()}
+        assert remaining == {entries[2].content_hash, entries[3].content_hash}
+        assert get_summary_cache_stats().evictions == 2
@@ -0,0 +1,155 @@
+"""Tests for daily LLM usage rollups."""
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from reconly_core.database.models import Feed, FeedRun, LLMUsageLog, LLMUsageRollup
+from reconly_core.services.feed_service import FeedService
+from reconly_core.services.usage_rollup_service import UsageRollupService
+
+
+@pytest.fixture
+def feed(db_session):
+    feed = Feed(name="Rollup Feed")
+    db_session.add(feed)
+    db_session.flush()
+    return feed
+
+
+def _run_with_usage(db_session, feed, usages):
+    """Create a completed feed run with (timestamp, provider, model, tokens_in, tokens_out, cost) logs."""
+    feed_run = FeedRun(feed_id=feed.id, triggered_by="manual", status="completed")
+    db_session.add(feed_run)
+    db_session.flush()
+    for timestamp, provider, model, tokens_in, tokens_out, cost in usages:
+        db_session.add(LLMUsageLog(
+            feed_run_id=feed_run.id,
+            provider=provider,
+            model=model,
+            tokens_in=tokens_in,
+            tokens_out=tokens_out,
+            cost=cost,
+            timestamp=timestamp,
+        ))
+    db_session.flush()
+    return feed_run
+
+
+class TestUsageRollupService:
+
+    def test_refresh_feed_run_aggregates_per_day_and_model(self, db_session, feed):
+        now = datetime.utcnow()
+        feed_run = _run_with_usage(db_session, feed, [
+            (now, "ollama", "llama3.2", 100, 10, 0.0),
+            (now, "ollama", "llama3.2", 50, 5, 0.0),
+            (now, "anthropic", "claude", 200, 20, 0.5),
+        ])
+
+        service = UsageRollupService(db_session)
+        assert service.refresh_feed_run(feed_run.id) == 2
+
+        rows = db_session.query(LLMUsageRollup).order_by(LLMUsageRollup.provider).all()
+        assert [(r.provider, r.requests, r.tokens_in, r.tokens_out) for r in rows] == [
+            ("anthropic", 1, 200, 20),
+            ("ollama", 2, 150, 15),
+        ]
+        assert all(r.feed_id == feed.id and r.day == now.date() for r in rows)
+
+    def test_refresh_is_idempotent_and_includes_other_runs_of_the_day(self, db_session, feed):
+        now = datetime.utcnow()
+        first = _run_with_usage(db_session, feed, [(now, "ollama", "llama3.2", 100, 10, 0.0)])
+        second = _run_with_usage(db_session, feed, [(now, "ollama", "llama3.2", 40, 4, 0.0)])
+
+        service = UsageRollupService(db_session)
+        service.refresh_feed_run(first.id)
+        service.refresh_feed_run(second.id)
+        service.refresh_feed_run(second.id)
+
+        assert service.totals() == {"requests": 2, "tokens_in": 140, "tokens_out": 14, "cost": 0.0}
+
+    def test_refresh_updates_existing_rows_in_place(self, db_session, feed):
+        now = datetime.utcnow()
+        feed_run = _run_with_usage(db_session, feed, [(now, "ollama", "llama3.2", 100, 10, 0.0)])
+        service = UsageRollupService(db_session)
+        service.refresh_feed_run(feed_run.id)
+
+        # More usage logged by the same run after the first refresh
+        db_session.add(LLMUsageLog(
+            feed_run_id=feed_run.id, provider="ollama", model="llama3.2",
+            tokens_in=30, tokens_out=3, cost=0.0, timestamp=now,
+        ))
+        db_session.flush()
+        service.refresh_feed_run(feed_run.id)
+
+        rows = db_session.query(LLMUsageRollup).all()
+        assert len(rows) == 1
+        db_session.refresh(rows[0])
+        assert (rows[0].requests, rows[0].tokens_in) == (2, 130)
+
+    def test_totals_since_day(self, db_session, feed):
+        now = datetime.utcnow()
+        feed_run = _run_with_usage(db_session, feed, [
+            (now, "ollama", "llama3.2", 100, 10, 0.0),
+            (now - timedelta(days=10), "ollama", "llama3.2", 1000, 100, 0.0),
+        ])
+        service = UsageRollupService(db_session)
+        service.refresh_feed_run(feed_run.id)
+
+        assert service.totals(since=now.date())["tokens_in"] == 100
+        assert service.totals()["tokens_in"] == 1100
+        assert [r["tokens_in"] for r in service.tokens_by_day()] == [1000, 100]
+
+    def test_tokens_by_model(self, db_session, feed):
+        now = datetime.utcnow()
+        feed_run = _run_with_usage(db_session, feed, [
+            (now, "ollama", "llama3.2", 100, 10, 0.0),
+            (now, "ollama", "qwen", 30, 3, 0.0),
+        ])
+        service = UsageRollupService(db_session)
+        service.refresh_feed_run(feed_run.id)
+
+        by_model = sorted(service.tokens_by_model(), key=lambda r: r["model"])
+        assert by_model == [
+            {"provider": "ollama", "model": "llama3.2", "tokens_in": 100, "tokens_out": 10},
+            {"provider": "ollama", "model": "qwen", "tokens_in": 30, "tokens_out": 3},
+        ]
+
+    def test_rebuild_includes_usage_without_feed_run(self, db_session, feed):
+        now = datetime.utcnow()
+        _run_with_usage(db_session, feed, [(now, "ollama", "llama3.2", 100, 10, 0.0)])
+        db_session.add(LLMUsageLog(provider="openai", model="gpt-4o", tokens_in=5, tokens_out=1, timestamp=now))
+        db_session.flush()
+
+        service = UsageRollupService(db_session)
+        assert service.rebuild() == 2
+        assert service.totals()["requests"] == 2
+        assert db_session.query(LLMUsageRollup).filter(LLMUsageRollup.feed_id.is_(None)).count() == 1
+
+
+def test_models_keep_their_own_to_dict():
+    assert LLMUsageLog(provider="ollama", model="llama3.2").to_dict()["provider"] == "ollama"
+    rollup = LLMUsageRollup(provider="ollama", model="llama3.2", requests=1, tokens_in=2, tokens_out=3, cost=0.0)
+    assert rollup.to_dict()["requests"] == 1
+
+
+class TestFailedRunRollupRefresh:
+    """Tests for FeedService._refresh_usage_rollups() on the run failure path."""
+
+    def test_refreshes_and_commits(self):
+        session = MagicMock()
+        with patch("reconly_core.services.feed_service.UsageRollupService") as service_cls:
+            FeedService()._refresh_usage_rollups(7, session)
+
+        session.rollback.assert_called_once()
+        service_cls.return_value.refresh_feed_run.assert_called_once_with(7)
+        session.commit.assert_called_once()
+
+    def test_refresh_error_is_not_raised(self):
+        session = MagicMock()
+        with patch("reconly_core.services.feed_service.UsageRollupService") as service_cls:
+            service_cls.return_value.refresh_feed_run.side_effect = RuntimeError("db down")
+            FeedService()._refresh_usage_rollups(7, session)
+
+        session.commit.assert_not_called()
+        assert session.rollback.call_count == 2
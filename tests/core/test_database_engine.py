@@ -0,0 +1,57 @@
+"""Tests for the process-wide database engine registry."""
+from unittest.mock import patch
+
+from reconly_core.database.engine import get_session_factory, get_shared_engine
+from reconly_core.services.feed_service import FeedService
+
+SQLITE_URL = "sqlite:///file:engine_registry?mode=memory&uri=true"
+
+
+class TestSharedEngine:
+    """One engine per database URL, reused by every caller."""
+
+    def test_same_url_returns_same_engine(self):
+        assert get_shared_engine(SQLITE_URL) is get_shared_engine(SQLITE_URL)
+
+    def test_different_urls_get_different_engines(self):
+        other = "sqlite:///file:engine_registry_other?mode=memory&uri=true"
+        assert get_shared_engine(SQLITE_URL) is not get_shared_engine(other)
+
+    def test_differing_options_are_reported(self):
+        url = "sqlite:///file:engine_registry_options?mode=memory&uri=true"
+        engine = get_shared_engine(url, echo=False)
+
+        with patch("reconly_core.database.engine.logger") as logger:
+            assert get_shared_engine(url) is engine
+            assert get_shared_engine(url, echo=False) is engine
+            logger.warning.assert_not_called()
+
+            assert get_shared_engine(url, echo=True) is engine
+            logger.warning.assert_called_once()
+            assert logger.warning.call_args.kwargs["ignored"] == ["echo"]
+
+    def test_session_factory_binds_shared_engine(self):
+        session = get_session_factory(SQLITE_URL)()
+        try:
+            assert session.get_bind() is get_shared_engine(SQLITE_URL)
+        finally:
+            session.close()
+
+
+class TestFeedServiceSessions:
+    """FeedService instances share the engine and close their sessions."""
+
+    def test_services_share_engine(self):
+        with FeedService(database_url=SQLITE_URL) as first, FeedService(database_url=SQLITE_URL) as second:
+            assert first._get_session().get_bind() is second._get_session().get_bind()
+            assert first._engine is get_shared_engine(SQLITE_URL)
+
+    def test_close_releases_session(self):
+        service = FeedService(database_url=SQLITE_URL)
+        session = service._get_session()
+
+        service.close()
+
+        assert service._session is None
+        assert service._get_session() is not session
+        service.close()
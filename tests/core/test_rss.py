@@ -1,9 +1,17 @@
 """Tests for RSS feed fetching."""
+import threading
+import time
+
+import httpx
 import pytest
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
+from reconly_core.fetchers.base import HTTPValidators
 from reconly_core.fetchers.rss import RSSFetcher
 
+# Feed downloads are answered by a mock transport; tests patch feedparser.parse
+pytestmark = pytest.mark.usefixtures("feed_requests")
+
 
 class TestRSSFetcher:
     """Test suite for RSSFetcher class."""
@@ -626,3 +634,169 @@ class TestRSSFetcherFullContent:
                 assert articles[0]['content'] == 'RSS summary'
                 # Should NOT have full_content (empty response from WebsiteFetcher)
                 assert 'full_content' not in articles[0]
+
+
+class TestRSSConditionalFetch:
+    """Test suite for conditional GET (ETag / Last-Modified) in RSSFetcher."""
+
+    @pytest.fixture(autouse=True)
+    def disable_age_limit(self, monkeypatch):
+        """Disable the first-run age limit for tests with mock data."""
+        monkeypatch.setenv('RSS_FIRST_RUN_MAX_AGE_DAYS', '0')
+
+    def test_not_modified_short_circuits(self, feed_requests):
+        """WHEN the server answers 304 Not Modified
+        THEN no articles are returned and validators are flagged."""
+        responses, requests = feed_requests
+        responses.append(httpx.Response(304))
+        validators = HTTPValidators(etag='"v1"', last_modified='Tue, 30 Dec 2025 10:00:00 GMT')
+
+        with patch('feedparser.parse') as parse:
+            articles = RSSFetcher().fetch('https://example.com/feed', validators=validators)
+
+        assert articles == []
+        assert validators.not_modified is True
+        assert validators.etag == '"v1"'
+        assert requests[0].headers['If-None-Match'] == '"v1"'
+        assert requests[0].headers['If-Modified-Since'] == 'Tue, 30 Dec 2025 10:00:00 GMT'
+        parse.assert_not_called()
+
+    def test_validators_updated_from_response(self, feed_requests):
+        """WHEN the feed changed
+        THEN new validators from the response are stored on the object."""
+        responses, _ = feed_requests
+        responses.append(httpx.Response(200, content=b"", headers={
+            'ETag': '"v2"',
+            'Last-Modified': 'Wed, 31 Dec 2025 10:00:00 GMT',
+        }))
+        mock_feed = MagicMock()
+        mock_feed.bozo = False
+        mock_feed.entries = []
+        validators = HTTPValidators(etag='"v1"')
+
+        with patch('feedparser.parse', return_value=mock_feed):
+            RSSFetcher().fetch('https://example.com/feed', validators=validators)
+
+        assert validators.not_modified is False
+        assert validators.etag == '"v2"'
+        assert validators.last_modified == 'Wed, 31 Dec 2025 10:00:00 GMT'
+
+
+class TestRSSEnrichment:
+    """Test suite for concurrent article enrichment in RSSFetcher."""
+
+    @pytest.fixture(autouse=True)
+    def disable_age_limit(self, monkeypatch):
+        """Disable the first-run age limit for tests with mock data."""
+        monkeypatch.setenv('RSS_FIRST_RUN_MAX_AGE_DAYS', '0')
+
+    @staticmethod
+    def _feed(links):
+        mock_feed = Mock()
+        mock_feed.bozo = False
+        mock_feed.feed = {'title': 'Test Feed'}
+        entries = []
+        for i, link in enumerate(links):
+            entry = Mock()
+            entry.get = Mock(side_effect=lambda k, default=None, link=link, i=i: {
+                'link': link,
+                'title': f'Article {i}',
+            }.get(k, default))
+            entry.summary = f'RSS summary {i}'
+            entry.published_parsed = (2025, 12, 30, 12, i, 0, 0, 0, 0)
+            entry.author = None
+            entry.content = None
+            entry.description = None
+            entries.append(entry)
+        mock_feed.entries = entries
+        return mock_feed
+
+    def test_only_returned_articles_are_enriched(self):
+        """WHEN max_items limits the result
+        THEN only the returned articles are downloaded."""
+        links = [f'https://site{i}.example.com/a' for i in range(5)]
+        enriched = []
+
+        def enrich(url, fetch_full_content):
+            enriched.append(url)
+            return 'Full', 'https://img.example.com/x.jpg'
+
+        with patch('feedparser.parse', return_value=self._feed(links)):
+            with patch.object(RSSFetcher, '_enrich_article', side_effect=enrich):
+                articles = RSSFetcher().fetch('https://example.com/feed', max_items=2, fetch_full_content=True)
+
+        assert len(articles) == 2
+        assert sorted(enriched) == sorted(a['url'] for a in articles)
+        assert all(a['full_content'] == 'Full' for a in articles)
+        assert all(a['image_url'] == 'https://img.example.com/x.jpg' for a in articles)
+
+    def test_articles_enriched_concurrently_with_host_cap(self):
+        """WHEN several articles live on the same host
+        THEN downloads run in parallel but never exceed the per-host cap."""
+        links = [f'https://{host}.example.com/{i}' for host in ('a', 'b') for i in range(4)]
+        lock = threading.Lock()
+        active, peak = {}, {}
+
+        def enrich(url, fetch_full_content):
+            host = url.split('/')[2]
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+            time.sleep(0.1)
+            with lock:
+                active[host] -= 1
+            return 'Full', None
+
+        with patch('feedparser.parse', return_value=self._feed(links)):
+            with patch.object(RSSFetcher, '_enrich_article', side_effect=enrich):
+                started = time.monotonic()
+                articles = RSSFetcher().fetch(
+                    'https://example.com/feed',
+                    fetch_full_content=True,
+                    enrichment_workers=8,
+                    enrichment_max_per_host=2,
+                )
+                elapsed = time.monotonic() - started
+
+        assert len(articles) == 8
+        assert peak == {'a.example.com': 2, 'b.example.com': 2}
+        assert elapsed < 0.35
+
+    def test_slow_articles_fall_back_to_summary_after_deadline(self):
+        """WHEN an article page is slower than the enrichment deadline
+        THEN the fetch returns on time and that article keeps its RSS summary."""
+        links = ['https://fast.example.com/1', 'https://slow.example.com/2']
+        release = threading.Event()
+
+        def enrich(url, fetch_full_content):
+            if 'slow' in url:
+                release.wait(2)
+            return f'Full {url}', None
+
+        with patch('feedparser.parse', return_value=self._feed(links)):
+            with patch.object(RSSFetcher, '_enrich_article', side_effect=enrich):
+                started = time.monotonic()
+                articles = RSSFetcher().fetch(
+                    'https://example.com/feed',
+                    fetch_full_content=True,
+                    enrichment_timeout=0.2,
+                )
+                elapsed = time.monotonic() - started
+        release.set()
+
+        by_url = {a['url']: a for a in articles}
+        assert elapsed < 1
+        assert by_url['https://fast.example.com/1']['full_content'] == 'Full https://fast.example.com/1'
+        assert 'full_content' not in by_url['https://slow.example.com/2']
+        assert by_url['https://slow.example.com/2']['content'] == 'RSS summary 1'
+        assert by_url['https://slow.example.com/2']['image_url'] is None
+
+    def test_preview_image_falls_back_to_og_image(self):
+        """WHEN full content scraping finds no image
+        THEN the og:image lookup is used."""
+        with patch.object(RSSFetcher, '_fetch_full_article_content', return_value=('Full', None)):
+            with patch('reconly_core.fetchers.rss.fetch_og_image', return_value='https://img/og.jpg') as og:
+                result = RSSFetcher()._enrich_article('https://example.com/a', fetch_full_content=True)
+
+        assert result == ('Full', 'https://img/og.jpg')
+        og.assert_called_once_with('https://example.com/a', timeout=5)
@@ -4,7 +4,7 @@ import tempfile
 from pathlib import Path
 from datetime import datetime
 from freezegun import freeze_time
-from reconly_core.tracking import FeedTracker
+from reconly_core.tracking import DBFeedTracker, FeedTracker
 
 
 class TestFeedTracker:
@@ -138,3 +138,91 @@ class TestFeedTracker:
         tracker.update_last_read('https://example.com/feed')
 
         assert temp_tracking_file.exists()
+
+
+class TestDBFeedTracker:
+    """Test suite for DBFeedTracker class."""
+
+    @pytest.fixture
+    def tracker(self, db_session, tmp_path):
+        """DB tracker bound to the test transaction, with an empty legacy file."""
+        legacy = FeedTracker(str(tmp_path / 'processed_feeds.json'))
+        return DBFeedTracker(db_session.get_bind(), legacy_tracker=legacy)
+
+    def test_update_and_get_last_read(self, tracker):
+        """WHEN last read is updated
+        THEN timestamp is stored and can be retrieved."""
+        timestamp = datetime(2025, 12, 30, 10, 30, 0)
+        tracker.update_last_read('https://example.com/feed', timestamp)
+
+        assert tracker.get_last_read('https://example.com/feed') == timestamp
+
+    def test_update_overwrites_single_row(self, tracker):
+        """WHEN last read is updated twice
+        THEN the existing row is updated in place."""
+        tracker.update_last_read('https://example.com/feed', datetime(2025, 12, 30))
+        tracker.update_last_read('https://example.com/feed', datetime(2025, 12, 31))
+
+        all_feeds = tracker.get_all_feeds()
+        assert list(all_feeds) == ['https://example.com/feed']
+        assert tracker.get_last_read('https://example.com/feed') == datetime(2025, 12, 31)
+
+    def test_instances_share_state(self, db_session, tmp_path):
+        """WHEN two trackers (parallel feed runs) write different feeds
+        THEN neither overwrites the other's state."""
+        legacy = FeedTracker(str(tmp_path / 'processed_feeds.json'))
+        tracker1 = DBFeedTracker(db_session.get_bind(), legacy_tracker=legacy)
+        tracker2 = DBFeedTracker(db_session.get_bind(), legacy_tracker=legacy)
+
+        tracker1.update_last_read('https://feed1.com/rss', datetime(2025, 12, 30))
+        tracker2.update_last_read('https://feed2.com/rss', datetime(2025, 12, 31))
+
+        assert tracker2.get_last_read('https://feed1.com/rss') == datetime(2025, 12, 30)
+        assert tracker1.get_last_read('https://feed2.com/rss') == datetime(2025, 12, 31)
+
+    def test_validators(self, tracker):
+        """WHEN HTTP validators are stored
+        THEN they are returned without touching last read."""
+        tracker.update_last_read('https://example.com/feed', datetime(2025, 12, 30))
+        tracker.update_validators('https://example.com/feed', etag='"abc"', last_modified='Tue, 30 Dec 2025 10:00:00 GMT')
+
+        assert tracker.get_validators('https://example.com/feed') == {
+            'etag': '"abc"',
+            'last_modified': 'Tue, 30 Dec 2025 10:00:00 GMT',
+        }
+        assert tracker.get_last_read('https://example.com/feed') == datetime(2025, 12, 30)
+        assert tracker.get_validators('https://unknown.com/feed') == {'etag': None, 'last_modified': None}
+
+    def test_legacy_file_fallback(self, db_session, tmp_path):
+        """WHEN a feed has no row yet
+        THEN the legacy JSON tracking file is consulted."""
+        legacy = FeedTracker(str(tmp_path / 'processed_feeds.json'))
+        legacy.update_last_read('https://example.com/feed', datetime(2025, 1, 1))
+        tracker = DBFeedTracker(db_session.get_bind(), legacy_tracker=legacy)
+
+        assert tracker.get_last_read('https://example.com/feed') == datetime(2025, 1, 1)
+
+        tracker.update_last_read('https://example.com/feed', datetime(2025, 2, 1))
+        assert tracker.get_last_read('https://example.com/feed') == datetime(2025, 2, 1)
+
+    def test_legacy_file_fallback_with_validators_only(self, db_session, tmp_path):
+        """WHEN a feed's row only holds HTTP validators
+        THEN the legacy JSON tracking file is still consulted."""
+        legacy = FeedTracker(str(tmp_path / 'processed_feeds.json'))
+        legacy.update_last_read('https://example.com/feed', datetime(2025, 1, 1))
+        tracker = DBFeedTracker(db_session.get_bind(), legacy_tracker=legacy)
+
+        tracker.update_validators('https://example.com/feed', etag='"v1"')
+
+        assert tracker.get_last_read('https://example.com/feed') == datetime(2025, 1, 1)
+
+    def test_reset_feed(self, tracker):
+        """WHEN feed is reset
+        THEN its tracking data is removed."""
+        tracker.update_last_read('https://feed1.com/rss')
+        tracker.update_last_read('https://feed2.com/rss')
+
+        tracker.reset_feed('https://feed1.com/rss')
+
+        assert tracker.get_last_read('https://feed1.com/rss') is None
+        assert list(tracker.get_all_feeds()) == ['https://feed2.com/rss']
@@ -0,0 +1,292 @@
+"""Tests for the shared HTTP client."""
+import asyncio
+import socket
+import threading
+import time
+from unittest.mock import patch
+
+import httpcore
+import httpx
+import pytest
+
+from reconly_core.resilience.config import RetryConfig
+from reconly_core.resilience.errors import ErrorCategory, classify_error
+from reconly_core.utils.http_client import (
+    DNSCache,
+    HTTPClient,
+    HTTPClientConfig,
+    _CachingSyncBackend,
+    _PoolTransport,
+    get_requests_session,
+)
+
+
+def _client(handler, **config):
+    config.setdefault('retry_attempts', 2)
+    client = HTTPClient(HTTPClientConfig(**config), transport=httpx.MockTransport(handler))
+    client.retry_config = RetryConfig(max_attempts=config['retry_attempts'], base_delay=0, rate_limit_delay=0, jitter=False)
+    return client
+
+
+def _addrinfo(*addresses):
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', (address, 443)) for address in addresses]
+
+
+class TestDNSCache:
+    """Tests for DNSCache."""
+
+    def test_resolve_is_cached(self):
+        cache = DNSCache(ttl=60)
+        with patch('socket.getaddrinfo', return_value=_addrinfo('10.0.0.1', '10.0.0.1', '10.0.0.2')) as lookup:
+            assert cache.resolve('example.com', 443) == ['10.0.0.1', '10.0.0.2']
+            assert cache.resolve('example.com', 443) == ['10.0.0.1', '10.0.0.2']
+
+        assert lookup.call_count == 1
+
+    def test_expired_entry_is_resolved_again(self):
+        cache = DNSCache(ttl=60)
+        with patch('socket.getaddrinfo', return_value=_addrinfo('10.0.0.1')) as lookup:
+            cache.resolve('example.com', 443)
+            with patch('reconly_core.utils.http_client.time.monotonic', return_value=time.monotonic() + 61):
+                cache.resolve('example.com', 443)
+
+        assert lookup.call_count == 2
+
+    def test_zero_ttl_disables_cache(self):
+        cache = DNSCache(ttl=0)
+        with patch('socket.getaddrinfo', return_value=_addrinfo('10.0.0.1')) as lookup:
+            cache.resolve('example.com', 443)
+            cache.resolve('example.com', 443)
+
+        assert lookup.call_count == 2
+
+    def test_backend_connects_to_cached_address(self):
+        cache = DNSCache(ttl=60)
+        cache.store('example.com', 443, ['10.0.0.1', '10.0.0.2'])
+        backend = _CachingSyncBackend(cache)
+
+        calls = []
+
+        def connect(self, host, port, *args):
+            calls.append(host)
+            if host == '10.0.0.1':
+                raise httpcore.ConnectError('refused')
+            return 'stream'
+
+        with patch.object(httpcore.SyncBackend, 'connect_tcp', connect):
+            assert backend.connect_tcp('example.com', 443) == 'stream'
+
+        assert calls == ['10.0.0.1', '10.0.0.2']
+
+
+class TestHTTPClientRetries:
+    """Retry behaviour built on resilience.retry."""
+
+    def test_retries_server_error_then_succeeds(self):
+        statuses = iter([503, 200])
+        client = _client(lambda request: httpx.Response(next(statuses), text='ok'))
+
+        response = client.get('https://example.com/page')
+
+        assert response.status_code == 200
+
+    def test_returns_last_response_when_attempts_exhausted(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429)
+
+        response = _client(handler).get('https://example.com/page')
+
+        assert response.status_code == 429
+        assert len(calls) == 2
+
+    def test_client_errors_are_not_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(404)
+
+        assert _client(handler).get('https://example.com/missing').status_code == 404
+        assert len(calls) == 1
+
+    def test_post_is_not_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        _client(handler).request('POST', 'https://example.com/hook')
+
+        assert len(calls) == 1
+
+    def test_retry_false_sends_once(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+
+        _client(handler).get('https://example.com/page', retry=False)
+
+        assert len(calls) == 1
+
+    def test_timeouts_are_retried_then_raised(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ReadTimeout('slow', request=request)
+
+        with pytest.raises(httpx.TimeoutException):
+            _client(handler).get('https://example.com/slow')
+
+        assert len(calls) == 2
+
+    def test_default_headers_and_redirects(self):
+        def handler(request):
+            if request.url.path == '/old':
+                return httpx.Response(301, headers={'Location': 'https://example.com/new'})
+            return httpx.Response(200, text=request.headers['User-Agent'])
+
+        response = _client(handler).get('https://example.com/old')
+
+        assert response.status_code == 200
+        assert 'Mozilla' in response.text
+
+    def test_classify_httpx_errors(self):
+        request = httpx.Request('GET', 'https://example.com')
+        assert classify_error(httpx.ConnectError('refused')) == ErrorCategory.TRANSIENT
+        assert classify_error(httpx.ReadTimeout('slow')) == ErrorCategory.TRANSIENT
+        assert classify_error(httpx.HTTPStatusError(
+            'x', request=request, response=httpx.Response(503, request=request),
+        )) == ErrorCategory.TRANSIENT
+        assert classify_error(httpx.HTTPStatusError(
+            'x', request=request, response=httpx.Response(404, request=request),
+        )) == ErrorCategory.PERMANENT
+
+
+class TestHTTPClientLimits:
+    """Per-host concurrency limits."""
+
+    def test_max_per_host(self):
+        lock = threading.Lock()
+        active = {}
+        peak = {}
+
+        def handler(request):
+            host = request.url.host
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+            time.sleep(0.1)
+            with lock:
+                active[host] -= 1
+            return httpx.Response(200)
+
+        client = _client(handler, max_per_host=2)
+        urls = [f'https://{host}.example.com/{i}' for host in ('a', 'b') for i in range(4)]
+        threads = [threading.Thread(target=client.get, args=(url,)) for url in urls]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak == {'a.example.com': 2, 'b.example.com': 2}
+
+
+class TestHTTPClientAsync:
+    """Async requests share configuration with the sync client."""
+
+    def test_aget(self):
+        client = _client(lambda request: httpx.Response(200, text='async'))
+
+        async def run():
+            return await client.aget('https://example.com/page')
+
+        assert asyncio.run(run()).text == 'async'
+
+    def test_async_client_shared_across_event_loops(self):
+        client = _client(lambda request: httpx.Response(200))
+
+        async def get():
+            return await client.aget('https://example.com/page')
+
+        asyncio.run(get())
+        async_client = client._async.client
+        asyncio.run(get())
+
+        assert client._async.client is async_client
+        client.close()
+        assert async_client.is_closed
+        assert client._async is None
+
+    def test_usable_after_close(self):
+        client = _client(lambda request: httpx.Response(200, text='again'))
+
+        async def get():
+            return await client.aget('https://example.com/page')
+
+        asyncio.run(get())
+        client.close()
+
+        assert asyncio.run(get()).text == 'again'
+        client.close()
+
+
+class TestPoolTransport:
+    """DNS-caching transport built on httpcore's public pool API."""
+
+    def test_uses_caching_backend(self):
+        client = HTTPClient(HTTPClientConfig(dns_cache_ttl=60))
+        with patch('urllib.request.getproxies', return_value={}):
+            transport = client._build_transport()
+
+        assert isinstance(transport, _PoolTransport)
+        transport.close()
+
+    def test_plain_transport_without_dns_cache(self):
+        client = HTTPClient(HTTPClientConfig(dns_cache_ttl=0))
+
+        assert client._build_transport() is None
+        assert client._build_async_transport() is None
+
+    def test_environment_proxy_honoured(self, monkeypatch):
+        for name in ('HTTP_PROXY', 'ALL_PROXY', 'http_proxy', 'https_proxy', 'all_proxy', 'no_proxy'):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv('HTTPS_PROXY', 'http://proxy.internal:3128')
+        monkeypatch.setenv('NO_PROXY', 'intranet.local')
+        client = HTTPClient(HTTPClientConfig(dns_cache_ttl=60))
+
+        assert client._build_transport() is None
+        proxied = client.client._transport_for_url(httpx.URL('https://example.com/feed'))
+        direct = client.client._transport_for_url(httpx.URL('https://intranet.local/feed'))
+        assert isinstance(proxied._pool, httpcore.HTTPProxy)
+        assert not isinstance(direct._pool, httpcore.HTTPProxy)
+        client.close()
+
+    def test_httpcore_errors_mapped_to_httpx(self):
+        class FailingPool:
+            def handle_request(self, request):
+                raise httpcore.ConnectTimeout('timed out')
+
+        transport = _PoolTransport(FailingPool())
+
+        with pytest.raises(httpx.ConnectTimeout):
+            transport.handle_request(httpx.Request('GET', 'https://example.com'))
+
+
+class TestRequestsSession:
+    """Pooled requests sessions for third-party libraries."""
+
+    def test_session_reused_per_thread(self):
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(get_requests_session()))
+        thread.start()
+        thread.join()
+
+        assert get_requests_session() is get_requests_session()
+        assert sessions[0] is not get_requests_session()